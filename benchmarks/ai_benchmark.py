@@ -0,0 +1,441 @@
+"""
+モンスターAIベンチマークスクリプト。
+
+このスクリプトは、固定シードで構築したフロア上で
+TurnManager.process_monster_turns をヘッドレスに繰り返し実行し、
+ターンごとの処理時間の分布とフェーズ別（ステータス・視線・経路・移動）の
+内訳を計測します。フェーズ別の時間はゲーム本体の計測区間（frame_timer）から
+集計します。結果はコミット間で比較できるJSONとして出力できます。
+
+Example:
+-------
+    $ PYTHONPATH=src python benchmarks/ai_benchmark.py --monsters 10 100 1000 --turns 200 --output ai_bench.json
+
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from pyrogue.constants import GameConstants
+from pyrogue.core.managers.game_context import GameContext
+from pyrogue.core.managers.monster_ai_manager import MonsterAIManager
+from pyrogue.core.managers.monster_behavior_manager import MonsterAIState
+from pyrogue.core.managers.turn_manager import TurnManager
+from pyrogue.core.message_log import MessageLog
+from pyrogue.entities.actors.monster import Monster
+from pyrogue.entities.actors.monster_spawner import MonsterSpawner
+from pyrogue.entities.actors.player import Player
+from pyrogue.entities.items.item_spawner import ItemSpawner
+from pyrogue.entities.traps.trap import TrapManager
+from pyrogue.map.dungeon_manager import DungeonManager, FloorData
+from pyrogue.map.tile import Floor, Wall
+from pyrogue.utils import frame_timer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pyrogue.utils.frame_timer import Span
+
+# 計測区間名と集計するフェーズの対応（"other" は合計から各フェーズを引いた残り）
+PHASE_SPANS: dict[str, str] = {
+    "turn.monster_status": "status",
+    "ai.vision": "vision",
+    "ai.pathing": "pathing",
+    "ai.movement": "movement",
+}
+
+# 計測するフェーズ
+PHASES: tuple[str, ...] = tuple(PHASE_SPANS.values())
+
+# シナリオ内のAI状態の構成比（合計1.0）
+STATE_MIX: tuple[tuple[str, float], ...] = (
+    ("wandering", 0.4),
+    ("hunting", 0.3),
+    ("fleeing", 0.15),
+    ("splitting", 0.15),
+)
+
+# レポートするパーセンタイル
+PERCENTILES: tuple[int, ...] = (50, 90, 95, 99)
+
+
+@contextmanager
+def record_spans() -> Iterator[deque[Span]]:
+    """
+    共有タイマーの計測を一時的に有効にし、容量無制限のバッファに区間を記録。
+
+    終了時にタイマーの有効状態とバッファを元に戻します。
+
+    Yields
+    ------
+        区間が記録されるバッファ
+
+    """
+    enabled, spans = frame_timer.enabled, frame_timer.spans
+    frame_timer.spans = deque()
+    frame_timer.enable()
+    try:
+        yield frame_timer.spans
+    finally:
+        frame_timer.enabled, frame_timer.spans = enabled, spans
+
+
+def phase_totals(spans: Iterable[Span]) -> dict[str, float]:
+    """
+    記録した区間からフェーズ別の排他的な処理時間を集計。
+
+    入れ子になった区間（経路探索中の移動など）の時間は内側の区間にのみ計上します。
+    区間は終了した順に並んでいる必要があります。
+
+    Args:
+    ----
+        spans: FrameTimerが記録した区間
+
+    Returns:
+    -------
+        フェーズ別累計時間（秒）
+
+    """
+    totals = dict.fromkeys(PHASES, 0.0)
+    child_ns: dict[int, int] = {}
+    for name, _, duration, depth in spans:
+        inner = child_ns.pop(depth + 1, 0)
+        child_ns[depth] = child_ns.get(depth, 0) + duration
+        phase = PHASE_SPANS.get(name)
+        if phase is not None:
+            totals[phase] += (duration - inner) / 1e9
+    return totals
+
+
+def build_arena(width: int, height: int) -> np.ndarray:
+    """
+    柱の並んだベンチマーク用フロアを構築。
+
+    ダンジョン生成の変更に影響されないよう、固定パターンで生成します。
+
+    Args:
+    ----
+        width: フロアの幅
+        height: フロアの高さ
+
+    Returns:
+    -------
+        タイル配列
+
+    """
+    floor, wall = Floor.shared(), Wall.shared()
+    tiles = np.full((height, width), floor, dtype=object)
+    tiles[0, :] = wall
+    tiles[-1, :] = wall
+    tiles[:, 0] = wall
+    tiles[:, -1] = wall
+
+    # 経路探索が意味を持つように短い壁を規則的に配置
+    for y in range(3, height - 1, 6):
+        for x in range(4, width - 1, 8):
+            tiles[y, x : x + 3] = wall
+    return tiles
+
+
+def _make_monster(x: int, y: int, role: str) -> Monster:
+    ai_pattern = {"fleeing": "flee", "splitting": "split"}.get(role, "basic")
+    monster = Monster(
+        char="B" if role != "splitting" else "I",
+        x=x,
+        y=y,
+        name=f"Bench {role}",
+        level=3,
+        hp=20,
+        max_hp=20,
+        attack=3,
+        defense=1,
+        exp_value=5,
+        view_range=6,
+        color=(200, 200, 200),
+        ai_pattern=ai_pattern,
+    )
+    if role == "fleeing":
+        # 逃走閾値を下回るHPで配置
+        monster.hp = 4
+    return monster
+
+
+class AIBenchmark:
+    """
+    モンスターAIのベンチマークシナリオ。
+
+    固定シードでフロア・プレイヤー・モンスターを構築し、
+    実際のターン処理（TurnManagerのモンスターターン）を駆動します。
+
+    Attributes
+    ----------
+        monster_count: 初期モンスター数
+        seed: 乱数シード
+        context: ゲームコンテキスト
+
+    """
+
+    def __init__(self, monster_count: int, seed: int = 0) -> None:
+        """
+        シナリオを構築。
+
+        Args:
+        ----
+            monster_count: 初期モンスター数
+            seed: 乱数シード
+
+        """
+        self.monster_count = monster_count
+        self.seed = seed
+        random.seed(seed)
+
+        width, height = GameConstants.DUNGEON_WIDTH, GameConstants.DUNGEON_HEIGHT
+        tiles = build_arena(width, height)
+        center = (width // 2, height // 2)
+
+        self.player = Player(*center)
+        self.player.hp = self.player.max_hp = 10**9
+
+        dungeon_manager = DungeonManager(width, height)
+        spawner = MonsterSpawner(1)
+        dungeon_manager.floors[1] = FloorData(
+            floor_number=1,
+            tiles=tiles,
+            up_pos=center,
+            down_pos=center,
+            monster_spawner=spawner,
+            item_spawner=ItemSpawner(1),
+            trap_manager=TrapManager(),
+            explored=np.ones((height, width), dtype=bool),
+        )
+        dungeon_manager.current_floor = 1
+
+        self.context = GameContext(
+            player=self.player,
+            inventory=self.player.inventory,
+            dungeon_manager=dungeon_manager,
+            message_log=MessageLog(),
+        )
+        self.turn_manager = TurnManager()
+        self.ai_manager = MonsterAIManager()
+        self.context.turn_manager = self.turn_manager
+        self.context.monster_ai_manager = self.ai_manager
+
+        self._spawn_monsters(spawner, tiles, center)
+        self._patrol = self._build_patrol(tiles, center)
+
+    def _spawn_monsters(self, spawner: MonsterSpawner, tiles: np.ndarray, center: tuple[int, int]) -> None:
+        cells = [
+            (x, y)
+            for y in range(tiles.shape[0])
+            for x in range(tiles.shape[1])
+            if tiles[y, x].walkable and (x, y) != center
+        ]
+        rng = random.Random(self.seed)
+        rng.shuffle(cells)
+
+        roles: list[str] = []
+        for role, ratio in STATE_MIX:
+            roles.extend([role] * round(self.monster_count * ratio))
+        roles = (roles + ["wandering"] * self.monster_count)[: self.monster_count]
+
+        for (x, y), role in zip(cells, roles, strict=False):
+            monster = _make_monster(x, y, role)
+            spawner.add_monster(monster)
+            if role == "hunting":
+                self.ai_manager.set_monster_state(monster, MonsterAIState.HUNTING, target=center)
+
+    def _build_patrol(self, tiles: np.ndarray, center: tuple[int, int]) -> list[tuple[int, int]]:
+        # 中心の周りを一周する巡回路（フローフィールドの再計算を発生させる）
+        cx, cy = center
+        radius = 2
+        ring = [(cx + dx, cy - radius) for dx in range(-radius, radius)]
+        ring += [(cx + radius, cy + dy) for dy in range(-radius, radius)]
+        ring += [(cx - dx, cy + radius) for dx in range(-radius, radius)]
+        ring += [(cx - radius, cy - dy) for dy in range(-radius, radius)]
+        return [(x, y) for x, y in ring if tiles[y, x].walkable]
+
+    def _advance_player(self, turn: int) -> None:
+        if not self._patrol:
+            return
+        x, y = self._patrol[turn % len(self._patrol)]
+        spawner = self.context.get_current_floor_data().monster_spawner
+        if spawner.get_monster_at(x, y) is None:
+            self.player.x, self.player.y = x, y
+        # プレイヤーは死亡しない（計測対象はモンスター側の処理のみ）
+        self.player.hp = self.player.max_hp
+
+    def _trigger_split(self) -> None:
+        # プレイヤーの攻撃を模して、隣接する分裂モンスターを1体だけ分裂させる
+        spawner = self.context.get_current_floor_data().monster_spawner
+        for monster in spawner.get_monsters_in_range(self.player.x, self.player.y, 1):
+            if monster.can_split and monster.parent_monster is None:
+                self.ai_manager.split_monster_on_damage(monster, self.context)
+                return
+
+    def run(self, turns: int, warmup: int = 5) -> dict[str, Any]:
+        """
+        指定ターン数を実行して計測結果を返す。
+
+        Args:
+        ----
+            turns: 計測するターン数
+            warmup: 計測前に実行するターン数
+
+        Returns:
+        -------
+            計測結果の辞書
+
+        """
+        latencies: list[float] = []
+        phase_samples: dict[str, list[float]] = {phase: [] for phase in (*PHASES, "other")}
+
+        with record_spans() as spans:
+            for turn in range(warmup + turns):
+                self._advance_player(turn)
+                self._trigger_split()
+
+                spans.clear()
+                start = time.perf_counter()
+                self.turn_manager.process_monster_turns(self.context)
+                elapsed = time.perf_counter() - start
+
+                if turn < warmup:
+                    continue
+                phases = phase_totals(spans)
+                latencies.append(elapsed * 1000.0)
+                for phase, seconds in phases.items():
+                    phase_samples[phase].append(seconds * 1000.0)
+                phase_samples["other"].append(max(0.0, elapsed - sum(phases.values())) * 1000.0)
+
+        monsters = self.context.get_current_floor_data().monster_spawner.monsters
+        return {
+            "monsters": self.monster_count,
+            "final_monsters": len(monsters),
+            "turns": turns,
+            "latency_ms": _summarize(latencies),
+            "phases_ms": {phase: _summarize(samples) for phase, samples in phase_samples.items()},
+            "state_checksum": self.state_checksum(),
+        }
+
+    def state_checksum(self) -> str:
+        """
+        全モンスターの位置とHPから決定的なチェックサムを計算。
+
+        同じシード・同じコードであれば同じ値になるため、
+        最適化によってAIの挙動が変わっていないかの確認に使えます。
+
+        Returns
+        -------
+            16進文字列のチェックサム
+
+        """
+        monsters = self.context.get_current_floor_data().monster_spawner.monsters
+        digest = hashlib.sha256()
+        digest.update(f"{self.player.x},{self.player.y};".encode())
+        for monster in monsters:
+            digest.update(f"{monster.x},{monster.y},{monster.hp};".encode())
+        return digest.hexdigest()[:16]
+
+
+def _summarize(samples: list[float]) -> dict[str, float]:
+    if not samples:
+        return {"mean": 0.0, "max": 0.0, **{f"p{p}": 0.0 for p in PERCENTILES}}
+    values = np.asarray(samples)
+    summary = {"mean": float(values.mean()), "max": float(values.max())}
+    for p, value in zip(PERCENTILES, np.percentile(values, PERCENTILES), strict=True):
+        summary[f"p{p}"] = float(value)
+    return {key: round(value, 4) for key, value in summary.items()}
+
+
+def _git_revision() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run_benchmarks(monster_counts: list[int], turns: int, seed: int, warmup: int = 5) -> dict[str, Any]:
+    """
+    複数のモンスター数でベンチマークを実行。
+
+    Args:
+    ----
+        monster_counts: 初期モンスター数のリスト
+        turns: 各シナリオで計測するターン数
+        seed: 乱数シード
+        warmup: 計測前に実行するターン数
+
+    Returns:
+    -------
+        JSONに変換可能な計測結果
+
+    """
+    return {
+        "benchmark": "monster_ai",
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "seed": seed,
+        "warmup": warmup,
+        "scenarios": [AIBenchmark(count, seed).run(turns, warmup) for count in monster_counts],
+    }
+
+
+def _write_report(report: dict[str, Any]) -> None:
+    columns = (*PHASES, "other")
+    lines = [
+        f"monster AI benchmark (seed={report['seed']}, revision={report['revision']})",
+        f"{'monsters':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}  " + " ".join(f"{phase:>9}" for phase in columns),
+    ]
+    for scenario in report["scenarios"]:
+        latency = scenario["latency_ms"]
+        phases = " ".join(f"{scenario['phases_ms'][phase]['mean']:>9.3f}" for phase in columns)
+        lines.append(
+            f"{scenario['monsters']:>8} {latency['p50']:>8.3f} {latency['p95']:>8.3f} "
+            f"{latency['p99']:>8.3f} {latency['max']:>8.3f}  {phases}"
+        )
+    lines.append("(latency in ms per turn; phase columns are mean ms per turn)")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def main(argv: list[str] | None = None) -> None:
+    """コマンドラインからベンチマークを実行。"""
+    parser = argparse.ArgumentParser(description="PyRogue monster AI benchmark")
+    parser.add_argument("--monsters", type=int, nargs="+", default=[10, 100, 1000], help="Monster counts to benchmark")
+    parser.add_argument("--turns", type=int, default=100, help="Measured turns per scenario")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured warm-up turns per scenario")
+    parser.add_argument("--seed", type=int, default=12345, help="Random seed")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.monsters, args.turns, args.seed, args.warmup)
+    _write_report(report)
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        sys.stdout.write(f"Report written to {args.output}\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -191,7 +191,45 @@ def get_auto_save_enabled() -> bool:
 
 def get_log_directory() -> str:
     """ログディレクトリの設定を取得。"""
-    return env_config.get("LOG_DIRECTORY", "logs")
+    # 環境変数からLOG_DIRECTORYを取得（デフォルト: "logs"）
+    log_subdir = env_config.get("LOG_DIRECTORY", "logs")
+
+    # ~/.pyrogue/${LOG_DIRECTORY}形式のパスを作成（絶対パスはそのまま使用）
+    home_dir = Path.home()
+    log_dir = home_dir / ".pyrogue" / log_subdir
+
+    return str(log_dir)
+
+
+def get_log_json() -> bool:
+    """JSON Lines形式のログ（game.jsonl）も出力するかどうかを取得。"""
+    return env_config.get_bool("LOG_JSON", False)
+
+
+def get_map_size(default_width: int, default_height: int) -> tuple[int, int]:
+    """
+    マップの大きさ（MAP_WIDTH / MAP_HEIGHT）を取得。
+
+    画面に収まらない大きさのマップは、カメラで表示範囲をスクロールして表示します。
+
+    Args:
+    ----
+        default_width: 未設定時の幅
+        default_height: 未設定時の高さ
+
+    Returns:
+    -------
+        (幅, 高さ)
+
+    """
+    width = env_config.get_int("MAP_WIDTH", default_width)
+    height = env_config.get_int("MAP_HEIGHT", default_height)
+    return (width, height) if width > 0 and height > 0 else (default_width, default_height)
+
+
+def get_profile_timing() -> bool:
+    """フレーム・ターン計測を起動時から有効にするかどうかを取得。"""
+    return env_config.get_bool("PROFILE_TIMING", False)
 
 
 def is_test_mode() -> bool:
@@ -30,6 +30,7 @@ class DisplayConfig:
     FONT_HEIGHT: int = 10
     MIN_SCREEN_WIDTH: int = GameConstants.DUNGEON_WIDTH
     MIN_SCREEN_HEIGHT: int = GameConstants.DUNGEON_HEIGHT + GameConstants.STATUS_PANEL_HEIGHT
+    FRAME_CAP: int = 30  # アニメーションする画面の最大描画回数（毎秒）
 
 
 @dataclass
@@ -1,5 +1,24 @@
-"""Core package."""
+"""
+Core package.
 
-from pyrogue.core.engine import Engine
+Engine is imported on first access so that CLI-only code paths
+(e.g. pyrogue.core.cli_engine) do not load the GUI stack.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyrogue.core.engine import Engine
 
 __all__ = ["Engine"]
+
+
+def __getattr__(name: str) -> object:
+    if name == "Engine":
+        from pyrogue.core.engine import Engine
+
+        return Engine
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
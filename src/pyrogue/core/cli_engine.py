@@ -6,9 +6,9 @@ CLI ゲームエンジンモジュール。
 
 主要機能:
     - コマンドライン入力の解析
-    - ゲーム状態の表示
+    - ゲーム状態の表示（1コマンドにつき1回の書き込み）
     - 非対話型のゲーム実行
-    - 自動テスト用のインターフェース
+    - 自動テスト用のインターフェース（--quiet / --json で差分のみを出力）
 
 Example:
 -------
@@ -22,12 +22,19 @@ Example:
 from __future__ import annotations
 
 import sys
+from typing import TYPE_CHECKING
 
+from pyrogue.core.cli_renderer import CLIRenderer
 from pyrogue.core.command_handler import CommandContext, CommonCommandHandler
 from pyrogue.core.game_logic import GameLogic
 from pyrogue.core.game_states import GameStates
 from pyrogue.utils import game_logger
 
+if TYPE_CHECKING:
+    from typing import TextIO
+
+    from pyrogue.entities.actors.inventory import Inventory
+
 
 class CLICommandContext(CommandContext):
     """CLI用のコマンドコンテキスト実装。"""
@@ -54,7 +61,8 @@ class CLICommandContext(CommandContext):
         """メッセージの追加。"""
         # GameLogicのmessage_logにも追加
         self.engine.game_logic.add_message(message)
-        print(message)
+        # quiet / json モードではメッセージ欄の差分として出力される
+        self.engine.renderer.write(message, verbose=True)
 
     def display_player_status(self) -> None:
         """プレイヤーステータスの表示。"""
@@ -90,15 +98,35 @@ class CLIEngine:
     ----------
         state: 現在のゲーム状態
         running: ゲームループ実行フラグ
-        game_screen: ゲーム画面インスタンス
+        game_logic: ゲームロジック
+        renderer: 出力をコマンド単位でまとめるレンダラー
+        last_command_ok: 直前のコマンドが成功したかどうか
 
     """
 
-    def __init__(self) -> None:
-        """CLIエンジンを初期化。"""
+    def __init__(self, output_mode: str = "text", stream: TextIO | None = None) -> None:
+        """
+        CLIエンジンを初期化。
+
+        Args:
+        ----
+            output_mode: 出力モード（text / quiet / json）
+            stream: 出力先（Noneの場合は標準出力）
+
+        """
         self.state = GameStates.PLAYERS_TURN
         self.running = False
         self.game_logic = GameLogic(None)  # CLIモードではエンジンはNone
+        self.renderer = CLIRenderer(output_mode, stream)
+        self.last_command_ok = True
+        # 周囲のアイテム表示のキャッシュ（階層・位置・アイテム数が同じ間は再走査しない）
+        self._nearby_items_source: list | None = None
+        self._nearby_items_key: tuple[int, int, int] | None = None
+        self._nearby_items_lines: list[str] = []
+        # インベントリ表示のキャッシュ（インベントリの世代番号が同じ間は再計算しない）
+        self._inventory_source: Inventory | None = None
+        self._inventory_version = -1
+        self._inventory_lines_cache: list[str] = []
 
         # 共通コマンドハンドラーを初期化
         self.command_context = CLICommandContext(self)
@@ -111,18 +139,22 @@ class CLIEngine:
         CLIメインループを実行。
 
         標準入力からコマンドを読み取り、処理し、結果を表示します。
+        出力は1コマンド分ずつまとめて書き込みます。textモード以外では
+        プロンプトを表示せず、標準入力を直接読み取ります。
         """
         self.running = True
-        print("PyRogue CLI Mode - Type 'help' for commands")
+        self.renderer.write("PyRogue CLI Mode - Type 'help' for commands", verbose=True)
 
         # 新しいゲームを開始
         self.game_logic.setup_new_game()
         self.display_game_state()
+        self.renderer.flush()
 
         try:
             while self.running:
+                command = None
                 try:
-                    command = input("> ").strip()
+                    command = self.read_command()
                     if not command:
                         continue
 
@@ -135,19 +167,43 @@ class CLIEngine:
                     self.update_game_state()
 
                 except KeyboardInterrupt:
-                    print("\nGame interrupted by user")
+                    self.renderer.write("\nGame interrupted by user", verbose=True)
                     self.running = False
                     break
                 except EOFError:
-                    print("\nEnd of input reached")
+                    self.renderer.write("\nEnd of input reached", verbose=True)
                     self.running = False
                     break
+                finally:
+                    if command:
+                        self.renderer.flush(command, self.last_command_ok)
+            self.renderer.flush()
 
         except Exception as e:
             game_logger.error(f"Fatal error in CLI loop: {e}")
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
 
+    def read_command(self) -> str:
+        """
+        次のコマンドを標準入力から読み取る。
+
+        Returns
+        -------
+            前後の空白を除いたコマンド文字列
+
+        Raises
+        ------
+            EOFError: 入力が終わった場合
+
+        """
+        if not self.renderer.diff_only:
+            return input("> ").strip()
+        line = sys.stdin.readline()
+        if not line:
+            raise EOFError
+        return line.strip()
+
     def process_command(self, command: str) -> bool | None:
         """
         コマンドを処理し、適切なアクションを実行。
@@ -163,6 +219,7 @@ class CLIEngine:
         """
         parts = command.lower().split()
         if not parts:
+            self.last_command_ok = False
             return None
 
         cmd = parts[0]
@@ -170,9 +227,10 @@ class CLIEngine:
 
         # 共通コマンドハンドラーを使用
         result = self.command_handler.handle_command(cmd, args)
+        self.last_command_ok = result.success
 
         if result.message:
-            print(result.message)
+            self.renderer.write(result.message)
 
         # 階段コマンド成功後の勝利チェック
         if (
@@ -182,9 +240,9 @@ class CLIEngine:
             and args[0].lower() in ["up", "u"]
             and self.game_logic.check_victory()
         ):
-            print("\n🎉 VICTORY! 🎉")
-            print("You have escaped with the Amulet of Yendor!")
-            print("You win the game!")
+            self.renderer.write("\n🎉 VICTORY! 🎉")
+            self.renderer.write("You have escaped with the Amulet of Yendor!")
+            self.renderer.write("You win the game!")
             self.running = False
             return True
 
@@ -210,16 +268,16 @@ class CLIEngine:
                 self.game_logic.player.hp = max(0, self.game_logic.player.hp - damage)
                 msg = f"Player took {damage} damage. HP: {self.game_logic.player.hp}/{self.game_logic.player.max_hp}"
                 self.game_logic.add_message(msg)
-                print(msg)
+                self.renderer.write(msg)
 
                 # 死亡チェック
                 if self.game_logic.player.hp <= 0:
                     self.game_logic.add_message("You have died!")
-                    print("You have died!")
+                    self.renderer.write("You have died!")
                     return False
                 return True
             except ValueError:
-                print("Invalid damage value")
+                self.renderer.write("Invalid damage value")
                 return False
         elif debug_cmd == "hp" and len(args) > 1:
             try:
@@ -227,16 +285,16 @@ class CLIEngine:
                 self.game_logic.player.hp = max(0, min(hp, self.game_logic.player.max_hp))
                 msg = f"Player HP set to {self.game_logic.player.hp}"
                 self.game_logic.add_message(msg)
-                print(msg)
+                self.renderer.write(msg)
 
                 # 死亡チェック
                 if self.game_logic.player.hp <= 0:
                     self.game_logic.add_message("You have died!")
-                    print("You have died!")
+                    self.renderer.write("You have died!")
                     return False
                 return True
             except ValueError:
-                print("Invalid HP value")
+                self.renderer.write("Invalid HP value")
                 return False
         elif debug_cmd == "kill" and len(args) > 1:
             try:
@@ -244,10 +302,10 @@ class CLIEngine:
                 self.game_logic.player.monsters_killed += count
                 msg = f"Added {count} monster kills. Total: {self.game_logic.player.monsters_killed}"
                 self.game_logic.add_message(msg)
-                print(msg)
+                self.renderer.write(msg)
                 return True
             except ValueError:
-                print("Invalid kill count value")
+                self.renderer.write("Invalid kill count value")
                 return False
         elif debug_cmd == "spawn":
             # 周囲にモンスターを生成
@@ -271,17 +329,19 @@ class CLIEngine:
                     view_range=3,
                     color=(255, 255, 255),
                 )
-                floor_data.monster_spawner.monsters.append(test_monster)
+                floor_data.monster_spawner.add_monster(test_monster)
                 msg = f"Spawned Test Bat at ({x}, {y})"
                 self.game_logic.add_message(msg)
-                print(msg)
+                self.renderer.write(msg)
                 return True
             msg = "Could not spawn monster"
             self.game_logic.add_message(msg)
-            print(msg)
+            self.renderer.write(msg)
             return False
         else:
-            print("Debug commands: 'debug damage <amount>', 'debug hp <value>', 'debug kill <count>', 'debug spawn'")
+            self.renderer.write(
+                "Debug commands: 'debug damage <amount>', 'debug hp <value>', 'debug kill <count>', 'debug spawn'"
+            )
             return False
 
     def handle_move(self, direction: str) -> bool:
@@ -309,7 +369,7 @@ class CLIEngine:
         }
 
         if direction not in direction_map:
-            print(f"Invalid direction: {direction}")
+            self.renderer.write(f"Invalid direction: {direction}")
             return False
 
         dx, dy = direction_map[direction]
@@ -318,15 +378,15 @@ class CLIEngine:
             # GameLogicの移動処理を呼び出し
             success = self.game_logic.handle_player_move(dx, dy)
             if success:
-                print(f"Moved {direction}")
+                self.renderer.write(f"Moved {direction}")
                 self.display_game_state()
                 # メッセージを表示
                 self.display_recent_messages()
             else:
-                print("Cannot move in that direction")
+                self.renderer.write("Cannot move in that direction")
             return success
         except Exception as e:
-            print(f"Error moving: {e}")
+            self.renderer.write(f"Error moving: {e}")
             return False
 
     def handle_attack(self, _target: str | None = None) -> bool:
@@ -359,14 +419,14 @@ class CLIEngine:
                     monster = current_floor.monster_spawner.get_monster_at(x, y)
                     if monster:
                         self.game_logic.handle_combat()
-                        print(f"Attacked {monster.name}!")
+                        self.renderer.write(f"Attacked {monster.name}!")
                         self.display_game_state()
                         return True
 
-            print("No enemy to attack")
+            self.renderer.write("No enemy to attack")
             return False
         except Exception as e:
-            print(f"Error attacking: {e}")
+            self.renderer.write(f"Error attacking: {e}")
             return False
 
     def handle_use_item(self, item_name: str) -> bool:
@@ -402,16 +462,16 @@ class CLIEngine:
 
                     success = self.game_logic.player.use_item(item, context=context)
                     if success:
-                        print(f"Used {item.name}")
+                        self.renderer.write(f"Used {item.name}")
                         self.display_game_state()
                         return True
-                    print(f"Cannot use {item.name}")
+                    self.renderer.write(f"Cannot use {item.name}")
                     return False
 
-            print(f"You don't have {item_name}")
+            self.renderer.write(f"You don't have {item_name}")
             return False
         except Exception as e:
-            print(f"Error using item: {e}")
+            self.renderer.write(f"Error using item: {e}")
             return False
 
     def handle_get_item(self) -> bool:
@@ -426,13 +486,13 @@ class CLIEngine:
         try:
             message = self.game_logic.handle_get_item()
             if message:
-                print(message)
+                self.renderer.write(message)
                 self.display_game_state()
             else:
-                print("There is nothing here to pick up.")
+                self.renderer.write("There is nothing here to pick up.")
             return message is not None
         except Exception as e:
-            print(f"Error getting item: {e}")
+            self.renderer.write(f"Error getting item: {e}")
             return False
 
     def handle_stairs(self, direction: str) -> bool:
@@ -454,11 +514,11 @@ class CLIEngine:
             elif direction.lower() in ["down", "d"]:
                 success = self.game_logic.descend_stairs()
             else:
-                print("Invalid direction. Use 'up' or 'down'")
+                self.renderer.write("Invalid direction. Use 'up' or 'down'")
                 return False
 
             if success:
-                print(f"Used stairs {direction}")
+                self.renderer.write(f"Used stairs {direction}")
 
                 # 勝利条件チェック（B1Fから上に脱出してアミュレットを持っている場合）
                 if (
@@ -466,55 +526,56 @@ class CLIEngine:
                     and self.game_logic.dungeon_manager.current_floor == 1
                     and self.game_logic.check_victory()
                 ):
-                    print("\n🎉 VICTORY! 🎉")
-                    print("You have escaped with the Amulet of Yendor!")
-                    print("You win the game!")
+                    self.renderer.write("\n🎉 VICTORY! 🎉")
+                    self.renderer.write("You have escaped with the Amulet of Yendor!")
+                    self.renderer.write("You win the game!")
                     self.running = False
                     return success
 
                 self.display_game_state()
                 self.display_recent_messages()
             else:
-                print(f"Cannot use stairs {direction}")
+                self.renderer.write(f"Cannot use stairs {direction}")
             return success
         except Exception as e:
-            print(f"Error using stairs: {e}")
+            self.renderer.write(f"Error using stairs: {e}")
             return False
 
     def display_recent_messages(self) -> None:
         """最近のメッセージを表示。"""
         try:
-            if self.game_logic.message_log:
-                recent_messages = self.game_logic.message_log[-3:]  # 最新の3つ
-                if recent_messages:
-                    print("\nMessages:")
-                    for msg in recent_messages:
-                        print(f"  {msg}")
+            recent_messages = self.game_logic.message_log[-3:]  # 最新の3つ
+            self.renderer.section("messages", [f"  {msg}" for msg in recent_messages], title="Messages:")
         except Exception as e:
-            print(f"Error displaying messages: {e}")
+            self.renderer.write(f"Error displaying messages: {e}")
 
     def display_game_state(self) -> None:
         """現在のゲーム状態を表示。"""
         try:
             if not self.game_logic.player:
-                print("Game not initialized")
+                self.renderer.write("Game not initialized")
                 return
 
             player = self.game_logic.player
 
-            print("\n" + "=" * 50)
-            print(f"Floor: B{self.game_logic.dungeon_manager.current_floor}F")
-            print(f"Player: ({player.x}, {player.y})")
-            print(f"HP: {player.hp}/{player.max_hp}")
-            print(f"Level: {player.level}")
-            print(f"Gold: {player.gold}")
-            print(f"Hunger: {player.hunger}%")
+            self.renderer.section(
+                "state",
+                [
+                    f"Floor: B{self.game_logic.dungeon_manager.current_floor}F",
+                    f"Player: ({player.x}, {player.y})",
+                    f"HP: {player.hp}/{player.max_hp}",
+                    f"Level: {player.level}",
+                    f"Gold: {player.gold}",
+                    f"Hunger: {player.hunger}%",
+                ],
+                title="=" * 50,
+            )
 
             # 周囲の情報を表示
             self.display_surroundings()
 
         except Exception as e:
-            print(f"Error displaying game state: {e}")
+            self.renderer.write(f"Error displaying game state: {e}")
 
     def display_surroundings(self) -> None:
         """プレイヤーの周囲の情報を表示。"""
@@ -524,51 +585,67 @@ class CLIEngine:
 
             player = self.game_logic.player
             floor_data = self.game_logic.get_current_floor_data()
-
-            print("\nSurroundings:")
+            height, width = floor_data.tiles.shape
 
             # 周囲のタイルを確認
+            tile_lines = []
             for dy in range(-1, 2):
                 for dx in range(-1, 2):
                     if dx == 0 and dy == 0:
                         continue
 
                     x, y = player.x + dx, player.y + dy
-                    if 0 <= y < floor_data.tiles.shape[0] and 0 <= x < floor_data.tiles.shape[1]:
+                    if 0 <= y < height and 0 <= x < width:
                         tile = floor_data.tiles[y, x]
                         direction = self.get_direction_name(dx, dy)
                         tile_name = getattr(tile, "name", tile.__class__.__name__)
-                        print(f"  {direction}: {tile_name}")
-
-            # 周囲の敵を表示
-            nearby_enemies = []
-            for monster in floor_data.monster_spawner.monsters:
-                distance = abs(monster.x - player.x) + abs(monster.y - player.y)
-                if distance <= 2:  # 隣接しているか近く
-                    nearby_enemies.append(monster)
-
-            if nearby_enemies:
-                print("\nNearby enemies:")
-                for enemy in nearby_enemies:
-                    print(f"  {enemy.name} at ({enemy.x}, {enemy.y}) - HP: {enemy.hp}/{enemy.max_hp}")
+                        tile_lines.append(f"  {direction}: {tile_name}")
+            self.renderer.section("surroundings", tile_lines, title="Surroundings:")
+
+            # 周囲の敵を表示（空間インデックスで範囲内だけを取得）
+            nearby_enemies = self.game_logic.get_nearby_enemies()
+            self.renderer.section(
+                "enemies",
+                [
+                    f"  {enemy.name} at ({enemy.x}, {enemy.y}) - HP: {enemy.hp}/{enemy.max_hp}"
+                    for enemy in nearby_enemies
+                ],
+                title="Nearby enemies:",
+            )
 
             # 周囲のアイテムを表示
-            nearby_items = []
-            for item in floor_data.item_spawner.items:
-                distance = abs(item.x - player.x) + abs(item.y - player.y)
-                if distance <= 1:  # 隣接または同じ位置
-                    nearby_items.append(item)
-
-            if nearby_items:
-                print("\nNearby items:")
-                for item in nearby_items:
-                    if item.x == player.x and item.y == player.y:
-                        print(f"  {item.name} (here - type 'get' to pick up)")
-                    else:
-                        print(f"  {item.name} at ({item.x}, {item.y})")
+            self.renderer.section("items", self._nearby_item_lines(floor_data), title="Nearby items:")
 
         except Exception as e:
-            print(f"Error displaying surroundings: {e}")
+            self.renderer.write(f"Error displaying surroundings: {e}")
+
+    def _nearby_item_lines(self, floor_data) -> list[str]:
+        """
+        隣接または同じ位置にあるアイテムの表示行を取得。
+
+        アイテムは拾う・落とす以外では動かないため、階層・プレイヤー位置・
+        アイテム数が前回と同じ場合は床のアイテムを走査し直しません。
+        """
+        player = self.game_logic.player
+        items = floor_data.item_spawner.items
+        key = (player.x, player.y, len(items))
+        if items is self._nearby_items_source and key == self._nearby_items_key:
+            return self._nearby_items_lines
+
+        lines = []
+        for item in items:
+            distance = abs(item.x - player.x) + abs(item.y - player.y)
+            if distance > 1:  # 隣接または同じ位置のみ
+                continue
+            if item.x == player.x and item.y == player.y:
+                lines.append(f"  {item.name} (here - type 'get' to pick up)")
+            else:
+                lines.append(f"  {item.name} at ({item.x}, {item.y})")
+
+        self._nearby_items_source = items
+        self._nearby_items_key = key
+        self._nearby_items_lines = lines
+        return lines
 
     def get_direction_name(self, dx: int, dy: int) -> str:
         """座標の差から方向名を取得。"""
@@ -594,78 +671,97 @@ class CLIEngine:
         """プレイヤーの詳細ステータスを表示。"""
         try:
             if not self.game_logic.player:
-                print("Game not initialized")
+                self.renderer.write("Game not initialized")
                 return
 
             player = self.game_logic.player
 
-            print("\n" + "=" * 30)
-            print("PLAYER STATUS")
-            print("=" * 30)
-            print(f"Level: {player.level}")
-            print(f"HP: {player.hp}/{player.max_hp}")
-            print(f"Attack: {player.get_attack()}")
-            print(f"Defense: {player.get_defense()}")
-            print(f"Gold: {player.gold}")
-            print(f"Hunger: {player.hunger}%")
-            print(f"Position: ({player.x}, {player.y})")
-            print(f"EXP: {player.exp}")
-            print(f"Monsters Killed: {player.monsters_killed}")
-            print(f"Deepest Floor: {player.deepest_floor}")
-            print(f"Turns Played: {player.turns_played}")
-            print(f"Score: {player.calculate_score()}")
-            print(f"Has Amulet: {'Yes' if getattr(player, 'has_amulet', False) else 'No'}")
+            lines = [
+                f"Level: {player.level}",
+                f"HP: {player.hp}/{player.max_hp}",
+                f"Attack: {player.get_attack()}",
+                f"Defense: {player.get_defense()}",
+                f"Gold: {player.gold}",
+                f"Hunger: {player.hunger}%",
+                f"Position: ({player.x}, {player.y})",
+                f"EXP: {player.exp}",
+                f"Monsters Killed: {player.monsters_killed}",
+                f"Deepest Floor: {player.deepest_floor}",
+                f"Turns Played: {player.turns_played}",
+                f"Score: {player.calculate_score()}",
+                f"Has Amulet: {'Yes' if getattr(player, 'has_amulet', False) else 'No'}",
+            ]
 
             # 現在の足下のタイルを表示
             floor_data = self.game_logic.get_current_floor_data()
             if floor_data:
                 current_tile = floor_data.tiles[player.y, player.x]
-                print(f"Current tile: {current_tile.__class__.__name__}")
+                lines.append(f"Current tile: {current_tile.__class__.__name__}")
                 if hasattr(current_tile, "char"):
-                    print(f"Tile char: '{current_tile.char}'")
+                    lines.append(f"Tile char: '{current_tile.char}'")
+
+            self.renderer.section("status", lines, title=f"{'=' * 30}\nPLAYER STATUS\n{'=' * 30}")
 
         except Exception as e:
-            print(f"Error displaying player status: {e}")
+            self.renderer.write(f"Error displaying player status: {e}")
 
     def display_inventory(self) -> None:
         """インベントリを表示。"""
         try:
             if not self.game_logic.player:
-                print("Game not initialized")
+                self.renderer.write("Game not initialized")
                 return
 
             inventory = self.game_logic.inventory
+            self.renderer.section(
+                "inventory", self._inventory_lines(inventory), title=f"{'=' * 30}\nINVENTORY\n{'=' * 30}"
+            )
 
-            print("\n" + "=" * 30)
-            print("INVENTORY")
-            print("=" * 30)
+        except Exception as e:
+            self.renderer.write(f"Error displaying inventory: {e}")
 
-            if not inventory.items:
-                print("Inventory is empty")
-            else:
-                for i, item in enumerate(inventory.items):
-                    equipped_str = ""
-                    if hasattr(item, "item_type"):
-                        if inventory.is_equipped(item):
-                            slot = inventory.get_equipped_slot(item)
-                            if slot == "ring_left":
-                                equipped_str = " (E-L)"
-                            elif slot == "ring_right":
-                                equipped_str = " (E-R)"
-                            else:
-                                equipped_str = " (E)"
-                    print(f"{i + 1}. {item.name}{equipped_str}")
-
-            # 装備情報を表示
-            equipped = inventory.equipped
-            print("\nEquipment:")
-            print(f"  Weapon: {equipped['weapon'].name if equipped['weapon'] else 'None'}")
-            print(f"  Armor: {equipped['armor'].name if equipped['armor'] else 'None'}")
-            print(f"  Ring(L): {equipped['ring_left'].name if equipped['ring_left'] else 'None'}")
-            print(f"  Ring(R): {equipped['ring_right'].name if equipped['ring_right'] else 'None'}")
+    def _inventory_lines(self, inventory: Inventory) -> list[str]:
+        """
+        所持品と装備の表示行を取得。
 
-        except Exception as e:
-            print(f"Error displaying inventory: {e}")
+        インベントリの世代番号が変わるまで前回の結果を再利用します。
+        """
+        if inventory is self._inventory_source and inventory.version == self._inventory_version:
+            return self._inventory_lines_cache
+
+        lines = []
+        if not inventory.items:
+            lines.append("Inventory is empty")
+        else:
+            for i, item in enumerate(inventory.items):
+                equipped_str = ""
+                if hasattr(item, "item_type"):
+                    if inventory.is_equipped(item):
+                        slot = inventory.get_equipped_slot(item)
+                        if slot == "ring_left":
+                            equipped_str = " (E-L)"
+                        elif slot == "ring_right":
+                            equipped_str = " (E-R)"
+                        else:
+                            equipped_str = " (E)"
+                lines.append(f"{i + 1}. {item.name}{equipped_str}")
+
+        # 装備情報を表示
+        equipped = inventory.equipped
+        lines.extend(
+            [
+                "\nEquipment:",
+                f"  Weapon: {equipped['weapon'].name if equipped['weapon'] else 'None'}",
+                f"  Armor: {equipped['armor'].name if equipped['armor'] else 'None'}",
+                f"  Ring(L): {equipped['ring_left'].name if equipped['ring_left'] else 'None'}",
+                f"  Ring(R): {equipped['ring_right'].name if equipped['ring_right'] else 'None'}",
+            ]
+        )
+
+        self._inventory_source = inventory
+        self._inventory_version = inventory.version
+        self._inventory_lines_cache = lines
+        return lines
 
     def update_game_state(self) -> None:
         """ゲーム状態を更新。"""
@@ -673,22 +769,22 @@ class CLIEngine:
             # ゲームオーバー条件のみをチェック
             # 勝利条件は ascend_stairs メソッド内でのみチェックする
             if self.game_logic.check_player_death():
-                print("\nGAME OVER!")
-                print(f"You died on floor B{self.game_logic.dungeon_manager.current_floor}F.")
+                self.renderer.write("\nGAME OVER!")
+                self.renderer.write(f"You died on floor B{self.game_logic.dungeon_manager.current_floor}F.")
                 self.running = False
 
         except Exception as e:
-            print(f"Error updating game state: {e}")
+            self.renderer.write(f"Error updating game state: {e}")
 
     def show_help(self) -> None:
         """利用可能なコマンドを表示。"""
-        print("\nAvailable Commands:")
-        print("  move <direction>  - Move player (north/south/east/west/n/s/e/w)")
-        print("  get               - Pick up item at current position (, key)")
-        print("  stairs <up/down>  - Use stairs (up/down)")
-        print("  inventory         - Show inventory")
-        print("  status            - Show player status")
-        print("  look              - Show current surroundings")
-        print("  help              - Show this help message")
-        print("  quit/exit         - Exit the game")
-        print()
+        self.renderer.write("\nAvailable Commands:")
+        self.renderer.write("  move <direction>  - Move player (north/south/east/west/n/s/e/w)")
+        self.renderer.write("  get               - Pick up item at current position (, key)")
+        self.renderer.write("  stairs <up/down>  - Use stairs (up/down)")
+        self.renderer.write("  inventory         - Show inventory")
+        self.renderer.write("  status            - Show player status")
+        self.renderer.write("  look              - Show current surroundings")
+        self.renderer.write("  help              - Show this help message")
+        self.renderer.write("  quit/exit         - Exit the game")
+        self.renderer.write()
@@ -0,0 +1,143 @@
+"""
+CLI 出力レンダラーモジュール。
+
+このモジュールは、CLIモードの出力を1コマンド分ずつバッファに貯め、
+1回の書き込みで出力するレンダラーを提供します。ステータスや周囲の情報は
+セクションとして前回出力した内容を保持し、quiet / json モードでは
+変化したセクションだけを出力します。
+
+出力モード:
+    - text: 従来どおり全ての情報を表示（既定）
+    - quiet: 結果メッセージと変化したセクションだけを表示
+    - json: 1コマンドにつき1行のJSONオブジェクトを出力
+
+Example:
+-------
+    >>> renderer = CLIRenderer("quiet")
+    >>> renderer.section("state", ["HP: 12/12"], title="=" * 50)
+    >>> renderer.flush("look")
+
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing import TextIO
+
+# 利用できる出力モード
+OUTPUT_MODES = ("text", "quiet", "json")
+
+
+class CLIRenderer:
+    """
+    CLIモードの出力をコマンド単位でまとめるレンダラー。
+
+    Attributes
+    ----------
+        mode: 出力モード（text / quiet / json）
+        stream: 出力先（Noneの場合は標準出力）
+
+    """
+
+    def __init__(self, mode: str = "text", stream: TextIO | None = None) -> None:
+        """
+        レンダラーを初期化。
+
+        Args:
+        ----
+            mode: 出力モード（text / quiet / json）
+            stream: 出力先（Noneの場合は書き込み時点の標準出力）
+
+        Raises:
+        ------
+            ValueError: 未知の出力モードが指定された場合
+
+        """
+        if mode not in OUTPUT_MODES:
+            msg = f"Unknown output mode: {mode}"
+            raise ValueError(msg)
+        self.mode = mode
+        self.stream = stream
+        self._lines: list[str] = []
+        self._changed: dict[str, list[str]] = {}
+        # セクション名から前回出力した行への辞書
+        self._last_sections: dict[str, list[str]] = {}
+
+    @property
+    def diff_only(self) -> bool:
+        """変化したセクションだけを出力するモードかどうか。"""
+        return self.mode != "text"
+
+    def write(self, text: str = "", *, verbose: bool = False) -> None:
+        """
+        出力する行をバッファに追加。
+
+        Args:
+        ----
+            text: 出力する文字列（改行を含んでもよい）
+            verbose: Trueの場合はtextモードでのみ出力する補足情報
+
+        """
+        if verbose and self.diff_only:
+            return
+        self._lines.append(text)
+
+    def section(self, name: str, lines: list[str], title: str | None = None) -> None:
+        """
+        前回と比較するセクションを出力。
+
+        textモードでは常に出力し、それ以外のモードでは前回出力した
+        内容から変化した場合だけ出力します。
+
+        Args:
+        ----
+            name: セクション名（比較とJSONのキーに使用）
+            lines: セクションの行
+            title: 見出し（前に空行を入れて出力する）
+
+        """
+        if self.diff_only:
+            if self._last_sections.get(name) == lines:
+                return
+            self._last_sections[name] = lines
+            if self.mode == "json":
+                self._changed[name] = [line.strip() for line in lines]
+                return
+            # 空になったことも変化として伝える
+            lines = lines or ["  (none)"]
+        elif not lines:
+            return
+
+        if title is not None:
+            self._lines.append(f"\n{title}")
+        self._lines.extend(lines)
+
+    def flush(self, command: str | None = None, ok: bool = True) -> None:
+        """
+        バッファの内容を1回の書き込みで出力。
+
+        Args:
+        ----
+            command: 出力のもとになったコマンド（jsonモードで使用）
+            ok: コマンドが成功したかどうか（jsonモードで使用）
+
+        """
+        stream = self.stream or sys.stdout
+        if self.mode == "json" and (command is not None or self._lines or self._changed):
+            record: dict[str, Any] = {"command": command, "ok": ok}
+            if self._lines:
+                record["output"] = "\n".join(self._lines).strip("\n").split("\n")
+            if self._changed:
+                record["changed"] = self._changed
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        elif self._lines:
+            stream.write("\n".join(self._lines) + "\n")
+        else:
+            return
+        stream.flush()
+        self._lines = []
+        self._changed = {}
@@ -90,7 +90,7 @@ class CommonCommandHandler:
         if args is None:
             args = []
 
-        game_logger.debug(f"Handling command: {command} with args: {args}")
+        game_logger.debug("Handling command: %s with args: %s", command, args)
 
         # 移動コマンド
         if command in ["move", "north", "south", "east", "west", "n", "s", "e", "w"]:
@@ -384,18 +384,30 @@ Available Commands:
                     self.context.add_message("You cannot rest with enemies nearby!")
                     return CommandResult(False)
 
-        # 完全回復するまで休憩
-        turns_rested = 0
-        while player.hp < player.max_hp:
-            player.hp = min(player.max_hp, player.hp + 1)
-            turns_rested += 1
-
-            # 100ターン以上は無理
-            if turns_rested >= 100:
-                break
+        if player.hp >= player.max_hp:
+            self.context.add_message("You are already at full health.")
+            return CommandResult(True)
 
-        self.context.add_message(f"You rest for {turns_rested} turns and recover {turns_rested} HP.")
-        return CommandResult(True, should_end_turn=True)
+        # 完全回復するまでターンを一括で進める（2ターンで1HP回復、最大100HP分）
+        from pyrogue.core.managers.turn_manager import TurnInterrupt
+
+        hp_before = player.hp
+        result = game_logic.simulate_turns(
+            min(player.max_hp - player.hp, 100) * 2,
+            stop_conditions={
+                TurnInterrupt.MONSTER_IN_VIEW,
+                TurnInterrupt.DAMAGE_TAKEN,
+                TurnInterrupt.HUNGER_THRESHOLD,
+                TurnInterrupt.FULL_HP,
+            },
+            watch_radius=5,
+            hp_regen_interval=2,
+        )
+
+        if result.interrupt == TurnInterrupt.MONSTER_IN_VIEW:
+            self.context.add_message("Your rest is interrupted by a monster!")
+        self.context.add_message(f"You rest for {result.turns} turns and recover {max(0, player.hp - hp_before)} HP.")
+        return CommandResult(True)
 
     def _handle_throw(self, args: list[str]) -> CommandResult:
         """投げるコマンドの処理。"""
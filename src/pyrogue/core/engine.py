@@ -21,24 +21,45 @@ Example:
 
 from __future__ import annotations
 
+import time
+from functools import cached_property
+from typing import TYPE_CHECKING
+
 import tcod
 import tcod.console
 import tcod.event
 import tcod.tileset
 
 from pyrogue.config import CONFIG
+from pyrogue.config.env import get_map_size
 from pyrogue.core.game_states import GameStates
 from pyrogue.core.input_handlers import StateManager
 from pyrogue.core.save_manager import SaveManager
-from pyrogue.ui.screens.game_over_screen import GameOverScreen
-from pyrogue.ui.screens.game_screen import GameScreen
-from pyrogue.ui.screens.help_menu_screen import HelpMenuScreen
-from pyrogue.ui.screens.inventory_screen import InventoryScreen
-from pyrogue.ui.screens.menu_screen import MenuScreen
-from pyrogue.ui.screens.quick_guide_screen import QuickGuideScreen
-from pyrogue.ui.screens.symbol_explanation_screen import SymbolExplanationScreen
-from pyrogue.ui.screens.victory_screen import VictoryScreen
-from pyrogue.utils import game_logger
+from pyrogue.utils import frame_timer, game_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from pyrogue.ui.screens.game_over_screen import GameOverScreen
+    from pyrogue.ui.screens.game_screen import GameScreen
+    from pyrogue.ui.screens.help_menu_screen import HelpMenuScreen
+    from pyrogue.ui.screens.inventory_screen import InventoryScreen
+    from pyrogue.ui.screens.menu_screen import MenuScreen
+    from pyrogue.ui.screens.quick_guide_screen import QuickGuideScreen
+    from pyrogue.ui.screens.symbol_explanation_screen import SymbolExplanationScreen
+    from pyrogue.ui.screens.victory_screen import VictoryScreen
+    from pyrogue.utils.startup_profiler import StartupProfiler
+
+# コンソールを参照する画面の属性名（リサイズ時に作成済みのものだけ更新する）
+_CONSOLE_SCREENS = (
+    "menu_screen",
+    "help_menu_screen",
+    "symbol_explanation_screen",
+    "quick_guide_screen",
+    "game_screen",
+    "game_over_screen",
+    "victory_screen",
+)
 
 
 class Engine:
@@ -51,7 +72,7 @@ class Engine:
     特徴:
         - 状態ベースの画面管理
         - リサイズ可能なウィンドウサポート
-        - イベント駆動型アーキテクチャ
+        - イベント駆動型アーキテクチャ（表示が変わった時だけ描画）
         - 統合されたログ機能
         - エラー処理とリソース管理
 
@@ -62,9 +83,13 @@ class Engine:
         console: TCODコンソールオブジェクト
         state: 現在のゲーム状態
         running: ゲームループ実行フラグ
-        menu_screen: メニュー画面インスタンス
+        menu_screen: メニュー画面インスタンス（各画面は初回アクセス時に作成）
         game_screen: ゲーム画面インスタンス
         game_over_screen: ゲームオーバー画面インスタンス
+        startup_profiler: 起動時間の計測（最初の画面転送時に報告、無効時はNone）
+        needs_redraw: 次のループで必ず描画するかどうか
+        frame_count: これまでに描画した回数
+        present_count: これまでに画面へ転送した回数
 
     """
 
@@ -72,13 +97,14 @@ class Engine:
         """
         ゲームエンジンを初期化。
 
-        画面サイズの設定、コンソールの作成、各画面インスタンスの初期化を行います。
-        ゲーム状態はメニューから開始し、ログ機能を有効化します。
+        画面サイズの設定とコンソールの作成を行います。各画面インスタンスは
+        初回アクセス時に作成するため、メニューの表示にゲームロジックの
+        初期化は不要です。ゲーム状態はメニューから開始し、ログ機能を有効化します。
         """
         self.screen_width = CONFIG.display.SCREEN_WIDTH
         self.screen_height = CONFIG.display.SCREEN_HEIGHT
-        self.map_width = CONFIG.display.MAP_WIDTH
-        self.map_height = CONFIG.display.MAP_HEIGHT
+        # 画面より大きいマップはカメラでスクロール表示する
+        self.map_width, self.map_height = get_map_size(CONFIG.display.MAP_WIDTH, CONFIG.display.MAP_HEIGHT)
         self.title = "PyRogue"
         self.console = tcod.console.Console(self.screen_width, self.screen_height)
         self.state = GameStates.MENU
@@ -89,19 +115,18 @@ class Engine:
         # セーブマネージャーを初期化
         self.save_manager = SaveManager()
 
-        # 各画面インスタンスの初期化
-        self.menu_screen = MenuScreen(self.console, self)
-        self.help_menu_screen = HelpMenuScreen(self.console, self)
-        self.symbol_explanation_screen = SymbolExplanationScreen(self.console, self)
-        self.quick_guide_screen = QuickGuideScreen(self.console, self)
-        self.game_screen = GameScreen(self)
-        self.inventory_screen = InventoryScreen(self.game_screen)
-        self.game_over_screen = GameOverScreen(self.console, self)
-        self.victory_screen = VictoryScreen(self.console, self)
-
         # 前の状態を記録する変数
         self.previous_state = None
 
+        # 再描画の判定
+        self.needs_redraw = True
+        self.frame_count = 0
+        self.present_count = 0
+        self._last_frame_key: Hashable | None = None
+        self._last_frame_time = 0.0
+
+        self.startup_profiler: StartupProfiler | None = None
+
         game_logger.debug(
             "Initializing game engine",
             extra={
@@ -111,6 +136,62 @@ class Engine:
             },
         )
 
+    @cached_property
+    def menu_screen(self) -> MenuScreen:
+        """メニュー画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.menu_screen import MenuScreen
+
+        return MenuScreen(self.console, self)
+
+    @cached_property
+    def help_menu_screen(self) -> HelpMenuScreen:
+        """ヘルプ画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.help_menu_screen import HelpMenuScreen
+
+        return HelpMenuScreen(self.console, self)
+
+    @cached_property
+    def symbol_explanation_screen(self) -> SymbolExplanationScreen:
+        """記号説明画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.symbol_explanation_screen import SymbolExplanationScreen
+
+        return SymbolExplanationScreen(self.console, self)
+
+    @cached_property
+    def quick_guide_screen(self) -> QuickGuideScreen:
+        """クイックガイド画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.quick_guide_screen import QuickGuideScreen
+
+        return QuickGuideScreen(self.console, self)
+
+    @cached_property
+    def game_screen(self) -> GameScreen:
+        """ゲーム画面（初回アクセス時にゲームロジックごと作成）。"""
+        from pyrogue.ui.screens.game_screen import GameScreen
+
+        return GameScreen(self)
+
+    @cached_property
+    def inventory_screen(self) -> InventoryScreen:
+        """インベントリ画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.inventory_screen import InventoryScreen
+
+        return InventoryScreen(self.game_screen)
+
+    @cached_property
+    def game_over_screen(self) -> GameOverScreen:
+        """ゲームオーバー画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.game_over_screen import GameOverScreen
+
+        return GameOverScreen(self.console, self)
+
+    @cached_property
+    def victory_screen(self) -> VictoryScreen:
+        """勝利画面（初回アクセス時に作成）。"""
+        from pyrogue.ui.screens.victory_screen import VictoryScreen
+
+        return VictoryScreen(self.console, self)
+
     def initialize(self) -> None:
         """
         ゲームエンジンとTCODコンソールを初期化。
@@ -164,14 +245,10 @@ class Engine:
         # 新しいサイズでコンソールを再作成
         self.console = tcod.console.Console(self.screen_width, self.screen_height)
 
-        # 各画面インスタンスのコンソール参照を更新
-        self.menu_screen.update_console(self.console)
-        self.help_menu_screen.update_console(self.console)
-        self.symbol_explanation_screen.update_console(self.console)
-        self.quick_guide_screen.update_console(self.console)
-        self.game_screen.update_console(self.console)
-        self.game_over_screen.update_console(self.console)
-        self.victory_screen.update_console(self.console)
+        # 作成済みの画面インスタンスのコンソール参照を更新（未作成の画面は作成時に新しいコンソールを使う）
+        for name in _CONSOLE_SCREENS:
+            if name in self.__dict__:
+                self.__dict__[name].update_console(self.console)
 
         game_logger.debug(
             "Window resized",
@@ -185,55 +262,42 @@ class Engine:
         """
         メインゲームループを実行。
 
-        ゲームが終了するまでレンダリング、イベント処理、
-        状態更新のサイクルを継続します。例外処理とリソース
-        クリーンアップも含まれます。
+        表示内容が変わった時だけ描画して画面へ転送し、それ以外は
+        イベントを待って休止します。一度に届いたイベント（キーリピート等）は
+        まとめて処理してから1回だけ描画します。アニメーションする画面では
+        FRAME_CAPの間隔で描き直します。例外処理とリソースクリーンアップも含まれます。
         """
         self.running = True
+        self.needs_redraw = True
+        frame_interval = 1.0 / max(1, CONFIG.display.FRAME_CAP)
         game_logger.debug("Starting game loop")
 
         try:
             while self.running:
-                self.console.clear()
-
-                # 現在のゲーム状態に応じた画面を描画
-                if self.state == GameStates.MENU:
-                    self.menu_screen.render()
-                elif self.state == GameStates.HELP_MENU:
-                    self.help_menu_screen.render()
-                elif self.state == GameStates.SYMBOL_EXPLANATION:
-                    self.symbol_explanation_screen.render()
-                elif self.state == GameStates.QUICK_GUIDE:
-                    self.quick_guide_screen.render()
-                elif self.state == GameStates.PLAYERS_TURN:
-                    self.game_screen.render(self.console)
-                elif self.state == GameStates.SHOW_INVENTORY:
-                    self.inventory_screen.render(self.console)
-                elif self.state == GameStates.TARGETING:
-                    self.game_screen.render(self.console)
-                elif self.state == GameStates.GAME_OVER:
-                    self.game_over_screen.render()
-                elif self.state == GameStates.VICTORY:
-                    self.victory_screen.render()
-
-                self.context.present(self.console)
-
-                for event in tcod.event.wait():
-                    if event.type == "QUIT":
-                        game_logger.debug("Quit event received")
+                screen = self._get_current_screen()
+                animated = bool(getattr(screen, "animated", False))
+                now = time.perf_counter()
+                frame_key = self._frame_key(screen)
+                if (
+                    self.needs_redraw
+                    or frame_key != self._last_frame_key
+                    or (animated and now - self._last_frame_time >= frame_interval)
+                ):
+                    self._render_current_state()
+                    self._present()
+                    self._last_frame_key = frame_key
+                    self._last_frame_time = now
+                    self.needs_redraw = False
+
+                # アニメーション中は次のフレームまで、それ以外は入力があるまで待つ
+                timeout = None
+                if animated:
+                    timeout = max(0.0, self._last_frame_time + frame_interval - time.perf_counter())
+
+                for event in tcod.event.wait(timeout):
+                    if not self._dispatch_event(event):
                         self.running = False
                         break
-                    if event.type == "WINDOWRESIZED":
-                        self.handle_resize(event)
-                    elif event.type == "KEYDOWN":
-                        continue_game, new_state = self._handle_input(event)
-                        if not continue_game:
-                            self.running = False
-                            break
-                        if new_state:
-                            # 状態遷移時に前の状態を記録
-                            self.previous_state = self.state
-                            self.state = new_state
 
         except Exception as e:
             game_logger.error(
@@ -244,6 +308,92 @@ class Engine:
         finally:
             self.cleanup()
 
+    def _frame_key(self, screen: object) -> Hashable:
+        """
+        描画結果を決める値の組を取得（前回と等しければ描き直さない）。
+
+        Args:
+        ----
+            screen: 現在の画面インスタンス
+
+        Returns:
+        -------
+            状態・コンソール・画面の版数の組
+
+        """
+        return (self.state, id(self.console), getattr(screen, "version", None))
+
+    def _render_current_state(self) -> None:
+        """現在のゲーム状態に応じた画面をコンソールに描画。"""
+        self.console.clear()
+
+        if self.state == GameStates.MENU:
+            self.menu_screen.render()
+        elif self.state == GameStates.HELP_MENU:
+            self.help_menu_screen.render()
+        elif self.state == GameStates.SYMBOL_EXPLANATION:
+            self.symbol_explanation_screen.render()
+        elif self.state == GameStates.QUICK_GUIDE:
+            self.quick_guide_screen.render()
+        elif self.state == GameStates.PLAYERS_TURN:
+            self.game_screen.render(self.console)
+        elif self.state == GameStates.SHOW_INVENTORY:
+            self.inventory_screen.render(self.console)
+        elif self.state == GameStates.TARGETING:
+            self.game_screen.render(self.console)
+        elif self.state == GameStates.GAME_OVER:
+            self.game_over_screen.render()
+        elif self.state == GameStates.VICTORY:
+            self.victory_screen.render()
+
+        self.frame_count += 1
+
+    def _present(self) -> None:
+        """描画済みのコンソールを画面へ転送。"""
+        with frame_timer.scope("present"):
+            self.context.present(self.console)
+        self.present_count += 1
+
+        if self.present_count == 1 and self.startup_profiler:
+            self.startup_profiler.mark("first_frame")
+            self.startup_profiler.report()
+
+    def _dispatch_event(self, event: tcod.event.Event) -> bool:
+        """
+        イベントを1つ処理し、再描画が必要かどうかを記録。
+
+        Args:
+        ----
+            event: TCODイベント
+
+        Returns:
+        -------
+            ゲームを継続する場合はTrue
+
+        """
+        if isinstance(event, tcod.event.Quit):
+            game_logger.debug("Quit event received")
+            return False
+        if isinstance(event, tcod.event.WindowResized):
+            self.handle_resize(event)
+            self.needs_redraw = True
+        elif isinstance(event, tcod.event.WindowEvent) and event.type in ("WindowExposed", "WindowRestored"):
+            # ウィンドウが隠れていた場合は描画済みの内容を転送し直す
+            self._present()
+        elif isinstance(event, tcod.event.KeyDown):
+            with frame_timer.scope("input"):
+                continue_game, new_state = self._handle_input(event)
+            if not continue_game:
+                return False
+            if new_state:
+                # 状態遷移時に前の状態を記録
+                self.previous_state = self.state
+                self.state = new_state
+            if getattr(self._get_current_screen(), "version", None) is None:
+                # 版数を持たない画面は入力のたびに描き直す
+                self.needs_redraw = True
+        return True
+
     def _handle_input(self, event: tcod.event.KeyDown) -> tuple[bool, GameStates | None]:
         """
         キー入力イベントを処理。
@@ -7,18 +7,25 @@
 
 from __future__ import annotations
 
+import time
+from functools import cached_property
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from pyrogue.config.env import get_log_directory
 from pyrogue.core.managers.combat_manager import CombatManager
 from pyrogue.core.managers.floor_manager import FloorManager
 from pyrogue.core.managers.game_context import GameContext
 from pyrogue.core.managers.item_manager import ItemManager
 from pyrogue.core.managers.monster_ai_manager import MonsterAIManager
 from pyrogue.core.managers.movement_manager import MovementManager
-from pyrogue.core.managers.turn_manager import TurnManager
+from pyrogue.core.managers.turn_manager import SimulationResult, TurnInterrupt, TurnManager
+from pyrogue.core.message_log import MessageLog
 from pyrogue.core.score_manager import ScoreManager
 from pyrogue.entities.actors.player import Player
 from pyrogue.map.dungeon_manager import DungeonManager
+from pyrogue.utils import frame_timer
+from pyrogue.utils.spatial_hash import DistanceMetric
 
 if TYPE_CHECKING:
     from pyrogue.core.engine import Engine
@@ -68,11 +75,14 @@ class GameLogic:
         # ゲーム状態を直接管理
         self.player = Player(x=0, y=0)
         self.inventory = self.player.inventory  # プレイヤーのインベントリを参照
-        self.message_log: list[str] = [
-            "Welcome to PyRogue!",
-            "Use vi keys (hjklyubn), arrow keys, or numpad (1-9) to move.",
-            "Press ESC to return to menu.",
-        ]
+        self.message_log = MessageLog(
+            [
+                "Welcome to PyRogue!",
+                "Use vi keys (hjklyubn), arrow keys, or numpad (1-9) to move.",
+                "Press ESC to return to menu.",
+            ],
+            archive=True,
+        )
 
         # ダンジョン管理
         self.dungeon_manager = DungeonManager(dungeon_width, dungeon_height)
@@ -90,7 +100,6 @@ class GameLogic:
         self.combat_manager = CombatManager()
         self.turn_manager = TurnManager()
         self.monster_ai_manager = MonsterAIManager()
-        self.score_manager = ScoreManager()
 
         # ウィザードモード（デバッグ用）
         from pyrogue.config.env import get_debug_mode
@@ -117,6 +126,11 @@ class GameLogic:
         # 初期化状態を追跡
         self._is_initialized = False
 
+    @cached_property
+    def score_manager(self) -> ScoreManager:
+        """スコア管理（スコアファイルは初回アクセス時に読み込む）。"""
+        return ScoreManager()
+
     def toggle_wizard_mode(self) -> None:
         """ウィザードモードの切り替え。"""
         self.wizard_mode = not self.wizard_mode
@@ -198,6 +212,7 @@ class GameLogic:
                 tile = floor_data.tiles[y, x]
                 if isinstance(tile, SecretDoor) and tile.door_state == "secret":
                     tile.reveal()
+                    floor_data.tile_buffer.mark_dirty(floor_data.tiles, x, y)
 
         if hasattr(floor_data, "trap_spawner") and floor_data.trap_spawner:
             for trap in floor_data.trap_spawner.traps:
@@ -207,6 +222,42 @@ class GameLogic:
         self.add_message("[Wizard] All map revealed!")
         self._update_fov()
 
+    def wizard_toggle_timing(self) -> None:
+        """ウィザード機能: フレーム・ターン計測とオーバーレイ表示の切り替え。"""
+        if not self.wizard_mode:
+            self.add_message("Wizard mode required!")
+            return
+
+        frame_timer.show_overlay = not frame_timer.show_overlay
+        if frame_timer.show_overlay:
+            frame_timer.enable()
+            self.add_message("[Wizard] Timing overlay enabled")
+        else:
+            frame_timer.disable()
+            self.add_message("[Wizard] Timing overlay disabled")
+
+    def wizard_export_trace(self) -> Path | None:
+        """
+        ウィザード機能: 計測結果をChromeのトレースイベント形式で書き出す。
+
+        Returns
+        -------
+            書き出したファイルのパス（計測結果がない場合はNone）
+
+        """
+        if not self.wizard_mode:
+            self.add_message("Wizard mode required!")
+            return None
+
+        if not frame_timer.spans:
+            self.add_message("[Wizard] No timing data (enable with Ctrl+P)")
+            return None
+
+        filename = f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path = frame_timer.export_chrome_trace(Path(get_log_directory()) / filename)
+        self.add_message(f"[Wizard] Trace exported to {path}")
+        return path
+
     def setup_new_game(self) -> None:
         """新しいゲームをセットアップ。"""
         # 重複初期化を防ぐ
@@ -572,6 +623,7 @@ class GameLogic:
 
         if isinstance(tile, Door) and tile.door_state == "closed":
             tile.toggle()  # ドアを開く
+            floor_data.tile_buffer.mark_dirty(floor_data.tiles, x, y)
             self.add_message("You open the door.")
             # FOVを更新
             self._update_fov()
@@ -598,6 +650,7 @@ class GameLogic:
             # モンスターやプレイヤーがドアの上にいないかチェック
             if not self._is_position_occupied(x, y):
                 tile.toggle()  # ドアを閉じる
+                floor_data.tile_buffer.mark_dirty(floor_data.tiles, x, y)
                 self.add_message("You close the door.")
                 # FOVを更新
                 self._update_fov()
@@ -645,6 +698,7 @@ class GameLogic:
 
             if random.randint(1, 100) <= success_rate:
                 tile.reveal()  # 隠しドアを発見
+                floor_data.tile_buffer.mark_dirty(floor_data.tiles, x, y)
                 self.add_message("You found a secret door!")
                 # FOVを更新
                 self._update_fov()
@@ -779,11 +833,21 @@ class GameLogic:
 
         return np.full((self.dungeon_manager.height, self.dungeon_manager.width), False, dtype=bool)
 
-    def update_explored_tiles(self, visible_tiles) -> None:
-        """探索済みタイルを更新。"""
+    def update_explored_tiles(self, visible_tiles, origin: tuple[int, int] = (0, 0)) -> None:
+        """
+        探索済みタイルを更新。
+
+        Args:
+        ----
+            visible_tiles: 視界内マスのブール配列（マップ全体、またはoriginを左上とする部分配列）
+            origin: visible_tilesの左上に対応するマップ座標 (x, y)
+
+        """
         floor_data = self.get_current_floor_data()
         if floor_data and hasattr(floor_data, "explored"):
-            floor_data.explored |= visible_tiles
+            ox, oy = origin
+            height, width = visible_tiles.shape
+            floor_data.explored[oy : oy + height, ox : ox + width] |= visible_tiles
 
     # CLIモード互換メソッド
     def try_attack_adjacent_enemy(self) -> bool:
@@ -817,12 +881,8 @@ class GameLogic:
         if not floor_data or not hasattr(floor_data, "monster_spawner"):
             return enemies
 
-        for monster in floor_data.monster_spawner.monsters:
-            distance = abs(monster.x - player.x) + abs(monster.y - player.y)
-            if distance <= 2:  # 周囲2マス以内
-                enemies.append(monster)
-
-        return enemies
+        # 周囲2マス以内（マンハッタン距離）
+        return floor_data.monster_spawner.get_monsters_in_range(player.x, player.y, 2, DistanceMetric.MANHATTAN)
 
     def record_game_over(self, death_cause: str = "Unknown") -> None:
         """ゲームオーバー時のスコア記録"""
@@ -862,6 +922,51 @@ class GameLogic:
         # オートセーブ機能の実行
         self._handle_auto_save()
 
+    def simulate_turns(
+        self,
+        count: int,
+        stop_conditions: set[TurnInterrupt] | None = None,
+        watch_radius: int = 10,
+        view_mask=None,
+        hp_regen_interval: int | None = None,
+    ) -> SimulationResult:
+        """
+        複数ターンを一括で進める（長時間休憩などで使用）。
+
+        ターン処理はTurnManager.simulateに委譲し、
+        オートセーブは一括処理の終了時に一度だけ判定します。
+
+        Args:
+        ----
+            count: 最大経過ターン数
+            stop_conditions: 中断条件のセット（Noneの場合は全て）
+            watch_radius: モンスター接近とみなすマンハッタン距離
+            view_mask: 監視対象とする可視範囲
+            hp_regen_interval: 休憩によるHP回復間隔
+
+        Returns:
+        -------
+            一括処理の結果
+
+        """
+        start_turn = self.turn_manager.turn_count
+        result = self.turn_manager.simulate(
+            count,
+            self.context,
+            stop_conditions=stop_conditions,
+            watch_radius=watch_radius,
+            view_mask=view_mask,
+            hp_regen_interval=hp_regen_interval,
+        )
+
+        # 一括処理中にオートセーブ間隔を跨いだ場合のみ保存
+        from pyrogue.config.env import get_auto_save_enabled
+
+        if get_auto_save_enabled() and self.turn_manager.turn_count // 10 > start_turn // 10:
+            self._perform_auto_save()
+
+        return result
+
     def _handle_auto_save(self) -> None:
         """
         オートセーブ機能の処理。
@@ -929,7 +1034,7 @@ class GameLogic:
             "inventory": self._serialize_inventory(self.inventory),
             "current_floor": self.dungeon_manager.current_floor,
             "floor_data": self._serialize_all_floors(self.dungeon_manager.floors),
-            "message_log": self.message_log,
+            "message_log": self.message_log.to_save_data(),
             "has_amulet": getattr(self.player, "has_amulet", False),
             "turn_count": self.turn_manager.turn_count,
             "auto_save": True,  # オートセーブフラグ
@@ -1043,11 +1148,11 @@ class GameLogic:
 
     def get_message_history(self) -> list[str]:
         """
-        メッセージ履歴を取得。
+        メッセージ履歴を取得（アーカイブ済みの古いメッセージを含む）。
 
         Returns
         -------
             メッセージ履歴のリスト
 
         """
-        return self.message_log.copy()
+        return self.message_log.history()
@@ -10,6 +10,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from pyrogue.core.message_log import MessageLog
     from pyrogue.entities.actors.inventory import Inventory
     from pyrogue.entities.actors.player import Player
     from pyrogue.map.dungeon_manager import DungeonManager
@@ -27,7 +28,7 @@ class GameContext:
         player: プレイヤーオブジェクト
         inventory: インベントリオブジェクト
         dungeon_manager: ダンジョン管理オブジェクト
-        message_log: メッセージログリスト
+        message_log: メッセージログ
         engine: ゲームエンジン（CLIモードではNone）
         game_screen: ゲームスクリーン（UIコンテキスト用）
 
@@ -38,7 +39,7 @@ class GameContext:
         player: Player,
         inventory: Inventory,
         dungeon_manager: DungeonManager,
-        message_log: list[str],
+        message_log: MessageLog,
         engine: Any = None,
         game_screen: Any = None,
     ) -> None:
@@ -50,7 +51,7 @@ class GameContext:
             player: プレイヤーオブジェクト
             inventory: インベントリオブジェクト
             dungeon_manager: ダンジョン管理オブジェクト
-            message_log: メッセージログリスト
+            message_log: メッセージログ
             engine: ゲームエンジン（オプション）
             game_screen: ゲームスクリーン（オプション）
 
@@ -83,12 +84,8 @@ class GameContext:
         try:
             # 安全な文字列変換
             safe_message = str(message)[:200]  # 過度に長いメッセージを切り詰め
+            # 容量を超えた古いメッセージはメッセージログ側で押し出される
             self.message_log.append(safe_message)
-
-            # 原子的なサイズ制限処理（インプレース更新）
-            if len(self.message_log) > 200:
-                # 200件を超えた場合、150件まで削減（段階的な削減）
-                self.message_log[:] = self.message_log[-150:]
         except Exception as e:
             # メッセージ追加エラーを記録（重要：無限ループを避けるためprintを使用）
             print(f"Warning: Failed to add message '{message}': {e}")
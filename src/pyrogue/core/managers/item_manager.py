@@ -339,9 +339,11 @@ class ItemManager:
         if item not in inventory.items:
             # アイテムがインベントリに存在しない場合は追加
             inventory.items.append(item)
+            inventory.mark_changed()
         elif item_index >= 0:
             # アイテムが既に存在する場合は、元の位置に確実に配置
             inventory.items[item_index] = item
+            inventory.mark_changed()
 
     def _handle_old_item_and_message(self, old_item, item_name: str) -> bool:
         """
@@ -361,6 +363,7 @@ class ItemManager:
             # 古いアイテムがインベントリに存在していない場合は追加
             if old_item not in self.context.inventory.items:
                 self.context.inventory.items.append(old_item)
+                self.context.inventory.mark_changed()
             self.context.add_message(f"You unequip the {old_item.name} and equip the {item_name}.")
         else:
             self.context.add_message(f"You equip the {item_name}.")
@@ -10,14 +10,20 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 from pyrogue.constants import CombatConstants, GameConstants
 from pyrogue.core.managers.monster_behavior_manager import MonsterAIState, MonsterBehaviorManager
 from pyrogue.core.managers.monster_combat_manager import MonsterCombatManager
 from pyrogue.core.managers.pathfinding_manager import PathfindingManager
-from pyrogue.utils import game_logger
+from pyrogue.core.managers.tracking_manager import TrackingManager
+from pyrogue.utils import frame_timer, game_logger
 from pyrogue.utils.coordinate_utils import calculate_distance, get_direction_to_target, has_line_of_sight
+from pyrogue.utils.line_of_sight import PlayerSightMap
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pyrogue.core.managers.game_context import GameContext
     from pyrogue.entities.actors.monster import Monster
 
@@ -33,12 +39,13 @@ class MonsterAIManager:
     def __init__(self) -> None:
         """モンスターAIマネージャーを初期化。"""
         # 専門マネージャーの初期化
-        self._behavior_manager = MonsterBehaviorManager()
+        self._tracking_manager = TrackingManager()
+        self._behavior_manager = MonsterBehaviorManager(self._tracking_manager)
         self._combat_manager = MonsterCombatManager()
         self._pathfinding_manager = PathfindingManager()
 
-        # パフォーマンス最適化用の視界キャッシュ
-        self._vision_cache: dict[tuple[int, int], bool] = {}
+        # パフォーマンス最適化用の視線マップ（ターンごとに一度だけ再計算）
+        self._sight_map = PlayerSightMap(radius=GameConstants.DEFAULT_FOV_RADIUS)
         self._last_player_position: tuple[int, int] = (-1, -1)
 
     def process_monster_ai(self, monster: Monster, context: GameContext) -> None:
@@ -164,6 +171,10 @@ class MonsterAIManager:
             self._behavior_manager.try_move_monster(monster, dx, dy, context)
             return
 
+        # 共有フローフィールドに沿って追跡
+        if self._behavior_manager.move_along_flow(monster, (player.x, player.y), context):
+            return
+
         # 高度な経路探索を試行
         if self._use_pathfinding(monster, player, context):
             return
@@ -187,7 +198,8 @@ class MonsterAIManager:
 
         """
         # 経路を探索
-        path = self._pathfinding_manager.find_path(monster.x, monster.y, player.x, player.y, context)
+        with frame_timer.scope("ai.pathing"):
+            path = self._pathfinding_manager.find_path(monster.x, monster.y, player.x, player.y, context)
 
         if path and len(path) > 1:
             # 次の位置に移動
@@ -240,7 +252,7 @@ class MonsterAIManager:
 
     def _can_monster_see_player_cached(self, monster: Monster, player, context: GameContext) -> bool:
         """
-        モンスターがプレイヤーを見ることができるかキャッシュ付きでチェック。
+        モンスターがプレイヤーを見ることができるか視線マップを用いてチェック。
 
         Args:
         ----
@@ -253,22 +265,16 @@ class MonsterAIManager:
             プレイヤーが見える場合True
 
         """
-        monster_pos = (monster.x, monster.y)
-
-        # キャッシュから結果を取得
-        if monster_pos in self._vision_cache:
-            return self._vision_cache[monster_pos]
-
-        # キャッシュにない場合は計算
-        can_see = self._can_monster_see_player(monster, player, context)
-        self._vision_cache[monster_pos] = can_see
-
-        return can_see
+        with frame_timer.scope("ai.vision"):
+            return self._can_monster_see_player(monster, player, context)
 
     def _can_monster_see_player(self, monster: Monster, player, context: GameContext) -> bool:
         """
         モンスターがプレイヤーを見ることができるかチェック。
 
+        視界範囲が視線マップに収まる場合は配列参照のみで判定し、
+        それ以外はブレゼンハム線分による判定にフォールバックします。
+
         Args:
         ----
             monster: モンスター
@@ -288,8 +294,34 @@ class MonsterAIManager:
             return False
 
         # 障害物チェック（壁越しには見えない）
+        if self._sight_map.covers(sight_range) and self._ensure_sight_map(player, context):
+            return self._sight_map.can_see_player_from(monster.x, monster.y)
+
         return has_line_of_sight(monster.x, monster.y, player.x, player.y, context)
 
+    def _ensure_sight_map(self, player, context: GameContext) -> bool:
+        """
+        現在のフロア・プレイヤー位置に対する視線マップを用意。
+
+        Args:
+        ----
+            player: プレイヤー
+            context: ゲームコンテキスト
+
+        Returns:
+        -------
+            視線マップが利用可能な場合True
+
+        """
+        floor_data = context.get_current_floor_data()
+        tiles = getattr(floor_data, "tiles", None)
+        if not isinstance(tiles, np.ndarray):
+            return False
+
+        if not self._sight_map.is_current(tiles, player.x, player.y):
+            self._sight_map.update(tiles, player.x, player.y)
+        return True
+
     def _should_flee(self, monster: Monster) -> bool:
         """
         モンスターが逃走すべきかチェック。
@@ -332,7 +364,7 @@ class MonsterAIManager:
         """
         # 戦闘処理はCombatManagerに委譲
         # ここではAIの観点での攻撃決定のみ
-        game_logger.debug(f"{monster.name} attacks player")
+        game_logger.debug("%s attacks player", monster.name)
 
     def process_all_monsters(self, context: GameContext) -> None:
         """
@@ -347,10 +379,15 @@ class MonsterAIManager:
         if not floor_data or not hasattr(floor_data, "monster_spawner"):
             return
 
-        # プレイヤーの位置が変わった場合、キャッシュをクリア
+        # 視線マップはターンごとに再計算（ドアの開閉を反映するため）
+        self._sight_map.invalidate()
+
+        # プレイヤーの足跡を追跡マップに記録
+        self._tracking_manager.record_player_position(context)
+
+        # プレイヤーの位置が変わった場合、経路キャッシュをクリア
         player_pos = (context.player.x, context.player.y)
         if player_pos != self._last_player_position:
-            self._vision_cache.clear()
             self._pathfinding_manager.clear_cache()
             self._last_player_position = player_pos
 
@@ -390,7 +427,7 @@ class MonsterAIManager:
             if distance <= active_radius:
                 active_monsters.append(monster)
 
-        game_logger.debug(f"Active monsters: {len(active_monsters)}/{len(monsters)}")
+        game_logger.debug("Active monsters: %d/%d", len(active_monsters), len(monsters))
         return active_monsters
 
     def get_monster_behavior_info(self, monster: Monster, context: GameContext) -> dict:
@@ -437,6 +474,32 @@ class MonsterAIManager:
             else:
                 monster.sight_range = getattr(monster, "sight_range", 8) // 2  # type: ignore
 
+    def set_move_listener(self, listener: Callable[[Monster, int, int], None] | None) -> None:
+        """
+        モンスター移動時の通知先を設定。
+
+        Args:
+        ----
+            listener: (monster, new_x, new_y)を受け取る関数、Noneで解除
+
+        """
+        self._behavior_manager.set_move_listener(listener)
+
+    def set_monster_state(self, monster: Monster, state: MonsterAIState, target: tuple[int, int] | None = None) -> None:
+        """
+        モンスターのAI状態を設定。
+
+        Args:
+        ----
+            monster: 対象モンスター
+            state: 新しい状態
+            target: 追跡目標位置（省略時は変更しない）
+
+        """
+        self._behavior_manager.set_monster_state(id(monster), state)
+        if target is not None:
+            self._behavior_manager.set_target_position(id(monster), target)
+
     def split_monster_on_damage(self, monster: Monster, context: GameContext) -> None:
         """
         ダメージを受けた時のモンスター分裂処理。
@@ -12,10 +12,14 @@ from enum import Enum
 from typing import TYPE_CHECKING
 
 from pyrogue.constants import CombatConstants, ProbabilityConstants
-from pyrogue.utils import game_logger
+from pyrogue.utils import frame_timer, game_logger
+from pyrogue.utils.spatial_hash import DistanceMetric
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pyrogue.core.managers.game_context import GameContext
+    from pyrogue.core.managers.tracking_manager import TrackingManager
     from pyrogue.entities.actors.monster import Monster
 
 
@@ -41,13 +45,36 @@ class MonsterBehaviorManager:
     モンスターの状態管理、移動処理、協調行動を担当します。
     """
 
-    def __init__(self) -> None:
-        """モンスター行動マネージャーを初期化。"""
+    def __init__(self, tracking_manager: TrackingManager | None = None) -> None:
+        """
+        モンスター行動マネージャーを初期化。
+
+        Args:
+        ----
+            tracking_manager: 匂い・フローフィールドによる追跡マップ（省略時は直線移動のみ）
+
+        """
+        self._tracking_manager = tracking_manager
+
         # AI状態管理
         self._monster_states: dict[int, MonsterAIState] = {}
         self._monster_target_positions: dict[int, tuple[int, int]] = {}
         self._monster_alert_timers: dict[int, int] = {}
 
+        # モンスター移動の通知先（ターン一括処理の中断検出用）
+        self._move_listener: Callable[[Monster, int, int], None] | None = None
+
+    def set_move_listener(self, listener: Callable[[Monster, int, int], None] | None) -> None:
+        """
+        モンスター移動時の通知先を設定。
+
+        Args:
+        ----
+            listener: (monster, new_x, new_y)を受け取る関数、Noneで解除
+
+        """
+        self._move_listener = listener
+
     def get_monster_state(self, monster_id: int) -> MonsterAIState:
         """
         モンスターの現在の状態を取得。
@@ -75,6 +102,18 @@ class MonsterBehaviorManager:
         """
         self._monster_states[monster_id] = new_state
 
+    def set_target_position(self, monster_id: int, position: tuple[int, int]) -> None:
+        """
+        モンスターの追跡目標位置を設定。
+
+        Args:
+        ----
+            monster_id: モンスターID
+            position: 目標位置 (x, y)
+
+        """
+        self._monster_target_positions[monster_id] = position
+
     def process_wandering_state(
         self, monster: Monster, can_see_player: bool, distance: float, context: GameContext
     ) -> None:
@@ -110,9 +149,14 @@ class MonsterBehaviorManager:
             # 警戒タイマーを減少
             timer = self._monster_alert_timers.get(monster_id, 0)
             if timer > 0:
+                # 最後に見た位置に到達済みなら匂いを辿る（辿れている間は警戒を維持）
+                target_pos = self._monster_target_positions.get(monster_id)
+                if target_pos == (monster.x, monster.y) and self._follow_scent(monster, context):
+                    self._monster_target_positions[monster_id] = (monster.x, monster.y)
+                    return
+
                 self._monster_alert_timers[monster_id] = timer - 1
                 # 最後に見た位置に向かう
-                target_pos = self._monster_target_positions.get(monster_id)
                 if target_pos:
                     self._move_towards_position(monster, target_pos, context)
             else:
@@ -197,29 +241,25 @@ class MonsterBehaviorManager:
             移動が成功した場合True
 
         """
-        new_x = monster.x + dx
-        new_y = monster.y + dy
-
-        # 移動可能かチェック
-        if self._can_monster_move_to(new_x, new_y, context):
-            # MonsterSpawnerの占有位置も更新
-            floor_data = context.get_current_floor_data()
-            if hasattr(floor_data, "monster_spawner"):
-                spawner = floor_data.monster_spawner
-                # 古い位置を削除
-                old_pos = (monster.x, monster.y)
-                if old_pos in spawner.occupied_positions:
-                    spawner.occupied_positions.remove(old_pos)
-
-                # 新しい位置を追加
-                spawner.occupied_positions.add((new_x, new_y))
-
-            # モンスターの位置を更新
-            monster.x = new_x
-            monster.y = new_y
-            return True
+        with frame_timer.scope("ai.movement"):
+            new_x = monster.x + dx
+            new_y = monster.y + dy
+
+            # 移動可能かチェック
+            if self._can_monster_move_to(new_x, new_y, context):
+                # MonsterSpawnerの占有位置と空間ハッシュも更新
+                floor_data = context.get_current_floor_data()
+                if hasattr(floor_data, "monster_spawner"):
+                    floor_data.monster_spawner.move_monster(monster, new_x, new_y)
+                else:
+                    monster.x = new_x
+                    monster.y = new_y
+
+                if self._move_listener:
+                    self._move_listener(monster, new_x, new_y)
+                return True
 
-        return False
+            return False
 
     def _can_monster_move_to(self, x: int, y: int, context: GameContext) -> bool:
         """
@@ -254,11 +294,10 @@ class MonsterBehaviorManager:
         if player.x == x and player.y == y:
             return False
 
-        # 他のモンスターとの重複チェック
+        # 他のモンスターとの重複チェック（空間ハッシュで該当セルのみ参照）
         if hasattr(floor_data, "monster_spawner"):
-            for other_monster in floor_data.monster_spawner.monsters:
-                if other_monster.x == x and other_monster.y == y:
-                    return False
+            if floor_data.monster_spawner.get_monster_at(x, y) is not None:
+                return False
 
         return True
 
@@ -279,17 +318,38 @@ class MonsterBehaviorManager:
         # 移動実行
         self.try_move_monster(monster, dx, dy, context)
 
-    def _move_towards_position(self, monster: Monster, target_pos: tuple[int, int], context: GameContext) -> None:
+    def _move_towards_position(self, monster: Monster, target_pos: tuple[int, int], context: GameContext) -> bool:
         """
         指定された位置に向かって移動。
 
+        追跡マップがある場合は共有フローフィールドに沿って移動し、
+        行き止まりでの往復を避けます。それ以外は直線的に移動します。
+
         Args:
         ----
             monster: 移動するモンスター
             target_pos: 目標位置
             context: ゲームコンテキスト
 
+        Returns:
+        -------
+            移動が成功した場合True
+
         """
+        # 混乱状態の場合はランダム方向
+        if self._is_confused(monster):
+            dx = random.randint(-1, 1)
+            dy = random.randint(-1, 1)
+            return self.try_move_monster(monster, dx, dy, context)
+
+        # フローフィールドに沿って移動（塞がっていれば次善の方向）
+        if self._tracking_manager:
+            with frame_timer.scope("ai.pathing"):
+                steps = self._tracking_manager.get_flow_step(context, monster.x, monster.y, target_pos)
+            for dx, dy in steps:
+                if self.try_move_monster(monster, dx, dy, context):
+                    return True
+
         target_x, target_y = target_pos
         dx = 0
         dy = 0
@@ -304,13 +364,51 @@ class MonsterBehaviorManager:
         elif monster.y > target_y:
             dy = -1
 
-        # 混乱状態の場合はランダム方向
-        if self._is_confused(monster):
-            dx = random.randint(-1, 1)
-            dy = random.randint(-1, 1)
-
         # 移動実行
-        self.try_move_monster(monster, dx, dy, context)
+        return self.try_move_monster(monster, dx, dy, context)
+
+    def move_along_flow(self, monster: Monster, target_pos: tuple[int, int], context: GameContext) -> bool:
+        """
+        共有フローフィールドのみを使って目標位置に向かう。
+
+        Args:
+        ----
+            monster: 移動するモンスター
+            target_pos: 目標位置
+            context: ゲームコンテキスト
+
+        Returns:
+        -------
+            移動が成功した場合True
+
+        """
+        if not self._tracking_manager:
+            return False
+
+        with frame_timer.scope("ai.pathing"):
+            steps = self._tracking_manager.get_flow_step(context, monster.x, monster.y, target_pos)
+        return any(self.try_move_monster(monster, dx, dy, context) for dx, dy in steps)
+
+    def _follow_scent(self, monster: Monster, context: GameContext) -> bool:
+        """
+        プレイヤーの匂いの痕跡を辿って移動。
+
+        Args:
+        ----
+            monster: 移動するモンスター
+            context: ゲームコンテキスト
+
+        Returns:
+        -------
+            移動が成功した場合True
+
+        """
+        if not self._tracking_manager or self._is_confused(monster):
+            return False
+
+        with frame_timer.scope("ai.pathing"):
+            steps = self._tracking_manager.get_scent_step(context, monster.x, monster.y)
+        return any(self.try_move_monster(monster, dx, dy, context) for dx, dy in steps)
 
     def _alert_nearby_monsters(self, alerting_monster: Monster, context: GameContext) -> None:
         """
@@ -329,27 +427,26 @@ class MonsterBehaviorManager:
         alert_radius = 5  # 警告範囲
         alerted_count = 0
 
-        for monster in floor_data.monster_spawner.monsters:
+        nearby_monsters = floor_data.monster_spawner.get_monsters_in_range(
+            alerting_monster.x, alerting_monster.y, alert_radius, DistanceMetric.EUCLIDEAN
+        )
+        for monster in nearby_monsters:
             if monster == alerting_monster:
                 continue
 
-            # 距離チェック
-            distance = self._calculate_distance(alerting_monster.x, alerting_monster.y, monster.x, monster.y)
+            monster_id = id(monster)
+            current_state = self.get_monster_state(monster_id)
 
-            if distance <= alert_radius:
-                monster_id = id(monster)
-                current_state = self.get_monster_state(monster_id)
-
-                # 既に警戒状態以上の場合はスキップ
-                if current_state in [MonsterAIState.ALERTED, MonsterAIState.HUNTING, MonsterAIState.ATTACKING]:
-                    continue
+            # 既に警戒状態以上の場合はスキップ
+            if current_state in [MonsterAIState.ALERTED, MonsterAIState.HUNTING, MonsterAIState.ATTACKING]:
+                continue
 
-                # 警戒状態に遷移
-                self.set_monster_state(monster_id, MonsterAIState.ALERTED)
-                self._monster_alert_timers[monster_id] = 3
-                self._monster_target_positions[monster_id] = (context.player.x, context.player.y)
+            # 警戒状態に遷移
+            self.set_monster_state(monster_id, MonsterAIState.ALERTED)
+            self._monster_alert_timers[monster_id] = 3
+            self._monster_target_positions[monster_id] = (context.player.x, context.player.y)
 
-                alerted_count += 1
+            alerted_count += 1
 
         if alerted_count > 0:
             game_logger.debug(f"{alerting_monster.name} alerted {alerted_count} nearby monsters")
@@ -298,8 +298,7 @@ class MonsterCombatManager:
             monster.max_hp = monster.max_hp // 2
 
             # スポナーに追加
-            floor_data.monster_spawner.monsters.append(split_monster)
-            floor_data.monster_spawner.occupied_positions.add((spawn_x, spawn_y))
+            floor_data.monster_spawner.add_monster(split_monster)
 
             context.add_message(f"{monster.name} splits into two!")
             game_logger.debug(f"{monster.name} split into two monsters")
@@ -337,11 +336,10 @@ class MonsterCombatManager:
         if player.x == x and player.y == y:
             return False
 
-        # 他のモンスターとの重複チェック
+        # 他のモンスターとの重複チェック（空間ハッシュで該当セルのみ参照）
         if hasattr(floor_data, "monster_spawner"):
-            for other_monster in floor_data.monster_spawner.monsters:
-                if other_monster.x == x and other_monster.y == y:
-                    return False
+            if floor_data.monster_spawner.get_monster_at(x, y) is not None:
+                return False
 
         return True
 
@@ -3,13 +3,16 @@
 
 このモジュールは、A*アルゴリズムを使用した経路探索機能を提供します。
 モンスターやプレイヤーの移動経路計算を担当します。
+コストマップは開始位置の周囲の最大探索距離のウィンドウだけで作成するため、
+処理量はマップの大きさに依存しません。
 """
 
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import tcod
+import numpy as np
+import tcod.path
 
 from pyrogue.utils import game_logger
 
@@ -51,7 +54,7 @@ class PathfindingManager:
 
         Returns:
         -------
-            経路のリスト（見つからない場合はNone）
+            開始位置を含む経路のリスト（見つからない場合はNone）
 
         """
         # 距離が遠い場合は経路探索を使用しない（パフォーマンス最適化）
@@ -65,7 +68,7 @@ class PathfindingManager:
             return self._pathfinding_cache[cache_key]
 
         # 経路探索を実行
-        path = self._find_path_internal(start_x, start_y, end_x, end_y, context)
+        path = self._find_path_internal(start_x, start_y, end_x, end_y, context, radius=max_distance)
         if path:
             # キャッシュに保存
             self._pathfinding_cache[cache_key] = path
@@ -73,79 +76,77 @@ class PathfindingManager:
         return path
 
     def _find_path_internal(
-        self, start_x: int, start_y: int, end_x: int, end_y: int, context: GameContext
+        self, start_x: int, start_y: int, end_x: int, end_y: int, context: GameContext, *, radius: int
     ) -> list[tuple[int, int]] | None:
         """
         内部的な経路探索実行。
 
+        開始位置を中心とした半径radiusのウィンドウだけでコストマップを作り、
+        その範囲内で経路を探索します。
+
         Args:
         ----
             start_x, start_y: 開始位置
             end_x, end_y: 終了位置
             context: ゲームコンテキスト
+            radius: 探索ウィンドウの半径
 
         Returns:
         -------
-            経路のリスト（見つからない場合はNone）
+            開始位置を含む経路のリスト（見つからない場合はNone）
 
         """
         floor_data = context.get_current_floor_data()
         if not floor_data:
             return None
 
-        # コストマップを作成
-        cost_map = self._create_cost_map(context)
-        if cost_map is None:
+        tiles = floor_data.tiles
+        height, width = tiles.shape
+        if not (0 <= start_x < width and 0 <= start_y < height and 0 <= end_x < width and 0 <= end_y < height):
+            return None
+
+        # 探索ウィンドウ（終了位置は最大探索距離以内なので必ず含まれる）
+        x0, x1 = max(0, start_x - radius), min(width, start_x + radius + 1)
+        y0, y1 = max(0, start_y - radius), min(height, start_y + radius + 1)
+        if not (x0 <= end_x < x1 and y0 <= end_y < y1):
             return None
 
-        # A*アルゴリズムを実行
-        try:
-            path = tcod.path.find_path(  # type: ignore
-                cost_map,
-                start=(start_x, start_y),
-                end=(end_x, end_y),
-                diagonal=True,
-                algorithm=tcod.path.DIJKSTRA,  # type: ignore
-            )
-            return [(x, y) for x, y in path]
-        except Exception as e:
-            game_logger.debug(f"Pathfinding failed: {e}")
+        cost = self._create_cost_map(tiles[y0:y1, x0:x1])
+        # 開始位置と終了位置（プレイヤーの位置）は通行可能として扱う
+        cost[start_y - y0, start_x - x0] = 1
+        cost[end_y - y0, end_x - x0] = 1
+
+        # A*アルゴリズムを実行（斜め移動のコストは直線の1.5倍）
+        path = tcod.path.path2d(
+            cost,
+            start_points=[(start_y - y0, start_x - x0)],
+            end_points=[(end_y - y0, end_x - x0)],
+            cardinal=2,
+            diagonal=3,
+        )
+        if len(path) == 0:
+            game_logger.debug("No path from (%d, %d) to (%d, %d)", start_x, start_y, end_x, end_y)
             return None
+        return [(int(j) + x0, int(i) + y0) for i, j in path]
 
-    def _create_cost_map(self, context: GameContext) -> tcod.path.Pathfinder | None:
+    def _create_cost_map(self, tiles: np.ndarray) -> np.ndarray:
         """
         経路探索用のコストマップを作成。
 
         Args:
         ----
-            context: ゲームコンテキスト
+            tiles: 探索ウィンドウのタイル配列
 
         Returns:
         -------
-            コストマップ（作成に失敗した場合はNone）
+            歩行可能なマスが1、歩行不可のマスが0のコスト配列
 
         """
-        floor_data = context.get_current_floor_data()
-        if not floor_data:
-            return None
-
-        try:
-            # タイルの歩行可能性に基づいてコストを設定
-            height, width = floor_data.tiles.shape
-            cost_array = tcod.numpy.zeros((height, width), dtype=tcod.numpy.int8)  # type: ignore
-
-            for y in range(height):
-                for x in range(width):
-                    tile = floor_data.tiles[y, x]
-                    if getattr(tile, "walkable", False):
-                        cost_array[y, x] = 1  # 歩行可能
-                    else:
-                        cost_array[y, x] = 0  # 歩行不可
-
-            return tcod.path.Pathfinder(cost_array)
-        except Exception as e:
-            game_logger.debug(f"Cost map creation failed: {e}")
-            return None
+        return np.fromiter(
+            (getattr(tile, "walkable", False) for tile in tiles.flat),
+            dtype=np.int8,
+            count=tiles.size,
+        ).reshape(tiles.shape)
 
     def _calculate_distance(self, x1: int, y1: int, x2: int, y2: int) -> float:
         """
@@ -0,0 +1,372 @@
+"""
+追跡マップ管理コンポーネント。
+
+このモジュールは、モンスターがプレイヤーを追跡するための
+フロア単位の匂いマップ（時間とともに薄れる足跡）と、
+プレイヤーの最終確認位置へのフローフィールドを管理します。
+全モンスターが同じマップを参照するため、個別の経路探索が不要になります。
+フローフィールドは目標位置の周囲のウィンドウだけで計算するため、
+処理量はマップの大きさに依存しません。計算済みのフィールドは目標位置ごとに
+少数だけ保持し、タイルが書き換えられた（ドアの開閉など）時に破棄します。
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+import numpy as np
+import tcod.path
+
+from pyrogue.constants import GameConstants
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
+from pyrogue.utils import game_logger
+
+if TYPE_CHECKING:
+    from pyrogue.core.managers.game_context import GameContext
+    from pyrogue.map.dungeon_manager import FloorData
+
+
+# 8方向の移動オフセット
+NEIGHBOR_OFFSETS: tuple[tuple[int, int], ...] = (
+    (-1, -1),
+    (0, -1),
+    (1, -1),
+    (-1, 0),
+    (1, 0),
+    (-1, 1),
+    (0, 1),
+    (1, 1),
+)
+
+# フローフィールドで到達不能な位置の距離値
+UNREACHABLE = np.iinfo(np.int32).max
+
+# フローフィールドを計算する目標位置からの範囲（アクティブエリアの外を回り込む経路も含める）
+FLOW_FIELD_RADIUS = GameConstants.AI_ACTIVE_AREA_RADIUS * 2
+
+# フロアごとに保持するフローフィールドの数（最近使った目標位置から順に残す）
+FLOW_FIELD_CACHE_SIZE = 8
+
+
+class FloorTrackingMap:
+    """
+    単一フロアの追跡マップ。
+
+    匂いは「プレイヤーが最後にそのマスにいたターン」として記録し、
+    強度は経過ターン数から算出します（配列全体の減衰処理は不要）。
+
+    フローフィールドは目標位置ごとにLRUで保持し、タイルバッファの
+    世代番号が変わった時（タイルの書き換えやドアの開閉）にまとめて破棄します。
+
+    Attributes
+    ----------
+        tiles: 対象フロアのタイル配列
+        tile_buffer: タイルの書き換えを記録するバッファ（ない場合はNone）
+        scent_turns: 各マスにプレイヤーが最後にいたターン（未訪問は-1）
+        flow_target: 選択中のフローフィールドの目標位置
+        flow_origin: 歩数マップの左上に対応するマップ座標 (x, y)
+        flow_distances: 目標位置までの歩数マップ（目標位置の周囲のウィンドウ分）
+
+    """
+
+    def __init__(self, tiles: np.ndarray, tile_buffer: TileBuffer | None = None) -> None:
+        """
+        追跡マップを初期化。
+
+        Args:
+        ----
+            tiles: 対象フロアのタイル配列
+            tile_buffer: タイルの書き換えを記録するバッファ
+
+        """
+        self.tiles = tiles
+        self.tile_buffer = tile_buffer
+        self.scent_turns = np.full(tiles.shape, -1, dtype=np.int32)
+        self.flow_target: tuple[int, int] | None = None
+        self.flow_origin = (0, 0)
+        self.flow_distances: np.ndarray | None = None
+        self._flow_fields: OrderedDict[tuple[int, int], tuple[tuple[int, int], np.ndarray]] = OrderedDict()
+        self._flow_revision = self._tile_revision()
+
+    def build_walkable_mask(self, tiles: np.ndarray | None = None) -> np.ndarray:
+        """
+        現在のタイル状態から歩行可能マスクを構築。
+
+        Args:
+        ----
+            tiles: 対象のタイル配列（省略時はフロア全体）
+
+        Returns:
+        -------
+            歩行可能なマスがTrueのブール配列
+
+        """
+        if tiles is None:
+            tiles = self.tiles
+        return np.fromiter(
+            (getattr(tile, "walkable", False) for tile in tiles.flat),
+            dtype=bool,
+            count=tiles.size,
+        ).reshape(tiles.shape)
+
+    def compute_flow_field(self, target_x: int, target_y: int, radius: int = FLOW_FIELD_RADIUS) -> None:
+        """
+        目標位置へのフローフィールド（歩数マップ）を計算。
+
+        Args:
+        ----
+            target_x: 目標のX座標
+            target_y: 目標のY座標
+            radius: 計算する目標位置からの範囲
+
+        """
+        height, width = self.tiles.shape
+        x0, x1 = max(0, target_x - radius), min(width, target_x + radius + 1)
+        y0, y1 = max(0, target_y - radius), min(height, target_y + radius + 1)
+
+        cost = self.build_walkable_mask(self.tiles[y0:y1, x0:x1]).astype(np.int8)
+        distances = np.full(cost.shape, UNREACHABLE, dtype=np.int32)
+        distances[target_y - y0, target_x - x0] = 0
+        cost[target_y - y0, target_x - x0] = 1
+        tcod.path.dijkstra2d(distances, cost, 1, 1, out=distances)
+
+        self._discard_stale_flow_fields()
+        self._flow_fields[target_x, target_y] = ((x0, y0), distances)
+        self._flow_fields.move_to_end((target_x, target_y))
+        if len(self._flow_fields) > FLOW_FIELD_CACHE_SIZE:
+            self._flow_fields.popitem(last=False)
+
+        self.flow_target = (target_x, target_y)
+        self.flow_origin = (x0, y0)
+        self.flow_distances = distances
+
+    def select_flow_field(self, target_x: int, target_y: int) -> bool:
+        """
+        目標位置のフローフィールドを選択（保持していない場合は計算）。
+
+        Args:
+        ----
+            target_x: 目標のX座標
+            target_y: 目標のY座標
+
+        Returns:
+        -------
+            フローフィールドを計算し直した場合True
+
+        """
+        self._discard_stale_flow_fields()
+        target = (target_x, target_y)
+        cached = self._flow_fields.get(target)
+        if cached is None:
+            self.compute_flow_field(target_x, target_y)
+            return True
+
+        self._flow_fields.move_to_end(target)
+        self.flow_target = target
+        self.flow_origin, self.flow_distances = cached
+        return False
+
+    def _tile_revision(self) -> int:
+        """タイルバッファの世代番号を取得（バッファがない場合は0）。"""
+        return self.tile_buffer.revision if self.tile_buffer is not None else 0
+
+    def _discard_stale_flow_fields(self) -> None:
+        """タイルが書き換えられていれば保持しているフローフィールドを破棄。"""
+        revision = self._tile_revision()
+        if revision == self._flow_revision:
+            return
+        self._flow_fields.clear()
+        self._flow_revision = revision
+        self.flow_target = None
+        self.flow_distances = None
+
+
+class TrackingManager:
+    """
+    追跡マップの管理クラス。
+
+    プレイヤーの移動に合わせて匂いを記録し、
+    最終確認位置へのフローフィールドを共有します。
+
+    Attributes
+    ----------
+        scent_duration: 匂いが残るターン数
+        current_turn: 匂い記録用のターンカウンタ
+
+    """
+
+    def __init__(self, scent_duration: int = 30) -> None:
+        """
+        追跡マネージャーを初期化。
+
+        Args:
+        ----
+            scent_duration: 匂いが残るターン数
+
+        """
+        self.scent_duration = scent_duration
+        self.current_turn = 0
+        self._floor_maps: dict[int, FloorTrackingMap] = {}
+
+    def get_floor_map(self, floor_data: FloorData) -> FloorTrackingMap | None:
+        """
+        フロアの追跡マップを取得（必要に応じて作成）。
+
+        Args:
+        ----
+            floor_data: 対象フロアのデータ
+
+        Returns:
+        -------
+            追跡マップ（タイル配列がない場合はNone）
+
+        """
+        tiles = getattr(floor_data, "tiles", None)
+        if not isinstance(tiles, np.ndarray):
+            return None
+
+        tile_buffer = getattr(floor_data, "tile_buffer", None)
+        if not isinstance(tile_buffer, TileBuffer):
+            tile_buffer = None
+
+        floor_number = getattr(floor_data, "floor_number", 0)
+        floor_map = self._floor_maps.get(floor_number)
+        if floor_map is None or floor_map.tiles is not tiles or floor_map.tile_buffer is not tile_buffer:
+            # 新しいフロア、またはロード等でタイル配列が差し替えられた場合は作り直す
+            floor_map = FloorTrackingMap(tiles, tile_buffer)
+            self._floor_maps[floor_number] = floor_map
+        return floor_map
+
+    def record_player_position(self, context: GameContext) -> None:
+        """
+        プレイヤーの現在位置に匂いを記録（1ターンに1回呼び出す）。
+
+        Args:
+        ----
+            context: ゲームコンテキスト
+
+        """
+        self.current_turn += 1
+        floor_map = self.get_floor_map(context.get_current_floor_data())
+        if floor_map is None:
+            return
+
+        player = context.player
+        if 0 <= player.y < floor_map.scent_turns.shape[0] and 0 <= player.x < floor_map.scent_turns.shape[1]:
+            floor_map.scent_turns[player.y, player.x] = self.current_turn
+
+    def get_scent_strength(self, context: GameContext, x: int, y: int) -> int:
+        """
+        指定座標の匂いの強さを取得。
+
+        Args:
+        ----
+            context: ゲームコンテキスト
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            匂いの強さ（0は匂いなし）
+
+        """
+        floor_map = self.get_floor_map(context.get_current_floor_data())
+        if floor_map is None or not self._in_bounds(floor_map, x, y):
+            return 0
+        visited = int(floor_map.scent_turns[y, x])
+        if visited < 0:
+            return 0
+        return max(0, self.scent_duration - (self.current_turn - visited))
+
+    def get_flow_step(self, context: GameContext, x: int, y: int, target: tuple[int, int]) -> list[tuple[int, int]]:
+        """
+        目標位置へのフローフィールドに沿った移動方向の候補を取得。
+
+        フローフィールドは目標位置ごとに保持され、同じ目標を追う
+        全モンスターで共有されます。保持していない目標位置か、タイルが
+        書き換えられた後だけ計算し直します。フローフィールドの
+        範囲外にいる場合は候補を返しません。
+
+        Args:
+        ----
+            context: ゲームコンテキスト
+            x: 現在のX座標
+            y: 現在のY座標
+            target: 目標位置
+
+        Returns:
+        -------
+            距離が縮まる方向 (dx, dy) のリスト（近い順）
+
+        """
+        floor_map = self.get_floor_map(context.get_current_floor_data())
+        if floor_map is None or not self._in_bounds(floor_map, *target):
+            return []
+
+        if floor_map.select_flow_field(*target):
+            game_logger.debug("Flow field recomputed for target %s", target)
+
+        distances = floor_map.flow_distances
+        height, width = distances.shape
+        # 歩数マップ内の座標に変換
+        local_x, local_y = x - floor_map.flow_origin[0], y - floor_map.flow_origin[1]
+        if not (0 <= local_x < width and 0 <= local_y < height):
+            return []
+        current = int(distances[local_y, local_x])
+
+        candidates = []
+        for dx, dy in NEIGHBOR_OFFSETS:
+            nx, ny = local_x + dx, local_y + dy
+            if not (0 <= nx < width and 0 <= ny < height):
+                continue
+            distance = int(distances[ny, nx])
+            if distance < current:
+                candidates.append((distance, dx, dy))
+
+        candidates.sort()
+        return [(dx, dy) for _, dx, dy in candidates]
+
+    def get_scent_step(self, context: GameContext, x: int, y: int) -> list[tuple[int, int]]:
+        """
+        匂いの痕跡を辿る移動方向の候補を取得。
+
+        Args:
+        ----
+            context: ゲームコンテキスト
+            x: 現在のX座標
+            y: 現在のY座標
+
+        Returns:
+        -------
+            現在地より新しい匂いがある方向 (dx, dy) のリスト（新しい順）
+
+        """
+        floor_map = self.get_floor_map(context.get_current_floor_data())
+        if floor_map is None or not self._in_bounds(floor_map, x, y):
+            return []
+
+        scent_turns = floor_map.scent_turns
+        oldest_allowed = self.current_turn - self.scent_duration
+        current = max(int(scent_turns[y, x]), oldest_allowed)
+
+        candidates = []
+        for dx, dy in NEIGHBOR_OFFSETS:
+            nx, ny = x + dx, y + dy
+            if not self._in_bounds(floor_map, nx, ny):
+                continue
+            visited = int(scent_turns[ny, nx])
+            if visited > current:
+                candidates.append((-visited, dx, dy))
+
+        candidates.sort()
+        return [(dx, dy) for _, dx, dy in candidates]
+
+    def clear(self) -> None:
+        """全フロアの追跡マップを破棄。"""
+        self._floor_maps.clear()
+
+    def _in_bounds(self, floor_map: FloorTrackingMap, x: int, y: int) -> bool:
+        """座標がフロア範囲内かチェック。"""
+        height, width = floor_map.scent_turns.shape
+        return 0 <= x < width and 0 <= y < height
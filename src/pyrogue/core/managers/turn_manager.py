@@ -7,13 +7,54 @@
 
 from __future__ import annotations
 
+from enum import Enum
 from typing import TYPE_CHECKING
 
 from pyrogue.constants import HungerConstants
-from pyrogue.utils import game_logger
+from pyrogue.utils import frame_timer, game_logger
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from pyrogue.core.managers.game_context import GameContext
+    from pyrogue.entities.actors.monster import Monster
+
+
+class TurnInterrupt(Enum):
+    """
+    複数ターン一括処理（simulate）を中断させるイベントの種類。
+
+    休憩などの連続行動は、これらのイベントが発生した時点で停止します。
+    """
+
+    MONSTER_IN_VIEW = "monster_in_view"  # モンスターが監視範囲に入った
+    DAMAGE_TAKEN = "damage_taken"  # プレイヤーがダメージを受けた
+    HUNGER_THRESHOLD = "hunger_threshold"  # 満腹度の段階が変化した
+    FULL_HP = "full_hp"  # HPが全回復した
+    PLAYER_DIED = "player_died"  # プレイヤーが死亡した（常に中断）
+
+
+class SimulationResult:
+    """
+    複数ターン一括処理の結果を表現するクラス。
+
+    Attributes
+    ----------
+        turns: 実際に経過したターン数
+        interrupt: 中断理由（最後まで進んだ場合はNone）
+        hp_recovered: 一括適用されたHP回復量
+
+    """
+
+    def __init__(self, turns: int, interrupt: TurnInterrupt | None = None, hp_recovered: int = 0) -> None:
+        self.turns = turns
+        self.interrupt = interrupt
+        self.hp_recovered = hp_recovered
+
+    @property
+    def interrupted(self) -> bool:
+        """中断されたかどうか。"""
+        return self.interrupt is not None
 
 
 class TurnManager:
@@ -33,6 +74,11 @@ class TurnManager:
         """ターンマネージャーを初期化。"""
         self.turn_count = 0
 
+        # 一括処理（simulate）中の状態
+        self._simulating = False
+        self._pending_interrupt: TurnInterrupt | None = None
+        self._batched_regen = 0
+
     def process_turn(self, context: GameContext) -> None:
         """
         1ターンの処理を実行。
@@ -42,24 +88,29 @@ class TurnManager:
             context: ゲームコンテキスト
 
         """
-        self.turn_count += 1
+        with frame_timer.scope("turn"):
+            self.turn_count += 1
 
-        # プレイヤーのターン数を増加
-        context.player.increment_turn()
+            # プレイヤーのターン数を増加
+            context.player.increment_turn()
 
-        # プレイヤーのステータス異常処理
-        self._process_player_status_effects(context)
+            # プレイヤーのステータス異常処理
+            with frame_timer.scope("turn.status_effects"):
+                self._process_player_status_effects(context)
 
-        # モンスターターンの処理
-        self._process_monster_turns(context)
+            # モンスターターンの処理
+            with frame_timer.scope("turn.monsters"):
+                self.process_monster_turns(context)
 
-        # 満腹度システムの処理
-        self._process_hunger_system(context)
+            # 満腹度システムの処理
+            with frame_timer.scope("turn.hunger"):
+                self._process_hunger_system(context)
 
-        # ターン終了後の状態チェック
-        self._check_end_turn_conditions(context)
+            # ターン終了後の状態チェック
+            with frame_timer.scope("turn.end_checks"):
+                self._check_end_turn_conditions(context)
 
-        game_logger.debug(f"Turn {self.turn_count} processed")
+        game_logger.debug("Turn %d processed", self.turn_count)
 
     def _process_player_status_effects(self, context: GameContext) -> None:
         """
@@ -112,10 +163,12 @@ class TurnManager:
                 if self.turn_count % 3 == 0:  # 3ターンごとにメッセージ
                     context.add_message("You are confused!")
 
-    def _process_monster_turns(self, context: GameContext) -> None:
+    def process_monster_turns(self, context: GameContext) -> None:
         """
         モンスターターンを処理。
 
+        ステータス異常の経過とAI処理だけを行い、ターン数や満腹度は進めません。
+
         Args:
         ----
             context: ゲームコンテキスト
@@ -129,11 +182,12 @@ class TurnManager:
         # ここでは基本的なターン進行のみ管理
         monsters = floor_data.monster_spawner.monsters.copy()
 
-        for monster in monsters:
-            # モンスターが生きている場合のみ処理
-            if monster.hp > 0:
-                # モンスターのステータス異常処理
-                self._process_monster_status_effects(monster)
+        with frame_timer.scope("turn.monster_status"):
+            for monster in monsters:
+                # モンスターが生きている場合のみ処理
+                if monster.hp > 0:
+                    # モンスターのステータス異常処理
+                    self._process_monster_status_effects(monster)
 
         # すべてのモンスターのAI処理をMonsterAIManagerに委譲
         if hasattr(context, "monster_ai_manager") and context.monster_ai_manager:
@@ -163,7 +217,7 @@ class TurnManager:
                 monster.hp = max(0, monster.hp - damage)
 
                 if monster.hp <= 0:
-                    game_logger.debug(f"{monster.name} died from poison")
+                    game_logger.debug("%s died from poison", monster.name)
 
     def _process_hunger_system(self, context: GameContext) -> None:
         """
@@ -216,6 +270,11 @@ class TurnManager:
             context.add_message("You are very hungry and feel weakened!")
         elif old_hunger >= HungerConstants.STARVING_THRESHOLD and new_hunger < HungerConstants.STARVING_THRESHOLD:
             context.add_message("You are starving! Your strength is failing!")
+        else:
+            return
+
+        # 一括処理中は段階変化を中断イベントとして通知
+        self._raise_interrupt(TurnInterrupt.HUNGER_THRESHOLD)
 
     def _apply_full_bonus_effects(self, context: GameContext, player) -> None:
         """
@@ -231,6 +290,10 @@ class TurnManager:
 
         # HP自然回復
         if player.hp < player.max_hp and random.random() < HungerConstants.FULL_HP_REGEN_CHANCE:
+            if self._simulating:
+                # 一括処理中は回復量を積算し、終了時にまとめて適用
+                self._batched_regen += 1
+                return
             player.hp = min(player.max_hp, player.hp + 1)
             context.add_message("You feel refreshed!")
 
@@ -348,6 +411,119 @@ class TurnManager:
             if context.player.hp <= 0:
                 break
 
+    def simulate(
+        self,
+        count: int,
+        context: GameContext,
+        stop_conditions: set[TurnInterrupt] | None = None,
+        watch_radius: int = 10,
+        view_mask: np.ndarray | None = None,
+        hp_regen_interval: int | None = None,
+    ) -> SimulationResult:
+        """
+        複数ターンを一括で進める（休憩などの連続行動用）。
+
+        1ターンごとのFOV更新・描画・全モンスター走査を行わず、
+        中断はイベント駆動で検出します。モンスターの接近は移動通知で、
+        満腹度の段階変化はターン処理中の通知で、ダメージはHPの減少で判定します。
+        HP回復は一括処理の終了時にまとめて適用されます。
+
+        Args:
+        ----
+            count: 最大経過ターン数
+            context: ゲームコンテキスト
+            stop_conditions: 中断条件のセット（Noneの場合は全て）
+            watch_radius: モンスター接近とみなすマンハッタン距離
+            view_mask: 監視対象とする可視範囲（Noneの場合は距離のみで判定）
+            hp_regen_interval: 休憩によるHP回復間隔（Noneの場合は回復なし）
+
+        Returns:
+        -------
+            一括処理の結果
+
+        """
+        if stop_conditions is None:
+            stop_conditions = set(TurnInterrupt)
+
+        player = context.player
+        watch_monsters = TurnInterrupt.MONSTER_IN_VIEW in stop_conditions
+        origin = (player.x, player.y)
+
+        def is_watched(x: int, y: int) -> bool:
+            if abs(x - origin[0]) + abs(y - origin[1]) > watch_radius:
+                return False
+            return view_mask is None or bool(view_mask[y, x])
+
+        # 開始時点で既に監視範囲内にモンスターがいる場合は即座に中断
+        if watch_monsters:
+            floor_data = context.get_current_floor_data()
+            monsters = floor_data.monster_spawner.monsters if floor_data else []
+            if any(m.hp > 0 and is_watched(m.x, m.y) for m in monsters):
+                return SimulationResult(0, TurnInterrupt.MONSTER_IN_VIEW)
+
+        def on_monster_moved(monster: Monster, x: int, y: int) -> None:
+            if is_watched(x, y):
+                self._raise_interrupt(TurnInterrupt.MONSTER_IN_VIEW)
+
+        ai_manager = getattr(context, "monster_ai_manager", None)
+        if watch_monsters and ai_manager:
+            ai_manager.set_move_listener(on_monster_moved)
+
+        self._simulating = True
+        self._pending_interrupt = None
+        self._batched_regen = 0
+        turns = 0
+        interrupt: TurnInterrupt | None = None
+
+        try:
+            while turns < count:
+                hp_before = player.hp
+                self.process_turn(context)
+                turns += 1
+
+                if player.hp <= 0:
+                    interrupt = TurnInterrupt.PLAYER_DIED
+                    break
+                if player.hp < hp_before and TurnInterrupt.DAMAGE_TAKEN in stop_conditions:
+                    interrupt = TurnInterrupt.DAMAGE_TAKEN
+                    break
+                if self._pending_interrupt in stop_conditions:
+                    interrupt = self._pending_interrupt
+                    break
+                if TurnInterrupt.FULL_HP in stop_conditions:
+                    pending = self._batched_regen + (turns // hp_regen_interval if hp_regen_interval else 0)
+                    if player.hp + pending >= player.max_hp:
+                        interrupt = TurnInterrupt.FULL_HP
+                        break
+        finally:
+            if watch_monsters and ai_manager:
+                ai_manager.set_move_listener(None)
+            self._simulating = False
+
+        # 積算したHP回復をまとめて適用
+        hp_recovered = 0
+        if player.hp > 0:
+            regen = self._batched_regen + (turns // hp_regen_interval if hp_regen_interval else 0)
+            hp_recovered = max(0, min(regen, player.max_hp - player.hp))
+            player.hp += hp_recovered
+        self._batched_regen = 0
+        self._pending_interrupt = None
+
+        game_logger.debug("Simulated %d turns (interrupt: %s)", turns, interrupt.value if interrupt else None)
+        return SimulationResult(turns, interrupt, hp_recovered)
+
+    def _raise_interrupt(self, interrupt: TurnInterrupt) -> None:
+        """
+        一括処理中の中断イベントを記録。
+
+        Args:
+        ----
+            interrupt: 発生したイベント
+
+        """
+        if self._simulating and self._pending_interrupt is None:
+            self._pending_interrupt = interrupt
+
     def can_act(self, entity) -> bool:
         """
         エンティティが行動可能かチェック。
@@ -0,0 +1,254 @@
+"""
+メッセージログモジュール。
+
+このモジュールは、ゲームメッセージを固定長のリングバッファに保持する
+メッセージログを提供します。連続する同じメッセージは1件にまとめて
+回数を表示し（"You hit the bat (x3)"）、リングバッファから押し出された
+古いメッセージは任意で圧縮アーカイブに保存します。画面表示用には
+指定幅で折り返した行をキャッシュし、ログが変わらない間は再計算しません。
+
+Example:
+-------
+    >>> log = MessageLog(capacity=3)
+    >>> log.append("You hit the bat.")
+    >>> log.append("You hit the bat.")
+    >>> log[-1]
+    'You hit the bat. (x2)'
+
+"""
+
+from __future__ import annotations
+
+import json
+import textwrap
+import zlib
+from collections import deque
+from typing import TYPE_CHECKING, Any, overload
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class MessageLog:
+    """
+    固定長リングバッファのメッセージログ。
+
+    表示用のメッセージ（まとめた回数を含む文字列）のシーケンスとして
+    振る舞い、従来のリストと同じく append / extend / clear / スライスで
+    扱えます。追加はO(1)で、容量を超えると最も古いメッセージを押し出します。
+
+    Attributes
+    ----------
+        capacity: リングバッファに保持するメッセージ数
+        archive_enabled: 押し出したメッセージを圧縮アーカイブに保存するかどうか
+        revision: 内容が変わるたびに増える版数
+
+    """
+
+    # リングバッファに保持するメッセージ数の既定値
+    DEFAULT_CAPACITY = 200
+    # アーカイブを圧縮する単位（メッセージ数）
+    ARCHIVE_CHUNK_SIZE = 100
+
+    def __init__(
+        self,
+        messages: Iterable[str] = (),
+        capacity: int = DEFAULT_CAPACITY,
+        archive: bool = False,
+    ) -> None:
+        """
+        メッセージログを初期化。
+
+        Args:
+        ----
+            messages: 初期メッセージ
+            capacity: リングバッファに保持するメッセージ数
+            archive: 押し出したメッセージを圧縮アーカイブに保存するかどうか
+
+        """
+        self.capacity = capacity
+        self.archive_enabled = archive
+        self.revision = 0
+        # 各要素は [メッセージ, 連続回数]（まとめる時に回数を書き換える）
+        self._entries: deque[list[Any]] = deque()
+        self._archive_chunks: list[bytes] = []
+        self._archive_pending: list[str] = []
+        self._wrap_key: tuple[int, int, int] | None = None
+        self._wrap_lines: tuple[str, ...] = ()
+        self.extend(messages)
+
+    def append(self, message: str) -> None:
+        """
+        メッセージを追加（直前と同じメッセージは回数をまとめる）。
+
+        Args:
+        ----
+            message: 追加するメッセージ
+
+        """
+        if self._entries and self._entries[-1][0] == message:
+            self._entries[-1][1] += 1
+        else:
+            self._push([message, 1])
+        self.revision += 1
+
+    def extend(self, messages: Iterable[str]) -> None:
+        """
+        複数のメッセージを順に追加。
+
+        Args:
+        ----
+            messages: 追加するメッセージ
+
+        """
+        for message in messages:
+            self.append(message)
+
+    def clear(self) -> None:
+        """全てのメッセージとアーカイブを破棄。"""
+        self._entries.clear()
+        self._archive_chunks.clear()
+        self._archive_pending.clear()
+        self.revision += 1
+
+    def copy(self) -> list[str]:
+        """
+        表示用メッセージのリストを取得。
+
+        Returns
+        -------
+            リングバッファ内の表示用メッセージ（古い順）
+
+        """
+        return list(self)
+
+    def _push(self, entry: list[Any]) -> None:
+        """新しいメッセージをリングバッファに追加し、溢れた分をアーカイブに移す。"""
+        if len(self._entries) >= self.capacity:
+            evicted = self._entries.popleft()
+            if self.archive_enabled:
+                self._archive_pending.append(_format(evicted))
+                if len(self._archive_pending) >= self.ARCHIVE_CHUNK_SIZE:
+                    self._archive_chunks.append(_compress(self._archive_pending))
+                    self._archive_pending = []
+        self._entries.append(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        return (_format(entry) for entry in self._entries)
+
+    @overload
+    def __getitem__(self, index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[str]: ...
+
+    def __getitem__(self, index: int | slice) -> str | list[str]:
+        if isinstance(index, slice):
+            return [_format(entry) for entry in list(self._entries)[index]]
+        return _format(self._entries[index])
+
+    def history(self) -> list[str]:
+        """
+        アーカイブを含む全てのメッセージを取得。
+
+        Returns
+        -------
+            表示用メッセージのリスト（古い順）
+
+        """
+        archived = [message for chunk in self._archive_chunks for message in _decompress(chunk)]
+        return [*archived, *self._archive_pending, *self]
+
+    def wrapped_lines(self, width: int, max_lines: int) -> tuple[str, ...]:
+        """
+        最新のメッセージを指定幅で折り返した表示行を取得（結果はキャッシュする）。
+
+        Args:
+        ----
+            width: 1行の最大文字数
+            max_lines: 取得する最大行数
+
+        Returns:
+        -------
+            最新の行から数えて max_lines 行までの表示行（古い順）
+
+        """
+        key = (self.revision, width, max_lines)
+        if key == self._wrap_key:
+            return self._wrap_lines
+
+        lines: list[str] = []
+        for entry in reversed(self._entries):
+            wrapped = [
+                line
+                for paragraph in _format(entry).splitlines() or [""]
+                for line in textwrap.wrap(paragraph, width) or [""]
+            ]
+            lines[:0] = wrapped
+            if len(lines) >= max_lines:
+                break
+
+        self._wrap_key = key
+        self._wrap_lines = tuple(lines[-max_lines:]) if max_lines > 0 else ()
+        return self._wrap_lines
+
+    def to_save_data(self) -> dict[str, Any]:
+        """
+        セーブ用のデータを作成。
+
+        圧縮済みのアーカイブはそのまま渡すため、セーブのたびに処理する
+        メッセージはリングバッファと未圧縮分だけです。
+
+        Returns
+        -------
+            セーブデータ辞書
+
+        """
+        return {
+            "entries": [list(entry) for entry in self._entries],
+            "archive": list(self._archive_chunks),
+            "archive_pending": list(self._archive_pending),
+        }
+
+    def load_save_data(self, data: dict[str, Any] | list[str]) -> None:
+        """
+        セーブデータから内容を復元。
+
+        Args:
+        ----
+            data: to_save_data() の結果、または旧形式のメッセージのリスト
+
+        """
+        self.clear()
+        if isinstance(data, dict):
+            for message, count in data.get("entries", []):
+                self._push([message, count])
+            self._archive_chunks.extend(data.get("archive", []))
+            self._archive_pending.extend(data.get("archive_pending", []))
+        else:
+            # 旧形式（メッセージのリスト）は連続する同じメッセージもそのまま復元
+            for message in data:
+                self._push([message, 1])
+        self.revision += 1
+
+
+def _format(entry: list[Any]) -> str:
+    """連続回数を付けた表示用メッセージを作成。"""
+    message, count = entry
+    return message if count == 1 else f"{message} (x{count})"
+
+
+def _compress(messages: list[str]) -> bytes:
+    """メッセージのリストを圧縮。"""
+    return zlib.compress(json.dumps(messages).encode("utf-8"))
+
+
+def _decompress(chunk: bytes) -> list[str]:
+    """圧縮したメッセージのリストを展開。"""
+    return json.loads(zlib.decompress(chunk).decode("utf-8"))
@@ -9,6 +9,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from pyrogue.core.command_handler import CommandResult
+from pyrogue.core.message_log import MessageLog
 
 if TYPE_CHECKING:
     from pyrogue.core.command_handler import CommandContext
@@ -102,6 +103,7 @@ class SaveLoadHandler:
         """
         player = self.context.player
         dungeon_manager = self.context.game_logic.dungeon_manager
+        message_log = self.context.game_logic.message_log
 
         # GUIモードと同じ完全なセーブデータを作成
         save_data = {
@@ -109,7 +111,7 @@ class SaveLoadHandler:
             "inventory": self._serialize_inventory(self.context.game_logic.inventory),
             "current_floor": dungeon_manager.current_floor,
             "floor_data": self._serialize_all_floors(dungeon_manager.floors),
-            "message_log": self.context.game_logic.message_log,
+            "message_log": message_log.to_save_data() if isinstance(message_log, MessageLog) else list(message_log),
             "has_amulet": getattr(player, "has_amulet", False),
             "identification": self._serialize_identification(player.identification),
             "version": "1.0",
@@ -153,12 +155,16 @@ class SaveLoadHandler:
             # メッセージログの復元
             message_log = save_data.get("message_log", [])
             if hasattr(self.context.game_logic, "message_log"):
-                # GameLogicのmessage_logを更新
-                self.context.game_logic.message_log.clear()
-                self.context.game_logic.message_log.extend(message_log)
+                # GameLogicのmessage_logを更新（旧形式のリストにも対応）
+                log = self.context.game_logic.message_log
+                if isinstance(log, MessageLog):
+                    log.load_save_data(message_log)
+                else:
+                    log.clear()
+                    log.extend(message_log)
 
-                # GameContextのmessage_logも同じリストを参照するよう更新
-                self.context.message_log = self.context.game_logic.message_log
+                # GameContextのmessage_logも同じログを参照するよう更新
+                self.context.message_log = log
 
             # アミュレット状態の復元
             if "has_amulet" in save_data:
@@ -228,6 +234,7 @@ class SaveLoadHandler:
         for slot, index in equipped_data.items():
             if index is not None and 0 <= index < len(inventory.items):
                 inventory.equipped[slot] = inventory.items[index]
+        inventory.mark_changed()
 
     def _serialize_player(self, player) -> dict[str, Any]:
         """
@@ -587,7 +594,7 @@ class SaveLoadHandler:
                 for monster_data in monsters_data:
                     monster = self._deserialize_monster(monster_data)
                     if monster:
-                        monster_spawner.monsters.append(monster)
+                        monster_spawner.add_monster(monster)
 
                 # ItemSpawnerを復元
                 item_spawner = ItemSpawner(floor_num)
@@ -826,3 +833,4 @@ class SaveLoadHandler:
         # ワンドの外観マッピング（後方互換性のため属性チェック）
         if hasattr(identification, "wand_appearances"):
             identification.wand_appearances = identification_data.get("wand_appearances", {})
+        identification.mark_changed()
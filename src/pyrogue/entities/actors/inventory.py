@@ -10,6 +10,8 @@ class Inventory:
 
     def __init__(self, capacity: int = 26) -> None:  # a-zの26文字分
         self.capacity = capacity
+        # 所持品・装備が変わるたびに増える世代番号（派生値のキャッシュ用）
+        self.version = 0
         self.items: list[Item] = []
 
         # 装備スロット
@@ -20,6 +22,24 @@ class Inventory:
             "ring_right": None,
         }
 
+    @property
+    def items(self) -> list[Item]:
+        """所持品のリスト。"""
+        return self._items
+
+    @items.setter
+    def items(self, items: list[Item]) -> None:
+        self._items = items
+        self.mark_changed()
+
+    def mark_changed(self) -> None:
+        """
+        所持品・装備の変更を記録。
+
+        itemsやequippedを直接変更した場合に呼び出します。
+        """
+        self.version += 1
+
     def add_item(self, item: Item) -> bool:
         """
         アイテムを追加
@@ -45,9 +65,11 @@ class Inventory:
                     and isinstance(existing_item, type(item))
                 ):
                     existing_item.stack_count += item.stack_count
+                    self.mark_changed()
                     return True
 
         self.items.append(item)
+        self.mark_changed()
         return True
 
     def remove_item(self, item: Item, count: int = 1) -> int:
@@ -75,6 +97,7 @@ class Inventory:
         if item not in self.items:
             return 0  # アイテムが存在しない場合は0を返す
 
+        self.mark_changed()
         if item.stackable and item.stack_count > count:
             # スタック可能なアイテムで、削除数がスタック数より少ない場合
             item.stack_count -= count
@@ -115,6 +138,7 @@ class Inventory:
             Optional[Item]: 外したアイテム（ある場合）
 
         """
+        self.mark_changed()
         if isinstance(item, Weapon):
             old_item = self.equipped["weapon"]
             self.equipped["weapon"] = item
@@ -155,6 +179,7 @@ class Inventory:
             if item and item.cursed:
                 return None
             self.equipped[slot] = None
+            self.mark_changed()
             return item
         return None
 
@@ -346,6 +371,7 @@ class Inventory:
             slot = self.get_equipped_slot(item)
             if slot:
                 self.equipped[slot] = None
+                self.mark_changed()
 
         # アイテムを削除
         if item.stackable:
@@ -3,14 +3,85 @@
 from __future__ import annotations
 
 import random
+from typing import TYPE_CHECKING, Self, SupportsIndex
 
 import numpy as np
 
+from pyrogue.map.dungeon.free_cells import FreeCellSampler
+from pyrogue.map.dungeon.grid_kernels import tile_mask
 from pyrogue.map.tile import Door, Floor, SecretDoor
+from pyrogue.utils.alias_table import AliasTable
+from pyrogue.utils.spatial_hash import DistanceMetric, SpatialHash
 
 from .monster import Monster
 from .monster_types import FLOOR_MONSTERS, MONSTER_STATS
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+# (階層, 魔除け所持) ごとにコンパイルした出現テーブルのプロセス内キャッシュ
+_MONSTER_TABLES: dict[tuple[int, bool], AliasTable[str]] = {}
+
+
+class MonsterList(list[Monster]):
+    """
+    変更のたびに世代番号が増えるモンスターのリスト。
+
+    リストを直接変更された場合でも、空間ハッシュが古くなったことを
+    要素数に頼らずに検出するために使用します。
+
+    Attributes
+    ----------
+        version: 要素の追加・削除・置き換えのたびに増える世代番号
+
+    """
+
+    def __init__(self, monsters: Iterable[Monster] = ()) -> None:
+        super().__init__(monsters)
+        self.version = 0
+
+    def append(self, monster: Monster) -> None:
+        """末尾に追加。"""
+        super().append(monster)
+        self.version += 1
+
+    def extend(self, monsters: Iterable[Monster]) -> None:
+        """まとめて末尾に追加。"""
+        super().extend(monsters)
+        self.version += 1
+
+    def insert(self, index: SupportsIndex, monster: Monster) -> None:
+        """指定位置に挿入。"""
+        super().insert(index, monster)
+        self.version += 1
+
+    def remove(self, monster: Monster) -> None:
+        """最初に見つかった要素を削除。"""
+        super().remove(monster)
+        self.version += 1
+
+    def pop(self, index: SupportsIndex = -1) -> Monster:
+        """指定位置の要素を取り出す。"""
+        self.version += 1
+        return super().pop(index)
+
+    def clear(self) -> None:
+        """全要素を削除。"""
+        super().clear()
+        self.version += 1
+
+    def __setitem__(self, index, value) -> None:
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index) -> None:
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, monsters: Iterable[Monster]) -> Self:
+        self.extend(monsters)
+        return self
+
 
 class MonsterSpawner:
     """モンスターの生成と管理を行うクラス"""
@@ -18,8 +89,21 @@ class MonsterSpawner:
     def __init__(self, dungeon_level: int, has_amulet: bool = False):
         self.dungeon_level = dungeon_level
         self.has_amulet = has_amulet  # 復路判定用
-        self.monsters: list[Monster] = []
+        self.monsters = []
         self.occupied_positions: set[tuple[int, int]] = set()
+        # モンスター同士の近傍検索用の空間ハッシュ
+        self.spatial_index: SpatialHash[Monster] = SpatialHash()
+        # 空間ハッシュに反映済みのリストとその世代番号
+        self._indexed_state: tuple[MonsterList, int] = (self._monsters, self._monsters.version)
+
+    @property
+    def monsters(self) -> MonsterList:
+        """フロア上のモンスターのリスト。"""
+        return self._monsters
+
+    @monsters.setter
+    def monsters(self, monsters: Iterable[Monster]) -> None:
+        self._monsters = monsters if isinstance(monsters, MonsterList) else MonsterList(monsters)
 
     def spawn_monsters(self, dungeon_tiles: np.ndarray, rooms: list[any]) -> None:
         """
@@ -73,9 +157,11 @@ class MonsterSpawner:
             self._spawn_monsters_everywhere(dungeon_tiles, monster_count)
         else:
             # 通常時: 部屋ベース配置
+            available_rooms = [room for room in rooms if not room.is_special]
+            taken = set(self.occupied_positions)
+            positions = []
             for _ in range(monster_count):
                 # ランダムな部屋を選択（特別な部屋は除外）
-                available_rooms = [room for room in rooms if not room.is_special]
                 if not available_rooms:
                     break
 
@@ -83,57 +169,97 @@ class MonsterSpawner:
 
                 # 部屋の内部の座標から、まだモンスターがいない場所を選択
                 available_positions = [
-                    (x, y)
-                    for x, y in room.inner
-                    if isinstance(dungeon_tiles[y, x], Floor) and (x, y) not in self.occupied_positions
+                    (x, y) for x, y in room.inner if isinstance(dungeon_tiles[y, x], Floor) and (x, y) not in taken
                 ]
 
                 if not available_positions:
                     continue
 
                 pos = random.choice(available_positions)
-                monster = self._create_monster(pos[0], pos[1])
-                if monster:
-                    self.monsters.append(monster)
-                    self.occupied_positions.add(pos)
-
-    def _create_monster(self, x: int, y: int) -> Monster | None:
-        """指定された位置にモンスターを生成"""
-        # 復路の場合は特別なモンスター出現ルールを適用
-        if self.has_amulet:
-            monster_table = self._get_return_journey_monsters()
-        else:
-            # 階層に応じたモンスター出現テーブルを取得
-            level = min(self.dungeon_level, 26)  # 26階以降は26階の設定を使用
-            monster_table = FLOOR_MONSTERS.get(level, FLOOR_MONSTERS[26])
-
-        # 出現確率に基づいてモンスターを選択
-        total = sum(prob for _, prob in monster_table)
-        r = random.randint(1, total)
-        cumulative = 0
-
-        for monster_id, prob in monster_table:
-            cumulative += prob
-            if r <= cumulative:
-                # モンスターのステータスを取得
-                stats = MONSTER_STATS[monster_id]
-                return Monster(
-                    char=stats[0],
-                    x=x,
-                    y=y,
-                    name=stats[1],
-                    level=stats[2],
-                    hp=stats[3],
-                    max_hp=stats[3],
-                    attack=stats[4],
-                    defense=stats[5],
-                    exp_value=stats[6],
-                    view_range=stats[7],
-                    color=stats[8],
-                    ai_pattern=stats[9],
-                )
+                taken.add(pos)
+                positions.append(pos)
+
+            self._create_monsters(positions)
+
+    def _get_monster_table(self) -> AliasTable[str]:
+        """
+        現在の階層と魔除け所持状態に対応する出現テーブルを取得。
+
+        テーブルは (階層, 魔除け所持) ごとに一度だけコンパイルし、プロセス内でキャッシュします。
+
+        Returns
+        -------
+            モンスターIDを要素とするエイリアステーブル
+
+        """
+        # 26階以降は26階の設定を使用
+        key = (self.dungeon_level if self.has_amulet else min(self.dungeon_level, 26), self.has_amulet)
+        table = _MONSTER_TABLES.get(key)
+        if table is None:
+            if self.has_amulet:
+                # 復路の場合は特別なモンスター出現ルールを適用
+                monster_table = self._get_return_journey_monsters()
+            else:
+                # 階層に応じたモンスター出現テーブルを取得
+                monster_table = FLOOR_MONSTERS.get(key[0], FLOOR_MONSTERS[26])
+            table = AliasTable(monster_table)
+            _MONSTER_TABLES[key] = table
+        return table
+
+    def _create_monster(self, x: int, y: int, monster_id: str | None = None) -> Monster | None:
+        """
+        指定された位置にモンスターを生成。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+            monster_id: 抽選済みのモンスターID（Noneの場合は出現テーブルから抽選）
+
+        Returns:
+        -------
+            生成されたモンスター
+
+        """
+        if monster_id is None:
+            monster_id = self._get_monster_table().sample()
+
+        # モンスターのステータスを取得
+        stats = MONSTER_STATS.get(monster_id)
+        if stats is None:
+            return None
+        return Monster(
+            char=stats[0],
+            x=x,
+            y=y,
+            name=stats[1],
+            level=stats[2],
+            hp=stats[3],
+            max_hp=stats[3],
+            attack=stats[4],
+            defense=stats[5],
+            exp_value=stats[6],
+            view_range=stats[7],
+            color=stats[8],
+            ai_pattern=stats[9],
+        )
+
+    def _create_monsters(self, positions: list[tuple[int, int]]) -> None:
+        """
+        複数の位置にモンスターを生成してフロアに追加。
+
+        モンスターの種類は出現テーブルから一括で抽選します。
+
+        Args:
+        ----
+            positions: 配置する座標 (x, y) のリスト
 
-        return None
+        """
+        monster_ids = self._get_monster_table().sample_many(len(positions))
+        for (x, y), monster_id in zip(positions, monster_ids, strict=True):
+            monster = self._create_monster(x, y, monster_id)
+            if monster:
+                self.add_monster(monster)
 
     def _get_return_journey_monsters(self) -> list[tuple[str, int]]:
         """
@@ -207,16 +333,8 @@ class MonsterSpawner:
             int: 床タイルの総数
 
         """
-        floor_count = 0
-        height, width = dungeon_tiles.shape
-
-        for y in range(height):
-            for x in range(width):
-                # Floor, Door, SecretDoorを歩行可能なタイルとしてカウント
-                if isinstance(dungeon_tiles[y, x], (Floor, Door, SecretDoor)):
-                    floor_count += 1
-
-        return floor_count
+        # Floor, Door, SecretDoorを歩行可能なタイルとしてカウント
+        return int(np.count_nonzero(tile_mask(dungeon_tiles, (Floor, Door, SecretDoor))))
 
     def _spawn_monsters_everywhere(self, dungeon_tiles: np.ndarray, monster_count: int) -> None:
         """
@@ -228,35 +346,16 @@ class MonsterSpawner:
             monster_count: 配置するモンスター数
 
         """
-        # 全ての歩行可能位置を取得
-        walkable_positions = []
-        height, width = dungeon_tiles.shape
-
-        for y in range(height):
-            for x in range(width):
-                if isinstance(dungeon_tiles[y, x], (Floor, Door, SecretDoor)):
-                    walkable_positions.append((x, y))
+        # 歩行可能かつ未占有のマスから非復元抽出する
+        walkable = tile_mask(dungeon_tiles, (Floor, Door, SecretDoor))
+        free_cells = FreeCellSampler(walkable, self.occupied_positions)
 
         # 物理的制限: 歩行可能タイルの90%まで
-        max_possible = int(len(walkable_positions) * 0.9)
+        max_possible = int(np.count_nonzero(walkable) * 0.9)
         monster_count = min(monster_count, max_possible)
 
-        # ランダムに配置位置を選択
-        random.shuffle(walkable_positions)
-
         # 大量配置実行
-        placed_count = 0
-        for pos in walkable_positions:
-            if placed_count >= monster_count:
-                break
-
-            x, y = pos
-            if (x, y) not in self.occupied_positions:
-                monster = self._create_monster(x, y)
-                if monster:
-                    self.monsters.append(monster)
-                    self.occupied_positions.add(pos)
-                    placed_count += 1
+        self._create_monsters(free_cells.sample_many(monster_count))
 
     def _spawn_monsters_in_maze(self, dungeon_tiles: np.ndarray, monster_count: int) -> None:
         """
@@ -270,50 +369,35 @@ class MonsterSpawner:
             monster_count: 配置するモンスター数
 
         """
-        # 迷路の床タイル（通路）を全て取得
-        floor_positions = []
-        height, width = dungeon_tiles.shape
-
-        for y in range(height):
-            for x in range(width):
-                if isinstance(dungeon_tiles[y, x], Floor):
-                    floor_positions.append((x, y))
+        # 迷路の床タイル（通路）のうち未占有のマスから非復元抽出する
+        floor_mask = tile_mask(dungeon_tiles, Floor)
+        floor_count = int(np.count_nonzero(floor_mask))
+        free_cells = FreeCellSampler(floor_mask, self.occupied_positions)
 
         # ★★★ 迷路でのAMULET奪還総攻撃 ★★★
         if self.has_amulet:
             if self.dungeon_level <= 5:
                 # B1F-B5F迷路: 地上封鎖の最終防衛線
-                monster_count = int(len(floor_positions) * 0.50)  # 50%を最強クラスで
+                monster_count = int(floor_count * 0.50)  # 50%を最強クラスで
                 monster_count = max(monster_count, 120)  # 最低120体の精鋭軍
             elif self.dungeon_level <= 10:
                 # B6F-B10F迷路: 第二波迷路総攻撃
-                monster_count = int(len(floor_positions) * 0.45)  # 45%を強敵で
+                monster_count = int(floor_count * 0.45)  # 45%を強敵で
                 monster_count = max(monster_count, 100)  # 最低100体の強敵軍
             else:
                 # B11F-B15F迷路: 深層迷路追撃
-                monster_count = int(len(floor_positions) * 0.40)  # 40%を混成軍で
+                monster_count = int(floor_count * 0.40)  # 40%を混成軍で
                 monster_count = max(monster_count, 80)  # 最低80体の混成軍
         # 通常時の迷路階層調整
-        elif len(floor_positions) > monster_count * 3:
+        elif floor_count > monster_count * 3:
             monster_count = int(monster_count * 1.5)  # 1.5倍に増やす
 
         # 物理的制限: 全床タイルの90%まで（プレイヤーの移動スペース確保）
-        max_possible = int(len(floor_positions) * 0.9)
+        max_possible = int(floor_count * 0.9)
         monster_count = min(monster_count, max_possible)
 
-        # ランダムに配置位置を選択
-        random.shuffle(floor_positions)
-
         # モンスターを配置
-        for i in range(min(monster_count, len(floor_positions))):
-            x, y = floor_positions[i]
-
-            # 既に占有されていないかチェック
-            if (x, y) not in self.occupied_positions:
-                monster = self._create_monster(x, y)
-                if monster:
-                    self.monsters.append(monster)
-                    self.occupied_positions.add((x, y))
+        self._create_monsters(free_cells.sample_many(monster_count))
 
     def update_monsters(self, player_x: int, player_y: int, dungeon_tiles: np.ndarray, fov_map: any) -> None:
         """
@@ -330,6 +414,8 @@ class MonsterSpawner:
         # 死亡したモンスターを除去
         self.monsters = [m for m in self.monsters if not m.is_dead()]
         self.occupied_positions = {(m.x, m.y) for m in self.monsters}
+        self.spatial_index.rebuild(self.monsters)
+        self._mark_indexed()
 
         for monster in self.monsters:
             if not monster.is_hostile:
@@ -367,22 +453,92 @@ class MonsterSpawner:
 
                 # 移動を実行
                 monster.move(dx, dy)
+                self.spatial_index.move(monster, monster.x, monster.y)
 
                 # 新しい位置を記録
                 self.occupied_positions.add((monster.x, monster.y))
 
+    def add_monster(self, monster: Monster) -> None:
+        """
+        モンスターをフロアに追加。
+
+        Args:
+        ----
+            monster: 追加するモンスター
+
+        """
+        self._sync_spatial_index()
+        self.monsters.append(monster)
+        self.occupied_positions.add((monster.x, monster.y))
+        self.spatial_index.insert(monster, monster.x, monster.y)
+        self._mark_indexed()
+
+    def move_monster(self, monster: Monster, x: int, y: int) -> None:
+        """
+        モンスターを指定座標へ移動し、占有位置と空間ハッシュを更新。
+
+        Args:
+        ----
+            monster: 移動するモンスター
+            x: 移動先のX座標
+            y: 移動先のY座標
+
+        """
+        self.occupied_positions.discard((monster.x, monster.y))
+        monster.x = x
+        monster.y = y
+        self.occupied_positions.add((x, y))
+        self.spatial_index.move(monster, x, y)
+
     def get_monster_at(self, x: int, y: int) -> Monster | None:
         """指定された位置にいるモンスターを取得"""
-        for monster in self.monsters:
-            if monster.x == x and monster.y == y:
-                return monster
-        return None
+        self._sync_spatial_index()
+        return next(self.spatial_index.at(x, y), None)
+
+    def get_monsters_in_range(
+        self,
+        x: int,
+        y: int,
+        radius: float,
+        metric: DistanceMetric = DistanceMetric.CHEBYSHEV,
+    ) -> list[Monster]:
+        """
+        指定座標から一定距離内のモンスターを取得。
+
+        Args:
+        ----
+            x: 中心のX座標
+            y: 中心のY座標
+            radius: 検索半径
+            metric: 距離の種類
+
+        Returns:
+        -------
+            範囲内のモンスターのリスト
+
+        """
+        self._sync_spatial_index()
+        return self.spatial_index.query(x, y, radius, metric)
 
     def remove_monster(self, monster: Monster) -> None:
         """モンスターをリストから削除"""
+        self._sync_spatial_index()
+        self.spatial_index.remove(monster)
         if monster in self.monsters:
             self.monsters.remove(monster)
+            self._mark_indexed()
             # 占有位置からも削除
             pos = (monster.x, monster.y)
             if pos in self.occupied_positions:
                 self.occupied_positions.remove(pos)
+
+    def _sync_spatial_index(self) -> None:
+        """monstersリストが直接変更・差し替えされていた場合に空間ハッシュを作り直す。"""
+        indexed, version = self._indexed_state
+        if indexed is not self._monsters or version != self._monsters.version:
+            self.spatial_index.rebuild(self._monsters)
+            self._mark_indexed()
+
+    def _mark_indexed(self) -> None:
+        """現在のmonstersリストが空間ハッシュに反映済みであることを記録。"""
+        self._indexed_state = (self._monsters, self._monsters.version)
@@ -110,7 +110,7 @@ class AmuletOfYendor(Item):
             for x in range(1, width - 1):
                 if isinstance(tiles[y, x], Floor):
                     # 最初に見つかった床タイルに上り階段を配置
-                    tiles[y, x] = StairsUp()
+                    floor_data.tile_buffer.set_tile(tiles, x, y, StairsUp.shared())
                     return (x, y)
 
         return None
@@ -258,6 +258,7 @@ class EnchantWeaponEffect(InstantEffect):
             return True
 
         weapon.enchantment += 1
+        player.inventory.mark_changed()
         enchant_text = f"+{weapon.enchantment}" if weapon.enchantment > 0 else ""
         _add_message_safe(
             context,
@@ -287,6 +288,7 @@ class EnchantArmorEffect(InstantEffect):
             return True
 
         armor.enchantment += 1
+        player.inventory.mark_changed()
         enchant_text = f"+{armor.enchantment}" if armor.enchantment > 0 else ""
         _add_message_safe(
             context,
@@ -447,8 +449,8 @@ class MagicMissileWandEffect(WandEffect):
                 context.player.gain_exp(monster.exp_value)
                 # Remove monster from floor
                 current_floor = _get_floor_data_safe(context)
-                if current_floor and monster in current_floor.monster_spawner.monsters:
-                    current_floor.monster_spawner.monsters.remove(monster)
+                if current_floor:
+                    current_floor.monster_spawner.remove_monster(monster)
         else:
             _add_message_safe(context, "Your magic missile dissipates harmlessly.")
 
@@ -480,8 +482,8 @@ class LightningWandEffect(WandEffect):
                 context.player.gain_exp(monster.exp_value)
                 # Remove monster from floor
                 current_floor = _get_floor_data_safe(context)
-                if current_floor and monster in current_floor.monster_spawner.monsters:
-                    current_floor.monster_spawner.monsters.remove(monster)
+                if current_floor:
+                    current_floor.monster_spawner.remove_monster(monster)
         else:
             _add_message_safe(context, "Lightning crackles harmlessly through the air.")
 
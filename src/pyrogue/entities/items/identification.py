@@ -14,6 +14,9 @@ class ItemIdentification:
 
     def __init__(self) -> None:
         """識別状態を初期化"""
+        # 識別状態が変わるたびに増える世代番号（表示名のキャッシュ用）
+        self.version = 0
+
         # 識別済みアイテムを追跡
         self.identified_potions: set[str] = set()
         self.identified_scrolls: set[str] = set()
@@ -211,22 +214,28 @@ class ItemIdentification:
         # 未対応のアイテムタイプや武器・防具は常に識別済み
         return item_name
 
+    def mark_changed(self) -> None:
+        """
+        識別状態の変更を記録。
+
+        識別済みセットや外観マッピングを直接変更した場合に呼び出します。
+        """
+        self.version += 1
+
     def identify_item(self, item_name: str, item_type: str) -> bool:
         """アイテムを識別"""
-        if item_type == "POTION" and item_name not in self.identified_potions:
-            self.identified_potions.add(item_name)
-            return True
-        if item_type == "SCROLL" and item_name not in self.identified_scrolls:
-            self.identified_scrolls.add(item_name)
-            return True
-        if item_type == "RING" and item_name not in self.identified_rings:
-            self.identified_rings.add(item_name)
-            return True
-        if item_type == "WAND" and item_name not in self.identified_wands:
-            self.identified_wands.add(item_name)
-            return True
-
-        return False  # 既に識別済み
+        identified = {
+            "POTION": self.identified_potions,
+            "SCROLL": self.identified_scrolls,
+            "RING": self.identified_rings,
+            "WAND": self.identified_wands,
+        }.get(item_type)
+        if identified is None or item_name in identified:
+            return False  # 既に識別済み
+
+        identified.add(item_name)
+        self.mark_changed()
+        return True
 
     def is_identified(self, item_name: str, item_type: str) -> bool:
         """アイテムが識別済みかどうかを判定"""
@@ -16,10 +16,13 @@ Example:
 from __future__ import annotations
 
 import random
+from functools import cache
 
 import numpy as np
 
 from pyrogue.map.dungeon import Room
+from pyrogue.map.dungeon.free_cells import FreeCellSampler, walkable_mask
+from pyrogue.utils.alias_table import AliasTable
 
 from .amulet import AmuletOfYendor
 from .effects import (
@@ -35,18 +38,67 @@ from .effects import (
 )
 from .item import Armor, Food, Gold, Item, Potion, Ring, Scroll, Wand, Weapon
 from .item_types import (
-    ARMORS,
-    FOODS,
-    POTIONS,
-    RINGS,
-    SCROLLS,
-    WANDS,
-    WEAPONS,
-    get_available_items,
+    ArmorType,
+    FoodType,
+    ItemType,
+    PotionType,
+    RingType,
+    ScrollType,
+    WandType,
+    WeaponType,
     get_gold_amount,
     get_item_spawn_count,
+    get_spawn_table,
 )
 
+# カテゴリごとの基本出現重み（食料は階層で補正）
+CATEGORY_WEIGHTS: dict[str, int] = {
+    "weapon": 15,
+    "armor": 15,
+    "ring": 10,
+    "scroll": 25,
+    "potion": 25,
+    "food": 20,
+    "wand": 10,
+    "gold": 35,
+}
+
+
+@cache
+def get_floor_item_table(floor: int) -> AliasTable[tuple[str, ItemType | None]]:
+    """
+    階層のアイテム出現テーブルを取得（プロセス内でキャッシュ）。
+
+    カテゴリの抽選とカテゴリ内の種類の抽選を1つの同時分布にまとめたテーブルです。
+    その階層に出現する種類がないカテゴリは (カテゴリ, None) として残し、
+    従来どおり何も配置されない結果になります。
+
+    Args:
+    ----
+        floor: 階層
+
+    Returns:
+    -------
+        (カテゴリ, アイテムタイプ) を要素とするエイリアステーブル
+
+    """
+    # 深い階層ほど食料の重みを増加（10階層以降は3階層ごとに+5）
+    weights = dict(CATEGORY_WEIGHTS)
+    weights["food"] += max(0, (floor - 10) // 3) * 5
+
+    entries: list[tuple[tuple[str, ItemType | None], float]] = []
+    for category, category_weight in weights.items():
+        table = get_spawn_table(floor, category) if category != "gold" else None
+        if table is None:
+            entries.append(((category, None), category_weight))
+            continue
+        total = float(table.weights.sum())
+        entries.extend(
+            ((category, item_type), category_weight * weight / total)
+            for item_type, weight in zip(table.items, table.weights, strict=True)
+        )
+    return AliasTable(entries)
+
 
 class ItemSpawner:
     """
@@ -61,6 +113,7 @@ class ItemSpawner:
         floor: 現在の階層
         items: 配置されたアイテムのリスト
         occupied_positions: アイテムが配置されている座標のセット
+        free_cells: 部屋がない階層での配置候補（spawn_items中のみ有効）
 
     """
 
@@ -76,6 +129,7 @@ class ItemSpawner:
         self.floor = floor
         self.items: list[Item] = []
         self.occupied_positions: set[tuple[int, int]] = set()
+        self.free_cells: FreeCellSampler | None = None
 
     def spawn_items(self, dungeon_tiles: np.ndarray, rooms: list[Room]) -> None:
         """
@@ -92,6 +146,7 @@ class ItemSpawner:
         """
         self.items.clear()
         self.occupied_positions.clear()  # 位置情報もクリア
+        self.free_cells = None
 
         # Get total number of items to spawn on this floor
         total_items = get_item_spawn_count(self.floor)
@@ -109,8 +164,8 @@ class ItemSpawner:
                 self.items.append(amulet)
                 self.occupied_positions.add((x, y))  # 位置を追加
 
-        # Spawn regular items
-        for _ in range(total_items):
+        # Spawn regular items（カテゴリと種類は階層のテーブルから一括で抽選）
+        for category, item_type in get_floor_item_table(self.floor).sample_many(total_items):
             # 迷路階層など部屋がない場合は床タイルから直接選択
             if not rooms:
                 x, y = self._find_valid_position_anywhere(dungeon_tiles)
@@ -121,35 +176,7 @@ class ItemSpawner:
             if x is None or y is None:
                 continue
 
-            # Determine item type with floor-based food weight adjustment
-            base_food_weight = 20
-            # 深い階層ほど食料の重みを増加（10階層以降は段階的に増加）
-            floor_food_bonus = max(0, (self.floor - 10) // 3) * 5  # 3階層ごとに+5
-            food_weight = base_food_weight + floor_food_bonus
-
-            item_type = random.choices(
-                ["weapon", "armor", "ring", "scroll", "potion", "food", "wand", "gold"],
-                weights=[15, 15, 10, 25, 25, food_weight, 10, 35],
-                k=1,
-            )[0]
-
-            item: Item | None = None
-            if item_type == "weapon":
-                item = self._create_weapon()
-            elif item_type == "armor":
-                item = self._create_armor()
-            elif item_type == "ring":
-                item = self._create_ring()
-            elif item_type == "scroll":
-                item = self._create_scroll()
-            elif item_type == "potion":
-                item = self._create_potion()
-            elif item_type == "food":
-                item = self._create_food()
-            elif item_type == "wand":
-                item = self._create_wand()
-            else:  # gold
-                item = self._create_gold()
+            item = self._create_item(category, item_type)
 
             if item:
                 item.x = x
@@ -157,6 +184,8 @@ class ItemSpawner:
                 self.items.append(item)
                 self.occupied_positions.add((x, y))  # 位置を追加
 
+        self.free_cells = None
+
     def _find_valid_position(self, dungeon_tiles: np.ndarray, room: Room) -> tuple[int | None, int | None]:
         """
         指定された部屋内でアイテムの有効な配置位置を検索。
@@ -194,6 +223,7 @@ class ItemSpawner:
         ダンジョン全体でアイテムの有効な配置位置を検索。
 
         迷路階層など部屋がない場合に使用します。
+        歩行可能で未占有のマスから非復元抽出するため、候補が残っている限り必ず見つかります。
 
         Args:
         ----
@@ -204,18 +234,17 @@ class ItemSpawner:
             有効な位置の(x, y)座標。見つからない場合は(None, None)
 
         """
-        height, width = dungeon_tiles.shape
+        if self.free_cells is None:
+            # 外周を除く歩行可能なマスから、配置済みの位置を除いて一度だけ作成する
+            mask = walkable_mask(dungeon_tiles)
+            mask[[0, -1], :] = False
+            mask[:, [0, -1]] = False
+            self.free_cells = FreeCellSampler(mask, self.occupied_positions)
 
-        # 最大50回試行して有効な位置を探す
-        for _ in range(50):
-            x = random.randint(1, width - 2)
-            y = random.randint(1, height - 2)
-
-            # 歩行可能で占有されていない位置をチェック
-            if dungeon_tiles[y, x].walkable and not self._is_position_occupied(x, y):
-                return x, y
-
-        return None, None
+        position = self.free_cells.sample()
+        if position is None:
+            return None, None
+        return position
 
     def _is_position_occupied(self, x: int, y: int) -> bool:
         """
@@ -233,141 +262,207 @@ class ItemSpawner:
         """
         return any(item.x == x and item.y == y for item in self.items)
 
-    def _create_weapon(self) -> Weapon | None:
+    def _create_item(self, category: str, item_type: ItemType | None) -> Item | None:
+        """
+        抽選済みのカテゴリと種類からアイテムを生成。
+
+        Args:
+        ----
+            category: アイテムのカテゴリ
+            item_type: アイテムタイプ（金貨や出現する種類がないカテゴリではNone）
+
+        Returns:
+        -------
+            生成されたアイテム。生成できない場合はNone
+
+        """
+        if category == "gold":
+            return self._create_gold()
+        if item_type is None:
+            return None
+        creators = {
+            "weapon": self._create_weapon,
+            "armor": self._create_armor,
+            "ring": self._create_ring,
+            "scroll": self._create_scroll,
+            "potion": self._create_potion,
+            "food": self._create_food,
+            "wand": self._create_wand,
+        }
+        return creators[category](item_type)
+
+    def _draw_type(self, category: str) -> ItemType | None:
+        """
+        現在の階層のテーブルからカテゴリ内の種類を1つ抽選。
+
+        Args:
+        ----
+            category: アイテムのカテゴリ
+
+        Returns:
+        -------
+            抽選されたアイテムタイプ。出現する種類がない場合はNone
+
+        """
+        table = get_spawn_table(self.floor, category)
+        return table.sample() if table is not None else None
+
+    def _create_weapon(self, weapon_type: WeaponType | None = None) -> Weapon | None:
         """
         ランダムな武器を生成。
 
-        現在の階層で利用可能な武器タイプから重み付き抽選で選択し、
+        種類を指定しない場合は現在の階層の出現テーブルから抽選し、
         ボーナス値もランダムに決定します。
 
-        Returns
+        Args:
+        ----
+            weapon_type: 抽選済みの武器タイプ
+
+        Returns:
         -------
             生成された武器。利用可能な武器がない場合はNone
 
         """
-        available = get_available_items(self.floor, WEAPONS)
-        if not available:
+        weapon_type = weapon_type or self._draw_type("weapon")
+        if weapon_type is None:
             return None
 
-        weapon_type = random.choices(available, weights=[w.spawn_weight for w in available], k=1)[0]
         bonus = random.randint(*weapon_type.bonus_range)
         return Weapon(0, 0, weapon_type.name, bonus)
 
-    def _create_armor(self) -> Armor | None:
+    def _create_armor(self, armor_type: ArmorType | None = None) -> Armor | None:
         """
         ランダムな防具を生成。
 
-        現在の階層で利用可能な防具タイプから重み付き抽選で選択し、
+        種類を指定しない場合は現在の階層の出現テーブルから抽選し、
         ボーナス値もランダムに決定します。
 
-        Returns
+        Args:
+        ----
+            armor_type: 抽選済みの防具タイプ
+
+        Returns:
         -------
             生成された防具。利用可能な防具がない場合はNone
 
         """
-        available = get_available_items(self.floor, ARMORS)
-        if not available:
+        armor_type = armor_type or self._draw_type("armor")
+        if armor_type is None:
             return None
 
-        armor_type = random.choices(available, weights=[a.spawn_weight for a in available], k=1)[0]
         bonus = random.randint(*armor_type.bonus_range)
         return Armor(0, 0, armor_type.name, bonus)
 
-    def _create_ring(self) -> Ring | None:
+    def _create_ring(self, ring_type: RingType | None = None) -> Ring | None:
         """
         ランダムな指輪を生成。
 
-        現在の階層で利用可能な指輪タイプから重み付き抽選で選択し、
+        種類を指定しない場合は現在の階層の出現テーブルから抽選し、
         効果の強度もランダムに決定します。
 
-        Returns
+        Args:
+        ----
+            ring_type: 抽選済みの指輪タイプ
+
+        Returns:
         -------
             生成された指輪。利用可能な指輪がない場合はNone
 
         """
-        available = get_available_items(self.floor, RINGS)
-        if not available:
+        ring_type = ring_type or self._draw_type("ring")
+        if ring_type is None:
             return None
 
-        ring_type = random.choices(available, weights=[r.spawn_weight for r in available], k=1)[0]
         power = random.randint(*ring_type.power_range)
         return Ring(0, 0, ring_type.name, ring_type.effect, power)
 
-    def _create_scroll(self) -> Scroll | None:
+    def _create_scroll(self, scroll_type: ScrollType | None = None) -> Scroll | None:
         """
         ランダムな巻物を生成。
 
-        現在の階層で利用可能な巻物タイプから重み付き抽選で選択します。
+        種類を指定しない場合は現在の階層の出現テーブルから抽選します。
 
-        Returns
+        Args:
+        ----
+            scroll_type: 抽選済みの巻物タイプ
+
+        Returns:
         -------
             生成された巻物。利用可能な巻物がない場合はNone
 
         """
-        available = get_available_items(self.floor, SCROLLS)
-        if not available:
+        scroll_type = scroll_type or self._draw_type("scroll")
+        if scroll_type is None:
             return None
 
-        scroll_type = random.choices(available, weights=[s.spawn_weight for s in available], k=1)[0]
         effect = self._get_scroll_effect(scroll_type.effect)
         return Scroll(0, 0, scroll_type.name, effect)
 
-    def _create_potion(self) -> Potion | None:
+    def _create_potion(self, potion_type: PotionType | None = None) -> Potion | None:
         """
         ランダムなポーションを生成。
 
-        現在の階層で利用可能なポーションタイプから重み付き抽選で選択し、
+        種類を指定しない場合は現在の階層の出現テーブルから抽選し、
         効果の強度もランダムに決定します。
 
-        Returns
+        Args:
+        ----
+            potion_type: 抽選済みのポーションタイプ
+
+        Returns:
         -------
             生成されたポーション。利用可能なポーションがない場合はNone
 
         """
-        available = get_available_items(self.floor, POTIONS)
-        if not available:
+        potion_type = potion_type or self._draw_type("potion")
+        if potion_type is None:
             return None
 
-        potion_type = random.choices(available, weights=[p.spawn_weight for p in available], k=1)[0]
         effect = self._get_potion_effect(potion_type.effect, potion_type.power_range)
         return Potion(0, 0, potion_type.name, effect)
 
-    def _create_food(self) -> Food | None:
+    def _create_food(self, food_type: FoodType | None = None) -> Food | None:
         """
         ランダムな食料を生成。
 
-        現在の階層で利用可能な食料タイプから重み付き抽選で選択します。
+        種類を指定しない場合は現在の階層の出現テーブルから抽選します。
 
-        Returns
+        Args:
+        ----
+            food_type: 抽選済みの食料タイプ
+
+        Returns:
         -------
             生成された食料。利用可能な食料がない場合はNone
 
         """
-        available = get_available_items(self.floor, FOODS)
-        if not available:
+        food_type = food_type or self._draw_type("food")
+        if food_type is None:
             return None
 
-        food_type = random.choices(available, weights=[f.spawn_weight for f in available], k=1)[0]
         effect = self._get_food_effect(food_type.nutrition)
         return Food(0, 0, food_type.name, effect)
 
-    def _create_wand(self) -> Wand | None:
+    def _create_wand(self, wand_type: WandType | None = None) -> Wand | None:
         """
         ランダムなワンドを生成。
 
-        現在の階層で利用可能なワンドタイプから重み付き抽選で選択し、
+        種類を指定しない場合は現在の階層の出現テーブルから抽選し、
         チャージ数もランダムに決定します。
 
-        Returns
+        Args:
+        ----
+            wand_type: 抽選済みのワンドタイプ
+
+        Returns:
         -------
             生成されたワンド。利用可能なワンドがない場合はNone
 
         """
-        available = get_available_items(self.floor, WANDS)
-        if not available:
+        wand_type = wand_type or self._draw_type("wand")
+        if wand_type is None:
             return None
 
-        wand_type = random.choices(available, weights=[w.spawn_weight for w in available], k=1)[0]
         charges = random.randint(*wand_type.charges_range)
         effect = self._get_wand_effect(wand_type.effect)
         return Wand(0, 0, wand_type.name, effect, charges)
@@ -2,6 +2,9 @@
 
 import random
 from dataclasses import dataclass
+from functools import cache
+
+from pyrogue.utils.alias_table import AliasTable
 
 
 @dataclass
@@ -174,6 +177,27 @@ def get_available_items(floor: int, item_list: list[ItemType]) -> list[ItemType]
     return [i for i in item_list if i.min_floor <= floor <= i.max_floor]
 
 
+# Type catalogs by spawn category
+ITEM_CATALOGS: dict[str, list[ItemType]] = {
+    "weapon": WEAPONS,
+    "armor": ARMORS,
+    "ring": RINGS,
+    "scroll": SCROLLS,
+    "potion": POTIONS,
+    "food": FOODS,
+    "wand": WANDS,
+}
+
+
+@cache
+def get_spawn_table(floor: int, category: str) -> AliasTable[ItemType] | None:
+    """Get the compiled spawn table of a category on the given floor (cached per process)."""
+    available = get_available_items(floor, ITEM_CATALOGS[category])
+    if not available:
+        return None
+    return AliasTable((item_type, item_type.spawn_weight) for item_type in available)
+
+
 # Special room item generation - オリジナルRogue準拠の宝物部屋
 def get_treasure_room_items(floor: int) -> list[ItemType]:
     """Get items to spawn in a treasure room."""
@@ -8,18 +8,26 @@
 Example:
 -------
     $ python -m pyrogue.main
+    $ python -m pyrogue.main --startup-profile
 
 """
 
+from __future__ import annotations
+
 import argparse
 import sys
 import traceback
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
 
 from pyrogue.config.env import env_config
-from pyrogue.core.cli_engine import CLIEngine
-from pyrogue.core.engine import Engine
 from pyrogue.utils import game_logger
 
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from pyrogue.utils.startup_profiler import StartupProfiler
+
 
 def main() -> None:
     """
@@ -36,15 +44,43 @@ def main() -> None:
 
     parser = argparse.ArgumentParser(description="PyRogue - A Python Roguelike Game")
     parser.add_argument("--cli", action="store_true", help="Run in CLI mode for automated testing")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument("--quiet", action="store_true", help="With --cli, print only command results and what changed")
+    output.add_argument("--json", action="store_true", help="With --cli, print one JSON object per command")
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Report per-module import and initialization time up to the first frame",
+    )
     args = parser.parse_args()
 
+    profiler = None
+    if args.startup_profile:
+        from pyrogue.utils.startup_profiler import StartupProfiler
+
+        profiler = StartupProfiler()
+        profiler.install()
+
     try:
+        # CLIモードとGUIモードはそれぞれのエンジンだけを読み込む
         if args.cli:
-            engine = CLIEngine()
+            with _phase(profiler, "import cli_engine"):
+                from pyrogue.core.cli_engine import CLIEngine
+            with _phase(profiler, "CLIEngine()"):
+                engine = CLIEngine("json" if args.json else "quiet" if args.quiet else "text")
+            if profiler:
+                # CLIモードは入力待ちになるため、ループ開始前に報告する
+                profiler.report()
             engine.run()
         else:
-            engine = Engine()
-            engine.initialize()
+            with _phase(profiler, "import engine"):
+                from pyrogue.core.engine import Engine
+            with _phase(profiler, "Engine()"):
+                engine = Engine()
+            with _phase(profiler, "Engine.initialize()"):
+                engine.initialize()
+            # 最初の画面転送時にレポートを出力する
+            engine.startup_profiler = profiler
             engine.run()
     except Exception as e:
         game_logger.error("Fatal error", extra={"error": str(e), "traceback": traceback.format_exc()})
@@ -53,5 +89,10 @@ def main() -> None:
         sys.exit(1)
 
 
+def _phase(profiler: StartupProfiler | None, name: str) -> AbstractContextManager[None]:
+    """プロファイラーが有効な場合だけ初期化段階を計測する。"""
+    return profiler.phase(name) if profiler else nullcontext()
+
+
 if __name__ == "__main__":
     main()
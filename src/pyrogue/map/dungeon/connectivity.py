@@ -0,0 +1,366 @@
+"""
+連結成分ラベリングエンジン。
+
+このモジュールは、歩行可能マスク上の連結成分（4近傍）を
+スキャンライン方式で一度にラベル付けし、成分ごとのサイズ・外接矩形・
+成分間の最近点といった問い合わせを提供します。
+また、1点からの距離マップによる到達可能性の問い合わせも提供します。
+迷路生成の連結性保証とダンジョン検証で共通に使用されます。
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import tcod.path
+
+# 背景（歩行不可）のラベル値
+BACKGROUND = 0
+
+# 距離マップで到達不能なマスの値
+UNREACHABLE = np.iinfo(np.int32).max
+
+
+def _find(parents: list[int], node: int) -> int:
+    root = node
+    while parents[root] != root:
+        root = parents[root]
+    # 経路圧縮
+    while parents[node] != root:
+        parents[node], node = root, parents[node]
+    return root
+
+
+class ComponentLabels:
+    """
+    連結成分のラベル付け結果。
+
+    Attributes
+    ----------
+        labels: 各マスの成分ラベル（0は歩行不可、1以上が成分番号）のint32配列
+        count: 成分の数
+        sizes: 成分ごとのマス数（インデックス0は歩行不可マスの数）
+        bounding_boxes: 成分ごとの外接矩形 (x0, y0, x1, y1)（両端を含む、インデックス0は未使用）
+
+    """
+
+    def __init__(self, labels: np.ndarray, count: int) -> None:
+        """
+        ラベル付け結果を初期化。
+
+        Args:
+        ----
+            labels: 成分ラベルの配列
+            count: 成分の数
+
+        """
+        self.labels = labels
+        self.count = count
+        self.sizes = np.bincount(labels.ravel(), minlength=count + 1)
+
+        height, width = labels.shape
+        ys, xs = np.nonzero(labels)
+        ids = labels[ys, xs]
+        boxes = np.empty((count + 1, 4), dtype=np.int32)
+        boxes[:, 0:2] = (width, height)
+        boxes[:, 2:4] = -1
+        np.minimum.at(boxes[:, 0], ids, xs)
+        np.minimum.at(boxes[:, 1], ids, ys)
+        np.maximum.at(boxes[:, 2], ids, xs)
+        np.maximum.at(boxes[:, 3], ids, ys)
+        self.bounding_boxes = boxes
+
+    def largest(self) -> int:
+        """
+        最大の成分のラベルを取得。
+
+        Returns
+        -------
+            最大成分のラベル（成分がない場合は0）
+
+        """
+        if self.count == 0:
+            return BACKGROUND
+        return int(np.argmax(self.sizes[1:])) + 1
+
+    def label_at(self, x: int, y: int) -> int:
+        """
+        指定座標の成分ラベルを取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            成分ラベル（範囲外や歩行不可の場合は0）
+
+        """
+        height, width = self.labels.shape
+        if not (0 <= x < width and 0 <= y < height):
+            return BACKGROUND
+        return int(self.labels[y, x])
+
+    def connected(self, a: tuple[int, int], b: tuple[int, int]) -> bool:
+        """
+        2点が同じ成分に属するかチェック。
+
+        Args:
+        ----
+            a: 1点目の座標
+            b: 2点目の座標
+
+        Returns:
+        -------
+            同じ成分に属する場合True
+
+        """
+        label = self.label_at(*a)
+        return label != BACKGROUND and label == self.label_at(*b)
+
+    def mask(self, label: int) -> np.ndarray:
+        """
+        指定成分のマスクを取得。
+
+        Args:
+        ----
+            label: 成分ラベル
+
+        Returns:
+        -------
+            成分に属するマスがTrueのブール配列
+
+        """
+        return self.labels == label
+
+    def points(self, label: int) -> list[tuple[int, int]]:
+        """
+        指定成分に属する座標の一覧を取得（走査順）。
+
+        Args:
+        ----
+            label: 成分ラベル
+
+        Returns:
+        -------
+            (x, y) のリスト
+
+        """
+        x0, y0, x1, y1 = self.bounding_boxes[label]
+        ys, xs = np.nonzero(self.labels[y0 : y1 + 1, x0 : x1 + 1] == label)
+        return [(int(x) + x0, int(y) + y0) for x, y in zip(xs, ys, strict=True)]
+
+    def nearest_point(self, label: int, x: int, y: int) -> tuple[tuple[int, int], int] | None:
+        """
+        指定成分のうち、指定座標に最も近い（マンハッタン距離）マスを取得。
+
+        Args:
+        ----
+            label: 成分ラベル
+            x: 基準のX座標
+            y: 基準のY座標
+
+        Returns:
+        -------
+            ((x, y), 距離)。成分が空の場合はNone
+
+        """
+        ys, xs = np.nonzero(self.labels == label)
+        if len(xs) == 0:
+            return None
+        distances = np.abs(xs - x) + np.abs(ys - y)
+        index = int(np.argmin(distances))
+        return (int(xs[index]), int(ys[index])), int(distances[index])
+
+    def nearest_points(self, label_a: int, label_b: int) -> tuple[tuple[int, int], tuple[int, int], int] | None:
+        """
+        2つの成分間で最も近い（マンハッタン距離）点の組を取得。
+
+        Args:
+        ----
+            label_a: 1つ目の成分ラベル
+            label_b: 2つ目の成分ラベル
+
+        Returns:
+        -------
+            (成分Aの点, 成分Bの点, 距離)。どちらかの成分が空の場合はNone
+
+        """
+        ay, ax = np.nonzero(self.labels == label_a)
+        by, bx = np.nonzero(self.labels == label_b)
+        if len(ax) == 0 or len(bx) == 0:
+            return None
+
+        best: tuple[tuple[int, int], tuple[int, int], int] | None = None
+        # メモリ使用量を抑えるため成分Aを分割して距離行列を計算
+        chunk = max(1, 1_000_000 // len(bx))
+        for start in range(0, len(ax), chunk):
+            cx, cy = ax[start : start + chunk], ay[start : start + chunk]
+            distances = np.abs(cx[:, None] - bx[None, :]) + np.abs(cy[:, None] - by[None, :])
+            i, j = np.unravel_index(int(np.argmin(distances)), distances.shape)
+            distance = int(distances[i, j])
+            if best is None or distance < best[2]:
+                best = ((int(cx[i]), int(cy[i])), (int(bx[j]), int(by[j])), distance)
+        return best
+
+
+def label_components(walkable: np.ndarray) -> ComponentLabels:
+    """
+    歩行可能マスクの連結成分（4近傍）をラベル付け。
+
+    各行の連続区間（ラン）を一括で抽出し、上下に重なるラン同士を
+    Union-Findで統合するスキャンライン方式です。Pythonでの処理は
+    マス数ではなくラン数に比例します。
+
+    Args:
+    ----
+        walkable: 歩行可能マスク
+
+    Returns:
+    -------
+        ラベル付け結果
+
+    """
+    mask = np.asarray(walkable, dtype=bool)
+    if mask.size == 0 or not mask.any():
+        return ComponentLabels(np.zeros(mask.shape, dtype=np.int32), 0)
+
+    # 各行の区間の開始位置を検出し、ランIDを割り当てる
+    starts = mask.copy()
+    starts[:, 1:] &= ~mask[:, :-1]
+    run_ids = np.cumsum(starts.ravel(), dtype=np.int32).reshape(mask.shape) - 1
+    run_count = int(run_ids.max()) + 1 if starts.any() else 0
+
+    # 上下に隣接するランの組を統合
+    vertical = mask[:-1, :] & mask[1:, :]
+    upper = run_ids[:-1, :][vertical]
+    lower = run_ids[1:, :][vertical]
+    pairs = np.unique(upper.astype(np.int64) * run_count + lower)
+
+    parents = list(range(run_count))
+    for a, b in zip((pairs // run_count).tolist(), (pairs % run_count).tolist(), strict=True):
+        root_a, root_b = _find(parents, a), _find(parents, b)
+        if root_a != root_b:
+            if root_a < root_b:
+                parents[root_b] = root_a
+            else:
+                parents[root_a] = root_b
+
+    # ルートを走査順の連番ラベルに変換
+    roots = np.fromiter((_find(parents, run) for run in range(run_count)), dtype=np.int64, count=run_count)
+    unique_roots, run_labels = np.unique(roots, return_inverse=True)
+    run_labels = (run_labels + 1).astype(np.int32)
+
+    labels = np.zeros(mask.shape, dtype=np.int32)
+    labels[mask] = run_labels[run_ids[mask]]
+    return ComponentLabels(labels, len(unique_roots))
+
+
+class DistanceMap:
+    """
+    1点から各マスへの歩数マップ（8方向移動）。
+
+    一度の計算で、任意のマスへの到達可能性と歩数を配列参照だけで答えます。
+
+    Attributes
+    ----------
+        origin: 起点の座標
+        distances: 各マスへの歩数のint32配列（到達不能はUNREACHABLE）
+
+    """
+
+    def __init__(self, passable: np.ndarray, origin: tuple[int, int]) -> None:
+        """
+        距離マップを計算。
+
+        Args:
+        ----
+            passable: 通行可能マスク
+            origin: 起点の座標 (x, y)
+
+        """
+        self.origin = origin
+        cost = np.asarray(passable, dtype=np.int8).copy()
+        self.distances = np.full(cost.shape, UNREACHABLE, dtype=np.int32)
+
+        x, y = origin
+        height, width = cost.shape
+        if 0 <= x < width and 0 <= y < height:
+            cost[y, x] = 1
+            self.distances[y, x] = 0
+            tcod.path.dijkstra2d(self.distances, cost, 1, 1, out=self.distances)
+
+    @property
+    def reachable_mask(self) -> np.ndarray:
+        """到達可能なマスがTrueのブール配列。"""
+        return self.distances != UNREACHABLE
+
+    def distance_to(self, x: int, y: int) -> int | None:
+        """
+        指定座標までの歩数を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            歩数（範囲外または到達不能の場合はNone）
+
+        """
+        height, width = self.distances.shape
+        if not (0 <= x < width and 0 <= y < height):
+            return None
+        distance = int(self.distances[y, x])
+        return None if distance == UNREACHABLE else distance
+
+    def is_reachable(self, x: int, y: int) -> bool:
+        """
+        指定座標に到達可能かチェック。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            到達可能な場合True
+
+        """
+        return self.distance_to(x, y) is not None
+
+    def any_reachable(self, x0: int, y0: int, x1: int, y1: int) -> bool:
+        """
+        矩形領域（x1, y1は含まない）内に到達可能なマスがあるかチェック。
+
+        Args:
+        ----
+            x0: 左端のX座標
+            y0: 上端のY座標
+            x1: 右端のX座標（含まない）
+            y1: 下端のY座標（含まない）
+
+        Returns:
+        -------
+            到達可能なマスがある場合True
+
+        """
+        region = self.distances[max(0, y0) : max(0, y1), max(0, x0) : max(0, x1)]
+        return bool((region != UNREACHABLE).any())
+
+    def count_unreachable(self, mask: np.ndarray) -> int:
+        """
+        マスクがTrueのマスのうち到達不能なものを数える。
+
+        Args:
+        ----
+            mask: 対象マスのブール配列
+
+        Returns:
+        -------
+            到達不能なマスの数
+
+        """
+        return int(np.count_nonzero(mask & (self.distances == UNREACHABLE)))
@@ -13,7 +13,9 @@ from dataclasses import dataclass
 import numpy as np
 
 from pyrogue.map.dungeon.constants import CorridorConstants
+from pyrogue.map.dungeon.corridor_mask import NO_CORRIDOR, CorridorMask
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Floor
 from pyrogue.utils import game_logger
 
@@ -46,6 +48,7 @@ class CorridorBuilder:
         width: ダンジョンの幅
         height: ダンジョンの高さ
         corridors: 生成された通路のリスト
+        corridor_mask: 掘った通路を記録する通路マスク
 
     """
 
@@ -62,6 +65,8 @@ class CorridorBuilder:
         self.width = width
         self.height = height
         self.corridors: list[Corridor] = []
+        self.corridor_mask = CorridorMask(width, height)
+        self.tile_buffer = TileBuffer(width, height)  # タイル書き込み用
 
     def connect_rooms_rogue_style(self, rooms: list[Room], tiles: np.ndarray) -> list[Corridor]:
         """
@@ -78,6 +83,7 @@ class CorridorBuilder:
 
         """
         self.corridors = []
+        self.corridor_mask = CorridorMask(self.width, self.height)
 
         if len(rooms) < 2:
             return self.corridors
@@ -113,7 +119,7 @@ class CorridorBuilder:
                 room1, room2 = best_pair
                 corridor = self._create_corridor_between_rooms(room1, room2, tiles)
                 if corridor:
-                    self.corridors.append(corridor)
+                    self._add_corridor(corridor)
                     room1.add_connection(room2)
                     connected_rooms.add(room2.id)
 
@@ -123,6 +129,11 @@ class CorridorBuilder:
         game_logger.info(f"Created {len(self.corridors)} corridors connecting {len(rooms)} rooms")
         return self.corridors
 
+    def _add_corridor(self, corridor: Corridor) -> None:
+        """通路をリストと通路マスクに記録。"""
+        self.corridors.append(corridor)
+        self.corridor_mask.add_points(corridor.points)
+
     def _calculate_distance(self, pos1: tuple[int, int], pos2: tuple[int, int]) -> float:
         """
         2点間の距離を計算。
@@ -271,13 +282,9 @@ class CorridorBuilder:
         # 重複を除去
         corridor_points = list(dict.fromkeys(corridor_points))
 
-        # タイルに通路を配置
-        actual_corridor_points = []
-        for x, y in corridor_points:
-            if self._is_valid_corridor_position(x, y, tiles):
-                # 通路座標を床タイルに変更
-                tiles[y, x] = Floor()
-                actual_corridor_points.append((x, y))
+        # 有効な座標だけを床タイルとして一括配置
+        actual_corridor_points = [(x, y) for x, y in corridor_points if self._is_valid_corridor_position(x, y, tiles)]
+        self.tile_buffer.write_points(tiles, actual_corridor_points, Floor.shared())
 
         return actual_corridor_points
 
@@ -323,7 +330,7 @@ class CorridorBuilder:
             if not room1.is_connected_to(room2):
                 corridor = self._create_corridor_between_rooms(room1, room2, tiles)
                 if corridor:
-                    self.corridors.append(corridor)
+                    self._add_corridor(corridor)
                     room1.add_connection(room2)
 
     def get_corridor_at_position(self, x: int, y: int) -> Corridor | None:
@@ -340,14 +347,13 @@ class CorridorBuilder:
             見つかった通路、または None
 
         """
-        for corridor in self.corridors:
-            if (x, y) in corridor.points:
-                return corridor
-        return None
+        corridor_id = self.corridor_mask.corridor_id_at(x, y)
+        return None if corridor_id == NO_CORRIDOR else self.corridors[corridor_id]
 
     def reset(self) -> None:
         """ビルダーの状態をリセット。"""
         self.corridors = []
+        self.corridor_mask = CorridorMask(self.width, self.height)
 
     def get_statistics(self) -> dict:
         """通路生成の統計情報を取得。"""
@@ -0,0 +1,193 @@
+"""
+通路マスク。
+
+このモジュールは、掘られた通路のマスを記録するフロア単位のラスターを提供します。
+各マスに通路IDと掘削順を保持し、「この座標は通路か」という問い合わせや、
+部屋の内部に隣接する通路マス（ドア候補）の抽出を、通路の座標リストを
+走査せずに配列演算で行います。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyrogue.map.dungeon.corridor_builder import Corridor
+
+# 通路でないマスの値
+NO_CORRIDOR = -1
+
+
+class CorridorMask:
+    """
+    通路IDと掘削順のラスター。
+
+    同じマスを複数の通路が通る場合は、最初に記録された通路を保持します
+    （従来の通路リスト走査と同じ優先順位）。
+
+    Attributes
+    ----------
+        width: マップの幅
+        height: マップの高さ
+        corridor_ids: 各マスの通路番号（記録順、通路外はNO_CORRIDOR）のint16配列
+        order: 各マスが最初に記録された順番（通路外はNO_CORRIDOR）のint32配列
+        count: 記録された通路の数
+
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        空の通路マスクを初期化。
+
+        Args:
+        ----
+            width: マップの幅
+            height: マップの高さ
+
+        """
+        self.width = width
+        self.height = height
+        self.corridor_ids = np.full((height, width), NO_CORRIDOR, dtype=np.int16)
+        self.order = np.full((height, width), NO_CORRIDOR, dtype=np.int32)
+        self.count = 0
+        self._next_order = 0
+
+    @classmethod
+    def from_corridors(cls, width: int, height: int, corridors: list[Corridor]) -> CorridorMask:
+        """
+        通路リストから通路マスクを作成。
+
+        Args:
+        ----
+            width: マップの幅
+            height: マップの高さ
+            corridors: 通路のリスト
+
+        Returns:
+        -------
+            作成された通路マスク
+
+        """
+        corridor_mask = cls(width, height)
+        for corridor in corridors:
+            corridor_mask.add_points(corridor.points)
+        return corridor_mask
+
+    def add_points(self, points: Iterable[tuple[int, int]]) -> int:
+        """
+        1本の通路の座標を記録。
+
+        Args:
+        ----
+            points: 通路の座標 (x, y) の列
+
+        Returns:
+        -------
+            割り当てられた通路番号
+
+        """
+        corridor_id = self.count
+        self.count += 1
+
+        coords = np.asarray(list(points), dtype=np.int64).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        in_bounds = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[in_bounds], ys[in_bounds]
+
+        # 通路内での最初の出現だけを残し、未記録のマスに掘削順を割り当てる
+        flat = ys * self.width + xs
+        _, first = np.unique(flat, return_index=True)
+        first.sort()
+        xs, ys = xs[first], ys[first]
+        new = self.order[ys, xs] == NO_CORRIDOR
+        xs, ys = xs[new], ys[new]
+
+        self.corridor_ids[ys, xs] = corridor_id
+        self.order[ys, xs] = np.arange(self._next_order, self._next_order + len(xs), dtype=np.int32)
+        self._next_order += len(xs)
+        return corridor_id
+
+    @property
+    def mask(self) -> np.ndarray:
+        """通路のマスがTrueのブール配列。"""
+        return self.order != NO_CORRIDOR
+
+    def contains(self, x: int, y: int) -> bool:
+        """
+        指定座標が通路かチェック。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            通路の場合True
+
+        """
+        return 0 <= x < self.width and 0 <= y < self.height and self.order[y, x] != NO_CORRIDOR
+
+    def corridor_id_at(self, x: int, y: int) -> int:
+        """
+        指定座標の通路番号を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            通路番号（通路外や範囲外の場合はNO_CORRIDOR）
+
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return NO_CORRIDOR
+        return int(self.corridor_ids[y, x])
+
+    def adjacent_cells(self, region: np.ndarray, origin: tuple[int, int] = (0, 0)) -> list[tuple[int, int]]:
+        """
+        領域に4近傍で隣接する通路マスを掘削順に取得。
+
+        領域マスクの外側1マスまでの範囲だけを計算するため、
+        コストは領域の大きさに比例します。
+
+        Args:
+        ----
+            region: 領域のブール配列（マップ全体、またはoriginを左上とする部分配列）
+            origin: regionの左上に対応するマップ座標 (x, y)
+
+        Returns:
+        -------
+            隣接する通路マスの座標 (x, y) のリスト
+
+        """
+        ox, oy = origin
+        region_height, region_width = region.shape
+
+        # 領域を1マス広げた窓をマップ範囲に切り詰める
+        x0, y0 = max(0, ox - 1), max(0, oy - 1)
+        x1, y1 = min(self.width, ox + region_width + 1), min(self.height, oy + region_height + 1)
+        if x0 >= x1 or y0 >= y1:
+            return []
+
+        window = np.zeros((y1 - y0, x1 - x0), dtype=bool)
+        sx0, sy0 = max(0, x0 - ox), max(0, y0 - oy)
+        sx1, sy1 = min(region_width, x1 - ox), min(region_height, y1 - oy)
+        window[sy0 + oy - y0 : sy1 + oy - y0, sx0 + ox - x0 : sx1 + ox - x0] = region[sy0:sy1, sx0:sx1]
+
+        adjacent = np.zeros(window.shape, dtype=bool)
+        adjacent[1:, :] |= window[:-1, :]
+        adjacent[:-1, :] |= window[1:, :]
+        adjacent[:, 1:] |= window[:, :-1]
+        adjacent[:, :-1] |= window[:, 1:]
+
+        order = self.order[y0:y1, x0:x1]
+        ys, xs = np.nonzero(adjacent & (order != NO_CORRIDOR))
+        sequence = np.argsort(order[ys, xs], kind="stable")
+        return [(int(xs[i]) + x0, int(ys[i]) + y0) for i in sequence]
@@ -11,7 +11,10 @@ import random
 
 import numpy as np
 
+from pyrogue.map.dungeon.light_map import LIGHT_INFLUENCE_RADIUS, LightMap
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.room_raster import RoomRaster
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Floor
 from pyrogue.utils import game_logger
 
@@ -68,10 +71,17 @@ class DarkRoomBuilder:
         self.darkness_intensity = darkness_intensity
         self.dark_rooms: list[DarkRoom] = []
         self.light_sources: list[tuple[int, int]] = []  # 光源の位置
+        self.light_map: LightMap | None = None  # 暗い部屋と光源の明暗ラスター（光源配置時に作成）
+        self.tile_buffer = TileBuffer(0, 0)  # 光源を置いたマスの記録用（配列は書き込み時にバインド）
 
         game_logger.info(f"DarkRoomBuilder initialized: darkness_intensity={darkness_intensity}")
 
-    def apply_darkness_to_rooms(self, rooms: list[Room], darkness_probability: float = 0.3) -> list[DarkRoom]:
+    def apply_darkness_to_rooms(
+        self,
+        rooms: list[Room],
+        darkness_probability: float = 0.3,
+        room_raster: RoomRaster | None = None,
+    ) -> list[DarkRoom]:
         """
         既存の部屋を暗い部屋に変換。
 
@@ -79,6 +89,7 @@ class DarkRoomBuilder:
         ----
             rooms: 変換対象の部屋リスト
             darkness_probability: 暗い部屋になる確率
+            room_raster: 部屋IDラスター（指定時は変換した部屋を暗い部屋に置き換える）
 
         Returns:
         -------
@@ -96,6 +107,8 @@ class DarkRoomBuilder:
             if random.random() < darkness_probability:
                 dark_room = self._convert_to_dark_room(room)
                 self.dark_rooms.append(dark_room)
+                if room_raster is not None:
+                    room_raster.replace_room(room, dark_room)
 
         game_logger.info(f"Converted {len(self.dark_rooms)} rooms to dark rooms")
         return self.dark_rooms
@@ -141,6 +154,8 @@ class DarkRoomBuilder:
         """
         暗い部屋に光源を配置。
 
+        配置後に暗い部屋と光源から明暗ラスターを作成します。
+
         Args:
         ----
             dark_rooms: 暗い部屋のリスト
@@ -158,6 +173,9 @@ class DarkRoomBuilder:
                     self._place_light_source(light_pos, tiles)
                     self.light_sources.append(light_pos)
 
+        height, width = tiles.shape
+        self.light_map = LightMap.from_dark_rooms(width, height, dark_rooms, self.light_sources)
+
         game_logger.info(f"Placed {len(self.light_sources)} light sources")
 
     def _find_light_source_position(self, dark_room: DarkRoom, tiles: np.ndarray) -> tuple[int, int] | None:
@@ -209,13 +227,24 @@ class DarkRoomBuilder:
         """
         x, y = position
 
-        # 既存の床タイルに光源属性を追加
+        # 床タイルを光源属性付きの専用タイルに置き換える（共有の床は変更しない）
         if isinstance(tiles[y, x], Floor):
-            tiles[y, x].has_light_source = True
-            tiles[y, x].light_radius = 3  # 光源の照射範囲
+            self.tile_buffer.set_tile(tiles, x, y, Floor(has_light_source=True, light_radius=3))
             game_logger.debug(f"Placed light source at ({x}, {y})")
 
-    def get_darkness_level_at(self, x: int, y: int, rooms: list[Room]) -> float:
+    def _find_dark_room(self, x: int, y: int, rooms: list[Room] | RoomRaster) -> DarkRoom | None:
+        """指定位置を含む暗い部屋を取得（ラスター指定時は配列参照）。"""
+        if isinstance(rooms, RoomRaster):
+            room = rooms.room_at(x, y)
+            return room if isinstance(room, DarkRoom) else None
+
+        for room in rooms:
+            if isinstance(room, DarkRoom):
+                if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
+                    return room
+        return None
+
+    def get_darkness_level_at(self, x: int, y: int, rooms: list[Room] | RoomRaster) -> float:
         """
         指定位置の暗さレベルを取得。
 
@@ -223,21 +252,20 @@ class DarkRoomBuilder:
         ----
             x: X座標
             y: Y座標
-            rooms: 部屋のリスト
+            rooms: 部屋のリスト、または部屋IDラスター
 
         Returns:
         -------
             暗さレベル（0.0-1.0）。0.0は明るい、1.0は完全な暗闇
 
         """
-        for room in rooms:
-            if isinstance(room, DarkRoom):
-                if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
-                    return room.darkness_level
+        dark_room = self._find_dark_room(x, y, rooms)
+        if dark_room is not None:
+            return dark_room.darkness_level
 
         return 0.0  # 通常の部屋は明るい
 
-    def is_position_in_dark_room(self, x: int, y: int, rooms: list[Room]) -> bool:
+    def is_position_in_dark_room(self, x: int, y: int, rooms: list[Room] | RoomRaster) -> bool:
         """
         指定位置が暗い部屋内かどうかを判定。
 
@@ -245,25 +273,20 @@ class DarkRoomBuilder:
         ----
             x: X座標
             y: Y座標
-            rooms: 部屋のリスト
+            rooms: 部屋のリスト、または部屋IDラスター
 
         Returns:
         -------
             暗い部屋内の場合True
 
         """
-        for room in rooms:
-            if isinstance(room, DarkRoom):
-                if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
-                    return True
-
-        return False
+        return self._find_dark_room(x, y, rooms) is not None
 
     def get_visibility_range_at(
         self,
         x: int,
         y: int,
-        rooms: list[Room],
+        rooms: list[Room] | RoomRaster,
         player_has_light: bool = False,
         light_radius: int = 5,
     ) -> int:
@@ -274,7 +297,7 @@ class DarkRoomBuilder:
         ----
             x: X座標
             y: Y座標
-            rooms: 部屋のリスト
+            rooms: 部屋のリスト、または部屋IDラスター
             player_has_light: プレイヤーが光源を持っているか
             light_radius: 光源の照射範囲
 
@@ -284,18 +307,27 @@ class DarkRoomBuilder:
 
         """
         # 暗い部屋内かチェック
-        for room in rooms:
-            if isinstance(room, DarkRoom):
-                if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
-                    if player_has_light:
-                        # 光源を持っている場合は通常の視界範囲
-                        return light_radius
-                    # 光源なしの場合は制限された視界範囲
-                    return room.base_visibility_range
+        dark_room = self._find_dark_room(x, y, rooms)
+        if dark_room is not None:
+            if player_has_light:
+                # 光源を持っている場合は通常の視界範囲
+                return light_radius
+            # 光源なしの場合は制限された視界範囲
+            return dark_room.base_visibility_range
 
         # 通常の部屋では標準的な視界範囲
         return 8  # デフォルトのFOV範囲
 
+    def _light_map_for(self, x: int, y: int, light_sources: list[tuple[int, int]]) -> LightMap | None:
+        """現在の光源リストから作った明暗ラスターがあり、座標がその範囲内なら返す。"""
+        light_map = self.light_map
+        if light_map is None or light_sources is not self.light_sources or not light_map.in_bounds(x, y):
+            return None
+        # 作成後に光源リストが変更された場合はリストを走査する
+        if len(light_map.light_sources) != len(light_sources):
+            return None
+        return light_map
+
     def find_nearest_light_source(self, x: int, y: int, max_distance: int = 10) -> tuple[int, int] | None:
         """
         最も近い光源を見つける。
@@ -314,6 +346,10 @@ class DarkRoomBuilder:
         if not self.light_sources:
             return None
 
+        light_map = self._light_map_for(x, y, self.light_sources)
+        if light_map is not None:
+            return light_map.nearest_light_source(x, y, max_distance)
+
         min_distance = float("inf")
         nearest_light = None
 
@@ -343,14 +379,18 @@ class DarkRoomBuilder:
         if light_sources is None:
             light_sources = self.light_sources
 
+        light_map = self._light_map_for(x, y, light_sources)
+        if light_map is not None:
+            return light_map.influence_at(x, y)
+
         max_influence = 0.0
 
         for light_x, light_y in light_sources:
             distance = ((x - light_x) ** 2 + (y - light_y) ** 2) ** 0.5
 
-            # 光の影響は距離に反比例（最大3セル）
-            if distance <= 3:
-                influence = max(0.0, 1.0 - distance / 3.0)
+            # 光の影響は距離に反比例（最大LIGHT_INFLUENCE_RADIUSセル）
+            if distance <= LIGHT_INFLUENCE_RADIUS:
+                influence = max(0.0, 1.0 - distance / LIGHT_INFLUENCE_RADIUS)
                 max_influence = max(max_influence, influence)
 
         return min(1.0, max_influence)
@@ -359,6 +399,7 @@ class DarkRoomBuilder:
         """ビルダーの状態をリセット。"""
         self.dark_rooms = []
         self.light_sources = []
+        self.light_map = None
 
     def get_statistics(self) -> dict:
         """生成統計を取得。"""
@@ -10,16 +10,20 @@ from __future__ import annotations
 import numpy as np
 
 from pyrogue.map.dungeon.corridor_builder import CorridorBuilder
+from pyrogue.map.dungeon.corridor_mask import CorridorMask
 from pyrogue.map.dungeon.dark_room_builder import DarkRoomBuilder
 from pyrogue.map.dungeon.door_manager import DoorManager
 from pyrogue.map.dungeon.enhanced_bsp_builder import EnhancedBSPBuilder
+from pyrogue.map.dungeon.grid_kernels import tile_mask
 from pyrogue.map.dungeon.isolated_room_builder import IsolatedRoomBuilder
 from pyrogue.map.dungeon.maze_builder import MazeBuilder
 from pyrogue.map.dungeon.profiler import DungeonProfiler
 from pyrogue.map.dungeon.room_builder import RoomBuilder
+from pyrogue.map.dungeon.room_raster import RoomRaster
 from pyrogue.map.dungeon.section_based_builder import BSPDungeonBuilder
 from pyrogue.map.dungeon.special_room_builder import SpecialRoomBuilder
 from pyrogue.map.dungeon.stairs_manager import StairsManager
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.dungeon.validation_manager import ValidationManager
 from pyrogue.map.tile import Floor, Wall
 from pyrogue.utils import game_logger
@@ -59,6 +63,9 @@ class DungeonDirector:
         tiles: ダンジョンのタイル配列
         rooms: 生成された部屋のリスト
         corridors: 生成された通路のリスト
+        room_raster: 部屋IDラスター（部屋の所属・境界の判定用）
+        corridor_mask: 通路マスク（通路の判定用）
+        tile_buffer: 全ビルダーが共有するタイル書き込みバッファ（ダーティマスクを保持）
 
     """
 
@@ -78,9 +85,11 @@ class DungeonDirector:
         self.floor = floor
 
         # タイル配列を初期化（全て壁で開始）
-        self.tiles = np.full((height, width), Wall(), dtype=object)
+        self.tiles = np.full((height, width), Wall.shared(), dtype=object)
         self.rooms: list[Room] = []
         self.corridors: list[Corridor] = []
+        self.room_raster = RoomRaster(width, height)
+        self.corridor_mask = CorridorMask(width, height)
 
         # Builder components
         self.room_builder = RoomBuilder(width, height, floor)
@@ -99,6 +108,10 @@ class DungeonDirector:
         self.stairs_manager = StairsManager()
         self.validation_manager = ValidationManager()
 
+        # 全ビルダーのタイル書き込みを1つのバッファに集約
+        self.tile_buffer = TileBuffer(width, height, tiles=self.tiles)
+        self._share_tile_buffer()
+
         # フラグ: セクションベースシステムを使用するか
         # 新しいダンジョン生成システムを使用したい場合は True に設定
         self.use_section_based = True
@@ -116,6 +129,20 @@ class DungeonDirector:
 
         game_logger.debug(f"DungeonDirector initialized for floor {floor} ({width}x{height})")
 
+    def _share_tile_buffer(self) -> None:
+        """各ビルダーに共有のタイルバッファを設定。"""
+        for builder in [
+            self.bsp_builder,
+            self.enhanced_bsp_builder,
+            self.maze_builder,
+            self.isolated_room_builder,
+            self.dark_room_builder,
+            self.corridor_builder,
+            self.door_manager,
+            self.stairs_manager,
+        ]:
+            builder.tile_buffer = self.tile_buffer
+
     def build_dungeon(self) -> tuple[np.ndarray, tuple[int, int], tuple[int, int]]:
         """
         ダンジョンを構築。
@@ -146,16 +173,18 @@ class DungeonDirector:
 
                 # 2. 特別部屋の処理
                 self.special_room_builder.process_special_rooms(self.rooms)
+                self.room_raster = RoomRaster.from_rooms(self.width, self.height, self.rooms)
 
                 # 3. 部屋をタイル配列に配置
                 self._place_rooms_on_tiles()
 
                 # 4. 通路の生成
                 self.corridors = self.corridor_builder.connect_rooms_rogue_style(self.rooms, self.tiles)
+                self.corridor_mask = self.corridor_builder.corridor_mask
                 game_logger.debug(f"Generated {len(self.corridors)} corridor segments")
 
                 # 5. ドアの配置
-                self.door_manager.place_doors(self.rooms, self.corridors, self.tiles)
+                self.door_manager.place_doors(self.rooms, self.corridors, self.tiles, self.corridor_mask)
 
                 # 6. 階段の配置
                 start_pos, end_pos = self.stairs_manager.place_stairs(self.rooms, self.floor, self.tiles)
@@ -163,6 +192,9 @@ class DungeonDirector:
                 # 7. 最終検証
                 self.validation_manager.validate_dungeon(self.rooms, self.corridors, start_pos, end_pos, self.tiles)
 
+            # 溜まっている書き込みを適用してから返す
+            self.tile_buffer.flush_to_tiles(self.tiles)
+
             # パフォーマンス計測終了とレポート
             self.profiler.stop_profiling()
             self.profiler.record_stat("rooms_count", len(self.rooms))
@@ -184,10 +216,9 @@ class DungeonDirector:
         """
         for room in self.rooms:
             # 部屋の内部を床に設定
-            for y in range(room.y + 1, room.y + room.height - 1):
-                for x in range(room.x + 1, room.x + room.width - 1):
-                    if 0 <= y < self.height and 0 <= x < self.width:
-                        self.tiles[y, x] = Floor()
+            self.tile_buffer.fill_rect(
+                self.tiles, room.x + 1, room.y + 1, room.width - 2, room.height - 2, Floor.shared()
+            )
 
             # 部屋の境界は壁のまま（既に初期化済み）
 
@@ -197,27 +228,29 @@ class DungeonDirector:
         """
         from pyrogue.map.tile import Floor, Wall
 
+        corridor = self.corridor_mask.mask
+
         for room in self.rooms:
-            # 部屋の境界座標を取得
-            for x in range(room.x, room.x + room.width):
-                for y in range(room.y, room.y + room.height):
-                    # 境界（外周）かつ内部でない位置
-                    if (
-                        x == room.x or x == room.x + room.width - 1 or y == room.y or y == room.y + room.height - 1
-                    ) and (x, y) not in room.inner:
-                        # 現在のタイルが床の場合のみ壁に変更
-                        # （ドアや階段は保護）
-                        if isinstance(self.tiles[y, x], Floor):
-                            # この床が通路かチェック
-                            is_corridor = False
-                            for corridor in self.corridors:
-                                if (x, y) in corridor.points:
-                                    is_corridor = True
-                                    break
-
-                            # 通路でない床は壁に戻す
-                            if not is_corridor:
-                                self.tiles[y, x] = Wall()
+            x0, y0 = max(0, room.x), max(0, room.y)
+            x1, y1 = min(self.width, room.x + room.width), min(self.height, room.y + room.height)
+            if x0 >= x1 or y0 >= y1:
+                continue
+
+            # 部屋の矩形のうち外周（内部を除く）
+            boundary = np.ones((y1 - y0, x1 - x0), dtype=bool)
+            boundary[
+                max(0, room.y + 1 - y0) : max(0, room.y + room.height - 1 - y0),
+                max(0, room.x + 1 - x0) : max(0, room.x + room.width - 1 - x0),
+            ] = False
+
+            # 通路でない床だけを壁に戻す（ドアや階段は保護）
+            region = self.tiles[y0:y1, x0:x1]
+            self.tile_buffer.write_mask(
+                self.tiles,
+                boundary & tile_mask(region, Floor) & ~corridor[y0:y1, x0:x1],
+                Wall.shared(),
+                origin=(x0, y0),
+            )
 
         game_logger.debug("Reinforced room boundaries")
 
@@ -235,6 +268,7 @@ class DungeonDirector:
             try:
                 with self.profiler.section("maze_generation"):
                     self.rooms = self.maze_builder.build_dungeon(self.tiles)
+                    self.room_raster = RoomRaster.from_rooms(self.width, self.height, self.rooms)
                     game_logger.debug("Generated maze dungeon (no rooms)")
 
                 with self.profiler.section("maze_stairs_placement"):
@@ -253,7 +287,7 @@ class DungeonDirector:
                     self.dungeon_type = "normal"
                     return self._build_normal_dungeon_with_profiling()
                 # タイルを再初期化してリトライ
-                self.tiles = np.full((self.height, self.width), Wall(), dtype=object)
+                self.tiles = np.full((self.height, self.width), Wall.shared(), dtype=object)
                 game_logger.debug(f"Retrying maze generation (attempt {attempt + 2})")
 
         # このポイントに到達することはないはずだが、安全のため
@@ -271,9 +305,11 @@ class DungeonDirector:
         with self.profiler.section("bsp_room_generation"):
             if self.use_enhanced_bsp:
                 self.rooms = self.enhanced_bsp_builder.build_dungeon(self.tiles)
+                self.room_raster = self.enhanced_bsp_builder.room_raster
                 game_logger.debug(f"Generated {len(self.rooms)} rooms using Enhanced BSP system")
             else:
                 self.rooms = self.bsp_builder.build_dungeon(self.tiles)
+                self.room_raster = self.bsp_builder.room_raster
                 game_logger.debug(f"Generated {len(self.rooms)} rooms using BSP system")
 
         with self.profiler.section("special_room_processing"):
@@ -284,16 +320,21 @@ class DungeonDirector:
                 isolated_groups = self.isolated_room_builder.generate_isolated_rooms(
                     self.tiles, self.rooms, max_groups=2
                 )
+                for group in isolated_groups:
+                    for room in group.rooms:
+                        self.room_raster.add_room(room)
                 game_logger.debug(f"Generated {len(isolated_groups)} isolated room groups")
 
         with self.profiler.section("door_placement"):
             # 拡張BSPでは既にドアが配置されているため、従来のドア配置はスキップ
             if not self.use_enhanced_bsp:
-                self.door_manager.place_doors(self.rooms, [], self.tiles)
+                self.door_manager.place_doors(self.rooms, [], self.tiles, self.corridor_mask)
 
         if self._should_generate_dark_rooms():
             with self.profiler.section("dark_room_generation"):
-                dark_rooms = self.dark_room_builder.apply_darkness_to_rooms(self.rooms, darkness_probability=0.4)
+                dark_rooms = self.dark_room_builder.apply_darkness_to_rooms(
+                    self.rooms, darkness_probability=0.4, room_raster=self.room_raster
+                )
                 # 暗い部屋に光源を配置
                 self.dark_room_builder.place_light_sources(dark_rooms, self.tiles)
                 game_logger.debug(f"Generated {len(dark_rooms)} dark rooms")
@@ -369,13 +410,19 @@ class DungeonDirector:
         if validation_manager:
             self.validation_manager = validation_manager
 
+        self._share_tile_buffer()
+
     def reset(self) -> None:
         """
         ディレクターの状態をリセット。
         """
-        self.tiles = np.full((self.height, self.width), Wall(), dtype=object)
+        self.tiles = np.full((self.height, self.width), Wall.shared(), dtype=object)
+        self.tile_buffer.clear_queue()
+        self.tile_buffer.bind(self.tiles)
         self.rooms = []
         self.corridors = []
+        self.room_raster = RoomRaster(self.width, self.height)
+        self.corridor_mask = CorridorMask(self.width, self.height)
 
         # 各ビルダーコンポーネントもリセット
         for builder in [
@@ -13,7 +13,9 @@ import numpy as np
 
 from pyrogue.constants import ProbabilityConstants
 from pyrogue.map.dungeon.corridor_builder import Corridor
+from pyrogue.map.dungeon.corridor_mask import CorridorMask
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Door, SecretDoor
 from pyrogue.utils import game_logger
 
@@ -29,8 +31,15 @@ class DoorManager:
     def __init__(self) -> None:
         """ドアマネージャーを初期化。"""
         self.placed_doors: list[tuple[int, int, str]] = []
+        self.tile_buffer = TileBuffer(0, 0)  # タイル書き込み用（配列は書き込み時にバインド）
 
-    def place_doors(self, rooms: list[Room], corridors: list[Corridor], tiles: np.ndarray) -> None:
+    def place_doors(
+        self,
+        rooms: list[Room],
+        corridors: list[Corridor],
+        tiles: np.ndarray,
+        corridor_mask: CorridorMask | None = None,
+    ) -> None:
         """
         ドアを配置。
 
@@ -39,13 +48,18 @@ class DoorManager:
             rooms: 部屋のリスト
             corridors: 通路のリスト
             tiles: ダンジョンのタイル配列
+            corridor_mask: 通路マスク（省略時は通路リストから作成）
 
         """
         self.placed_doors = []
 
+        if corridor_mask is None:
+            height, width = tiles.shape
+            corridor_mask = CorridorMask.from_corridors(width, height, corridors)
+
         # 新しいアプローチ: 通路から部屋への接続点を直接探す
         for room in rooms:
-            door_positions = self._find_corridor_to_room_connections(room, corridors, tiles)
+            door_positions = self._find_corridor_to_room_connections(room, corridor_mask)
 
             # 各部屋に最大2個のドアまでに制限
             door_positions = door_positions[:2]
@@ -56,40 +70,24 @@ class DoorManager:
 
         game_logger.info(f"Placed {len(self.placed_doors)} doors")
 
-    def _find_corridor_to_room_connections(
-        self, room: Room, corridors: list[Corridor], tiles: np.ndarray
-    ) -> list[tuple[int, int]]:
+    def _find_corridor_to_room_connections(self, room: Room, corridor_mask: CorridorMask) -> list[tuple[int, int]]:
         """
         通路から部屋への接続点を直接探す。
 
+        部屋の内部に4方向で隣接する通路マスを、通路を掘った順に返します。
+
         Args:
         ----
             room: 対象の部屋
-            corridors: 通路のリスト
-            tiles: ダンジョンのタイル配列
+            corridor_mask: 通路マスク
 
         Returns:
         -------
             ドア配置位置のリスト
 
         """
-        door_positions = []
-
-        # 各通路の各座標について、部屋の内部に隣接しているかチェック
-        for corridor in corridors:
-            for corridor_x, corridor_y in corridor.points:
-                # 通路座標の4方向をチェック
-                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    adj_x, adj_y = corridor_x + dx, corridor_y + dy
-
-                    # 隣接位置が部屋の内部かチェック
-                    if (adj_x, adj_y) in room.inner:
-                        # 通路座標をドア位置として追加
-                        if (corridor_x, corridor_y) not in door_positions:
-                            door_positions.append((corridor_x, corridor_y))
-                        break  # この通路座標は既に処理したので次へ
-
-        return door_positions
+        inner = np.ones((max(0, room.height - 2), max(0, room.width - 2)), dtype=bool)
+        return corridor_mask.adjacent_cells(inner, origin=(room.x + 1, room.y + 1))
 
     def _is_room_boundary(self, x: int, y: int, room: Room) -> bool:
         """
@@ -107,20 +105,18 @@ class DoorManager:
 
         """
         # 部屋の境界矩形内にあり、かつ内部ではない
-        return (
-            room.x <= x <= room.x + room.width - 1
-            and room.y <= y <= room.y + room.height - 1
-            and (x, y) not in room.inner
-        )
+        in_rect = room.x <= x <= room.x + room.width - 1 and room.y <= y <= room.y + room.height - 1
+        in_inner = room.x < x < room.x + room.width - 1 and room.y < y < room.y + room.height - 1
+        return in_rect and not in_inner
 
-    def _find_door_positions(self, room: Room, corridors: list[Corridor], tiles: np.ndarray) -> list[tuple[int, int]]:
+    def _find_door_positions(self, room: Room, corridor_mask: CorridorMask, tiles: np.ndarray) -> list[tuple[int, int]]:
         """
         部屋のドア配置位置を見つける。
 
         Args:
         ----
             room: 対象の部屋
-            corridors: 通路のリスト
+            corridor_mask: 通路マスク
             tiles: ダンジョンのタイル配列
 
         Returns:
@@ -132,7 +128,7 @@ class DoorManager:
 
         # 部屋の境界をチェック
         for wall_pos in self._get_room_wall_positions(room):
-            if self._should_place_door_at(wall_pos, room, corridors, tiles):
+            if self._should_place_door_at(wall_pos, room, corridor_mask, tiles):
                 door_positions.append(wall_pos)
 
         return door_positions
@@ -168,7 +164,7 @@ class DoorManager:
         self,
         position: tuple[int, int],
         room: Room,
-        corridors: list[Corridor],
+        corridor_mask: CorridorMask,
         tiles: np.ndarray,
     ) -> bool:
         """
@@ -180,7 +176,7 @@ class DoorManager:
         ----
             position: チェック位置（壁の座標）
             room: 部屋
-            corridors: 通路のリスト
+            corridor_mask: 通路マスク
             tiles: ダンジョンのタイル配列
 
         Returns:
@@ -213,10 +209,10 @@ class DoorManager:
                     continue
 
                 # 部屋の内部かチェック
-                if (adj_x, adj_y) in room.inner:
+                if room.x < adj_x < room.x + room.width - 1 and room.y < adj_y < room.y + room.height - 1:
                     room_side = (adj_x, adj_y)
                 # 通路かチェック
-                elif self._is_corridor_tile(adj_x, adj_y, room, corridors):
+                elif self._is_corridor_tile(adj_x, adj_y, room, corridor_mask):
                     corridor_side = (adj_x, adj_y)
 
             # 片側が部屋内部、もう片側が通路の場合はドア配置
@@ -225,7 +221,7 @@ class DoorManager:
 
         return False
 
-    def _is_corridor_tile(self, x: int, y: int, room: Room, corridors: list[Corridor]) -> bool:
+    def _is_corridor_tile(self, x: int, y: int, room: Room, corridor_mask: CorridorMask) -> bool:
         """
         指定座標が通路のタイルかチェック。
 
@@ -234,7 +230,7 @@ class DoorManager:
             x: X座標
             y: Y座標
             room: 部屋
-            corridors: 通路のリスト
+            corridor_mask: 通路マスク
 
         Returns:
         -------
@@ -245,21 +241,17 @@ class DoorManager:
         if room.x < x < room.x + room.width - 1 and room.y < y < room.y + room.height - 1:
             return False
 
-        # 通路の座標リストに含まれているかチェック
-        for corridor in corridors:
-            if (x, y) in corridor.points:
-                return True
+        # 通路マスクに記録されているかチェック
+        return corridor_mask.contains(x, y)
 
-        return False
-
-    def _is_corridor_connection(self, position: tuple[int, int], corridors: list[Corridor]) -> bool:
+    def _is_corridor_connection(self, position: tuple[int, int], corridor_mask: CorridorMask) -> bool:
         """
         位置が通路との接続点かチェック。
 
         Args:
         ----
             position: チェック位置
-            corridors: 通路のリスト
+            corridor_mask: 通路マスク
 
         Returns:
         -------
@@ -269,14 +261,7 @@ class DoorManager:
         x, y = position
 
         # 隣接する位置に通路があるかチェック
-        for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-            adj_x, adj_y = x + dx, y + dy
-
-            for corridor in corridors:
-                if (adj_x, adj_y) in corridor.points:
-                    return True
-
-        return False
+        return any(corridor_mask.contains(x + dx, y + dy) for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)])
 
     def _is_main_door_position(self, position: tuple[int, int], room: Room) -> bool:
         """
@@ -347,7 +332,7 @@ class DoorManager:
         """
         if self._validate_door_placement(x, y, tiles):
             door = door_type()
-            tiles[y, x] = door
+            self.tile_buffer.set_tile(tiles, x, y, door)
             room.add_door(x, y)
             self.placed_doors.append((x, y, door_type.__name__))
 
@@ -19,6 +19,8 @@ from pyrogue.map.dungeon.deadend_manager import DeadEndManager
 from pyrogue.map.dungeon.line_drawer import LineDrawer
 from pyrogue.map.dungeon.room_builder import Room
 from pyrogue.map.dungeon.room_placement_optimizer import RoomPlacementOptimizer
+from pyrogue.map.dungeon.room_raster import RoomRaster
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Door, Floor, SecretDoor
 from pyrogue.utils import game_logger
 
@@ -52,6 +54,8 @@ class EnhancedBSPBuilder:
         self.rooms: list[Room] = []
         self.room_id_counter = 0
         self.door_positions: set[tuple[int, int]] = set()
+        self.room_raster = RoomRaster(width, height)
+        self.tile_buffer = TileBuffer(width, height)  # タイル書き込み用
 
         # BSP設定
         self._depth = BSPConstants.DEPTH
@@ -89,6 +93,7 @@ class EnhancedBSPBuilder:
         self.rooms = []
         self.room_id_counter = 0
         self.door_positions = set()
+        self.room_raster = RoomRaster(self.width, self.height)
 
         # 1. BSPツリーを作成・分割
         bsp = tcod.bsp.BSP(x=0, y=0, width=self.width, height=self.height)
@@ -151,6 +156,7 @@ class EnhancedBSPBuilder:
             self.room_id_counter += 1
 
             self.rooms.append(room)
+            self.room_raster.add_room(room)
 
             # タイルに部屋を配置
             self._dig_room(room, tiles)
@@ -209,10 +215,7 @@ class EnhancedBSPBuilder:
 
     def _dig_room(self, room: Room, tiles: np.ndarray) -> None:
         """部屋をタイル配列に掘る。"""
-        for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    tiles[y, x] = Floor()
+        self.tile_buffer.fill_rect(tiles, room.x, room.y, room.width, room.height, Floor.shared())
 
     def _connect_nodes_enhanced(self, node1: tcod.bsp.BSP, node2: tcod.bsp.BSP, tiles: np.ndarray) -> None:
         """
@@ -255,18 +258,9 @@ class EnhancedBSPBuilder:
     def _place_deadends(self, tiles: np.ndarray) -> None:
         """デッドエンドを配置。"""
         if self.rooms:
-            # numpy配列をリストに変換（デッドエンドマネージャーとの互換性）
-            tiles_list = tiles.tolist()
-
-            # デッドエンドを配置
-            deadend_points = self.deadend_manager.place_strategic_deadends(
-                self.rooms, tiles_list, self._place_corridor_tile
-            )
-
-            # 変更をnumpy配列に反映
-            for i, row in enumerate(tiles_list):
-                for j, tile in enumerate(row):
-                    tiles[i, j] = tile
+            # デッドエンドマネージャーはtiles[y][x]で参照するため、配列をそのまま渡して
+            # 書き込みはタイルバッファ経由の_place_corridor_tileに任せる
+            deadend_points = self.deadend_manager.place_strategic_deadends(self.rooms, tiles, self._place_corridor_tile)
 
             game_logger.info(f"Placed {len(deadend_points)} deadend points")
 
@@ -302,13 +296,13 @@ class EnhancedBSPBuilder:
             if is_wall and allow_door and position not in self.door_positions:
                 if self._is_room_boundary_wall(x, y) and not self._has_adjacent_door(x, y):
                     door = self._create_random_door()
-                    tiles[y, x] = door
+                    self.tile_buffer.set_tile(tiles, x, y, door)
                     self.door_positions.add(position)
                     game_logger.debug(f"Door placed at ({x},{y}), type: {type(door).__name__}")
                 else:
-                    tiles[y, x] = Floor()
+                    self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
             else:
-                tiles[y, x] = Floor()
+                self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
 
     def _place_boundary_door_tile(self, tiles: np.ndarray, x: int, y: int, allow_door: bool = True) -> None:
         """境界位置でのドア配置（より積極的にドアを設置）。"""
@@ -322,13 +316,13 @@ class EnhancedBSPBuilder:
             if is_wall and allow_door and position not in self.door_positions:
                 if self._is_room_boundary_wall(x, y) and not self._has_adjacent_door(x, y):
                     door = self._create_random_door()
-                    tiles[y, x] = door
+                    self.tile_buffer.set_tile(tiles, x, y, door)
                     self.door_positions.add(position)
                     game_logger.debug(f"Boundary door placed at ({x},{y}), type: {type(door).__name__}")
                 else:
-                    tiles[y, x] = Floor()
+                    self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
             else:
-                tiles[y, x] = Floor()
+                self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
 
     def _create_random_door(self) -> Door | SecretDoor:
         """ランダムな状態のドアを作成。"""
@@ -341,16 +335,7 @@ class EnhancedBSPBuilder:
 
     def _is_room_boundary_wall(self, x: int, y: int) -> bool:
         """指定された壁が部屋の境界（外周）かどうかを判定。"""
-        for room in self.rooms:
-            left, right = room.x, room.x + room.width - 1
-            top, bottom = room.y, room.y + room.height - 1
-
-            if (y == top - 1 or y == bottom + 1) and (left <= x <= right):
-                return True
-            if (x == left - 1 or x == right + 1) and (top <= y <= bottom):
-                return True
-
-        return False
+        return self.room_raster.is_boundary_wall(x, y)
 
     def _has_adjacent_door(self, x: int, y: int) -> bool:
         """指定された位置の隣接8方向にドアがあるかどうかをチェック。"""
@@ -433,6 +418,7 @@ class EnhancedBSPBuilder:
         self.rooms = []
         self.room_id_counter = 0
         self.door_positions = set()
+        self.room_raster = RoomRaster(self.width, self.height)
 
         # 拡張システムのリセット
         if hasattr(self, "room_optimizer"):
@@ -0,0 +1,246 @@
+"""
+空きマスサンプラー。
+
+このモジュールは、歩行可能かつ未占有のマスを平坦化インデックスの配列として保持し、
+占有時のO(1)削除（末尾との入れ替え）と非復元抽出を提供します。
+スポナーはマスク演算を1回行った後、グリッドの走査やランダム座標の再試行なしに
+N体の配置をO(N)で行えます。
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pyrogue.map.dungeon.grid_kernels import tile_mask
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyrogue.map.tile import Tile
+
+# 空きマスでないことを示すスロット値
+NOT_FREE = -1
+
+
+def walkable_mask(tiles: np.ndarray) -> np.ndarray:
+    """
+    walkable属性がTrueのタイルのマスクを作成。
+
+    Args:
+    ----
+        tiles: タイル配列
+
+    Returns:
+    -------
+        タイル配列と同じ形状のブール配列
+
+    """
+    return np.fromiter(
+        (tile.walkable for tile in tiles.flat),
+        dtype=bool,
+        count=tiles.size,
+    ).reshape(tiles.shape)
+
+
+class FreeCellSampler:
+    """
+    空きマスの集合とランダム抽出。
+
+    空きマスを平坦化インデックス (y * width + x) の配列に詰めて保持し、
+    各マスの配列内の位置（スロット）を別の配列で引けるようにしています。
+    占有されたマスは末尾の要素と入れ替えて取り除くため、追加・削除・抽出はO(1)です。
+
+    Attributes
+    ----------
+        width: マップの幅
+        height: マップの高さ
+        rng: 抽出に使う乱数生成器（Noneの場合はrandomモジュール）
+
+    """
+
+    def __init__(
+        self,
+        mask: np.ndarray,
+        occupied: Iterable[tuple[int, int]] = (),
+        rng: random.Random | None = None,
+    ) -> None:
+        """
+        空きマスサンプラーを初期化。
+
+        Args:
+        ----
+            mask: 配置可能なマスがTrueのブール配列
+            occupied: 既に占有されている座標 (x, y) の列
+            rng: 抽出に使う乱数生成器（Noneの場合はrandomモジュール）
+
+        """
+        self.height, self.width = mask.shape
+        self.rng = rng
+        self._cells = np.flatnonzero(mask).astype(np.int64)
+        self._slots = np.full(mask.size, NOT_FREE, dtype=np.int64)
+        self._slots[self._cells] = np.arange(len(self._cells))
+        self._size = len(self._cells)
+        for x, y in occupied:
+            self.occupy(x, y)
+
+    @classmethod
+    def from_tiles(
+        cls,
+        tiles: np.ndarray,
+        tile_type: type[Tile] | tuple[type[Tile], ...] | None = None,
+        occupied: Iterable[tuple[int, int]] = (),
+        rng: random.Random | None = None,
+    ) -> FreeCellSampler:
+        """
+        タイル配列から空きマスサンプラーを作成。
+
+        Args:
+        ----
+            tiles: タイル配列
+            tile_type: 配置可能とするタイルクラス（Noneの場合はwalkable属性で判定）
+            occupied: 既に占有されている座標 (x, y) の列
+            rng: 抽出に使う乱数生成器
+
+        Returns:
+        -------
+            作成されたサンプラー
+
+        """
+        mask = walkable_mask(tiles) if tile_type is None else tile_mask(tiles, tile_type)
+        return cls(mask, occupied, rng)
+
+    def __len__(self) -> int:
+        """残っている空きマスの数。"""
+        return self._size
+
+    def _index(self, x: int, y: int) -> int:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return NOT_FREE
+        return y * self.width + x
+
+    def _randrange(self, stop: int) -> int:
+        return self.rng.randrange(stop) if self.rng is not None else random.randrange(stop)
+
+    def _swap(self, slot_a: int, slot_b: int) -> None:
+        index_a, index_b = self._cells[slot_a], self._cells[slot_b]
+        self._cells[slot_a], self._cells[slot_b] = index_b, index_a
+        self._slots[index_a], self._slots[index_b] = slot_b, slot_a
+
+    def _remove_slot(self, slot: int) -> int:
+        # 末尾の空きマスと入れ替え、取り除いたマスは _cells[_size:] 側に残す
+        last = self._size - 1
+        self._swap(slot, last)
+        self._size = last
+        return int(self._cells[last])
+
+    def _slot_of(self, x: int, y: int) -> int:
+        index = self._index(x, y)
+        return NOT_FREE if index == NOT_FREE else int(self._slots[index])
+
+    def contains(self, x: int, y: int) -> bool:
+        """
+        指定座標が空きマスかチェック。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            空きマスの場合True
+
+        """
+        slot = self._slot_of(x, y)
+        return slot != NOT_FREE and slot < self._size
+
+    def occupy(self, x: int, y: int) -> bool:
+        """
+        指定座標を占有済みにして空きマスから取り除く。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            空きマスだった場合True
+
+        """
+        slot = self._slot_of(x, y)
+        if slot == NOT_FREE or slot >= self._size:
+            return False
+        self._remove_slot(slot)
+        return True
+
+    def release(self, x: int, y: int) -> bool:
+        """
+        占有済みの座標を空きマスに戻す。
+
+        初期マスクで配置不可だったマスは戻せません。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            空きマスに戻した場合True
+
+        """
+        slot = self._slot_of(x, y)
+        if slot == NOT_FREE or slot < self._size:
+            return False
+        self._swap(slot, self._size)
+        self._size += 1
+        return True
+
+    def sample(self) -> tuple[int, int] | None:
+        """
+        空きマスを1つ抽出して占有済みにする。
+
+        Returns
+        -------
+            抽出した座標 (x, y)。空きマスがない場合はNone
+
+        """
+        if self._size == 0:
+            return None
+        index = self._remove_slot(self._randrange(self._size))
+        return index % self.width, index // self.width
+
+    def sample_many(self, count: int) -> list[tuple[int, int]]:
+        """
+        空きマスを非復元抽出して占有済みにする。
+
+        Args:
+        ----
+            count: 抽出する数（空きマスより多い場合は全て）
+
+        Returns:
+        -------
+            抽出した座標 (x, y) のリスト（抽出順）
+
+        """
+        positions = []
+        for _ in range(min(count, self._size)):
+            index = self._remove_slot(self._randrange(self._size))
+            positions.append((index % self.width, index // self.width))
+        return positions
+
+    def positions(self) -> list[tuple[int, int]]:
+        """
+        残っている空きマスの座標を取得。
+
+        Returns
+        -------
+            空きマスの座標 (x, y) のリスト（順序は不定）
+
+        """
+        cells = self._cells[: self._size]
+        return list(zip((cells % self.width).tolist(), (cells // self.width).tolist(), strict=True))
@@ -0,0 +1,207 @@
+"""
+グリッド演算カーネル。
+
+このモジュールは、ダンジョン生成で使用するブール配列（壁マスク・床マスク）上の
+NumPy演算を提供します。タイルオブジェクトを1マスずつ判定する代わりに、
+マスクに変換してから一括で計算し、変化したマスだけをタイル配列へ書き戻します。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+
+from pyrogue.map.tile import Tile
+
+# 4方向の隣接オフセット (dy, dx)
+ORTHOGONAL_OFFSETS: tuple[tuple[int, int], ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# 書き込むタイル: 共有インスタンス（全マスで同じオブジェクト）またはマスごとに呼ぶ生成関数
+type TileSource = Tile | Callable[[], Tile]
+
+
+def tile_values(source: TileSource, count: int) -> np.ndarray:
+    """
+    書き込むタイルのobject配列を作成。
+
+    共有インスタンスは全要素に同じオブジェクトを入れ、生成関数は
+    マスごとに呼び出して別インスタンスを作ります。
+
+    Args:
+    ----
+        source: 共有インスタンス、またはタイルを生成する関数
+        count: 要素数
+
+    Returns:
+    -------
+        長さcountのobject配列
+
+    Raises:
+    ------
+        ValueError: 共有されていないタイルインスタンスを渡した場合
+
+    """
+    values = np.empty(count, dtype=object)
+    if isinstance(source, Tile):
+        if not source.is_shared:
+            msg = "Only shared tiles can be written to many cells; pass a factory for per-cell tiles"
+            raise ValueError(msg)
+        values.fill(source)
+    else:
+        values[:] = [source() for _ in range(count)]
+    return values
+
+
+def tile_mask(tiles: np.ndarray, tile_type: type[Tile] | tuple[type[Tile], ...]) -> np.ndarray:
+    """
+    指定した種類のタイルがあるマスをTrueとするマスクを作成。
+
+    Args:
+    ----
+        tiles: タイル配列
+        tile_type: 判定するタイルクラス（タプルで複数指定可）
+
+    Returns:
+    -------
+        タイル配列と同じ形状のブール配列
+
+    """
+    return np.fromiter(
+        (isinstance(tile, tile_type) for tile in tiles.flat),
+        dtype=bool,
+        count=tiles.size,
+    ).reshape(tiles.shape)
+
+
+def write_tiles(tiles: np.ndarray, mask: np.ndarray, source: TileSource) -> int:
+    """
+    マスクがTrueのマスにタイルを一括で書き込む。
+
+    Args:
+    ----
+        tiles: 書き込み先のタイル配列
+        mask: 書き込むマスのブール配列
+        source: 共有インスタンス、またはタイルを生成する関数
+
+    Returns:
+    -------
+        書き込んだマスの数
+
+    """
+    ys, xs = np.nonzero(mask)
+    if len(ys) == 0:
+        return 0
+    tiles[ys, xs] = tile_values(source, len(ys))
+    return len(ys)
+
+
+def count_neighbors(mask: np.ndarray, diagonal: bool = True) -> np.ndarray:
+    """
+    各マスの隣接マスのうちマスクがTrueのものを数える。
+
+    配列外は数えません（呼び出し側で境界を除外する前提）。
+
+    Args:
+    ----
+        mask: ブール配列
+        diagonal: 斜め方向も含める場合True（8近傍）、False の場合は4近傍
+
+    Returns:
+    -------
+        隣接数のint配列
+
+    """
+    padded = np.pad(mask, 1).astype(np.int8)
+    height, width = mask.shape
+    counts = np.zeros(mask.shape, dtype=np.int8)
+    for dy in (-1, 0, 1):
+        for dx in (-1, 0, 1):
+            if dy == 0 and dx == 0:
+                continue
+            if not diagonal and dy != 0 and dx != 0:
+                continue
+            counts += padded[1 + dy : 1 + dy + height, 1 + dx : 1 + dx + width]
+    return counts
+
+
+def cellular_automata_step(wall: np.ndarray, birth_limit: int = 4, death_limit: int = 6) -> np.ndarray:
+    """
+    セルラーオートマタを1ステップ適用した壁マスクを返す。
+
+    外周のマスは変化させません。
+
+    Args:
+    ----
+        wall: 壁マスク
+        birth_limit: 壁の周囲の壁がこの数未満なら床になる
+        death_limit: 床の周囲の壁がこの数を超えたら壁になる
+
+    Returns:
+    -------
+        更新後の壁マスク
+
+    """
+    counts = count_neighbors(wall)
+    interior = np.zeros(wall.shape, dtype=bool)
+    interior[1:-1, 1:-1] = True
+
+    result = wall.copy()
+    result[interior & wall & (counts < birth_limit)] = False
+    result[interior & ~wall & (counts > death_limit)] = True
+    return result
+
+
+def prune_dead_ends(floor: np.ndarray, removal_rate: float, rng: np.random.Generator) -> np.ndarray:
+    """
+    行き止まり（4近傍の床が1つだけの床）を確率的に埋める。
+
+    全体を繰り返し走査する代わりに、候補マス（フロンティア）だけを
+    ラウンドごとに判定します。埋めたマスの隣接マスが新たな行き止まりになれば
+    次のラウンドの候補に加え、残った行き止まりも何かが変化している間は
+    再判定します（従来の「変化がなくなるまで走査」と同じ終了条件）。
+
+    Args:
+    ----
+        floor: 床マスク（変更されません）
+        removal_rate: 行き止まりを埋める確率
+        rng: 乱数生成器
+
+    Returns:
+    -------
+        更新後の床マスク
+
+    """
+    result = floor.copy()
+    height, width = result.shape
+    interior = np.zeros(result.shape, dtype=bool)
+    interior[1:-1, 1:-1] = True
+
+    neighbors = count_neighbors(result, diagonal=False).astype(np.int16)
+    frontier_y, frontier_x = np.nonzero(result & interior & (neighbors == 1))
+
+    while len(frontier_y) > 0:
+        removed = rng.random(len(frontier_y)) < removal_rate
+        if not removed.any():
+            break
+
+        ry, rx = frontier_y[removed], frontier_x[removed]
+        result[ry, rx] = False
+
+        # 埋めたマスの隣接マスの床数を更新し、新たな行き止まりを候補に追加
+        candidates_y = [frontier_y[~removed]]
+        candidates_x = [frontier_x[~removed]]
+        for dy, dx in ORTHOGONAL_OFFSETS:
+            ny, nx = ry + dy, rx + dx
+            in_bounds = (ny >= 0) & (ny < height) & (nx >= 0) & (nx < width)
+            np.subtract.at(neighbors, (ny[in_bounds], nx[in_bounds]), 1)
+            candidates_y.append(ny[in_bounds])
+            candidates_x.append(nx[in_bounds])
+
+        cy = np.concatenate(candidates_y)
+        cx = np.concatenate(candidates_x)
+        is_dead_end = result[cy, cx] & interior[cy, cx] & (neighbors[cy, cx] == 1)
+        flat = np.unique(cy[is_dead_end] * width + cx[is_dead_end])
+        frontier_y, frontier_x = np.divmod(flat, width)
+
+    return result
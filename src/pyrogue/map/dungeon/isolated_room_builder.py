@@ -12,6 +12,7 @@ import random
 import numpy as np
 
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Floor, SecretDoor, Wall
 from pyrogue.utils import game_logger
 
@@ -66,6 +67,7 @@ class IsolatedRoomBuilder:
         self.isolation_level = isolation_level
         self.isolated_groups: list[IsolatedRoomGroup] = []
         self.used_areas: set[tuple[int, int]] = set()
+        self.tile_buffer = TileBuffer(width, height)  # タイル書き込み用
 
         game_logger.info(f"IsolatedRoomBuilder initialized: {width}x{height}, isolation_level={isolation_level}")
 
@@ -230,10 +232,7 @@ class IsolatedRoomBuilder:
         """部屋をタイルに配置。"""
         for room in rooms:
             # 部屋の内部を床に設定
-            for y in range(room.y + 1, room.y + room.height - 1):
-                for x in range(room.x + 1, room.x + room.width - 1):
-                    if 0 <= y < self.height and 0 <= x < self.width:
-                        tiles[y, x] = Floor()
+            self.tile_buffer.fill_rect(tiles, room.x + 1, room.y + 1, room.width - 2, room.height - 2, Floor.shared())
 
             # 部屋の境界は壁のまま（既に初期化済み）
 
@@ -283,6 +282,7 @@ class IsolatedRoomBuilder:
         # L字型の通路を作成
         current_x, current_y = start
         target_x, target_y = end
+        path: list[tuple[int, int]] = []
 
         # 水平方向に移動
         while current_x != target_x:
@@ -291,8 +291,7 @@ class IsolatedRoomBuilder:
             else:
                 current_x -= 1
 
-            if 0 <= current_y < self.height and 0 <= current_x < self.width:
-                tiles[current_y, current_x] = Floor()
+            path.append((current_x, current_y))
 
         # 垂直方向に移動
         while current_y != target_y:
@@ -301,8 +300,10 @@ class IsolatedRoomBuilder:
             else:
                 current_y -= 1
 
-            if 0 <= current_y < self.height and 0 <= current_x < self.width:
-                tiles[current_y, current_x] = Floor()
+            path.append((current_x, current_y))
+
+        # 範囲外の座標はバッファ側で除外される
+        self.tile_buffer.write_points(tiles, path, Floor.shared())
 
     def _determine_access_points(self, rooms: list[Room]) -> list[tuple[int, int]]:
         """アクセスポイントを決定。"""
@@ -388,11 +389,13 @@ class IsolatedRoomBuilder:
         # 隠し通路のパスを計算
         path = self._calculate_secret_path(current_x, current_y, target_x, target_y)
 
-        # 隠し通路を配置
-        for x, y in path:
-            if 0 <= x < self.width and 0 <= y < self.height:
-                if isinstance(tiles[y, x], Wall):
-                    tiles[y, x] = SecretDoor()
+        # 壁を貫く位置にだけ隠し扉を一括配置
+        secret_points = [
+            (x, y)
+            for x, y in dict.fromkeys(path)
+            if 0 <= x < self.width and 0 <= y < self.height and isinstance(tiles[y, x], Wall)
+        ]
+        self.tile_buffer.write_points(tiles, secret_points, SecretDoor)
 
         game_logger.debug(f"Created secret passage from {start} to {target}")
 
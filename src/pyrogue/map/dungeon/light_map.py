@@ -0,0 +1,261 @@
+"""
+明暗ラスター。
+
+このモジュールは、暗い部屋と光源の配置から作るフロア単位のラスターを提供します。
+暗さレベル・光源なしでの視界範囲・光源の影響度・最寄りの光源までの距離を
+生成時に一度だけ計算しておき、視界計算の度に部屋や光源のリストを走査せずに
+配列参照で答えます。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pyrogue.map.dungeon.dark_room_builder import DarkRoom
+
+# 暗い部屋の外を示す視界範囲の値（暗い部屋の視界範囲は1以上）
+NOT_DARK = 0
+
+# 光源が届かないマスの距離
+NO_LIGHT = np.iinfo(np.int32).max
+
+# 床に置かれた光源の影響範囲（ユークリッド距離）
+LIGHT_INFLUENCE_RADIUS = 3
+
+
+class LightMap:
+    """
+    暗い部屋と光源の明暗ラスター。
+
+    部屋が重なる場合は、最初に登録された暗い部屋を保持します
+    （従来の部屋リスト走査と同じ優先順位）。
+
+    Attributes
+    ----------
+        width: マップの幅
+        height: マップの高さ
+        darkness: 各マスの暗さレベル（暗い部屋の外は0.0）のfloat32配列
+        visibility: 各マスの光源なしでの視界範囲（暗い部屋の外はNOT_DARK）のint16配列
+        influence: 各マスの光源の影響度（0.0-1.0）のfloat32配列
+        light_distance: 最寄りの光源までのマンハッタン距離（光源がない場合はNO_LIGHT）のint32配列
+        nearest_light: 最寄りの光源の番号（光源がない場合は-1）のint32配列
+        light_sources: 登録された光源の位置のリスト
+
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        空の明暗ラスターを初期化。
+
+        Args:
+        ----
+            width: マップの幅
+            height: マップの高さ
+
+        """
+        self.width = width
+        self.height = height
+        self.darkness = np.zeros((height, width), dtype=np.float32)
+        self.visibility = np.full((height, width), NOT_DARK, dtype=np.int16)
+        self.influence = np.zeros((height, width), dtype=np.float32)
+        self.light_distance = np.full((height, width), NO_LIGHT, dtype=np.int32)
+        self.nearest_light = np.full((height, width), -1, dtype=np.int32)
+        self.light_sources: list[tuple[int, int]] = []
+
+    @classmethod
+    def from_dark_rooms(
+        cls,
+        width: int,
+        height: int,
+        dark_rooms: list[DarkRoom],
+        light_sources: list[tuple[int, int]],
+    ) -> LightMap:
+        """
+        暗い部屋と光源のリストから明暗ラスターを作成。
+
+        Args:
+        ----
+            width: マップの幅
+            height: マップの高さ
+            dark_rooms: 暗い部屋のリスト
+            light_sources: 光源の位置のリスト
+
+        Returns:
+        -------
+            作成された明暗ラスター
+
+        """
+        light_map = cls(width, height)
+        for dark_room in dark_rooms:
+            light_map.add_dark_room(dark_room)
+        for x, y in light_sources:
+            light_map.add_light_source(x, y)
+        return light_map
+
+    def _clip(self, x: int, y: int, width: int, height: int) -> tuple[slice, slice] | None:
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        if x0 >= x1 or y0 >= y1:
+            return None
+        return slice(y0, y1), slice(x0, x1)
+
+    def add_dark_room(self, dark_room: DarkRoom) -> None:
+        """
+        暗い部屋を登録。
+
+        Args:
+        ----
+            dark_room: 暗い部屋
+
+        """
+        region = self._clip(dark_room.x, dark_room.y, dark_room.width, dark_room.height)
+        if region is None:
+            return
+        unclaimed = self.visibility[region] == NOT_DARK
+        self.darkness[region][unclaimed] = dark_room.darkness_level
+        self.visibility[region][unclaimed] = dark_room.base_visibility_range
+
+    def add_light_source(self, x: int, y: int) -> None:
+        """
+        光源を登録し、影響度と最寄りの光源を更新。
+
+        Args:
+        ----
+            x: 光源のX座標
+            y: 光源のY座標
+
+        """
+        index = len(self.light_sources)
+        self.light_sources.append((x, y))
+
+        # 影響度: 距離に反比例（最大LIGHT_INFLUENCE_RADIUSセル）
+        radius = LIGHT_INFLUENCE_RADIUS
+        region = self._clip(x - radius, y - radius, 2 * radius + 1, 2 * radius + 1)
+        if region is not None:
+            ys, xs = np.ogrid[region[0], region[1]]
+            distance = np.sqrt((xs - x) ** 2 + (ys - y) ** 2)
+            influence = np.where(distance <= radius, np.maximum(0.0, 1.0 - distance / radius), 0.0)
+            np.maximum(self.influence[region], influence, out=self.influence[region])
+
+        # 最寄りの光源: 距離が同じ場合は先に登録された光源を保持する
+        ys, xs = np.ogrid[0 : self.height, 0 : self.width]
+        distance = np.abs(xs - x) + np.abs(ys - y)
+        closer = distance < self.light_distance
+        self.light_distance[closer] = distance[closer]
+        self.nearest_light[closer] = index
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """
+        座標がマップ内かチェック。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            マップ内の場合True
+
+        """
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def is_dark(self, x: int, y: int) -> bool:
+        """
+        指定位置が暗い部屋内かチェック。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            暗い部屋内の場合True
+
+        """
+        return self.in_bounds(x, y) and self.visibility[y, x] != NOT_DARK
+
+    def darkness_at(self, x: int, y: int) -> float:
+        """
+        指定位置の暗さレベルを取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            暗さレベル（0.0-1.0）
+
+        """
+        return float(self.darkness[y, x]) if self.in_bounds(x, y) else 0.0
+
+    def visibility_range_at(
+        self,
+        x: int,
+        y: int,
+        player_has_light: bool,
+        light_radius: int,
+        default_range: int,
+    ) -> int:
+        """
+        指定位置での視界範囲を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+            player_has_light: プレイヤーが光源を持っているか
+            light_radius: 光源の照射範囲
+            default_range: 暗い部屋の外での視界範囲
+
+        Returns:
+        -------
+            視界範囲（セル数）
+
+        """
+        if not self.is_dark(x, y):
+            return default_range
+        if player_has_light:
+            return light_radius
+        return int(self.visibility[y, x])
+
+    def influence_at(self, x: int, y: int) -> float:
+        """
+        指定位置での光源の影響度を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            光の影響度（0.0-1.0）
+
+        """
+        return float(self.influence[y, x]) if self.in_bounds(x, y) else 0.0
+
+    def nearest_light_source(self, x: int, y: int, max_distance: int) -> tuple[int, int] | None:
+        """
+        最寄りの光源を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+            max_distance: 最大距離（マンハッタン距離）
+
+        Returns:
+        -------
+            最寄りの光源の位置、または None
+
+        """
+        if not self.in_bounds(x, y) or self.light_distance[y, x] > max_distance:
+            return None
+        return self.light_sources[self.nearest_light[y, x]]
@@ -11,7 +11,10 @@ import random
 
 import numpy as np
 
+from pyrogue.map.dungeon.connectivity import ComponentLabels, label_components
+from pyrogue.map.dungeon.grid_kernels import cellular_automata_step, count_neighbors, prune_dead_ends, tile_mask
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Floor, Wall
 from pyrogue.utils import game_logger
 
@@ -39,6 +42,7 @@ class MazeBuilder:
         self.height = height
         self.complexity = complexity
         self.rooms: list[Room] = []  # 迷路には部屋は存在しないが、互換性のため
+        self.tile_buffer = TileBuffer(width, height)  # タイル書き込み用
 
         game_logger.info(f"MazeBuilder initialized: {width}x{height}, complexity={complexity}")
 
@@ -78,17 +82,17 @@ class MazeBuilder:
 
     def _fill_with_walls(self, tiles: np.ndarray) -> None:
         """全体を壁で埋める。"""
-        for y in range(self.height):
-            for x in range(self.width):
-                tiles[y, x] = Wall()
+        self.tile_buffer.fill_rect(tiles, 0, 0, self.width, self.height, Wall.shared())
 
     def _generate_base_maze(self, tiles: np.ndarray) -> None:
         """基本的な迷路パターンを生成。"""
         # 格子状のベースパターンを作成
         # 奇数座標に通路を配置（古典的な迷路アルゴリズム）
+        # 書き込みのみで読み取りがないため、座標を溜めて最後に一括適用する
+        self.tile_buffer.bind(tiles)
         for y in range(1, self.height - 1, 2):
             for x in range(1, self.width - 1, 2):
-                tiles[y, x] = Floor()
+                self.tile_buffer.queue_tile_change(x, y, Floor.shared())
 
                 # ランダムに隣接するセルに通路を延伸（斜め方向も追加）
                 directions = [(0, 2), (2, 0), (0, -2), (-2, 0), (2, 2), (-2, -2), (2, -2), (-2, 2)]
@@ -105,165 +109,92 @@ class MazeBuilder:
                         and random.random() < extension_probability
                     ):
                         # 通路と中間点を床に
-                        tiles[ny, nx] = Floor()
+                        self.tile_buffer.queue_tile_change(nx, ny, Floor.shared())
                         # 斜め方向の場合は中間点の座標計算を調整
                         mid_x, mid_y = x + dx // 2, y + dy // 2
                         if 1 <= mid_x < self.width - 1 and 1 <= mid_y < self.height - 1:
-                            tiles[mid_y, mid_x] = Floor()
+                            self.tile_buffer.queue_tile_change(mid_x, mid_y, Floor.shared())
+
+        self.tile_buffer.flush_to_tiles(tiles)
 
     def _apply_cellular_automata(self, tiles: np.ndarray) -> None:
         """セルラーオートマタで迷路を自然化。"""
         iterations = 1  # イテレーション数をさらに減らして、より広い通路を保持
 
+        # 壁マスク上で隣接数を一括計算し、変化したマスだけを書き戻す
+        original = tile_mask(tiles, Wall)
+        wall = original
         for _ in range(iterations):
-            new_tiles = np.copy(tiles)
-
-            for y in range(1, self.height - 1):
-                for x in range(1, self.width - 1):
-                    # 隣接する8方向の壁の数をカウント
-                    wall_count = 0
-                    for dy in [-1, 0, 1]:
-                        for dx in [-1, 0, 1]:
-                            if dy == 0 and dx == 0:
-                                continue
-                            ny, nx = y + dy, x + dx
-                            if isinstance(tiles[ny, nx], Wall):
-                                wall_count += 1
-
-                    # セルラーオートマタのルール（より通路を保持）
-                    if isinstance(tiles[y, x], Wall):
-                        # 壁の場合：隣接する壁が少なければ通路に
-                        if wall_count < 4:
-                            new_tiles[y, x] = Floor()
-                    # 通路の場合：隣接する壁が非常に多い場合のみ壁に
-                    elif wall_count > 6:
-                        new_tiles[y, x] = Wall()
-
-            tiles[:] = new_tiles
+            # 壁の場合は隣接する壁が4未満なら通路に、通路の場合は6を超えたら壁に
+            wall = cellular_automata_step(wall, birth_limit=4, death_limit=6)
+
+        self.tile_buffer.write_mask(tiles, original & ~wall, Floor.shared())
+        self.tile_buffer.write_mask(tiles, ~original & wall, Wall.shared())
 
     def _remove_dead_ends(self, tiles: np.ndarray) -> None:
         """デッドエンドを部分的に除去。"""
         dead_end_removal_rate = max(0.3, 1.0 - self.complexity)  # 最低30%は除去（迷路をより複雑に）
 
-        changed = True
-        while changed:
-            changed = False
-
-            for y in range(1, self.height - 1):
-                for x in range(1, self.width - 1):
-                    if isinstance(tiles[y, x], Floor):
-                        # 隣接する床タイルの数をカウント
-                        floor_neighbors = 0
-                        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                            nx, ny = x + dx, y + dy
-                            if isinstance(tiles[ny, nx], Floor):
-                                floor_neighbors += 1
-
-                        # デッドエンド（隣接する床が1つだけ）を除去
-                        if floor_neighbors == 1 and random.random() < dead_end_removal_rate:
-                            tiles[y, x] = Wall()
-                            changed = True
+        # 候補マスだけを再判定するフロンティア方式で除去
+        floor = tile_mask(tiles, Floor)
+        rng = np.random.default_rng(random.getrandbits(64))
+        pruned = prune_dead_ends(floor, dead_end_removal_rate, rng)
+
+        removed = self.tile_buffer.write_mask(tiles, floor & ~pruned, Wall.shared())
+        game_logger.debug(f"Maze dead ends removed: {removed}")
 
     def _ensure_connectivity(self, tiles: np.ndarray) -> None:
         """連結性を保証。"""
-        # フラッドフィルで最大の連結成分を見つける
-        visited = np.zeros((self.height, self.width), dtype=bool)
-        components = []
-
-        for y in range(self.height):
-            for x in range(self.width):
-                if isinstance(tiles[y, x], Floor) and not visited[y, x]:
-                    component = self._flood_fill(tiles, visited, x, y)
-                    if component:
-                        components.append(component)
-
-        if not components:
+        # 連結成分をラベル付けして最大の連結成分を見つける
+        components = label_components(tile_mask(tiles, Floor))
+        if components.count == 0:
             return
 
-        # 最大連結成分を特定
-        largest_component = max(components, key=len)
+        largest = components.largest()
 
         # 小さな孤立成分を最大成分に接続を試行
-        for component in components:
-            if component != largest_component and len(component) >= 3:
-                self._connect_component_to_largest(tiles, component, largest_component)
-
-        # 接続できなかった小さな成分は壁に変換
-        for y in range(self.height):
-            for x in range(self.width):
-                if isinstance(tiles[y, x], Floor) and (x, y) not in largest_component:
-                    # 再度連結性をチェック
-                    if not self._is_connected_to_largest(tiles, x, y, largest_component):
-                        tiles[y, x] = Wall()
-
-    def _flood_fill(self, tiles: np.ndarray, visited: np.ndarray, start_x: int, start_y: int) -> list[tuple[int, int]]:
-        """フラッドフィルで連結成分を取得。"""
-        component = []
-        stack = [(start_x, start_y)]
-
-        while stack:
-            x, y = stack.pop()
-            if x < 0 or x >= self.width or y < 0 or y >= self.height or visited[y, x] or isinstance(tiles[y, x], Wall):
-                continue
-
-            visited[y, x] = True
-            component.append((x, y))
+        for label in range(1, components.count + 1):
+            if label != largest and components.sizes[label] >= 3:
+                self._connect_component_to_largest(tiles, components, label, largest)
 
-            # 4方向に探索
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                stack.append((x + dx, y + dy))
-
-        return component
+        # 接続後に再ラベル付けし、最大成分に繋がらなかった床は壁に変換
+        floor = tile_mask(tiles, Floor)
+        components = label_components(floor)
+        self.tile_buffer.write_mask(tiles, floor & ~components.mask(components.largest()), Wall.shared())
 
     def _clean_maze(self, tiles: np.ndarray) -> None:
         """最終的な清掃処理。"""
         # 境界を確実に壁にする
-        for y in range(self.height):
-            tiles[y, 0] = Wall()
-            tiles[y, self.width - 1] = Wall()
-
-        for x in range(self.width):
-            tiles[0, x] = Wall()
-            tiles[self.height - 1, x] = Wall()
-
-        # 孤立した床タイルを壁に変換
-        for y in range(1, self.height - 1):
-            for x in range(1, self.width - 1):
-                if isinstance(tiles[y, x], Floor):
-                    # 隣接する床タイルの数をカウント
-                    floor_neighbors = 0
-                    for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                        nx, ny = x + dx, y + dy
-                        if isinstance(tiles[ny, nx], Floor):
-                            floor_neighbors += 1
-
-                    # 完全に孤立した床タイルを壁に変換
-                    if floor_neighbors == 0:
-                        tiles[y, x] = Wall()
+        border = np.zeros((self.height, self.width), dtype=bool)
+        border[[0, -1], :] = True
+        border[:, [0, -1]] = True
+        self.tile_buffer.write_mask(tiles, border, Wall.shared())
+
+        # 孤立した床タイル（4近傍に床がない）を壁に変換
+        floor = tile_mask(tiles, Floor)
+        isolated = floor & (count_neighbors(floor, diagonal=False) == 0)
+        isolated[[0, -1], :] = False
+        isolated[:, [0, -1]] = False
+        self.tile_buffer.write_mask(tiles, isolated, Wall.shared())
 
     def _connect_component_to_largest(
         self,
         tiles: np.ndarray,
-        component: list[tuple[int, int]],
-        largest_component: list[tuple[int, int]],
+        components: ComponentLabels,
+        label: int,
+        largest: int,
     ) -> None:
         """小さな成分を最大成分に接続を試行。"""
-        import random
-
         # コンポーネントからランダムに点を選択
-        comp_point = random.choice(component)
+        comp_point = random.choice(components.points(label))
 
         # 最大成分の最寄りの点を見つける
-        min_distance = float("inf")
-        closest_point = None
-
-        for large_point in largest_component:
-            distance = abs(comp_point[0] - large_point[0]) + abs(comp_point[1] - large_point[1])
-            if distance < min_distance:
-                min_distance = distance
-                closest_point = large_point
+        nearest = components.nearest_point(largest, *comp_point)
+        if nearest is None:
+            return
 
-        if closest_point and min_distance <= 4:  # 距離が4以下なら接続を試行
+        closest_point, min_distance = nearest
+        if min_distance <= 4:  # 距離が4以下なら接続を試行
             self._create_simple_path(tiles, comp_point, closest_point)
 
     def _create_simple_path(self, tiles: np.ndarray, start: tuple[int, int], end: tuple[int, int]) -> None:
@@ -271,34 +202,21 @@ class MazeBuilder:
         x1, y1 = start
         x2, y2 = end
 
+        path: list[tuple[int, int]] = []
+
         # 水平移動
         if x1 != x2:
             step = 1 if x2 > x1 else -1
-            for x in range(x1, x2, step):
-                if 1 <= x < self.width - 1 and 1 <= y1 < self.height - 1:
-                    tiles[y1, x] = Floor()
+            path.extend((x, y1) for x in range(x1, x2, step))
 
         # 垂直移動
         if y1 != y2:
             step = 1 if y2 > y1 else -1
-            for y in range(y1, y2, step):
-                if 1 <= x2 < self.width - 1 and 1 <= y < self.height - 1:
-                    tiles[y, x2] = Floor()
+            path.extend((x2, y) for y in range(y1, y2, step))
 
-    def _is_connected_to_largest(
-        self,
-        tiles: np.ndarray,
-        x: int,
-        y: int,
-        largest_component: list[tuple[int, int]],
-    ) -> bool:
-        """指定位置が最大成分に接続されているかチェック。"""
-        # 簡易チェック：隣接する4方向に最大成分の点があるか
-        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nx, ny = x + dx, y + dy
-            if (nx, ny) in largest_component:
-                return True
-        return False
+        # 外周は掘らない
+        inner = [(x, y) for x, y in path if 1 <= x < self.width - 1 and 1 <= y < self.height - 1]
+        self.tile_buffer.write_points(tiles, inner, Floor.shared())
 
     def reset(self) -> None:
         """ビルダーの状態をリセット。"""
@@ -0,0 +1,205 @@
+"""
+部屋IDラスター。
+
+このモジュールは、各マスがどの部屋に属するかを記録するint16配列と、
+部屋の内部マスク・境界壁マスクを提供します。部屋を掘るたびに更新され、
+「この座標はどの部屋か」「部屋の外周の壁か」という問い合わせを
+部屋リストの走査ではなく配列参照で答えます。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pyrogue.map.dungeon.room_builder import Room
+
+# 部屋に属さないマスの値
+NO_ROOM = -1
+
+
+class RoomRaster:
+    """
+    部屋IDラスターと部屋マスク。
+
+    部屋の矩形（x, y, width, height）を幾何的に記録します。
+    重なった場合は先に登録された部屋が優先されます（従来のリスト走査と同じ）。
+
+    Attributes
+    ----------
+        width: マップの幅
+        height: マップの高さ
+        room_ids: 各マスの部屋番号（登録順、部屋外はNO_ROOM）のint16配列
+        interior: 部屋の外周を除く内部のマスク
+        boundary: 部屋の矩形に辺で接する外側1マスの壁のマスク（角は含まない）
+        rooms: 部屋番号から部屋へのリスト
+
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        空のラスターを初期化。
+
+        Args:
+        ----
+            width: マップの幅
+            height: マップの高さ
+
+        """
+        self.width = width
+        self.height = height
+        self.room_ids = np.full((height, width), NO_ROOM, dtype=np.int16)
+        self.interior = np.zeros((height, width), dtype=bool)
+        self.boundary = np.zeros((height, width), dtype=bool)
+        self.rooms: list[Room] = []
+
+    @classmethod
+    def from_rooms(cls, width: int, height: int, rooms: list[Room]) -> RoomRaster:
+        """
+        部屋リストからラスターを作成。
+
+        Args:
+        ----
+            width: マップの幅
+            height: マップの高さ
+            rooms: 部屋のリスト
+
+        Returns:
+        -------
+            作成されたラスター
+
+        """
+        raster = cls(width, height)
+        for room in rooms:
+            raster.add_room(room)
+        return raster
+
+    def _clip(self, x0: int, y0: int, x1: int, y1: int) -> tuple[slice, slice]:
+        return (
+            slice(max(0, min(y0, self.height)), max(0, min(y1, self.height))),
+            slice(max(0, min(x0, self.width)), max(0, min(x1, self.width))),
+        )
+
+    def add_room(self, room: Room) -> int:
+        """
+        部屋を登録してラスターを更新。
+
+        Args:
+        ----
+            room: 登録する部屋
+
+        Returns:
+        -------
+            割り当てられた部屋番号
+
+        """
+        index = len(self.rooms)
+        self.rooms.append(room)
+
+        left, top = room.x, room.y
+        right, bottom = room.x + room.width, room.y + room.height
+
+        footprint = self.room_ids[self._clip(left, top, right, bottom)]
+        footprint[footprint == NO_ROOM] = index
+        self.interior[self._clip(left + 1, top + 1, right - 1, bottom - 1)] = True
+
+        # 上下・左右の外周の壁（角は含まない）
+        self.boundary[self._clip(left, top - 1, right, top)] = True
+        self.boundary[self._clip(left, bottom, right, bottom + 1)] = True
+        self.boundary[self._clip(left - 1, top, left, bottom)] = True
+        self.boundary[self._clip(right, top, right + 1, bottom)] = True
+        return index
+
+    def replace_room(self, old: Room, new: Room) -> None:
+        """
+        登録済みの部屋を同じ矩形の別オブジェクトに置き換える（暗い部屋への変換など）。
+
+        Args:
+        ----
+            old: 置き換え前の部屋
+            new: 置き換え後の部屋
+
+        """
+        for index, room in enumerate(self.rooms):
+            if room is old:
+                self.rooms[index] = new
+                return
+
+    def in_bounds(self, x: int, y: int) -> bool:
+        """座標がマップ範囲内かチェック。"""
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def room_index_at(self, x: int, y: int) -> int:
+        """
+        指定座標の部屋番号を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            部屋番号（部屋外や範囲外の場合はNO_ROOM）
+
+        """
+        if not self.in_bounds(x, y):
+            return NO_ROOM
+        return int(self.room_ids[y, x])
+
+    def room_at(self, x: int, y: int) -> Room | None:
+        """
+        指定座標を含む部屋を取得。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Returns:
+        -------
+            部屋（部屋外の場合はNone）
+
+        """
+        index = self.room_index_at(x, y)
+        return None if index == NO_ROOM else self.rooms[index]
+
+    def is_room_floor(self, x: int, y: int) -> bool:
+        """指定座標が部屋の矩形内（外周を含む）かチェック。"""
+        return self.room_index_at(x, y) != NO_ROOM
+
+    def is_inside_room(self, x: int, y: int) -> bool:
+        """指定座標が部屋の外周を除く内部かチェック。"""
+        return self.in_bounds(x, y) and bool(self.interior[y, x])
+
+    def is_boundary_wall(self, x: int, y: int) -> bool:
+        """指定座標が部屋の外周の壁（角を除く）かチェック。"""
+        return self.in_bounds(x, y) and bool(self.boundary[y, x])
+
+    def any_room_near(self, x: int, y: int, radius: int) -> bool:
+        """
+        指定座標を中心とする正方形の範囲内（中心を除く）に部屋のマスがあるかチェック。
+
+        Args:
+        ----
+            x: 中心のX座標
+            y: 中心のY座標
+            radius: 範囲（チェビシェフ距離）
+
+        Returns:
+        -------
+            範囲内に部屋のマスがある場合True
+
+        """
+        region = self.room_ids[self._clip(x - radius, y - radius, x + radius + 1, y + radius + 1)]
+        count = int(np.count_nonzero(region != NO_ROOM))
+        if self.is_room_floor(x, y):
+            count -= 1
+        return count > 0
+
+    @property
+    def footprint(self) -> np.ndarray:
+        """部屋の矩形内（外周を含む）がTrueのマスク。"""
+        return self.room_ids != NO_ROOM
@@ -14,6 +14,8 @@ import tcod.bsp
 from pyrogue.map.dungeon.constants import BSPConstants, DoorConstants
 from pyrogue.map.dungeon.line_drawer import LineDrawer
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.room_raster import RoomRaster
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Door, Floor, SecretDoor
 from pyrogue.utils import game_logger
 
@@ -48,6 +50,8 @@ class BSPDungeonBuilder:
         self.rooms: list[Room] = []
         self.room_id_counter = 0
         self.door_positions: set[tuple[int, int]] = set()  # ドア配置済み位置を記録
+        self.room_raster = RoomRaster(width, height)  # 部屋の所属・境界の判定用
+        self.tile_buffer = TileBuffer(width, height)  # タイル書き込み用
 
         # BSP設定（定数クラスから）
         self._depth = BSPConstants.DEPTH
@@ -75,6 +79,7 @@ class BSPDungeonBuilder:
         self.rooms = []
         self.room_id_counter = 0
         self.door_positions = set()
+        self.room_raster = RoomRaster(self.width, self.height)
 
         # 1. BSPツリーを作成・分割
         bsp = tcod.bsp.BSP(x=0, y=0, width=self.width, height=self.height)
@@ -168,6 +173,7 @@ class BSPDungeonBuilder:
             height=room_height,
         )
         self.rooms.append(room)
+        self.room_raster.add_room(room)
         self.room_id_counter += 1
 
         # タイルに部屋を配置
@@ -178,10 +184,7 @@ class BSPDungeonBuilder:
 
     def _dig_room(self, room: Room, tiles: np.ndarray) -> None:
         """部屋をタイル配列に掘る。"""
-        for y in range(room.y, room.y + room.height):
-            for x in range(room.x, room.x + room.width):
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    tiles[y, x] = Floor()
+        self.tile_buffer.fill_rect(tiles, room.x, room.y, room.width, room.height, Floor.shared())
 
     def _connect_nodes(self, node1: tcod.bsp.BSP, node2: tcod.bsp.BSP, tiles: np.ndarray) -> None:
         """2つのノード間を接続（参考リンク準拠の多様なパターン）。"""
@@ -266,17 +269,17 @@ class BSPDungeonBuilder:
                 if self._is_room_boundary_wall(x, y) and not self._has_adjacent_door(x, y):
                     # 壁をランダムな状態のドアで置き換え
                     door = self._create_random_door()
-                    tiles[y, x] = door
+                    self.tile_buffer.set_tile(tiles, x, y, door)
                     self.door_positions.add(position)
                     game_logger.debug(
                         f"Door placed at ({x},{y}) - room boundary penetration, type: {type(door).__name__}"
                     )
                 else:
                     # 通常の壁を通路で置き換え
-                    tiles[y, x] = Floor()
+                    self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
             else:
                 # 壁以外（床など）を通路で置き換え
-                tiles[y, x] = Floor()
+                self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
 
     def _create_random_door(self) -> Door | SecretDoor:
         """ランダムな状態のドアを作成（定数クラスの確率使用）。"""
@@ -303,54 +306,25 @@ class BSPDungeonBuilder:
                 if self._is_room_boundary_wall(x, y) and not self._has_adjacent_door(x, y):
                     # 壁をランダムな状態のドアで置き換え
                     door = self._create_random_door()
-                    tiles[y, x] = door
+                    self.tile_buffer.set_tile(tiles, x, y, door)
                     self.door_positions.add(position)
                     game_logger.debug(
                         f"Boundary door placed at ({x},{y}) - room boundary penetration, type: {type(door).__name__}"
                     )
                 else:
                     # 通常の壁を通路で置き換え
-                    tiles[y, x] = Floor()
+                    self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
             else:
                 # 壁以外（床など）を通路で置き換え
-                tiles[y, x] = Floor()
+                self.tile_buffer.set_tile(tiles, x, y, Floor.shared())
 
     def _is_wall_near_room(self, x: int, y: int) -> bool:
         """指定された壁が部屋の近く（2タイル以内）にあるかどうかを判定。"""
-        # 隣接する8方向（対角線含む）を広範囲でチェック
-        for dx in range(-2, 3):
-            for dy in range(-2, 3):
-                if dx == 0 and dy == 0:
-                    continue
-
-                adj_x, adj_y = x + dx, y + dy
-
-                # 境界チェック
-                if not (0 <= adj_x < self.width and 0 <= adj_y < self.height):
-                    continue
-
-                # 近傍に部屋の床があるかチェック
-                if self._is_room_floor(adj_x, adj_y):
-                    return True
-
-        return False
+        return self.room_raster.any_room_near(x, y, 2)
 
     def _is_room_boundary_wall(self, x: int, y: int) -> bool:
         """指定された壁が部屋の境界（外周）かどうかを判定。"""
-        for room in self.rooms:
-            # 部屋の境界座標
-            left, right = room.x, room.x + room.width - 1
-            top, bottom = room.y, room.y + room.height - 1
-
-            # 部屋の外周の壁かチェック
-            # 上下の境界壁
-            if (y == top - 1 or y == bottom + 1) and (left <= x <= right):
-                return True
-            # 左右の境界壁
-            if (x == left - 1 or x == right + 1) and (top <= y <= bottom):
-                return True
-
-        return False
+        return self.room_raster.is_boundary_wall(x, y)
 
     def _has_adjacent_door(self, x: int, y: int) -> bool:
         """指定された位置の隣接8方向にドアがあるかどうかをチェック。"""
@@ -374,19 +348,11 @@ class BSPDungeonBuilder:
 
     def _is_inside_room(self, x: int, y: int) -> bool:
         """指定された座標が部屋の内部にあるかどうかを判定。"""
-        for room in self.rooms:
-            # 部屋の内部（境界を除く）かどうかをチェック
-            if room.x < x < room.x + room.width - 1 and room.y < y < room.y + room.height - 1:
-                return True
-        return False
+        return self.room_raster.is_inside_room(x, y)
 
     def _is_room_floor(self, x: int, y: int) -> bool:
         """指定された座標が部屋の床（境界含む）かどうかを判定。"""
-        for room in self.rooms:
-            # 部屋の範囲内（境界含む）かどうかをチェック
-            if room.x <= x <= room.x + room.width - 1 and room.y <= y <= room.y + room.height - 1:
-                return True
-        return False
+        return self.room_raster.is_room_floor(x, y)
 
     # 水平線・垂直線描画メソッドは LineDrawer に統合されました
     # 互換性のためのラッパーメソッドを維持
@@ -423,6 +389,7 @@ class BSPDungeonBuilder:
         self.rooms = []
         self.room_id_counter = 0
         self.door_positions = set()
+        self.room_raster = RoomRaster(self.width, self.height)
 
     def make_bsp(
         self,
@@ -12,7 +12,9 @@ import random
 import numpy as np
 
 from pyrogue.constants import GameConstants
+from pyrogue.map.dungeon.grid_kernels import tile_mask
 from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 from pyrogue.map.tile import Floor, StairsDown, StairsUp
 from pyrogue.utils import game_logger
 
@@ -33,6 +35,7 @@ class StairsManager:
     def __init__(self) -> None:
         """階段マネージャーを初期化。"""
         self.stairs_placed: list[tuple[str, tuple[int, int], str]] = []
+        self.tile_buffer = TileBuffer(0, 0)  # タイル書き込み用（配列は書き込み時にバインド）
 
     def _find_safe_fallback_position(self, tiles: np.ndarray) -> tuple[int, int]:
         """
@@ -128,7 +131,7 @@ class StairsManager:
 
         # 上り階段を配置（1階は不要）
         if floor > 1:
-            tiles[up_pos[1], up_pos[0]] = StairsUp()
+            self.tile_buffer.set_tile(tiles, up_pos[0], up_pos[1], StairsUp.shared())
             self.stairs_placed.append(("up", up_pos, "maze"))
             game_logger.debug(f"Placed up stairs at {up_pos} in maze")
         else:
@@ -137,7 +140,7 @@ class StairsManager:
 
         # 下り階段を配置（最下層は不要）
         if floor < GameConstants.MAX_FLOORS:
-            tiles[down_pos[1], down_pos[0]] = StairsDown()
+            self.tile_buffer.set_tile(tiles, down_pos[0], down_pos[1], StairsDown.shared())
             self.stairs_placed.append(("down", down_pos, "maze"))
             game_logger.debug(f"Placed down stairs at {down_pos} in maze")
         else:
@@ -161,12 +164,9 @@ class StairsManager:
             Floorタイルの位置リスト
 
         """
-        positions = []
-        for y in range(tiles.shape[0]):
-            for x in range(tiles.shape[1]):
-                if isinstance(tiles[y, x], Floor):
-                    positions.append((x, y))
-        return positions
+        # 行優先（y, xの昇順）で返す
+        ys, xs = np.nonzero(tile_mask(tiles, Floor))
+        return list(zip(xs.tolist(), ys.tolist(), strict=True))
 
     def _place_up_stairs(self, rooms: list[Room], floor: int, tiles: np.ndarray) -> tuple[int, int]:
         """
@@ -193,7 +193,7 @@ class StairsManager:
         if up_stairs_room:
             position = self._find_stairs_position(up_stairs_room, tiles)
             if position:
-                tiles[position[1], position[0]] = StairsUp()
+                self.tile_buffer.set_tile(tiles, position[0], position[1], StairsUp.shared())
                 self.stairs_placed.append(("up", position, up_stairs_room.id))
                 game_logger.debug(f"Placed up stairs at {position} in room {up_stairs_room.id}")
                 return position
@@ -202,7 +202,7 @@ class StairsManager:
         if rooms:
             fallback_room = rooms[0]
             center = fallback_room.center()
-            tiles[center[1], center[0]] = StairsUp()
+            self.tile_buffer.set_tile(tiles, center[0], center[1], StairsUp.shared())
             self.stairs_placed.append(("up", center, fallback_room.id))
             return center
 
@@ -233,7 +233,7 @@ class StairsManager:
         if down_stairs_room:
             position = self._find_stairs_position(down_stairs_room, tiles)
             if position:
-                tiles[position[1], position[0]] = StairsDown()
+                self.tile_buffer.set_tile(tiles, position[0], position[1], StairsDown.shared())
                 self.stairs_placed.append(("down", position, down_stairs_room.id))
                 game_logger.debug(f"Placed down stairs at {position} in room {down_stairs_room.id}")
                 return position
@@ -242,7 +242,7 @@ class StairsManager:
         if rooms:
             fallback_room = rooms[-1]
             center = fallback_room.center()
-            tiles[center[1], center[0]] = StairsDown()
+            self.tile_buffer.set_tile(tiles, center[0], center[1], StairsDown.shared())
             self.stairs_placed.append(("down", center, fallback_room.id))
             return center
 
@@ -410,17 +410,8 @@ class StairsManager:
             妥当な配置の場合True
 
         """
-        up_stairs_count = 0
-        down_stairs_count = 0
-
-        height, width = tiles.shape
-        for y in range(height):
-            for x in range(width):
-                tile = tiles[y, x]
-                if isinstance(tile, StairsUp):
-                    up_stairs_count += 1
-                elif isinstance(tile, StairsDown):
-                    down_stairs_count += 1
+        up_stairs_count = np.count_nonzero(tile_mask(tiles, StairsUp))
+        down_stairs_count = np.count_nonzero(tile_mask(tiles, StairsDown))
 
         # 階段が適切に配置されているかチェック
         # 1階以外では上り階段が1つ、最深階以外では下り階段が1つ必要
@@ -484,9 +475,9 @@ class StairsManager:
 
         # 階段を配置
         if stairs_type == "up":
-            tiles[position[1], position[0]] = StairsUp()
+            self.tile_buffer.set_tile(tiles, position[0], position[1], StairsUp.shared())
         else:
-            tiles[position[1], position[0]] = StairsDown()
+            self.tile_buffer.set_tile(tiles, position[0], position[1], StairsDown.shared())
 
         self.stairs_placed.append((stairs_type, position, "maze"))
         return position
@@ -2,16 +2,23 @@
 タイルバッファリングシステム。
 
 このモジュールは、ダンジョン生成時のタイル操作を最適化するための
-バッファリングシステムを提供します。
+バッファリングシステムを提供します。座標と値を配列に溜めて
+NumPyのファンシーインデックスで一括適用し、矩形の塗りつぶしは
+スライス代入で行います。書き込まれたマスはダーティマスクに記録され、
+FOVマップやコストマップ、描画キャッシュなどが差分更新に利用できます。
+ダーティマスクを消費しない利用者は、書き込みごとに増える世代番号で
+変更の有無を判定できます。
 """
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from typing import Any
 
 import numpy as np
 
-from pyrogue.map.tile import Floor, Wall
+from pyrogue.map.dungeon.grid_kernels import TileSource, tile_values, write_tiles
+from pyrogue.map.tile import Floor, Tile, Wall
 from pyrogue.utils import game_logger
 
 
@@ -19,18 +26,28 @@ class TileBuffer:
     """
     タイル操作を最適化するためのバッファリングクラス。
 
-    大量のタイル操作を一括で実行することでパフォーマンスを向上させます。
+    2種類の書き込みを提供します。
+
+    - 遅延書き込み（queue_*）: 座標と値を配列に溜め、flush時に一括適用します。
+      同じマスへの書き込みは最後のものが有効です。対象のタイル配列が
+      バインドされている場合、batch_sizeに達した時点で部分フラッシュします。
+    - 即時書き込み（set_tile / fill_rect / write_mask / write_points）:
+      直後にタイルを読み取る生成処理向けに、その場で適用します。
+      書き込み順序を保つため、溜まっている遅延書き込みを先に適用します。
 
     Attributes
     ----------
         width: バッファの幅
         height: バッファの高さ
-        operations: 未実行の操作リスト
-        batch_size: バッチサイズ
+        batch_size: 部分フラッシュを行う溜まり数
+        tiles: 書き込み先のタイル配列（未バインドの場合はNone）
+        dirty: 前回のconsume_dirty以降に書き込まれたマスのブール配列
+        revision: 書き込みや配列の切り替えのたびに増える世代番号
+        applied_count: これまでに適用したマスの総数
 
     """
 
-    def __init__(self, width: int, height: int, batch_size: int = 1000) -> None:
+    def __init__(self, width: int, height: int, batch_size: int = 1000, tiles: np.ndarray | None = None) -> None:
         """
         タイルバッファを初期化。
 
@@ -39,12 +56,54 @@ class TileBuffer:
             width: バッファの幅
             height: バッファの高さ
             batch_size: バッチサイズ
+            tiles: 書き込み先のタイル配列
 
         """
         self.width = width
         self.height = height
         self.batch_size = batch_size
-        self.operations: list[tuple[int, int, Any]] = []
+        self.tiles: np.ndarray | None = None
+        self.dirty = np.zeros((height, width), dtype=bool)
+        self.revision = 0
+        self.applied_count = 0
+
+        self._xs = np.empty(batch_size, dtype=np.int32)
+        self._ys = np.empty(batch_size, dtype=np.int32)
+        self._values = np.empty(batch_size, dtype=object)
+        self._size = 0
+
+        if tiles is not None:
+            self.bind(tiles)
+
+    def bind(self, tiles: np.ndarray) -> TileBuffer:
+        """
+        書き込み先のタイル配列を設定。
+
+        別の配列に切り替える場合は、溜まっている書き込みを元の配列に適用し、
+        ダーティマスクを新しい配列の大きさでリセットします。
+
+        Args:
+        ----
+            tiles: タイル配列
+
+        Returns:
+        -------
+            このバッファ
+
+        """
+        if tiles is self.tiles:
+            return self
+
+        if self.tiles is not None:
+            self._apply_pending(self.tiles)
+
+        self.tiles = tiles
+        self.height, self.width = tiles.shape
+        self.dirty = np.zeros(tiles.shape, dtype=bool)
+        self.revision += 1
+        return self
+
+    # 遅延書き込み
 
     def queue_tile_change(self, x: int, y: int, tile: Any) -> None:
         """
@@ -57,12 +116,51 @@ class TileBuffer:
             tile: 新しいタイルオブジェクト
 
         """
-        if 0 <= x < self.width and 0 <= y < self.height:
-            self.operations.append((x, y, tile))
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return
+
+        self._reserve(1)
+        self._xs[self._size] = x
+        self._ys[self._size] = y
+        self._values[self._size] = tile
+        self._size += 1
+
+        # バッチサイズに達したら自動実行
+        if self._size >= self.batch_size:
+            self._flush_partial()
+
+    def queue_points(self, points: Iterable[tuple[int, int]], source: TileSource) -> int:
+        """
+        複数の座標への書き込みを一括でキューに追加。
+
+        Args:
+        ----
+            points: 座標 (x, y) の列
+            source: 共有インスタンス、またはタイルを生成する関数
+
+        Returns:
+        -------
+            キューに追加した数（範囲外の座標は除外）
+
+        """
+        coords = np.asarray(list(points), dtype=np.int32).reshape(-1, 2)
+        xs, ys = coords[:, 0], coords[:, 1]
+        in_bounds = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+        xs, ys = xs[in_bounds], ys[in_bounds]
+        count = len(xs)
+        if count == 0:
+            return 0
+
+        self._reserve(count)
+        end = self._size + count
+        self._xs[self._size : end] = xs
+        self._ys[self._size : end] = ys
+        self._values[self._size : end] = tile_values(source, count)
+        self._size = end
 
-            # バッチサイズに達したら自動実行
-            if len(self.operations) >= self.batch_size:
-                self._flush_partial()
+        if self._size >= self.batch_size:
+            self._flush_partial()
+        return count
 
     def queue_room_floor(self, room_x: int, room_y: int, room_width: int, room_height: int) -> None:
         """
@@ -76,10 +174,8 @@ class TileBuffer:
             room_height: 部屋の高さ
 
         """
-        floor_tile = Floor()
-        for y in range(room_y + 1, room_y + room_height - 1):
-            for x in range(room_x + 1, room_x + room_width - 1):
-                self.queue_tile_change(x, y, floor_tile)
+        ys, xs = np.mgrid[room_y + 1 : room_y + room_height - 1, room_x + 1 : room_x + room_width - 1]
+        self.queue_points(zip(xs.ravel().tolist(), ys.ravel().tolist(), strict=True), Floor.shared())
 
     def queue_corridor_tiles(self, points: list[tuple[int, int]]) -> None:
         """
@@ -90,52 +186,217 @@ class TileBuffer:
             points: 通路の座標リスト
 
         """
-        floor_tile = Floor()
-        for x, y in points:
-            self.queue_tile_change(x, y, floor_tile)
+        self.queue_points(points, Floor.shared())
 
-    def flush_to_tiles(self, tiles: np.ndarray) -> int:
+    def flush_to_tiles(self, tiles: np.ndarray | None = None) -> int:
         """
         キューに溜まった操作をタイル配列に適用。
 
         Args:
         ----
-            tiles: タイル配列
+            tiles: タイル配列（省略時はバインド済みの配列）
 
         Returns:
         -------
             適用された操作数
 
         """
-        operations_count = len(self.operations)
-
+        operations_count = self._size
         if operations_count == 0:
             return 0
 
-        # 座標による並び替えでキャッシュ効率を向上
-        self.operations.sort(key=lambda op: (op[1], op[0]))  # y, x順
-
-        # 一括適用
-        for x, y, tile in self.operations:
-            tiles[y, x] = tile
+        if tiles is not None:
+            self.bind(tiles)
+        if self.tiles is None:
+            raise ValueError("TileBuffer has no target tiles to flush to")
 
-        self.operations.clear()
+        self._apply_pending(self.tiles)
 
-        game_logger.debug(f"Applied {operations_count} tile operations")
+        game_logger.debug("Applied %d tile operations", operations_count)
         return operations_count
 
     def _flush_partial(self) -> None:
         """
         部分的なフラッシュ（内部使用）。
 
-        Note:
+        バインド済みの配列がある場合のみ適用します。未バインドの場合は
+        flush_to_tilesが呼ばれるまで溜め続けます。
+        """
+        if self.tiles is not None:
+            self._apply_pending(self.tiles)
+
+    def _reserve(self, count: int) -> None:
+        """キューの容量を確保。"""
+        required = self._size + count
+        capacity = len(self._xs)
+        if required <= capacity:
+            return
+
+        new_capacity = max(required, capacity * 2)
+        for name in ("_xs", "_ys", "_values"):
+            old = getattr(self, name)
+            grown = np.empty(new_capacity, dtype=old.dtype)
+            grown[: self._size] = old[: self._size]
+            setattr(self, name, grown)
+
+    def _apply_pending(self, tiles: np.ndarray) -> None:
+        """溜まった書き込みを1回のファンシーインデックス代入で適用。"""
+        size = self._size
+        if size == 0:
+            return
+
+        xs, ys, values = self._xs[:size], self._ys[:size], self._values[:size]
+
+        # 同じマスへの書き込みは最後のものだけを残す
+        flat = ys.astype(np.int64) * self.width + xs
+        _, last_from_end = np.unique(flat[::-1], return_index=True)
+        keep = size - 1 - last_from_end
+
+        tiles[ys[keep], xs[keep]] = values[keep]
+        self.dirty[ys[keep], xs[keep]] = True
+        self.revision += 1
+        self.applied_count += len(keep)
+
+        self._values[:size] = None
+        self._size = 0
+
+    # 即時書き込み
+
+    def set_tile(self, tiles: np.ndarray, x: int, y: int, tile: Tile) -> None:
+        """
+        1マスをその場で書き込む。
+
+        Args:
         ----
-            この方法は現在の実装では使用されませんが、
-            将来の拡張で使用される可能性があります。
+            tiles: タイル配列
+            x: X座標
+            y: Y座標
+            tile: 新しいタイルオブジェクト
 
         """
-        # 現在の実装では何もしない
-        # 将来、部分的なフラッシュが必要になった場合に実装
+        self.bind(tiles)
+        self._apply_pending(tiles)
+        tiles[y, x] = tile
+        self.dirty[y, x] = True
+        self.revision += 1
+        self.applied_count += 1
+
+    def fill_rect(self, tiles: np.ndarray, x: int, y: int, width: int, height: int, source: TileSource) -> int:
+        """
+        矩形領域をスライス代入で塗りつぶす（配列外は切り詰める）。
+
+        Args:
+        ----
+            tiles: タイル配列
+            x: 左端のX座標
+            y: 上端のY座標
+            width: 幅
+            height: 高さ
+            source: 共有インスタンス、またはタイルを生成する関数
+
+        Returns:
+        -------
+            書き込んだマスの数
+
+        """
+        self.bind(tiles)
+        self._apply_pending(tiles)
+
+        x0, y0 = max(0, x), max(0, y)
+        x1, y1 = min(self.width, x + width), min(self.height, y + height)
+        if x0 >= x1 or y0 >= y1:
+            return 0
+
+        count = (y1 - y0) * (x1 - x0)
+        tiles[y0:y1, x0:x1] = tile_values(source, count).reshape(y1 - y0, x1 - x0)
+        self.dirty[y0:y1, x0:x1] = True
+        self.revision += 1
+        self.applied_count += count
+        return count
+
+    def write_mask(
+        self,
+        tiles: np.ndarray,
+        mask: np.ndarray,
+        source: TileSource,
+        origin: tuple[int, int] = (0, 0),
+    ) -> int:
+        """
+        マスクがTrueのマスに一括で書き込む。
+
+        Args:
+        ----
+            tiles: タイル配列
+            mask: 書き込むマスのブール配列（マップ全体、またはoriginを左上とする部分配列）
+            source: 共有インスタンス、またはタイルを生成する関数
+            origin: maskの左上に対応するマップ座標 (x, y)
+
+        Returns:
+        -------
+            書き込んだマスの数
+
+        """
+        self.bind(tiles)
+        self._apply_pending(tiles)
+
+        ox, oy = origin
+        height, width = mask.shape
+        region = tiles[oy : oy + height, ox : ox + width]
+        count = write_tiles(region, mask, source)
+        if count:
+            self.dirty[oy : oy + height, ox : ox + width] |= mask
+            self.revision += 1
+            self.applied_count += count
+        return count
+
+    def write_points(self, tiles: np.ndarray, points: Iterable[tuple[int, int]], source: TileSource) -> int:
+        """
+        複数の座標にその場で一括書き込む。
+
+        Args:
+        ----
+            tiles: タイル配列
+            points: 座標 (x, y) の列
+            source: 共有インスタンス、またはタイルを生成する関数
+
+        Returns:
+        -------
+            書き込んだ数（範囲外の座標は除外）
+
+        """
+        self.bind(tiles)
+        count = self.queue_points(points, source)
+        self._apply_pending(tiles)
+        return count
+
+    def mark_dirty(self, tiles: np.ndarray, x: int, y: int) -> None:
+        """
+        タイルオブジェクトをその場で変更した（光源の設置など）マスを記録。
+
+        Args:
+        ----
+            tiles: タイル配列
+            x: X座標
+            y: Y座標
+
+        """
+        self.bind(tiles)
+        self.dirty[y, x] = True
+        self.revision += 1
+
+    def consume_dirty(self) -> np.ndarray:
+        """
+        書き込まれたマスのマスクを取得してリセット。
+
+        Returns
+        -------
+            前回の呼び出し以降に書き込まれたマスのブール配列
+
+        """
+        self._flush_partial()
+        dirty = self.dirty
+        self.dirty = np.zeros(dirty.shape, dtype=bool)
+        return dirty
 
     def get_queue_size(self) -> int:
         """
@@ -146,11 +407,12 @@ class TileBuffer:
             キューに溜まった操作数
 
         """
-        return len(self.operations)
+        return self._size
 
     def clear_queue(self) -> None:
         """キューをクリア。"""
-        self.operations.clear()
+        self._values[: self._size] = None
+        self._size = 0
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -164,8 +426,10 @@ class TileBuffer:
         return {
             "buffer_size": f"{self.width}x{self.height}",
             "batch_size": self.batch_size,
-            "queue_size": len(self.operations),
-            "memory_usage_mb": len(self.operations) * 32 / 1024 / 1024,  # 概算
+            "queue_size": self._size,
+            "applied_count": self.applied_count,
+            "dirty_count": int(np.count_nonzero(self.dirty)),
+            "memory_usage_mb": self._size * 32 / 1024 / 1024,  # 概算
         }
 
 
@@ -200,7 +464,9 @@ class OptimizedTileManager:
             初期化されたタイル配列
 
         """
-        return np.full((self.height, self.width), Wall(), dtype=object)
+        tiles = np.empty((self.height, self.width), dtype=object)
+        self.buffer.fill_rect(tiles, 0, 0, self.width, self.height, Wall.shared())
+        return tiles
 
     def batch_create_rooms(self, rooms: list[Any], tiles: np.ndarray) -> None:
         """
@@ -212,12 +478,9 @@ class OptimizedTileManager:
             tiles: タイル配列
 
         """
-        # 全部屋の床タイルをバッファに追加
+        # 部屋の内部を矩形ごとにスライス代入
         for room in rooms:
-            self.buffer.queue_room_floor(room.x, room.y, room.width, room.height)
-
-        # 一括適用
-        self.buffer.flush_to_tiles(tiles)
+            self.buffer.fill_rect(tiles, room.x + 1, room.y + 1, room.width - 2, room.height - 2, Floor.shared())
 
     def batch_create_corridors(self, corridors: list[Any], tiles: np.ndarray) -> None:
         """
@@ -230,6 +493,7 @@ class OptimizedTileManager:
 
         """
         # 全通路の座標をバッファに追加
+        self.buffer.bind(tiles)
         for corridor in corridors:
             if hasattr(corridor, "points"):
                 self.buffer.queue_corridor_tiles(corridor.points)
@@ -9,9 +9,11 @@ from __future__ import annotations
 
 import numpy as np
 
+from pyrogue.map.dungeon.connectivity import DistanceMap, label_components
 from pyrogue.map.dungeon.corridor_builder import Corridor
+from pyrogue.map.dungeon.grid_kernels import tile_mask
 from pyrogue.map.dungeon.room_builder import Room
-from pyrogue.map.tile import Floor, StairsDown, StairsUp, Wall
+from pyrogue.map.tile import Door, Floor, StairsDown, StairsUp, Wall
 from pyrogue.utils import game_logger
 
 
@@ -70,11 +72,14 @@ class ValidationManager:
         self.warnings = []
 
         try:
+            # 到達可能性の問い合わせは全て上り階段からの単一の距離マップで答える
+            distance_map = self._build_distance_map(start_pos, end_pos, tiles)
+
             # 基本構造の検証
             self._validate_basic_structure(rooms, tiles)
 
             # 部屋接続性の検証
-            self._validate_room_connectivity(rooms)
+            self._validate_room_connectivity(rooms, distance_map)
 
             # 通路の完全性検証
             self._validate_corridor_integrity(corridors, tiles)
@@ -89,7 +94,7 @@ class ValidationManager:
             self._validate_special_room_rules(rooms)
 
             # アクセス可能性の検証
-            self._validate_accessibility(rooms, start_pos, end_pos, tiles)
+            self._validate_accessibility(rooms, start_pos, end_pos, tiles, distance_map)
 
             success = len([r for r in self.validation_results if not r["passed"]]) == 0
 
@@ -154,19 +159,38 @@ class ValidationManager:
         else:
             self._add_result("floor_coverage", True, f"Floor coverage: {floor_ratio:.2%}")
 
-    def _validate_room_connectivity(self, rooms: list[Room]) -> None:
+    def _validate_room_connectivity(self, rooms: list[Room], distance_map: DistanceMap | None = None) -> None:
         """
         部屋接続性を検証。
 
+        距離マップがある場合は、各部屋に上り階段から実際に歩いて
+        到達できるかで判定します。ない場合は部屋の接続グラフを探索します。
+
         Args:
         ----
             rooms: 部屋のリスト
+            distance_map: 上り階段からの距離マップ
 
         """
         if len(rooms) < 2:
             self._add_result("connectivity", True, "Single room, connectivity N/A")
             return
 
+        if distance_map is not None:
+            total_rooms = len(rooms)
+            reachable_rooms = sum(
+                distance_map.any_reachable(room.x, room.y, room.x + room.width, room.y + room.height) for room in rooms
+            )
+            if reachable_rooms == total_rooms:
+                self._add_result("connectivity", True, f"All {total_rooms} rooms are connected")
+            else:
+                self._add_result(
+                    "connectivity",
+                    False,
+                    f"Only {reachable_rooms}/{total_rooms} rooms are reachable from up stairs",
+                )
+            return
+
         # グラフ探索で全部屋が接続されているかチェック
         visited = set()
         to_visit = {rooms[0].id}
@@ -344,57 +368,73 @@ class ValidationManager:
         start_pos: tuple[int, int],
         end_pos: tuple[int, int],
         tiles: np.ndarray,
+        distance_map: DistanceMap | None = None,
     ) -> None:
         """
         アクセス可能性を検証。
 
+        上り階段からの距離マップを参照して、下り階段への到達可能性・
+        階段間の距離・到達不能な床の数を判定します。
+
         Args:
         ----
             rooms: 部屋のリスト
             start_pos: 上り階段位置
             end_pos: 下り階段位置
             tiles: ダンジョンのタイル配列
+            distance_map: 上り階段からの距離マップ（省略時は計算）
 
         """
-        # 簡単なアクセス可能性チェック
-        # 上り階段から下り階段への経路が存在するかをチェック
-
         if not start_pos or not end_pos:
             self._add_result("accessibility", True, "Stairs positions not available")
             return
 
-        # 実際の経路探索は複雑なので、簡易チェックのみ実装
-        # 部屋が接続されていて、階段が部屋内にあれば基本的にアクセス可能
+        if distance_map is None:
+            distance_map = self._build_distance_map(start_pos, end_pos, tiles)
 
-        start_room = self._find_room_containing_position(start_pos, rooms)
-        end_room = self._find_room_containing_position(end_pos, rooms)
+        # 階段間の到達可能性と距離
+        stairs_distance = distance_map.distance_to(*end_pos)
+        if stairs_distance is None:
+            self._add_result("accessibility", False, "Down stairs are not reachable from up stairs")
+            return
+        self._add_result("accessibility", True, f"Stairs are connected (distance {stairs_distance})")
+        if stairs_distance < 5:
+            self._add_warning(f"Stairs are very close together: {stairs_distance} steps")
 
-        if start_room and end_room:
-            self._add_result("accessibility", True, "Stairs are in accessible rooms")
-        else:
-            self._add_result("accessibility", False, "Stairs are not in proper rooms")
+        # 到達不能な床の数
+        unreachable_floors = distance_map.count_unreachable(tile_mask(tiles, Floor))
+        if unreachable_floors:
+            self._add_warning(f"{unreachable_floors} floor tiles are not reachable from up stairs")
 
-    def _find_room_containing_position(self, position: tuple[int, int], rooms: list[Room]) -> Room | None:
+    def _build_distance_map(
+        self, start_pos: tuple[int, int] | None, end_pos: tuple[int, int] | None, tiles: np.ndarray
+    ) -> DistanceMap | None:
         """
-        指定位置を含む部屋を検索。
+        階段からの距離マップを計算。
+
+        ドアは開閉できるため通行可能として扱います。
 
         Args:
         ----
-            position: 位置
-            rooms: 部屋のリスト
+            start_pos: 上り階段位置（起点）
+            end_pos: 下り階段位置（上り階段がない場合の起点）
+            tiles: ダンジョンのタイル配列
 
         Returns:
         -------
-            見つかった部屋、または None
+            距離マップ（階段がない場合はNone）
 
         """
-        x, y = position
+        origin = start_pos or end_pos
+        if not origin:
+            return None
 
-        for room in rooms:
-            if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height:
-                return room
-
-        return None
+        passable = np.fromiter(
+            (tile.walkable or isinstance(tile, Door) for tile in tiles.flat),
+            dtype=bool,
+            count=tiles.size,
+        ).reshape(tiles.shape)
+        return DistanceMap(passable, origin)
 
     def _add_result(self, test_name: str, passed: bool, message: str) -> None:
         """
@@ -477,7 +517,8 @@ class ValidationManager:
             self._validate_boundary_constraints([], [], tiles)
 
             # 2. 迷路専用の連結性検証
-            self._validate_maze_connectivity(start_pos, end_pos, tiles, floor)
+            distance_map = self._build_distance_map(start_pos, end_pos, tiles)
+            self._validate_maze_connectivity(start_pos, end_pos, tiles, floor, distance_map)
 
             # 3. 階段配置の検証
             self._validate_stairs_placement_for_maze(start_pos, end_pos, tiles, floor)
@@ -505,6 +546,7 @@ class ValidationManager:
         end_pos: tuple[int, int],
         tiles: np.ndarray,
         floor: int = 1,
+        distance_map: DistanceMap | None = None,
     ) -> None:
         """
         迷路の連結性を検証。
@@ -515,6 +557,7 @@ class ValidationManager:
             end_pos: 下り階段の位置
             tiles: ダンジョンのタイル配列
             floor: 階層番号
+            distance_map: 上り階段からの距離マップ（省略時は計算）
 
         """
         from pyrogue.constants import GameConstants
@@ -526,8 +569,9 @@ class ValidationManager:
 
         # 階段間の経路の存在を確認
         if start_pos and end_pos:
-            path_exists = self._find_path_between_positions(start_pos, end_pos, tiles)
-            if path_exists:
+            if distance_map is None:
+                distance_map = self._build_distance_map(start_pos, end_pos, tiles)
+            if distance_map.is_reachable(*end_pos):
                 self._add_result("maze_connectivity", True, "Stairs are connected")
             else:
                 self._add_result("maze_connectivity", False, "Stairs are not connected")
@@ -630,95 +674,8 @@ class ValidationManager:
             最大連結成分の床タイル数
 
         """
-        height, width = tiles.shape
-        visited = np.zeros((height, width), dtype=bool)
-        max_component_size = 0
-
-        for y in range(height):
-            for x in range(width):
-                if isinstance(tiles[y, x], Floor) and not visited[y, x]:
-                    component_size = self._flood_fill_count(tiles, visited, x, y)
-                    max_component_size = max(max_component_size, component_size)
-
-        return max_component_size
-
-    def _flood_fill_count(self, tiles: np.ndarray, visited: np.ndarray, start_x: int, start_y: int) -> int:
-        """
-        フラッドフィルで連結成分のサイズを数える。
-
-        Args:
-        ----
-            tiles: ダンジョンのタイル配列
-            visited: 訪問済みフラグ配列
-            start_x: 開始X座標
-            start_y: 開始Y座標
-
-        Returns:
-        -------
-            連結成分のサイズ
-
-        """
-        height, width = tiles.shape
-        count = 0
-        stack = [(start_x, start_y)]
-
-        while stack:
-            x, y = stack.pop()
-            if x < 0 or x >= width or y < 0 or y >= height or visited[y, x] or not isinstance(tiles[y, x], Floor):
-                continue
-
-            visited[y, x] = True
-            count += 1
-
-            # 4方向に探索
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                stack.append((x + dx, y + dy))
-
-        return count
-
-    def _find_path_between_positions(
-        self, start_pos: tuple[int, int], end_pos: tuple[int, int], tiles: np.ndarray
-    ) -> bool:
-        """
-        2つの位置間のパスが存在するかチェック。
-
-        Args:
-        ----
-            start_pos: 開始位置
-            end_pos: 終了位置
-            tiles: ダンジョンのタイル配列
-
-        Returns:
-        -------
-            パスが存在する場合True
-
-        """
-        if not start_pos or not end_pos:
-            return False
-
-        height, width = tiles.shape
-        visited = set()
-        stack = [start_pos]
-
-        while stack:
-            x, y = stack.pop()
-            if (x, y) == end_pos:
-                return True
-
-            if (x, y) in visited:
-                continue
-
-            visited.add((x, y))
-
-            # 4方向をチェック
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = x + dx, y + dy
-                if 0 <= nx < width and 0 <= ny < height and (nx, ny) not in visited:
-                    # 通行可能なタイルかチェック
-                    if isinstance(tiles[ny, nx], (Floor, StairsUp, StairsDown)):
-                        stack.append((nx, ny))
-
-        return False
+        components = label_components(tile_mask(tiles, Floor))
+        return int(components.sizes[components.largest()]) if components.count else 0
 
     def reset(self) -> None:
         """マネージャーの状態をリセット。"""
@@ -29,6 +29,7 @@ import numpy as np
 if TYPE_CHECKING:
     from pyrogue.entities.actors.monster_spawner import MonsterSpawner
     from pyrogue.entities.items.item_spawner import ItemSpawner
+    from pyrogue.map.dungeon.room_raster import RoomRaster
 
 from pyrogue.entities.actors.monster_spawner import MonsterSpawner
 from pyrogue.entities.items.item_spawner import ItemSpawner
@@ -36,6 +37,8 @@ from pyrogue.entities.traps.trap import TrapManager
 
 # 新しいBuilder Patternベースのダンジョン生成システムを使用
 from pyrogue.map.dungeon.director import DungeonDirector
+from pyrogue.map.dungeon.free_cells import FreeCellSampler
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
 
 
 class FloorData:
@@ -54,6 +57,8 @@ class FloorData:
         trap_manager: トラップ管理インスタンス
         explored: 探索済み領域のブール配列
         floor_number: 階層番号
+        room_raster: 部屋IDラスター（生成時の情報がない場合はNone）
+        tile_buffer: 実行時のタイル変更を記録するバッファ（ダーティマスクを保持）
 
     """
 
@@ -67,6 +72,7 @@ class FloorData:
         item_spawner: ItemSpawner,
         trap_manager: TrapManager,
         explored: np.ndarray,
+        room_raster: RoomRaster | None = None,
     ) -> None:
         """
         フロアデータを初期化。
@@ -81,6 +87,7 @@ class FloorData:
             item_spawner: アイテム管理インスタンス
             trap_manager: トラップ管理インスタンス
             explored: 探索済み領域のブール配列
+            room_raster: 部屋IDラスター
 
         """
         self.floor_number = floor_number
@@ -91,9 +98,11 @@ class FloorData:
         self.item_spawner = item_spawner
         self.trap_manager = trap_manager
         self.explored = explored
+        self.room_raster = room_raster
 
         # width/height属性を追加（tilesの形状から導出）
         self.height, self.width = tiles.shape if tiles is not None else (0, 0)
+        self.tile_buffer = TileBuffer(self.width, self.height, tiles=tiles)
 
         # 開始位置を設定
         if floor_number == 1:
@@ -224,7 +233,10 @@ class FloorData:
         if self.is_valid_position(x, y):
             tile = self.tiles[y, x]
             if hasattr(tile, "walkable"):
+                # 共有タイルは変更できないため、このマス専用のコピーに差し替える
+                tile = tile.unshared()
                 tile.walkable = walkable
+                self.tile_buffer.set_tile(self.tiles, x, y, tile)
 
     def set_tile(self, x: int, y: int, tile_type: str) -> None:
         """
@@ -241,12 +253,10 @@ class FloorData:
             # タイルタイプに応じたタイルインスタンスを作成
             from pyrogue.map.tile import Door, Floor, Wall
 
-            if tile_type == "Door":
-                self.tiles[y, x] = Door()
-            elif tile_type == "Floor":
-                self.tiles[y, x] = Floor()
-            elif tile_type == "Wall":
-                self.tiles[y, x] = Wall()
+            tiles = {"Door": Door, "Floor": Floor.shared, "Wall": Wall.shared}
+            factory = tiles.get(tile_type)
+            if factory is not None:
+                self.tile_buffer.set_tile(self.tiles, x, y, factory())
 
     def get_stairs_up_position(self) -> tuple[int, int] | None:
         """上り階段の位置を取得。"""
@@ -580,6 +590,7 @@ class DungeonManager:
             item_spawner=item_spawner,
             trap_manager=trap_manager,
             explored=explored,
+            room_raster=dungeon_director.room_raster,
         )
 
         self.floors[floor_number] = floor_data
@@ -677,27 +688,17 @@ class DungeonManager:
         """
         from pyrogue.map.tile import Floor
 
-        # 迷路の床タイル（通路）を全て取得
-        floor_positions = []
-        height, width = tiles.shape
-
-        for y in range(height):
-            for x in range(width):
-                if isinstance(tiles[y, x], Floor):
-                    floor_positions.append((x, y))
+        # 迷路の床タイル（通路）から非復元抽出する
+        free_cells = FreeCellSampler.from_tiles(tiles, Floor)
+        floor_count = len(free_cells)
 
         # 迷路での基本トラップ数を決定（通路数に応じて調整）
-        base_trap_count = max(2, len(floor_positions) // 50)  # 50床タイルごとに1つのトラップ
+        base_trap_count = max(2, floor_count // 50)  # 50床タイルごとに1つのトラップ
         level_bonus = floor_number // 5  # 階層ボーナス
-        total_traps = min(base_trap_count + level_bonus, len(floor_positions) // 10)  # 最大密度制限
-
-        # ランダムに配置位置を選択
-        random.shuffle(floor_positions)
+        total_traps = min(base_trap_count + level_bonus, floor_count // 10)  # 最大密度制限
 
         # トラップを配置
-        for i in range(min(total_traps, len(floor_positions))):
-            x, y = floor_positions[i]
-
+        for x, y in free_cells.sample_many(total_traps):
             # 同じ位置に既にトラップがないことを確認
             if trap_manager.get_trap_at(x, y) is None:
                 # 重み付き抽選でトラップタイプを選択
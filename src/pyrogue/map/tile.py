@@ -3,11 +3,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Any, ClassVar
 
 
 @dataclass
 class Tile:
-    """タイルの基底クラス"""
+    """
+    タイルの基底クラス
+
+    状態を持たない種類のタイル（床・壁・階段など）は shared() で
+    種類ごとに1つの共有インスタンス（フライウェイト）を使い回せます。
+    共有インスタンスは変更できず、マスごとに状態を持たせる場合は
+    unshared() で専用のコピーを作ります。
+    """
 
     walkable: bool
     transparent: bool
@@ -15,6 +23,68 @@ class Tile:
     light: tuple[int, int, int]  # RGB color when in FOV
     char: str
 
+    # 種類ごとの共有インスタンス
+    _shared_instances: ClassVar[dict[type[Tile], Tile]] = {}
+    # マスごとの状態を持つため共有できない種類はFalse
+    shareable: ClassVar[bool] = True
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.__dict__.get("_shared", False):
+            msg = f"Shared {type(self).__name__} tile is immutable; use unshared() for a per-cell copy"
+            raise AttributeError(msg)
+        object.__setattr__(self, name, value)
+
+    def __reduce_ex__(self, protocol: int) -> Any:
+        # 共有インスタンスは読み込み時にも共有インスタンスへ戻す
+        if self.is_shared:
+            return (type(self).shared, ())
+        return super().__reduce_ex__(protocol)
+
+    @classmethod
+    def shared(cls) -> Tile:
+        """
+        この種類の共有インスタンスを取得。
+
+        Returns
+        -------
+            変更不可の共有インスタンス
+
+        Raises
+        ------
+            TypeError: マスごとの状態を持つ種類（扉など）の場合
+
+        """
+        instance = Tile._shared_instances.get(cls)
+        if instance is None:
+            if not cls.shareable:
+                msg = f"{cls.__name__} tiles carry per-cell state and cannot be shared"
+                raise TypeError(msg)
+            instance = cls()
+            object.__setattr__(instance, "_shared", True)
+            Tile._shared_instances[cls] = instance
+        return instance
+
+    @property
+    def is_shared(self) -> bool:
+        """共有インスタンスかどうか"""
+        return self.__dict__.get("_shared", False)
+
+    def unshared(self) -> Tile:
+        """
+        変更可能なタイルを取得。
+
+        Returns
+        -------
+            共有インスタンスの場合はその専用コピー、それ以外は自身
+
+        """
+        if not self.is_shared:
+            return self
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        del clone.__dict__["_shared"]
+        return clone
+
 
 class Floor(Tile):
     """床タイル"""
@@ -106,6 +176,8 @@ class Wall(Tile):
 class Door(Tile):
     """扉タイル"""
 
+    shareable: ClassVar[bool] = False
+
     def __init__(self, state: str = "closed") -> None:
         super().__init__(
             walkable=False,
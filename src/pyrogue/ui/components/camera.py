@@ -0,0 +1,126 @@
+"""
+カメラ（表示範囲）コンポーネント。
+
+このモジュールは、画面に収まらない大きさのマップのうち、プレイヤーの
+周囲だけを表示するための表示範囲（ビューポート）を提供します。
+マップ全体が画面に収まる場合は表示範囲が常に左上に固定されるため、
+従来どおりマップ全体がそのまま表示されます。
+
+Example:
+-------
+    >>> camera = Camera(80, 43)
+    >>> camera.follow(250, 150, 500, 300)
+    True
+    >>> camera.x, camera.y
+    (210, 129)
+
+"""
+
+from __future__ import annotations
+
+
+class Camera:
+    """
+    マップのうち画面に表示する矩形範囲。
+
+    追従対象が表示範囲の中央に来るように位置を決め、マップの端では
+    範囲外を映さないように止めます。表示範囲の大きさはマップより
+    大きくならないように切り詰めます。
+
+    Attributes
+    ----------
+        x: 表示範囲の左端のマップX座標
+        y: 表示範囲の上端のマップY座標
+        width: 表示範囲の幅
+        height: 表示範囲の高さ
+
+    """
+
+    def __init__(self, width: int = 0, height: int = 0) -> None:
+        """
+        カメラを初期化。
+
+        Args:
+        ----
+            width: 表示範囲の幅
+            height: 表示範囲の高さ
+
+        """
+        self.x = 0
+        self.y = 0
+        self.width = width
+        self.height = height
+
+    @property
+    def bounds(self) -> tuple[int, int, int, int]:
+        """表示範囲 (x, y, 幅, 高さ)。"""
+        return self.x, self.y, self.width, self.height
+
+    def resize(self, width: int, height: int) -> None:
+        """
+        表示範囲の大きさを変更。
+
+        Args:
+        ----
+            width: 表示範囲の幅
+            height: 表示範囲の高さ
+
+        """
+        self.width = max(0, width)
+        self.height = max(0, height)
+
+    def follow(self, target_x: int, target_y: int, map_width: int, map_height: int) -> bool:
+        """
+        追従対象が中央に来るように表示範囲を移動。
+
+        Args:
+        ----
+            target_x: 追従対象のX座標
+            target_y: 追従対象のY座標
+            map_width: マップの幅
+            map_height: マップの高さ
+
+        Returns:
+        -------
+            表示範囲が移動した場合True
+
+        """
+        self.width = min(self.width, map_width)
+        self.height = min(self.height, map_height)
+        x = min(max(0, target_x - self.width // 2), map_width - self.width)
+        y = min(max(0, target_y - self.height // 2), map_height - self.height)
+        moved = (x, y) != (self.x, self.y)
+        self.x, self.y = x, y
+        return moved
+
+    def contains(self, x: int, y: int) -> bool:
+        """
+        マップ座標が表示範囲内かチェック。
+
+        Args:
+        ----
+            x: マップX座標
+            y: マップY座標
+
+        Returns:
+        -------
+            表示範囲内の場合True
+
+        """
+        return self.x <= x < self.x + self.width and self.y <= y < self.y + self.height
+
+    def to_screen(self, x: int, y: int) -> tuple[int, int]:
+        """
+        マップ座標を表示範囲内の座標に変換。
+
+        Args:
+        ----
+            x: マップX座標
+            y: マップY座標
+
+        Returns:
+        -------
+            表示範囲の左上を原点とする座標 (x, y)
+
+        """
+        return x - self.x, y - self.y
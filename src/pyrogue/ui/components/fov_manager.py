@@ -3,6 +3,8 @@ FOV（視界）管理コンポーネント。
 
 このモジュールは、GameScreen から分離された視界システムを担当します。
 FOV計算、可視範囲の管理、探索済みエリアの更新を行います。
+FOVはプレイヤーを中心とした視界半径のウィンドウだけで計算するため、
+1ターンの処理量はマップの大きさではなく視界半径で決まります。
 """
 
 from __future__ import annotations
@@ -10,11 +12,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-import tcod
+import tcod.map
 from tcod import libtcodpy
 
 from pyrogue.constants import GameConstants
-from pyrogue.map.tile import Wall
+from pyrogue.utils import frame_timer
+from pyrogue.utils.line_of_sight import build_transparency_window
 
 if TYPE_CHECKING:
     from pyrogue.ui.screens.game_screen import GameScreen
@@ -25,12 +28,13 @@ class FOVManager:
     FOV（視界）システムの管理クラス。
 
     プレイヤーの視界計算、可視範囲の管理、探索済みエリアの更新を担当します。
+    視界内のタイルはマップ全体の配列で提供しますが、毎ターン書き換えるのは
+    前回と今回の視界ウィンドウの範囲だけです。
 
     Attributes
     ----------
         game_screen: メインのゲームスクリーンへの参照
         fov_enabled: FOV表示の有効/無効フラグ
-        fov_map: FOV計算用のマップ
         visible: 現在視界内のタイル
         fov_radius: 視界半径
 
@@ -50,15 +54,14 @@ class FOVManager:
         self.fov_radius = GameConstants.DEFAULT_FOV_RADIUS
         self.base_fov_radius = GameConstants.DEFAULT_FOV_RADIUS  # 基本FOV半径
 
-        # FOV計算用のマップを初期化
-        self.fov_map = tcod.map.Map(width=game_screen.dungeon_width, height=game_screen.dungeon_height)
-
         # 可視範囲を初期化
         self.visible = np.full(
             (game_screen.dungeon_height, game_screen.dungeon_width),
             fill_value=False,
             dtype=bool,
         )
+        # 前回視界を書き込んだ範囲（Noneの場合は配列全体を消す必要がある）
+        self._window: tuple[slice, slice] | None = None
 
     def update_fov(self) -> None:
         """
@@ -70,81 +73,73 @@ class FOVManager:
         if not self.fov_enabled:
             # FOVが無効の場合は全体を可視にする
             self.visible.fill(True)
+            self._window = None
             return
 
-        # FOVマップを更新
-        self._update_fov_map()
-
-        # プレイヤーの位置でFOVを計算
-        player = self.game_screen.player
-        if player:
-            self._compute_fov(player.x, player.y)
-
-    def _update_fov_map(self) -> None:
-        """
-        FOV計算用のマップを現在のダンジョン状態に更新。
-
-        壁とその他のタイルの透明度を設定します。
-        """
-        floor_data = self.game_screen.game_logic.get_current_floor_data()
-        if not floor_data or not floor_data.tiles.size:
-            return
-
-        # 全てのタイルを透明（通行可能）として初期化
-        transparent = np.ones(
-            (self.game_screen.dungeon_height, self.game_screen.dungeon_width),
-            dtype=bool,
-        )
-        walkable = np.ones(
-            (self.game_screen.dungeon_height, self.game_screen.dungeon_width),
-            dtype=bool,
-        )
-
-        # 壁と閉じたドアは不透明で通行不可
-        for y in range(floor_data.tiles.shape[0]):
-            for x in range(floor_data.tiles.shape[1]):
-                tile = floor_data.tiles[y, x]
-                if isinstance(tile, Wall):
-                    transparent[y, x] = False
-                    walkable[y, x] = False
-                elif hasattr(tile, "transparent") and hasattr(tile, "walkable"):
-                    # ドアなどのタイルの透明度・通行可能性を使用
-                    transparent[y, x] = tile.transparent
-                    walkable[y, x] = tile.walkable
-
-        # FOVマップに設定
-        self.fov_map.transparent[:] = transparent
-        self.fov_map.walkable[:] = walkable
+        with frame_timer.scope("fov"):
+            # プレイヤーの位置でFOVを計算
+            player = self.game_screen.player
+            if player:
+                self._compute_fov(player.x, player.y)
 
     def _compute_fov(self, x: int, y: int) -> None:
         """
         指定座標からのFOVを計算。
 
+        視界半径のウィンドウの透過マスクだけを現在のタイルから作成して
+        FOVを計算し、前回のウィンドウを消してから今回のウィンドウを
+        可視範囲と探索済み領域に書き込みます。
+
         Args:
         ----
             x: プレイヤーのX座標
             y: プレイヤーのY座標
 
         """
-        # 可視範囲をリセット
-        self.visible.fill(False)
+        floor_data = self.game_screen.game_logic.get_current_floor_data()
+        if not floor_data or not floor_data.tiles.size:
+            return
 
-        # 暗い部屋での視界制限を適用
-        effective_radius = self._calculate_effective_fov_radius(x, y)
+        tiles = floor_data.tiles
+        height, width = tiles.shape
+        if self.visible.shape != (height, width):
+            # ロードしたフロアの大きさが設定と異なる場合など
+            self.visible = np.zeros((height, width), dtype=bool)
+            self._window = None
+
+        # 前回の可視範囲をリセット
+        if self._window is None:
+            self.visible.fill(False)
+        else:
+            self.visible[self._window] = False
+            self._window = None
+        if not (0 <= x < width and 0 <= y < height):
+            return
 
-        # FOV計算
-        self.fov_map.compute_fov(x, y, radius=effective_radius, algorithm=libtcodpy.FOV_SHADOW)
+        # 視界半径を決定
+        radius = self._calculate_effective_fov_radius(x, y)
 
-        # 結果を可視範囲配列にコピー
-        self.visible[:] = self.fov_map.fov[:]
+        # ウィンドウ内でFOV計算（壁と閉じたドアは不透明）
+        transparency = build_transparency_window(tiles, x, y, radius)
+        fov = tcod.map.compute_fov(transparency, (radius, radius), radius, algorithm=libtcodpy.FOV_SHADOW)
+
+        # マップ内の部分だけを可視範囲配列に書き込む
+        x0, x1 = max(0, x - radius), min(width, x + radius + 1)
+        y0, y1 = max(0, y - radius), min(height, y + radius + 1)
+        region = fov[y0 - (y - radius) : y1 - (y - radius), x0 - (x - radius) : x1 - (x - radius)]
+        self._window = np.s_[y0:y1, x0:x1]
+        self.visible[self._window] = region
 
         # 現在の可視範囲を探索済みとして記録
-        self.game_screen.game_logic.update_explored_tiles(self.visible)
+        self.game_screen.game_logic.update_explored_tiles(region, (x0, y0))
 
     def _calculate_effective_fov_radius(self, x: int, y: int) -> int:
         """
         暗い部屋での効果的なFOV半径を計算。
 
+        暗い部屋による視界制限はまだゲームに組み込まれていないため、
+        常に基本半径を返します。
+
         Args:
         ----
             x: プレイヤーのX座標
@@ -155,71 +150,7 @@ class FOVManager:
             効果的なFOV半径
 
         """
-        # 現在の階層データを取得
-        floor_data = self.game_screen.game_logic.get_current_floor_data()
-        if not floor_data:
-            return self.base_fov_radius
-
-        # ダンジョンディレクターから暗い部屋情報を取得
-        dungeon_director = getattr(floor_data, "dungeon_director", None)
-        if not dungeon_director or not hasattr(dungeon_director, "dark_room_builder"):
-            return self.base_fov_radius
-
-        dark_room_builder = dungeon_director.dark_room_builder
-
-        # プレイヤーの光源状態を取得
-        player = self.game_screen.game_logic.player
-        has_light = self._player_has_light_source(player)
-        light_radius = self._get_player_light_radius(player)
-
-        # 暗い部屋での視界範囲を計算
-        return dark_room_builder.get_visibility_range_at(
-            x, y, getattr(floor_data, "rooms", []), has_light, light_radius
-        )
-
-    def _player_has_light_source(self, player) -> bool:
-        """
-        プレイヤーが光源を持っているかチェック。
-
-        Args:
-        ----
-            player: プレイヤーオブジェクト
-
-        Returns:
-        -------
-            光源を持っている場合True
-
-        """
-        # プレイヤーのインベントリから光源アイテムを検索
-        if hasattr(player, "inventory") and hasattr(player.inventory, "items"):
-            for item in player.inventory.items:
-                if hasattr(item, "get_light_radius") and item.get_light_radius() > 0:
-                    return True
-
-        return False
-
-    def _get_player_light_radius(self, player) -> int:
-        """
-        プレイヤーの光源半径を取得。
-
-        Args:
-        ----
-            player: プレイヤーオブジェクト
-
-        Returns:
-        -------
-            光源半径
-
-        """
-        max_radius = 0
-
-        if hasattr(player, "inventory") and hasattr(player.inventory, "items"):
-            for item in player.inventory.items:
-                if hasattr(item, "get_light_radius"):
-                    radius = item.get_light_radius()
-                    max_radius = max(max_radius, radius)
-
-        return max_radius if max_radius > 0 else self.base_fov_radius
+        return self.base_fov_radius
 
     def toggle_fov(self) -> None:
         """
@@ -263,7 +194,8 @@ class FOVManager:
             視界内にある場合True
 
         """
-        if not (0 <= x < self.game_screen.dungeon_width and 0 <= y < self.game_screen.dungeon_height):
+        height, width = self.visible.shape
+        if not (0 <= x < width and 0 <= y < height):
             return False
         return self.visible[y, x]
 
@@ -281,6 +213,8 @@ class FOVManager:
             探索済みの場合True
 
         """
-        if not (0 <= x < self.game_screen.dungeon_width and 0 <= y < self.game_screen.dungeon_height):
+        explored = self.game_screen.game_logic.get_explored_tiles()
+        height, width = explored.shape
+        if not (0 <= x < width and 0 <= y < height):
             return False
-        return self.game_screen.game_logic.get_explored_tiles()[y, x]
+        return explored[y, x]
@@ -10,28 +10,53 @@ from __future__ import annotations
 import random
 from typing import TYPE_CHECKING
 
+import numpy as np
 import tcod
 import tcod.console
 
-from pyrogue.map.tile import Floor, StairsDown, StairsUp, Wall
+from pyrogue.ui.components.camera import Camera
+from pyrogue.ui.components.glyph_table import GLYPHS, HALLUCINATION_CHARS
+from pyrogue.ui.components.render_layers import MapLayer, PanelLayer
+from pyrogue.utils import frame_timer
 
 if TYPE_CHECKING:
     from pyrogue.ui.screens.game_screen import GameScreen
 
+# 幻覚状態で表示する文字の文字コード
+HALLUCINATION_CODES = np.array([ord(char) for char in HALLUCINATION_CHARS], dtype=np.int32)
+
 
 class GameRenderer:
     """
     ゲーム画面の描画処理を担当するクラス。
 
     GameScreenから描画処理を分離し、単一の責務を持つように設計されています。
-    マップ、ステータス、メッセージログなどの描画を管理します。
+    地形はオフスクリーンのマップ層に保持して変化したマスだけを描き直し、
+    その上にアイテム・モンスター・プレイヤーを重ねます。表示文字と色は
+    起動時に作成したルックアップテーブルから引きます。ステータスと
+    メッセージログも表示内容が変わった時だけ描き直すパネルに保持します。
+    各層の描画時間は計測タイマーに記録し、ウィザードモードでは
+    計測結果をオーバーレイ表示できます。
+
+    画面に収まらない大きさのマップは、プレイヤーを追従するカメラの
+    表示範囲だけを描画します。表示範囲はステータス行とメッセージログを
+    除いた画面の大きさで、マップが収まる場合はマップ全体になります。
 
     Attributes
     ----------
         game_screen: メインのゲームスクリーンへの参照
+        camera: マップの表示範囲
+        map_layer: 地形を保持するマップ層
+        status_panel: ステータス表示のパネル（未描画の場合はNone）
+        message_panel: メッセージログのパネル（未描画の場合はNone）
 
     """
 
+    # ステータス行の分だけマップをオフセット（2行分）
+    MAP_OFFSET_Y = 2
+    # メッセージログの最大表示数
+    MAX_MESSAGES = 7
+
     def __init__(self, game_screen: GameScreen) -> None:
         """
         レンダラーを初期化。
@@ -42,6 +67,12 @@ class GameRenderer:
 
         """
         self.game_screen = game_screen
+        self.camera = Camera()
+        self.map_layer = MapLayer()
+        self.status_panel: PanelLayer | None = None
+        self.message_panel: PanelLayer | None = None
+        # 幻覚表示用の乱数（ゲーム進行用の乱数列を消費しないように分ける）
+        self._rng = np.random.default_rng()
 
     def render(self, console: tcod.Console) -> None:
         """
@@ -52,19 +83,61 @@ class GameRenderer:
             console: TCODコンソール
 
         """
-        console.clear()
+        with frame_timer.scope("render"):
+            console.clear()
+
+            # 各要素を描画
+            self._update_camera(console)
+            self._render_map(console)
+            with frame_timer.scope("render.status"):
+                self._render_status(console)
+            with frame_timer.scope("render.messages"):
+                self._render_messages(console)
+            # コマンドヒントはデフォルトで無効化（メッセージエリアと干渉を避けるため）
+            # self._render_command_hints(console)
+
+        # 計測結果のオーバーレイ（ウィザードモードのみ）
+        if frame_timer.show_overlay and self.game_screen.game_logic.is_wizard_mode():
+            self._render_timing_overlay(console)
+
+    def invalidate(self) -> None:
+        """次回の描画でマップ層とパネルを全て描き直すようにする。"""
+        self.map_layer.invalidate()
+        self.status_panel = None
+        self.message_panel = None
+
+    def _panel(self, panel: PanelLayer | None, width: int, height: int) -> PanelLayer:
+        """サイズが合うパネルを取得（サイズが変わった場合は作り直す）。"""
+        if panel is None or (panel.width, panel.height) != (width, height):
+            panel = PanelLayer(width, height)
+        return panel
+
+    def _update_camera(self, console: tcod.Console) -> None:
+        """
+        表示範囲の大きさを画面に合わせ、プレイヤーを追従させる。
+
+        Args:
+        ----
+            console: TCODコンソール
+
+        """
+        game_screen = self.game_screen
+        floor_data = game_screen.game_logic.get_current_floor_data()
+        if floor_data and floor_data.tiles.size:
+            map_height, map_width = floor_data.tiles.shape
+        else:
+            map_width, map_height = game_screen.dungeon_width, game_screen.dungeon_height
 
-        # 各要素を描画
-        self._render_map(console)
-        self._render_status(console)
-        self._render_messages(console)
-        # コマンドヒントはデフォルトで無効化（メッセージエリアと干渉を避けるため）
-        # self._render_command_hints(console)
+        self.camera.resize(console.width, console.height - self.MAP_OFFSET_Y - self.MAX_MESSAGES)
+        player = game_screen.player
+        self.camera.follow(player.x if player else 0, player.y if player else 0, map_width, map_height)
 
     def _render_map(self, console: tcod.Console) -> None:
         """
         マップの描画処理。
 
+        表示範囲のマップ層を更新して転送し、その上にエンティティを重ねます。
+
         Args:
         ----
             console: TCODコンソール
@@ -76,166 +149,114 @@ class GameRenderer:
         if not floor_data or not floor_data.tiles.size:
             return
 
-        # ステータス行の分だけマップをオフセット（2行分）
-        map_offset_y = 2
-
-        for y in range(floor_data.tiles.shape[0]):
-            for x in range(floor_data.tiles.shape[1]):
-                tile = floor_data.tiles[y, x]
-                visible = game_screen.fov_manager.visible[y, x]
-                explored = game_screen.game_logic.get_explored_tiles()[y, x]
+        map_offset_y = self.MAP_OFFSET_Y
+        visible = game_screen.fov_manager.visible
+        explored = game_screen.game_logic.get_explored_tiles()
+        # ウィザードモード時は全マップを表示
+        wizard_mode = game_screen.game_logic.is_wizard_mode()
 
-                # ウィザードモード時は全マップを表示
-                wizard_mode = game_screen.game_logic.is_wizard_mode()
-                should_render = visible or explored or wizard_mode
+        with frame_timer.scope("render.map"):
+            layer = self.map_layer.update(floor_data, visible, explored, wizard_mode, bounds=self.camera.bounds)
+            layer.blit(console, dest_x=0, dest_y=map_offset_y)
 
-                if should_render:
-                    # タイルの描画（Y座標をオフセット）
-                    self._render_tile(console, x, y + map_offset_y, tile, visible, wizard_mode)
+        with frame_timer.scope("render.entities"):
+            self._render_entities(console, floor_data, visible, wizard_mode, map_offset_y, bounds=self.camera.bounds)
 
-                    # アイテムの描画（ウィザードモード時は全て表示）
-                    if visible or wizard_mode:
-                        self._render_items_at(console, x, y, floor_data, map_offset_y)
-
-                        # モンスターの描画
-                        self._render_monsters_at(console, x, y, floor_data, map_offset_y)
-
-                        # ウィザードモード時: トラップの描画
-                        if wizard_mode:
-                            self._render_traps_at(console, x, y, floor_data, map_offset_y)
-
-        # プレイヤーの描画（Y座標をオフセット）
+        # プレイヤーの描画（表示範囲内の座標に変換し、Y座標をオフセット）
         player = game_screen.player
-        if player:
-            console.print(player.x, player.y + map_offset_y, "@", fg=(255, 255, 255))
+        if player and self.camera.contains(player.x, player.y):
+            screen_x, screen_y = self.camera.to_screen(player.x, player.y)
+            console.print(screen_x, screen_y + map_offset_y, "@", fg=(255, 255, 255))
 
-    def _render_tile(
+    def _render_entities(
         self,
         console: tcod.Console,
-        x: int,
-        y: int,
-        tile: object,
-        visible: bool,
-        wizard_mode: bool = False,
+        floor_data,
+        visible: np.ndarray,
+        wizard_mode: bool,
+        map_offset_y: int,
+        *,
+        bounds: tuple[int, int, int, int] | None = None,
     ) -> None:
         """
-        タイルの描画処理。
+        表示範囲内で視界内（ウィザードモード時は全て）のアイテム・モンスター・トラップを描画。
+
+        各エンティティをシンボルコードに変換し、表示文字と色をテーブルから
+        引いてまとめて書き込みます。同じマスではアイテム、モンスター、
+        トラップの順に上書きし、各種類ではリストの先頭のものを表示します。
+        幻覚状態ではアイテムとモンスターの文字と色をランダムにします。
 
         Args:
         ----
             console: TCODコンソール
-            x: X座標
-            y: Y座標
-            tile: タイルオブジェクト
-            visible: 現在視界内かどうか
+            floor_data: フロアデータ
+            visible: 視界内マスのブール配列
             wizard_mode: ウィザードモード有効かどうか
+            map_offset_y: マップのYオフセット
+            bounds: 表示範囲 (x, y, 幅, 高さ)（Noneの場合はマップ全体）
 
         """
-        if isinstance(tile, Wall):
-            char = "#"
-            color = (130, 110, 50) if visible else (0, 0, 100)  # 元の色設定に戻す
-        elif isinstance(tile, Floor):
-            char = "."
-            color = (192, 192, 192) if visible else (64, 64, 64)  # 元の色設定に戻す
-        elif isinstance(tile, StairsDown):
-            char = ">"
-            color = (255, 255, 255) if visible else (128, 128, 128)
-        elif isinstance(tile, StairsUp):
-            char = "<"
-            color = (255, 255, 255) if visible else (128, 128, 128)
-        elif hasattr(tile, "char"):  # Door, SecretDoor等のタイル
-            from pyrogue.map.tile import SecretDoor
-
-            if isinstance(tile, SecretDoor) and wizard_mode and tile.door_state == "secret":
-                # ウィザードモード時の隠しドア表示（紫色で強調）
-                char = "S"  # Secret doorの頭文字
-                color = (255, 0, 255) if visible else (128, 0, 128)  # マゼンタ
-            else:
-                char = tile.char
-                color = tile.light if visible else tile.dark
-        else:
-            char = "?"
-            color = (255, 0, 255) if visible else (128, 0, 128)
-
-        # 座標範囲チェック付きの安全な描画
-        try:
-            if 0 <= x < console.width and 0 <= y < console.height:
-                console.print(x, y, char, fg=color)
-        except Exception as e:
-            # 描画エラーを記録（ゲームを継続）
-            print(f"Warning: Drawing error at ({x}, {y}): {e}")
+        entities = [*reversed(floor_data.item_spawner.items), *reversed(floor_data.monster_spawner.monsters)]
+        codes = [GLYPHS.symbol_code(entity.char, entity.color) for entity in entities]
+        # 幻覚の対象はアイテムとモンスターのみ
+        maskable = len(entities)
+
+        # ウィザードモード時: トラップの描画
+        if wizard_mode and hasattr(floor_data, "trap_spawner") and floor_data.trap_spawner:
+            traps = list(reversed(floor_data.trap_spawner.traps))
+            entities.extend(traps)
+            codes.extend(GLYPHS.trap_code(trap) for trap in traps)
+
+        if not entities:
+            return
 
-    def _render_traps_at(self, console: tcod.Console, x: int, y: int, floor_data, map_offset_y: int) -> None:
-        """
-        ウィザードモード時の指定座標のトラップを描画。
+        xs = np.fromiter((entity.x for entity in entities), dtype=np.int64, count=len(entities))
+        ys = np.fromiter((entity.y for entity in entities), dtype=np.int64, count=len(entities))
+        x0, y0, width, height = bounds or (0, 0, visible.shape[1], visible.shape[0])
+        in_view = (xs >= x0) & (xs < x0 + width) & (ys >= y0) & (ys < y0 + height)
+        shown = in_view.copy()
+        if not wizard_mode:
+            shown[in_view] = visible[ys[in_view], xs[in_view]]
 
-        Args:
-        ----
-            console: TCODコンソール
-            x: X座標
-            y: Y座標
-            floor_data: フロアデータ
-            map_offset_y: マップのYオフセット
+        ch = GLYPHS.symbol_ch[codes]
+        fg = GLYPHS.symbol_fg[codes]
 
-        """
-        if hasattr(floor_data, "trap_spawner") and floor_data.trap_spawner:
-            for trap in floor_data.trap_spawner.traps:
-                if trap.x == x and trap.y == y:
-                    # トラップタイプに応じた色分け
-                    if trap.name == "Pit Trap":
-                        color = (139, 69, 19)  # 茶色
-                        char = "P"
-                    elif trap.name == "Poison Needle Trap":
-                        color = (0, 255, 0)  # 緑色
-                        char = "N"
-                    elif trap.name == "Teleport Trap":
-                        color = (255, 0, 255)  # マゼンタ
-                        char = "T"
-                    else:
-                        color = (255, 255, 0)  # 黄色（汎用）
-                        char = "^"
-
-                    # 隠しトラップは薄い色で表示
-                    if trap.is_hidden:
-                        color = (color[0] // 2, color[1] // 2, color[2] // 2)  # 色を半分に
-
-                    console.print(x, y + map_offset_y, char, fg=color)
-                    break  # 1つの座標に複数トラップがある場合は最初のもののみ表示
-
-    def _render_items_at(self, console: tcod.Console, x: int, y: int, floor_data, map_offset_y: int) -> None:
-        """
-        指定座標のアイテムを描画。
+        player = self.game_screen.player
+        if player and player.status_effects.has_effect("Hallucination"):
+            ch, fg = self._hallucinate(ch, fg, shown & (np.arange(len(entities)) < maskable))
 
-        Args:
-        ----
-            console: TCODコンソール
-            x: X座標（マップ座標）
-            y: Y座標（マップ座標）
-            floor_data: フロアデータ
-            map_offset_y: マップのYオフセット
+        # 同じマスに複数ある場合は後のもの（上に重ねるもの）だけを書き込む
+        index = np.nonzero(shown)[0]
+        flat = (ys[index] - y0) * width + (xs[index] - x0)
+        _, last_from_end = np.unique(flat[::-1], return_index=True)
+        index = index[len(index) - 1 - last_from_end]
 
-        """
-        items_at_pos = [item for item in floor_data.item_spawner.items if item.x == x and item.y == y]
-        if items_at_pos:
-            item = items_at_pos[0]  # 最初のアイテムを描画
-            console.print(x, y + map_offset_y, item.char, fg=item.color)
+        console.ch[ys[index] - y0 + map_offset_y, xs[index] - x0] = ch[index]
+        console.fg[ys[index] - y0 + map_offset_y, xs[index] - x0] = fg[index]
 
-    def _render_monsters_at(self, console: tcod.Console, x: int, y: int, floor_data, map_offset_y: int) -> None:
+    def _hallucinate(self, ch: np.ndarray, fg: np.ndarray, mask: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
         """
-        指定座標のモンスターを描画。
+        幻覚状態で、マスクが立っているエンティティの文字と色をまとめてランダムにする。
 
         Args:
         ----
-            console: TCODコンソール
-            x: X座標（マップ座標）
-            y: Y座標（マップ座標）
-            floor_data: フロアデータ
-            map_offset_y: マップのYオフセット
+            ch: 文字コード配列
+            fg: 前景色配列
+            mask: ランダムにするエンティティのブール配列
+
+        Returns:
+        -------
+            置き換えた文字コード配列と前景色配列
 
         """
-        monster = floor_data.monster_spawner.get_monster_at(x, y)
-        if monster:
-            console.print(x, y + map_offset_y, monster.char, fg=monster.color)
+        count = int(np.count_nonzero(mask))
+        if count == 0:
+            return ch, fg
+        ch = ch.copy()
+        fg = fg.copy()
+        ch[mask] = self._rng.choice(HALLUCINATION_CODES, size=count)
+        fg[mask] = self._rng.integers(0, 256, size=(count, 3), dtype=np.uint8)
+        return ch, fg
 
     def _render_status(self, console: tcod.Console) -> None:
         """
@@ -292,17 +313,22 @@ class GameRenderer:
         if hasattr(self.game_screen.game_logic, "wizard_mode") and self.game_screen.game_logic.wizard_mode:
             wizard_info = " [WIZARD]"
 
-        # ステータス描画
-        console.print(x=1, y=status_y, string=status_line1, fg=(255, 255, 255))
-        console.print(x=1, y=status_y + 1, string=status_line2, fg=(255, 255, 255))
+        # 表示内容が変わった時だけパネルを描き直す
+        def paint(panel: tcod.Console) -> None:
+            panel.print(x=1, y=0, string=status_line1, fg=(255, 255, 255))
+            panel.print(x=1, y=1, string=status_line2, fg=(255, 255, 255))
 
-        # 地下階層番号を右上に表示
-        console.print(
-            x=console.width - len(floor_info) - len(wizard_info) - 1,
-            y=status_y,
-            string=floor_info + wizard_info,
-            fg=(255, 255, 255) if not wizard_info else (255, 255, 0),  # ウィザードモード時は黄色
-        )
+            # 地下階層番号を右上に表示
+            panel.print(
+                x=panel.width - len(floor_info) - len(wizard_info) - 1,
+                y=0,
+                string=floor_info + wizard_info,
+                fg=(255, 255, 255) if not wizard_info else (255, 255, 0),  # ウィザードモード時は黄色
+            )
+
+        self.status_panel = self._panel(self.status_panel, console.width, 2)
+        key = (status_line1, status_line2, floor_info, wizard_info)
+        self.status_panel.update(key, paint).blit(console, dest_x=0, dest_y=status_y)
 
         # オリジナルRogueには目標表示はありませんでした
         # プレイヤーは自分で目標を理解する必要がありました
@@ -371,29 +397,46 @@ class GameRenderer:
             if not messages:
                 return
 
-            # メッセージ表示エリアの設定
-            message_y = self.game_screen.dungeon_height + 2
-            max_messages = 7  # 最大7つのメッセージを表示
-
-            # 最新のメッセージから表示
-            recent_messages = messages[-max_messages:]
-            for i, message in enumerate(recent_messages):
-                try:
-                    # 安全な文字列処理
-                    safe_message = str(message)[:80]  # 長すぎるメッセージを切り詰め
-                    console.print(0, message_y + i, safe_message, fg=(255, 255, 255))
-                except Exception as msg_error:
-                    # 個別メッセージの描画エラー
-                    console.print(0, message_y + i, f"[Message error: {msg_error}]", fg=(255, 100, 100))
+            # メッセージ表示エリアの設定（マップの表示範囲の下）
+            message_y = self.MAP_OFFSET_Y + self.camera.height
+            max_messages = self.MAX_MESSAGES  # 最大7行を表示
+
+            # 最新のメッセージを画面幅で折り返した行（ログが変わらない間はキャッシュされる）
+            recent_lines = messages.wrapped_lines(console.width, max_messages)
+
+            def paint(panel: tcod.Console) -> None:
+                for i, line in enumerate(recent_lines):
+                    panel.print(0, i, line, fg=(255, 255, 255))
+
+            # 表示内容が変わった時だけパネルを描き直す
+            self.message_panel = self._panel(self.message_panel, console.width, max_messages)
+            self.message_panel.update(recent_lines, paint).blit(console, dest_x=0, dest_y=message_y)
         except Exception as e:
             # 全体的なエラーのフォールバック
             try:
-                message_y = self.game_screen.dungeon_height + 2
+                message_y = self.MAP_OFFSET_Y + self.camera.height
                 console.print(0, message_y, f"Message system error: {e}", fg=(255, 0, 0))
             except Exception:
                 # 最後の手段：何もしない（クラッシュを避ける）
                 pass
 
+    def _render_timing_overlay(self, console: tcod.Console) -> None:
+        """
+        計測タイマーの区間ごとの所要時間をマップ右上に重ねて表示。
+
+        Args:
+        ----
+            console: TCODコンソール
+
+        """
+        lines = frame_timer.overlay_lines()
+        width = max(len(line) for line in lines) + 2
+        x = max(0, console.width - width)
+        y = self.MAP_OFFSET_Y
+        console.draw_rect(x, y, width, len(lines), ch=ord(" "), bg=(0, 0, 64))
+        for i, line in enumerate(lines):
+            console.print(x + 1, y + i, line, fg=(255, 255, 0) if i == 0 else (200, 200, 200))
+
     def _get_hallucination_char(self) -> str:
         """
         幻覚状態でランダムな文字を返す。
@@ -403,8 +446,7 @@ class GameRenderer:
             str: ランダムな文字
 
         """
-        chars = ["?", "!", "@", "#", "$", "%", "^", "&", "*", "+", "=", "~"]
-        return random.choice(chars)
+        return random.choice(HALLUCINATION_CHARS)
 
     def _get_hallucination_color(self) -> tuple[int, int, int]:
         """
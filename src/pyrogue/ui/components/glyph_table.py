@@ -0,0 +1,260 @@
+"""
+表示文字と色のルックアップテーブル。
+
+このモジュールは、タイルの種類・トラップの種類・エンティティのシンボルを
+整数コードに変換し、コード × 表示状態から表示文字と色を引けるテーブルを
+提供します。タイルの判定（isinstanceの連鎖）は種類ごとに一度だけ行い、
+描画時はNumPyの配列参照でコンソールにまとめて書き込みます。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from pyrogue.map.tile import Door, Floor, Lava, SecretDoor, StairsDown, StairsUp, Wall, Water
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    from pyrogue.entities.traps.trap import Trap
+    from pyrogue.map.tile import Tile
+
+type Color = tuple[int, int, int]
+
+# 表示状態（テーブルの2番目の軸）
+HIDDEN = 0  # 未探索で表示しない
+VISIBLE = 1  # 現在視界内
+REMEMBERED = 2  # 探索済み（またはウィザードモード）で視界外
+
+# 表示しないマスの文字と色（console.clear()直後と同じ）
+BLANK_CHAR = " "
+BLANK_FG: Color = (255, 255, 255)
+BLANK_BG: Color = (0, 0, 0)
+
+# トラップの種類ごとの表示文字と色
+TRAP_GLYPHS: dict[str, tuple[str, Color]] = {
+    "Pit Trap": ("P", (139, 69, 19)),  # 茶色
+    "Poison Needle Trap": ("N", (0, 255, 0)),  # 緑色
+    "Teleport Trap": ("T", (255, 0, 255)),  # マゼンタ
+}
+DEFAULT_TRAP_GLYPH: tuple[str, Color] = ("^", (255, 255, 0))  # 黄色（汎用）
+
+# 幻覚状態で表示する文字
+HALLUCINATION_CHARS = ["?", "!", "@", "#", "$", "%", "^", "&", "*", "+", "=", "~"]
+
+
+def tile_glyph(tile: Tile, visible: bool, wizard_mode: bool = False) -> tuple[str, Color]:
+    """
+    タイルの表示文字と色を求める。
+
+    Args:
+    ----
+        tile: タイルオブジェクト
+        visible: 現在視界内かどうか
+        wizard_mode: ウィザードモード有効かどうか
+
+    Returns:
+    -------
+        表示文字と色
+
+    """
+    if isinstance(tile, Wall):
+        char = "#"
+        color = (130, 110, 50) if visible else (0, 0, 100)
+    elif isinstance(tile, Floor):
+        char = "."
+        color = (192, 192, 192) if visible else (64, 64, 64)
+    elif isinstance(tile, StairsDown):
+        char = ">"
+        color = (255, 255, 255) if visible else (128, 128, 128)
+    elif isinstance(tile, StairsUp):
+        char = "<"
+        color = (255, 255, 255) if visible else (128, 128, 128)
+    elif hasattr(tile, "char"):  # Door, SecretDoor等のタイル
+        if isinstance(tile, SecretDoor) and wizard_mode and tile.door_state == "secret":
+            # ウィザードモード時の隠しドア表示（紫色で強調）
+            char = "S"  # Secret doorの頭文字
+            color = (255, 0, 255) if visible else (128, 0, 128)  # マゼンタ
+        else:
+            char = tile.char
+            color = tile.light if visible else tile.dark
+    else:
+        char = "?"
+        color = (255, 0, 255) if visible else (128, 0, 128)
+
+    return char, color
+
+
+class GlyphTable:
+    """
+    種類コード × 表示状態の表示文字・色テーブル。
+
+    タイルは見た目が決まる属性（種類・文字・色・扉の状態）ごとに1つの
+    コードを割り当てます。共有インスタンスのタイルは種類だけで引けます。
+    未登録の見た目は最初に出現した時に追加します。
+
+    Attributes
+    ----------
+        tile_ch: [ウィザードモード, 表示状態, タイルコード] の文字コード配列
+        tile_fg: [ウィザードモード, 表示状態, タイルコード] の前景色配列
+        symbol_ch: シンボルコードごとの文字コード配列
+        symbol_fg: シンボルコードごとの前景色配列
+
+    """
+
+    def __init__(self) -> None:
+        """空のテーブルを初期化。"""
+        self._tile_codes: dict[Hashable, int] = {}
+        self._shared_codes: dict[type[Tile], int] = {}
+        self._tile_rows: list[tuple[np.ndarray, np.ndarray]] = []
+        self.tile_ch = np.zeros((2, 3, 0), dtype=np.int32)
+        self.tile_fg = np.zeros((2, 3, 0, 3), dtype=np.uint8)
+
+        self._symbol_codes: dict[tuple[str, Color], int] = {}
+        self._symbol_rows: list[tuple[int, Color]] = []
+        self.symbol_ch = np.zeros(0, dtype=np.int32)
+        self.symbol_fg = np.zeros((0, 3), dtype=np.uint8)
+
+    @classmethod
+    def with_defaults(cls) -> GlyphTable:
+        """
+        標準のタイル・トラップを登録したテーブルを作成。
+
+        Returns
+        -------
+            作成されたテーブル
+
+        """
+        table = cls()
+        shared_kinds = (Wall, Floor, StairsUp, StairsDown, Water, Lava)
+        for kind in shared_kinds:
+            table.tile_code(kind.shared())
+        for tile in (Door("closed"), Door("open"), SecretDoor()):
+            table.tile_code(tile)
+        revealed = SecretDoor()
+        revealed.reveal()
+        table.tile_code(revealed)
+
+        for char, color in (*TRAP_GLYPHS.values(), DEFAULT_TRAP_GLYPH):
+            table.symbol_code(char, color)
+            table.symbol_code(char, _dim(color))
+        return table
+
+    def tile_code(self, tile: Tile) -> int:
+        """
+        タイルの種類コードを取得（未登録の見た目は登録する）。
+
+        Args:
+        ----
+            tile: タイルオブジェクト
+
+        Returns:
+        -------
+            種類コード
+
+        """
+        if getattr(tile, "is_shared", False):
+            code = self._shared_codes.get(type(tile))
+            if code is not None:
+                return code
+
+        key = (
+            type(tile),
+            getattr(tile, "char", None),
+            getattr(tile, "light", None),
+            getattr(tile, "dark", None),
+            getattr(tile, "door_state", None),
+        )
+        code = self._tile_codes.get(key)
+        if code is None:
+            code = self._compile_tile(tile)
+            self._tile_codes[key] = code
+        if getattr(tile, "is_shared", False):
+            self._shared_codes[type(tile)] = code
+        return code
+
+    def tile_codes(self, tiles: np.ndarray, ys: np.ndarray, xs: np.ndarray) -> np.ndarray:
+        """
+        指定マスのタイルの種類コードをまとめて取得。
+
+        Args:
+        ----
+            tiles: タイル配列
+            ys: Y座標の配列
+            xs: X座標の配列
+
+        Returns:
+        -------
+            種類コードのint32配列
+
+        """
+        return np.fromiter((self.tile_code(tile) for tile in tiles[ys, xs]), dtype=np.int32, count=len(ys))
+
+    def _compile_tile(self, tile: Tile) -> int:
+        """タイルの見た目を全ての表示状態について求めてテーブルに追加。"""
+        ch = np.full((2, 3), ord(BLANK_CHAR), dtype=np.int32)
+        fg = np.empty((2, 3, 3), dtype=np.uint8)
+        fg[:] = BLANK_FG
+        for wizard in (0, 1):
+            for state, visible in ((VISIBLE, True), (REMEMBERED, False)):
+                char, color = tile_glyph(tile, visible, bool(wizard))
+                ch[wizard, state] = ord(char)
+                fg[wizard, state] = color
+
+        self._tile_rows.append((ch, fg))
+        self.tile_ch = np.stack([row[0] for row in self._tile_rows], axis=-1)
+        self.tile_fg = np.stack([row[1] for row in self._tile_rows], axis=2)
+        return len(self._tile_rows) - 1
+
+    def symbol_code(self, char: str, color: Color) -> int:
+        """
+        エンティティのシンボル（文字と色）のコードを取得（未登録の場合は登録する）。
+
+        Args:
+        ----
+            char: 表示文字
+            color: 前景色
+
+        Returns:
+        -------
+            シンボルコード
+
+        """
+        key = (char, tuple(color))
+        code = self._symbol_codes.get(key)
+        if code is None:
+            code = len(self._symbol_rows)
+            self._symbol_codes[key] = code
+            self._symbol_rows.append((ord(char), key[1]))
+            self.symbol_ch = np.array([row[0] for row in self._symbol_rows], dtype=np.int32)
+            self.symbol_fg = np.array([row[1] for row in self._symbol_rows], dtype=np.uint8)
+        return code
+
+    def trap_code(self, trap: Trap) -> int:
+        """
+        トラップのシンボルコードを取得（隠しトラップは薄い色）。
+
+        Args:
+        ----
+            trap: トラップ
+
+        Returns:
+        -------
+            シンボルコード
+
+        """
+        char, color = TRAP_GLYPHS.get(trap.name, DEFAULT_TRAP_GLYPH)
+        if trap.is_hidden:
+            color = _dim(color)
+        return self.symbol_code(char, color)
+
+
+def _dim(color: Color) -> Color:
+    """色を半分の明るさにする。"""
+    return (color[0] // 2, color[1] // 2, color[2] // 2)
+
+
+# 起動時に標準の種類を登録した共有テーブル
+GLYPHS = GlyphTable.with_defaults()
@@ -13,6 +13,8 @@ import tcod.event
 
 from pyrogue.core.command_handler import CommonCommandHandler, GUICommandContext
 from pyrogue.core.game_states import GameStates
+from pyrogue.core.managers.turn_manager import TurnInterrupt
+from pyrogue.utils.spatial_hash import DistanceMetric
 
 if TYPE_CHECKING:
     from pyrogue.ui.screens.game_screen import GameScreen
@@ -179,7 +181,7 @@ class InputHandler:
             self._handle_disarm_action()
             return None
 
-        if key == ord("e"):
+        if key == ord("e") and not (mod & tcod.event.Modifier.CTRL):
             # 食べる (eat food)
             self._handle_eat_action()
             return None
@@ -322,6 +324,16 @@ class InputHandler:
             self.game_screen.game_logic.wizard_reveal_all()
             return None
 
+        if key == ord("p") and mod & tcod.event.Modifier.CTRL:
+            # Ctrl+P で計測オーバーレイの切り替え
+            self.game_screen.game_logic.wizard_toggle_timing()
+            return None
+
+        if key == ord("e") and mod & tcod.event.Modifier.CTRL:
+            # Ctrl+E で計測結果をトレースとして書き出し
+            self.game_screen.game_logic.wizard_export_trace()
+            return None
+
         if key == ord("m") and mod & tcod.event.Modifier.CTRL:
             # Ctrl+M で最後のメッセージ表示（CommonCommandHandler経由）
             result = self.command_handler.handle_command("last_message")
@@ -583,7 +595,7 @@ class InputHandler:
             # モンスターが死亡したかチェック
             if target_monster.hp <= 0:
                 self.game_screen.game_logic.add_message(f"The {target_monster.name} dies!")
-                dungeon.monsters.remove(target_monster)
+                dungeon.monster_spawner.remove_monster(target_monster)
                 player.exp += target_monster.exp
                 player.kill_count += 1
 
@@ -1208,6 +1220,7 @@ Press any key to continue...
                     # インベントリから削除
                     if wand in self.game_screen.player.inventory.items:
                         self.game_screen.player.inventory.items.remove(wand)
+                        self.game_screen.player.inventory.mark_changed()
             else:
                 self.game_screen.game_logic.add_message(f"The {wand.name} fails to work.")
         else:
@@ -1388,36 +1401,37 @@ Press any key to continue...
         # 休憩開始メッセージ
         self.game_screen.game_logic.add_message("You begin to rest...")
 
-        # 回復が必要なターン数を計算
+        # 回復が必要なターン数を計算（2ターンで1HP回復）
         hp_to_recover = player.max_hp - player.hp
-        turns_needed = hp_to_recover * 2  # 2ターンで1HP回復
-
-        # 休憩ループ
-        turns_rested = 0
-        while player.hp < player.max_hp and turns_rested < turns_needed:
-            # ターンを進める
-            self.game_screen.game_logic.advance_turn()
-
-            # 2ターンごとに1HP回復
-            if turns_rested % 2 == 1:
-                player.hp = min(player.max_hp, player.hp + 1)
-
-            turns_rested += 1
-
-            # 途中でモンスターが近づいてきたら休憩を中断
-            if self._check_nearby_monsters():
-                self.game_screen.game_logic.add_message("Your rest is interrupted by a monster!")
-                return
+        turns_needed = hp_to_recover * 2
+
+        # ターンを一括で進める（モンスター接近・被ダメージ・空腹で中断）
+        fov_manager = self.game_screen.fov_manager
+        result = self.game_screen.game_logic.simulate_turns(
+            turns_needed,
+            stop_conditions={
+                TurnInterrupt.MONSTER_IN_VIEW,
+                TurnInterrupt.DAMAGE_TAKEN,
+                TurnInterrupt.HUNGER_THRESHOLD,
+                TurnInterrupt.FULL_HP,
+            },
+            view_mask=fov_manager.visible if fov_manager.fov_enabled else None,
+            hp_regen_interval=2,
+        )
+
+        # プレイヤーが死亡した場合は休憩を中断
+        if player.hp <= 0:
+            return
 
-            # プレイヤーが死亡した場合は休憩を中断
-            if player.hp <= 0:
-                return
+        if result.interrupt == TurnInterrupt.MONSTER_IN_VIEW:
+            self.game_screen.game_logic.add_message("Your rest is interrupted by a monster!")
+            return
 
         # 休憩完了メッセージ
         if player.hp >= player.max_hp:
-            self.game_screen.game_logic.add_message(f"You feel fully rested. (Rested for {turns_rested} turns)")
+            self.game_screen.game_logic.add_message(f"You feel fully rested. (Rested for {result.turns} turns)")
         else:
-            self.game_screen.game_logic.add_message(f"You feel somewhat better. (Rested for {turns_rested} turns)")
+            self.game_screen.game_logic.add_message(f"You feel somewhat better. (Rested for {result.turns} turns)")
 
     def _check_nearby_monsters(self) -> bool:
         """
@@ -1431,13 +1445,9 @@ Press any key to continue...
         player = self.game_screen.game_logic.player
         dungeon = self.game_screen.game_logic.dungeon
 
-        # 視界内のモンスターをチェック
-        for monster in dungeon.monsters:
-            if monster.hp > 0:  # 生きているモンスターのみ
-                distance = abs(monster.x - player.x) + abs(monster.y - player.y)
-                if distance <= 10:  # 10タイル以内にモンスターがいる
-                    return True
-        return False
+        # 10タイル以内の生きているモンスターをチェック
+        nearby = dungeon.monster_spawner.get_monsters_in_range(player.x, player.y, 10, DistanceMetric.MANHATTAN)
+        return any(monster.hp > 0 for monster in nearby)
 
     def _handle_run_action(self, dx: int, dy: int) -> None:
         """
@@ -0,0 +1,225 @@
+"""
+描画レイヤーコンポーネント。
+
+このモジュールは、ゲーム画面を重ね合わせで描画するためのオフスクリーン
+コンソールを提供します。マップ層は前回の描画から地形・視界・探索状態が
+変わったマスだけを書き換え、ステータスやメッセージのパネルは表示内容が
+変わった時だけ描き直します。毎フレームの処理はレイヤーの転送（blit）と
+変化したマスの数に比例し、マップ層が保持するのは表示範囲の分だけです。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import tcod.console
+
+from pyrogue.ui.components.glyph_table import BLANK_BG, GLYPHS, HIDDEN, REMEMBERED, VISIBLE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+    from pyrogue.map.dungeon_manager import FloorData
+    from pyrogue.ui.components.glyph_table import GlyphTable
+
+
+class MapLayer:
+    """
+    地形を保持するオフスクリーンのマップ層。
+
+    前回描画した視界・探索状態のスナップショットと、フロアのタイルバッファが
+    記録した書き換えマスを比較し、変化したマスだけを描き直します。
+    各マスのタイルの種類コードを保持し、表示文字と色はテーブルから
+    まとめて引きます。フロアの切り替えやウィザードモードの切り替え時は
+    全体を描き直します。
+
+    表示範囲（bounds）を指定した場合は、その範囲だけを保持・比較します。
+    表示範囲が移動した時は、重なる部分の内容をずらして使い回し、
+    新しく表示範囲に入ったマスだけを描き直します。
+
+    Attributes
+    ----------
+        console: マップ層のコンソール（未描画の場合はNone）
+        floor_data: 前回描画したフロア
+        origin: 前回描画した表示範囲の左上のマップ座標 (x, y)
+        visible: 前回描画した視界内マスのブール配列（表示範囲分）
+        explored: 前回描画した探索済みマスのブール配列（表示範囲分）
+        wizard_mode: 前回描画時のウィザードモード
+        kinds: 各マスのタイルの種類コードのint32配列（表示範囲分）
+        last_patch_count: 前回の更新で描き直したマスの数
+
+    """
+
+    def __init__(self) -> None:
+        """マップ層を初期化。"""
+        self.console: tcod.console.Console | None = None
+        self.floor_data: FloorData | None = None
+        self.origin = (0, 0)
+        self.visible = np.zeros((0, 0), dtype=bool)
+        self.explored = np.zeros((0, 0), dtype=bool)
+        self.wizard_mode = False
+        self.kinds = np.zeros((0, 0), dtype=np.int32)
+        self.last_patch_count = 0
+
+    def invalidate(self) -> None:
+        """次回の更新で全体を描き直すようにする。"""
+        self.floor_data = None
+
+    def update(
+        self,
+        floor_data: FloorData,
+        visible: np.ndarray,
+        explored: np.ndarray,
+        wizard_mode: bool,
+        glyphs: GlyphTable = GLYPHS,
+        *,
+        bounds: tuple[int, int, int, int] | None = None,
+    ) -> tcod.console.Console:
+        """
+        変化したマスを描き直したマップ層を取得。
+
+        Args:
+        ----
+            floor_data: 描画するフロア
+            visible: 視界内マスのブール配列（マップ全体）
+            explored: 探索済みマスのブール配列（マップ全体）
+            wizard_mode: ウィザードモード（全マスを表示）
+            glyphs: 表示文字と色のテーブル
+            bounds: 表示範囲 (x, y, 幅, 高さ)（Noneの場合はマップ全体）
+
+        Returns:
+        -------
+            表示範囲の大きさのマップ層のコンソール
+
+        """
+        tiles = floor_data.tiles
+        if bounds is None:
+            bounds = (0, 0, tiles.shape[1], tiles.shape[0])
+        x0, y0, width, height = bounds
+        window = np.s_[y0 : y0 + height, x0 : x0 + width]
+        visible = visible[window]
+        explored = explored[window]
+
+        # タイルバッファの書き換え記録は毎回消費し、次回の差分に持ち越さない
+        # （表示範囲外の書き換えは、範囲に入った時に描き直すので不要）
+        written = floor_data.tile_buffer.consume_dirty()[window]
+
+        if (
+            self.console is None
+            or self.floor_data is not floor_data
+            or self.wizard_mode != wizard_mode
+            or self.visible.shape != (height, width)
+        ):
+            if self.console is None or (self.console.height, self.console.width) != (height, width):
+                self.console = tcod.console.Console(width, height, order="C")
+            written = np.ones((height, width), dtype=bool)
+            self.floor_data = floor_data
+            self.wizard_mode = wizard_mode
+            self.visible = np.zeros((height, width), dtype=bool)
+            self.explored = np.zeros((height, width), dtype=bool)
+            self.kinds = np.zeros((height, width), dtype=np.int32)
+        elif self.origin != (x0, y0):
+            written = written | self._scroll(x0 - self.origin[0], y0 - self.origin[1])
+        self.origin = (x0, y0)
+
+        changed = written | (visible != self.visible) | (explored != self.explored)
+
+        # 書き換えられたマスだけ種類コードを求め直す
+        wys, wxs = np.nonzero(written)
+        if len(wys):
+            self.kinds[wys, wxs] = glyphs.tile_codes(tiles, wys + y0, wxs + x0)
+
+        ys, xs = np.nonzero(changed)
+        if len(ys):
+            shown = explored[ys, xs] | wizard_mode
+            states = np.where(visible[ys, xs], VISIBLE, np.where(shown, REMEMBERED, HIDDEN))
+            kinds = self.kinds[ys, xs]
+            rgb = self.console.rgb
+            rgb["ch"][ys, xs] = glyphs.tile_ch[int(wizard_mode), states, kinds]
+            rgb["fg"][ys, xs] = glyphs.tile_fg[int(wizard_mode), states, kinds]
+            rgb["bg"][ys, xs] = BLANK_BG
+
+        self.visible[:] = visible
+        self.explored[:] = explored
+        self.last_patch_count = len(ys)
+        return self.console
+
+    def _scroll(self, dx: int, dy: int) -> np.ndarray:
+        """
+        表示範囲の移動に合わせて保持している内容をずらす。
+
+        Args:
+        ----
+            dx: 表示範囲のX方向の移動量
+            dy: 表示範囲のY方向の移動量
+
+        Returns:
+        -------
+            新しく表示範囲に入った（描き直しが必要な）マスのブール配列
+
+        """
+        height, width = self.kinds.shape
+        fresh = np.ones((height, width), dtype=bool)
+        if abs(dx) >= width or abs(dy) >= height:
+            return fresh
+
+        # 移動後も表示範囲に残るマスの、移動前と移動後の位置
+        src = np.s_[max(0, dy) : height + min(0, dy), max(0, dx) : width + min(0, dx)]
+        dst = np.s_[max(0, -dy) : height + min(0, -dy), max(0, -dx) : width + min(0, -dx)]
+        for array in (self.kinds, self.visible, self.explored, self.console.rgb):
+            array[dst] = array[src].copy()
+        fresh[dst] = False
+        return fresh
+
+
+class PanelLayer:
+    """
+    表示内容が変わった時だけ描き直すオフスクリーンのパネル。
+
+    Attributes
+    ----------
+        width: パネルの幅
+        height: パネルの高さ
+        console: パネルのコンソール
+        key: 前回描画した表示内容のキー
+        redraw_count: これまでに描き直した回数
+
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        パネルを初期化。
+
+        Args:
+        ----
+            width: パネルの幅
+            height: パネルの高さ
+
+        """
+        self.width = width
+        self.height = height
+        self.console = tcod.console.Console(width, height, order="C")
+        self.key: Hashable | None = None
+        self.redraw_count = 0
+
+    def update(self, key: Hashable, paint: Callable[[tcod.console.Console], None]) -> tcod.console.Console:
+        """
+        表示内容のキーが変わった場合だけ描き直したパネルを取得。
+
+        Args:
+        ----
+            key: 表示内容を表すキー（前回と等しければ描き直さない）
+            paint: パネルのコンソールに描画する関数
+
+        Returns:
+        -------
+            パネルのコンソール
+
+        """
+        if key != self.key or self.redraw_count == 0:
+            self.console.clear()
+            paint(self.console)
+            self.key = key
+            self.redraw_count += 1
+        return self.console
@@ -2,10 +2,32 @@
 Screens package.
 
 This package contains all the screen classes used in the game.
+Screen classes are imported on first access so that importing one screen
+module does not load every other screen (GameScreen pulls in the whole
+game logic).
 """
 
-from pyrogue.ui.screens.game_screen import GameScreen
-from pyrogue.ui.screens.menu_screen import MenuScreen
-from pyrogue.ui.screens.victory_screen import VictoryScreen
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyrogue.ui.screens.game_screen import GameScreen
+    from pyrogue.ui.screens.menu_screen import MenuScreen
+    from pyrogue.ui.screens.victory_screen import VictoryScreen
 
 __all__ = ["GameScreen", "MenuScreen", "VictoryScreen"]
+
+_MODULES = {
+    "GameScreen": "pyrogue.ui.screens.game_screen",
+    "MenuScreen": "pyrogue.ui.screens.menu_screen",
+    "VictoryScreen": "pyrogue.ui.screens.victory_screen",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _MODULES:
+        return getattr(import_module(_MODULES[name]), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
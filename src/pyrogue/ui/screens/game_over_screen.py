@@ -27,16 +27,20 @@ class GameOverScreen:
         self.player_stats: dict[str, int] = {}
         self.final_floor = 1
         self.cause_of_death = "Unknown"
+        # 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+        self.version = 0
 
     def update_console(self, console: tcod.console.Console) -> None:
         """コンソールの更新"""
         self.console = console
+        self.version += 1
 
     def set_game_over_data(self, player_stats: dict, final_floor: int, cause_of_death: str = "Unknown") -> None:
         """ゲームオーバー時のデータを設定"""
         self.player_stats = player_stats.copy()
         self.final_floor = final_floor
         self.cause_of_death = cause_of_death
+        self.version += 1
 
     def render(self) -> None:
         """Render the game over screen."""
@@ -107,8 +111,10 @@ class GameOverScreen:
         """入力処理"""
         if key.sym == tcod.event.KeySym.UP:
             self.menu_selection = (self.menu_selection - 1) % len(self.menu_options)
+            self.version += 1
         elif key.sym == tcod.event.KeySym.DOWN:
             self.menu_selection = (self.menu_selection + 1) % len(self.menu_options)
+            self.version += 1
         elif key.sym == tcod.event.KeySym.RETURN:
             if self.menu_options[self.menu_selection] == "Return to Menu":
                 return GameStates.MENU
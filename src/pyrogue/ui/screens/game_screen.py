@@ -38,6 +38,7 @@ class GameScreen:
         fov_manager: FOV管理コンポーネント
         dungeon_width: ダンジョンの幅
         dungeon_height: ダンジョンの高さ
+        version: 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
 
     """
 
@@ -72,6 +73,8 @@ class GameScreen:
         # ゲームロジックに自身の参照を設定
         self.game_logic.set_game_screen_reference(self)
 
+        self.version = 0
+
     def setup_new_game(self) -> None:
         """
         新しいゲームをセットアップ。
@@ -79,13 +82,31 @@ class GameScreen:
         self.game_logic.reset_game()
         self.game_logic.setup_new_game()
         self.fov_manager.update_fov()
+        self.version += 1
 
-    def update_console(self) -> None:
+    def update_console(self, console: tcod.Console | None = None) -> None:
         """
-        コンソールの更新（エンジンから呼ばれる）。
+        コンソールの更新（ウィンドウサイズ変更時にエンジンから呼ばれる）。
+
+        描画レイヤーを破棄し、次回の描画で全体を描き直します。
+
+        Args:
+        ----
+            console: 新しいTCODコンソール（描画時に渡されるため保持しない）
+
+        """
+        self.renderer.invalidate()
+        self.version += 1
+
+    @property
+    def animated(self) -> bool:
+        """
+        入力がなくても一定間隔で描き直す必要があるか。
+
+        幻覚状態ではエンティティの表示が毎フレーム変わります。
         """
-        if self.engine:
-            self.engine.update_console()
+        player = self.game_logic.player
+        return bool(player and player.status_effects.has_effect("Hallucination"))
 
     def render(self, console: tcod.Console) -> None:
         """
@@ -115,6 +136,7 @@ class GameScreen:
             新しいゲーム状態、またはNone
 
         """
+        self.version += 1
         return self.input_handler.handle_key(event)
 
     def handle_targeting(self, event: tcod.event.KeyDown) -> None:
@@ -126,6 +148,7 @@ class GameScreen:
             event: TCODキーイベント
 
         """
+        self.version += 1
         self.input_handler.handle_targeting(event)
 
     def save_game(self) -> bool:
@@ -163,6 +186,7 @@ class GameScreen:
         # ロード成功時にFOVを更新
         if result.success:
             self.fov_manager.update_fov()
+            self.version += 1
 
         return result.success
 
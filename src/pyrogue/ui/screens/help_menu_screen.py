@@ -42,6 +42,8 @@ class HelpMenuScreen:
         self.menu_selection = 0
         self.current_page = 0
         self.help_sections = self._get_help_sections()
+        # 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+        self.version = 0
 
     def update_console(self, console: tcod.console.Console) -> None:
         """
@@ -53,6 +55,7 @@ class HelpMenuScreen:
 
         """
         self.console = console
+        self.version += 1
 
     def render(self) -> None:
         """ヘルプメニューを描画。"""
@@ -128,9 +131,11 @@ class HelpMenuScreen:
         # 上矢印キーで上のセクションへ移動
         if key.sym == tcod.event.KeySym.UP:
             self.menu_selection = (self.menu_selection - 1) % len(self.help_sections)
+            self.version += 1
         # 下矢印キーで下のセクションへ移動
         elif key.sym == tcod.event.KeySym.DOWN:
             self.menu_selection = (self.menu_selection + 1) % len(self.help_sections)
+            self.version += 1
         # ESCキーでメインメニューに戻る
         elif key.sym == tcod.event.KeySym.ESCAPE:
             # ゲーム中から来た場合はゲームに戻る
@@ -14,9 +14,26 @@ from pyrogue.ui.screens.screen import Screen
 if TYPE_CHECKING:
     from pyrogue.ui.screens.game_screen import GameScreen
 
+# 所持品一覧での装備スロットの表示（その他のスロットは " (E)"）
+SLOT_MARKS = {"ring_left": " (E-L)", "ring_right": " (E-R)"}
+
 
 class InventoryScreen(Screen):
-    """インベントリ画面"""
+    """
+    インベントリ画面
+
+    所持品の表示行・装備欄・文字キーとの対応は、インベントリと識別状態の
+    世代番号が変わった時だけ作り直します。選択の移動やヘルプの切り替えでは
+    キャッシュした行を描画するだけです。
+
+    Attributes
+    ----------
+        game_screen: メインのゲームスクリーンへの参照
+        selected_index: 選択中のアイテムのインデックス
+        show_help: ヘルプを表示するかどうか
+        unequip_mode: 装備解除の選択中かどうか
+
+    """
 
     def __init__(self, game_screen: GameScreen) -> None:
         super().__init__(game_screen.engine)
@@ -24,6 +41,11 @@ class InventoryScreen(Screen):
         self.selected_index = 0
         self.show_help = False
         self.unequip_mode = False
+        # 表示行のキャッシュ（キーはインベントリと識別状態とそれぞれの世代番号）
+        self._rows_key: tuple | None = None
+        self._item_rows: list[tuple[str, bool]] = []
+        self._equipment_lines: list[str] = []
+        self._letter_index: dict[str, int] = {}
 
     def render(self, console: Console) -> None:
         """
@@ -34,62 +56,23 @@ class InventoryScreen(Screen):
             console: 描画対象のコンソール
 
         """
+        self._refresh_rows()
+
         # 背景を塗りつぶし
         console.clear()
 
         # タイトルを描画
         console.print(1, 1, "Inventory", (255, 255, 0))
 
-        # インベントリの内容を描画
-        for i, item in enumerate(self.game_screen.game_logic.inventory.items):
-            # インデックスを文字に変換（0=a, 1=b, ...）
-            index_char = chr(ord("a") + i)
-
-            # 選択中のアイテムはハイライト
-            fg = (255, 255, 255) if i != self.selected_index else (255, 255, 0)
-
-            # アイテム情報を表示（識別システムを使用）
-            player = self.game_screen.game_logic.player
-            display_name = item.get_display_name(player.identification)
-            item_text = f"{index_char}) {display_name}"
-            if item.stackable and item.stack_count > 1:
-                item_text += f" (x{item.stack_count})"
-
-            # 装備状態を表示（統一された方法を使用）
-            if self.game_screen.game_logic.inventory.is_equipped(item):
-                slot = self.game_screen.game_logic.inventory.get_equipped_slot(item)
-                if slot == "ring_left":
-                    item_text += " (E-L)"
-                elif slot == "ring_right":
-                    item_text += " (E-R)"
-                else:
-                    item_text += " (E)"
-                fg = (0, 255, 0) if i != self.selected_index else (255, 255, 0)
-
+        # インベントリの内容を描画（選択中のアイテムはハイライト、装備中は緑）
+        for i, (item_text, equipped) in enumerate(self._item_rows):
+            fg = (255, 255, 0) if i == self.selected_index else ((0, 255, 0) if equipped else (255, 255, 255))
             console.print(2, 3 + i, item_text, fg)
 
-        # 装備情報を表示
-        equipped = self.game_screen.game_logic.inventory.equipped
-        player = self.game_screen.game_logic.player
+        # 装備情報と装備ボーナスを表示
         console.print(40, 3, "Equipment:", (255, 255, 0))
-
-        # 装備品の表示に識別システムを使用（能力値も表示）
-        weapon_info = self._get_equipment_info(equipped["weapon"], player.identification)
-        armor_info = self._get_equipment_info(equipped["armor"], player.identification)
-        ring_left_info = self._get_equipment_info(equipped["ring_left"], player.identification)
-        ring_right_info = self._get_equipment_info(equipped["ring_right"], player.identification)
-
-        console.print(42, 5, f"Weapon: {weapon_info}")
-        console.print(42, 6, f"Armor: {armor_info}")
-        console.print(42, 7, f"Ring(L): {ring_left_info}")
-        console.print(42, 8, f"Ring(R): {ring_right_info}")
-
-        # 装備ボーナス情報を表示
-        attack_bonus = self.game_screen.game_logic.inventory.get_attack_bonus()
-        defense_bonus = self.game_screen.game_logic.inventory.get_defense_bonus()
-
-        console.print(42, 10, f"Attack Bonus: {attack_bonus:+d}")
-        console.print(42, 11, f"Defense Bonus: {defense_bonus:+d}")
+        for y, line in zip((5, 6, 7, 8, 10, 11), self._equipment_lines, strict=True):
+            console.print(42, y, line)
 
         # ヘルプを表示
         if self.show_help:
@@ -107,6 +90,47 @@ class InventoryScreen(Screen):
             for i, text in enumerate(help_text):
                 console.print(2, console.height - 10 + i, text, (127, 127, 127))
 
+    def _refresh_rows(self) -> None:
+        """インベントリか識別状態が変わっていれば表示行と文字キーの対応を作り直す。"""
+        inventory = self.game_screen.game_logic.inventory
+        identification = self.game_screen.game_logic.player.identification
+        key = (inventory, inventory.version, identification, identification.version)
+        if key == self._rows_key:
+            return
+
+        # 装備スロットは1回の走査でアイテムから引けるようにする
+        slots = {id(item): slot for slot, item in inventory.equipped.items() if item is not None}
+
+        self._item_rows = []
+        self._letter_index = {}
+        for i, item in enumerate(inventory.items):
+            # インデックスを文字に変換（0=a, 1=b, ...）
+            index_char = chr(ord("a") + i)
+            self._letter_index[index_char] = i
+
+            # アイテム情報（識別システムを使用）
+            item_text = f"{index_char}) {item.get_display_name(identification)}"
+            if item.stackable and item.stack_count > 1:
+                item_text += f" (x{item.stack_count})"
+
+            # 装備状態
+            slot = slots.get(id(item))
+            if slot is not None:
+                item_text += SLOT_MARKS.get(slot, " (E)")
+            self._item_rows.append((item_text, slot is not None))
+
+        # 装備品の表示に識別システムを使用（能力値も表示）
+        equipped = inventory.equipped
+        self._equipment_lines = [
+            f"Weapon: {self._get_equipment_info(equipped['weapon'], identification)}",
+            f"Armor: {self._get_equipment_info(equipped['armor'], identification)}",
+            f"Ring(L): {self._get_equipment_info(equipped['ring_left'], identification)}",
+            f"Ring(R): {self._get_equipment_info(equipped['ring_right'], identification)}",
+            f"Attack Bonus: {inventory.get_attack_bonus():+d}",
+            f"Defense Bonus: {inventory.get_defense_bonus():+d}",
+        ]
+        self._rows_key = key
+
     def _get_equipment_info(self, item: Item | None, identification) -> str:
         """
         装備情報を取得して表示用文字列を作成
@@ -163,6 +187,9 @@ class InventoryScreen(Screen):
         """
         from pyrogue.core.game_states import GameStates
 
+        # 選択や所持品、ゲーム状態が変わりうるため入力ごとに再描画する
+        self.version += 1
+
         # 装備解除モードの場合は専用処理
         if self.unequip_mode:
             self._handle_unequip_selection(event)
@@ -219,8 +246,9 @@ class InventoryScreen(Screen):
         if ord("a") <= event.sym <= ord("z"):
             # コマンドキー（u, e, d, r）は除外
             if event.sym not in [ord("u"), ord("e"), ord("d"), ord("r")]:
-                item_index = event.sym - ord("a")
-                if 0 <= item_index < len(self.game_screen.game_logic.inventory.items):
+                self._refresh_rows()
+                item_index = self._letter_index.get(chr(event.sym))
+                if item_index is not None:
                     self.selected_index = item_index
                 return
 
@@ -373,6 +401,7 @@ class InventoryScreen(Screen):
                     else:
                         # インベントリが満杯の場合は再装備
                         self.game_screen.game_logic.inventory.equipped[slot] = unequipped_item
+                        self.game_screen.game_logic.inventory.mark_changed()
                         self.game_screen.game_logic.add_message("Your inventory is full!")
                 else:
                     # 呪われたアイテムの場合
@@ -43,6 +43,8 @@ class MenuScreen:
         self.menu_selection = 0
         self.save_manager = SaveManager()
         self.menu_options = self._get_menu_options()
+        # 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+        self.version = 0
 
     def update_console(self, console: tcod.console.Console) -> None:
         """
@@ -58,6 +60,7 @@ class MenuScreen:
         self.console = console
         # コンソール更新時にメニューオプションも更新
         self.menu_options = self._get_menu_options()
+        self.version += 1
 
     def render(self) -> None:
         """
@@ -171,9 +174,11 @@ class MenuScreen:
         # 上矢印キーで上のオプションへ移動
         if key.sym == tcod.event.KeySym.UP:
             self.menu_selection = (self.menu_selection - 1) % len(self.menu_options)
+            self.version += 1
         # 下矢印キーで下のオプションへ移動
         elif key.sym == tcod.event.KeySym.DOWN:
             self.menu_selection = (self.menu_selection + 1) % len(self.menu_options)
+            self.version += 1
         # Enterキーで選択されたオプションを実行
         elif key.sym == tcod.event.KeySym.RETURN:
             # 新しいゲームを開始
@@ -38,6 +38,8 @@ class QuickGuideScreen:
         """
         self.console = console
         self.engine = engine
+        # 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+        self.version = 0
 
     def update_console(self, console: tcod.console.Console) -> None:
         """
@@ -49,6 +51,7 @@ class QuickGuideScreen:
 
         """
         self.console = console
+        self.version += 1
 
     def render(self) -> None:
         """クイックガイドを描画。"""
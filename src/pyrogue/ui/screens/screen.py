@@ -12,7 +12,15 @@ if TYPE_CHECKING:
 
 
 class Screen:
-    """画面の基本クラス"""
+    """
+    画面の基本クラス
+
+    Attributes
+    ----------
+        engine: メインゲームエンジンのインスタンス
+        version: 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+
+    """
 
     def __init__(self, engine: Engine) -> None:
         """
@@ -24,6 +32,7 @@ class Screen:
 
         """
         self.engine = engine
+        self.version = 0
 
     def render(self, console: Console) -> None:
         """
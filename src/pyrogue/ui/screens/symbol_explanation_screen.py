@@ -41,6 +41,8 @@ class SymbolExplanationScreen:
         self.scroll_y = 0
         self.symbol_content = self._get_symbol_content()
         self.max_scroll = max(0, len(self.symbol_content) - (self.console.height - 6))
+        # 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+        self.version = 0
 
     def update_console(self, console: tcod.console.Console) -> None:
         """
@@ -53,6 +55,8 @@ class SymbolExplanationScreen:
         """
         self.console = console
         self.max_scroll = max(0, len(self.symbol_content) - (self.console.height - 6))
+        self.scroll_y = min(self.scroll_y, self.max_scroll)
+        self.version += 1
 
     def render(self) -> None:
         """シンボル説明スクリーンを描画。"""
@@ -122,6 +126,8 @@ class SymbolExplanationScreen:
             ゲーム状態、またはNone
 
         """
+        previous_scroll = self.scroll_y
+
         # 上矢印キーで上にスクロール
         if key.sym == tcod.event.KeySym.UP:
             self.scroll_y = max(0, self.scroll_y - 1)
@@ -138,6 +144,8 @@ class SymbolExplanationScreen:
         elif key.sym == tcod.event.KeySym.ESCAPE or key.sym == tcod.event.KeySym.SLASH or key.unicode == "/":
             return GameStates.PLAYERS_TURN
 
+        if self.scroll_y != previous_scroll:
+            self.version += 1
         return None
 
     def _get_symbol_content(self) -> list[str]:
@@ -27,16 +27,20 @@ class VictoryScreen:
         self.player_stats: dict[str, int] = {}
         self.final_floor = 26
         self.final_score = 0
+        # 表示内容の版数（表示が変わるたびに増やし、エンジンが再描画の要否を判定する）
+        self.version = 0
 
     def update_console(self, console: tcod.console.Console) -> None:
         """コンソールの更新"""
         self.console = console
+        self.version += 1
 
     def set_victory_data(self, player_stats: dict, final_floor: int, final_score: int) -> None:
         """勝利時のデータを設定"""
         self.player_stats = player_stats.copy()
         self.final_floor = final_floor
         self.final_score = final_score
+        self.version += 1
 
     def calculate_score(self) -> int:
         """最終スコアを計算"""
@@ -125,8 +129,10 @@ class VictoryScreen:
         """入力処理"""
         if key.sym == tcod.event.KeySym.UP:
             self.menu_selection = (self.menu_selection - 1) % len(self.menu_options)
+            self.version += 1
         elif key.sym == tcod.event.KeySym.DOWN:
             self.menu_selection = (self.menu_selection + 1) % len(self.menu_options)
+            self.version += 1
         elif key.sym == tcod.event.KeySym.RETURN:
             if self.menu_options[self.menu_selection] == "Return to Menu":
                 return GameStates.MENU
@@ -1,5 +1,6 @@
 """Utility modules for the game."""
 
+from pyrogue.utils.frame_timer import FrameTimer, frame_timer
 from pyrogue.utils.logger import GameLogger, game_logger
 
-__all__ = ["GameLogger", "game_logger"]
+__all__ = ["FrameTimer", "GameLogger", "frame_timer", "game_logger"]
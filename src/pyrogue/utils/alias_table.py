@@ -0,0 +1,136 @@
+"""
+エイリアステーブルモジュール。
+
+このモジュールは、重み付き抽選をWalker/Voseのエイリアス法で行うテーブルを提供します。
+テーブルは一度だけ構築し、以降の抽選は要素数に関係なくO(1)で行えます。
+まとめて抽選する場合はNumPyで一括計算します。
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+class AliasTable[T]:
+    """
+    エイリアス法による重み付き抽選テーブル。
+
+    各スロットは「自分の要素を選ぶ確率」と「外れた場合の代替要素」を持ち、
+    一様なスロット選択と1回の比較で抽選します。
+
+    Attributes
+    ----------
+        items: 抽選対象の要素（登録順）
+        weights: 各要素の重み
+        probabilities: 各スロットで自分の要素を選ぶ確率
+        aliases: 各スロットの代替要素のインデックス
+
+    """
+
+    def __init__(self, entries: Iterable[tuple[T, float]]) -> None:
+        """
+        (要素, 重み) の列からテーブルを構築。
+
+        Args:
+        ----
+            entries: 要素と重みのペアの列
+
+        Raises:
+        ------
+            ValueError: 要素がない場合、または重みの合計が正でない場合
+
+        """
+        pairs = list(entries)
+        self.items: list[T] = [item for item, _ in pairs]
+        self.weights = np.array([weight for _, weight in pairs], dtype=np.float64)
+
+        size = len(self.items)
+        total = float(self.weights.sum()) if size else 0.0
+        if size == 0 or total <= 0.0 or (self.weights < 0).any():
+            raise ValueError("AliasTable requires at least one entry with a positive total weight")
+
+        # Voseのアルゴリズム: 平均1に正規化した重みを小さい側と大きい側に分けて対にする
+        scaled = self.weights * (size / total)
+        self.probabilities = np.ones(size, dtype=np.float64)
+        self.aliases = np.arange(size, dtype=np.int64)
+
+        small = [i for i in range(size) if scaled[i] < 1.0]
+        large = [i for i in range(size) if scaled[i] >= 1.0]
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            if scaled[more] < 1.0:
+                small.append(more)
+            else:
+                large.append(more)
+        # 残りは丸め誤差のみなので確率1のまま
+
+    def __len__(self) -> int:
+        """要素の数。"""
+        return len(self.items)
+
+    def sample(self, rng: random.Random | None = None) -> T:
+        """
+        要素を1つ抽選。
+
+        Args:
+        ----
+            rng: 乱数生成器（Noneの場合はrandomモジュール）
+
+        Returns:
+        -------
+            抽選された要素
+
+        """
+        source = rng if rng is not None else random
+        slot = source.randrange(len(self.items))
+        if source.random() < self.probabilities[slot]:
+            return self.items[slot]
+        return self.items[self.aliases[slot]]
+
+    def sample_indices(self, count: int, rng: np.random.Generator | None = None) -> np.ndarray:
+        """
+        要素のインデックスをまとめて抽選。
+
+        Args:
+        ----
+            count: 抽選する数
+            rng: NumPyの乱数生成器（Noneの場合はrandomモジュールからシードを取得）
+
+        Returns:
+        -------
+            抽選された要素のインデックスのint64配列
+
+        """
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        slots = rng.integers(0, len(self.items), size=count)
+        keep = rng.random(count) < self.probabilities[slots]
+        return np.where(keep, slots, self.aliases[slots])
+
+    def sample_many(self, count: int, rng: np.random.Generator | None = None) -> list[T]:
+        """
+        要素をまとめて抽選。
+
+        Args:
+        ----
+            count: 抽選する数
+            rng: NumPyの乱数生成器（Noneの場合はrandomモジュールからシードを取得）
+
+        Returns:
+        -------
+            抽選された要素のリスト
+
+        """
+        if count <= 0:
+            return []
+        return [self.items[i] for i in self.sample_indices(count, rng).tolist()]
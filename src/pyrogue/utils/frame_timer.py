@@ -0,0 +1,248 @@
+"""
+フレーム・ターン計測モジュール。
+
+このモジュールは、入力処理・ターン処理の各段階・FOV更新・描画の各層などを
+名前付きの区間として計測するタイマーを提供します。計測結果は固定長の
+リングバッファに保持し、ウィザードモードのオーバーレイ表示や
+Chromeのトレースイベント形式（chrome://tracing, Perfetto）への
+書き出しに使用します。無効時の区間は何もしない共有オブジェクトを返すため、
+計測箇所のコストはメソッド呼び出し1回分だけです。
+
+Example:
+-------
+    >>> timer = FrameTimer()
+    >>> timer.enable()
+    >>> with timer.scope("fov"):
+    ...     pass
+    >>> timer.summary()["fov"].count
+    1
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pyrogue.config.env import get_profile_timing
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+# 計測無効時に返す共有の区間（何もしない）
+_NULL_SCOPE = nullcontext()
+
+# 1区間の記録: (区間名, 開始時刻[ns], 所要時間[ns], 入れ子の深さ)
+type Span = tuple[str, int, int, int]
+
+
+class SpanStats:
+    """
+    区間名ごとの集計結果。
+
+    Attributes
+    ----------
+        count: 記録数
+        last_ms: 最新の所要時間（ミリ秒）
+        mean_ms: 平均所要時間（ミリ秒）
+        max_ms: 最大所要時間（ミリ秒）
+
+    """
+
+    __slots__ = ("count", "last_ms", "max_ms", "mean_ms")
+
+    def __init__(self, count: int, last_ms: float, mean_ms: float, max_ms: float) -> None:
+        """
+        集計結果を初期化。
+
+        Args:
+        ----
+            count: 記録数
+            last_ms: 最新の所要時間（ミリ秒）
+            mean_ms: 平均所要時間（ミリ秒）
+            max_ms: 最大所要時間（ミリ秒）
+
+        """
+        self.count = count
+        self.last_ms = last_ms
+        self.mean_ms = mean_ms
+        self.max_ms = max_ms
+
+
+class _Scope:
+    """有効時に1区間を計測するコンテキストマネージャー。"""
+
+    __slots__ = ("depth", "name", "start", "timer")
+
+    def __init__(self, timer: FrameTimer, name: str) -> None:
+        self.timer = timer
+        self.name = name
+        self.start = 0
+        self.depth = 0
+
+    def __enter__(self) -> None:
+        self.depth = self.timer.depth
+        self.timer.depth += 1
+        self.start = time.perf_counter_ns()
+
+    def __exit__(self, *exc_info: object) -> None:
+        duration = time.perf_counter_ns() - self.start
+        self.timer.depth -= 1
+        self.timer.spans.append((self.name, self.start, duration, self.depth))
+
+
+class FrameTimer:
+    """
+    名前付き区間の計測結果をリングバッファに保持するタイマー。
+
+    Attributes
+    ----------
+        enabled: 計測が有効かどうか
+        show_overlay: ウィザードモードで計測結果を画面に表示するかどうか
+        spans: 計測した区間のリングバッファ（古いものから順）
+        depth: 計測中の区間の入れ子の深さ
+
+    """
+
+    # リングバッファに保持する区間数の既定値
+    DEFAULT_CAPACITY = 4096
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, enabled: bool = False) -> None:
+        """
+        タイマーを初期化。
+
+        Args:
+        ----
+            capacity: リングバッファに保持する区間数
+            enabled: 計測を有効にするかどうか
+
+        """
+        self.enabled = enabled
+        self.show_overlay = False
+        self.spans: deque[Span] = deque(maxlen=capacity)
+        self.depth = 0
+
+    def enable(self) -> None:
+        """計測を有効にする。"""
+        self.enabled = True
+
+    def disable(self) -> None:
+        """計測を無効にする（記録済みの区間は保持する）。"""
+        self.enabled = False
+
+    def clear(self) -> None:
+        """記録済みの区間を破棄。"""
+        self.spans.clear()
+
+    def scope(self, name: str) -> AbstractContextManager[None]:
+        """
+        区間を計測するコンテキストマネージャーを取得。
+
+        Args:
+        ----
+            name: 区間名
+
+        Returns:
+        -------
+            有効時は計測する区間、無効時は何もしない共有の区間
+
+        """
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def summary(self) -> dict[str, SpanStats]:
+        """
+        リングバッファ内の区間を区間名ごとに集計。
+
+        Returns
+        -------
+            区間名から集計結果への辞書（最初に記録された順）
+
+        """
+        durations: dict[str, list[int]] = {}
+        for name, _, duration, _ in self.spans:
+            durations.setdefault(name, []).append(duration)
+
+        return {
+            name: SpanStats(
+                count=len(values),
+                last_ms=values[-1] / 1e6,
+                mean_ms=sum(values) / len(values) / 1e6,
+                max_ms=max(values) / 1e6,
+            )
+            for name, values in durations.items()
+        }
+
+    def overlay_lines(self, limit: int = 12) -> list[str]:
+        """
+        オーバーレイに表示する行を作成。
+
+        Args:
+        ----
+            limit: 表示する区間名の最大数（平均所要時間の長い順）
+
+        Returns:
+        -------
+            表示行のリスト（1行目は見出し）
+
+        """
+        stats = sorted(self.summary().items(), key=lambda item: item[1].mean_ms, reverse=True)[:limit]
+        width = max((len(name) for name, _ in stats), default=0)
+        lines = [f"{'span':<{width}}   last   mean    max (ms)"]
+        lines.extend(
+            f"{name:<{width}} {stat.last_ms:6.2f} {stat.mean_ms:6.2f} {stat.max_ms:6.2f}" for name, stat in stats
+        )
+        return lines
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        記録済みの区間をChromeのトレースイベント形式に変換。
+
+        Returns
+        -------
+            "traceEvents" を持つ辞書（時刻はマイクロ秒）
+
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": name,
+                "cat": name.split(".", 1)[0],
+                "ph": "X",
+                "ts": start / 1e3,
+                "dur": duration / 1e3,
+                "pid": pid,
+                "tid": 0,
+                "args": {"depth": depth},
+            }
+            for name, start, duration, depth in self.spans
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> Path:
+        """
+        記録済みの区間をChromeのトレースイベント形式のJSONファイルに書き出す。
+
+        Args:
+        ----
+            path: 書き出し先のファイルパス
+
+        Returns:
+        -------
+            書き出したファイルのパス
+
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+        return path
+
+
+# ゲーム全体で共有するタイマー（PROFILE_TIMING=true で起動時から計測）
+frame_timer = FrameTimer(enabled=get_profile_timing())
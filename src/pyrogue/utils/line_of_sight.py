@@ -0,0 +1,199 @@
+"""
+視線判定テーブルモジュール。
+
+このモジュールは、モンスターからプレイヤーへの視線判定を高速化するための
+事前計算済みレイテーブルと、プレイヤー中心の視線マップを提供します。
+視線の判定はブレゼンハム線分（get_line_points）と同一の経路で行われます。
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+from pyrogue.utils.coordinate_utils import get_line_points
+
+
+@lru_cache(maxsize=8)
+def build_ray_table(radius: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    オフセットごとのレイテーブルを構築。
+
+    プレイヤーからの相対位置 (ox, oy) にいる観測者から
+    プレイヤーへ引いたブレゼンハム線分の中間点を、
+    (2r+1, 2r+1, r) の配列に格納します。
+
+    Args:
+    ----
+        radius: テーブルがカバーする最大距離（チェビシェフ距離）
+
+    Returns:
+    -------
+        (中間点のX配列, 中間点のY配列, 有効フラグ配列)。
+        座標はウィンドウ配列のインデックス（0〜2r）に変換済み
+
+    """
+    size = radius * 2 + 1
+    depth = max(radius - 1, 1)
+    ray_x = np.full((size, size, depth), radius, dtype=np.intp)
+    ray_y = np.full((size, size, depth), radius, dtype=np.intp)
+    valid = np.zeros((size, size, depth), dtype=bool)
+
+    for oy in range(-radius, radius + 1):
+        for ox in range(-radius, radius + 1):
+            points = get_line_points(ox, oy, 0, 0)[1:-1]
+            for i, (px, py) in enumerate(points):
+                ray_x[oy + radius, ox + radius, i] = px + radius
+                ray_y[oy + radius, ox + radius, i] = py + radius
+                valid[oy + radius, ox + radius, i] = True
+
+    for array in (ray_x, ray_y, valid):
+        array.setflags(write=False)
+    return ray_x, ray_y, valid
+
+
+def build_transparency_window(tiles: np.ndarray, center_x: int, center_y: int, radius: int) -> np.ndarray:
+    """
+    指定座標を中心としたウィンドウの透過マスクを構築。
+
+    マップ範囲外は透過扱いとします（has_line_of_sightと同じ扱い）。
+
+    Args:
+    ----
+        tiles: ダンジョンタイルの2次元配列
+        center_x: 中心のX座標
+        center_y: 中心のY座標
+        radius: ウィンドウの半径
+
+    Returns:
+    -------
+        (2r+1, 2r+1) のブール配列
+
+    """
+    size = radius * 2 + 1
+    window = np.ones((size, size), dtype=bool)
+    height, width = tiles.shape
+
+    x0, x1 = max(0, center_x - radius), min(width, center_x + radius + 1)
+    y0, y1 = max(0, center_y - radius), min(height, center_y + radius + 1)
+    if x0 >= x1 or y0 >= y1:
+        return window
+
+    region = tiles[y0:y1, x0:x1]
+    transparent = np.fromiter(
+        (getattr(tile, "transparent", True) for tile in region.flat),
+        dtype=bool,
+        count=region.size,
+    ).reshape(region.shape)
+
+    wx0 = x0 - (center_x - radius)
+    wy0 = y0 - (center_y - radius)
+    window[wy0 : wy0 + transparent.shape[0], wx0 : wx0 + transparent.shape[1]] = transparent
+    return window
+
+
+class PlayerSightMap:
+    """
+    プレイヤー中心の視線マップ。
+
+    ターンごとに一度だけプレイヤー周辺の透過マスクとレイテーブルから
+    「各オフセットからプレイヤーが見えるか」を一括計算し、
+    個々のモンスターの視線判定を配列参照のみで行えるようにします。
+
+    Attributes
+    ----------
+        radius: マップがカバーする最大距離
+        origin: 計算時のプレイヤー座標（未計算の場合はNone）
+
+    """
+
+    def __init__(self, radius: int = 8) -> None:
+        """
+        視線マップを初期化。
+
+        Args:
+        ----
+            radius: マップがカバーする最大距離
+
+        """
+        self.radius = radius
+        self.origin: tuple[int, int] | None = None
+        self._tiles: np.ndarray | None = None
+        self._sight = np.zeros((radius * 2 + 1, radius * 2 + 1), dtype=bool)
+
+    def invalidate(self) -> None:
+        """計算結果を破棄（次回参照時に再計算）。"""
+        self.origin = None
+        self._tiles = None
+
+    def is_current(self, tiles: np.ndarray, x: int, y: int) -> bool:
+        """
+        指定フロア・プレイヤー座標に対して計算済みかチェック。
+
+        Args:
+        ----
+            tiles: ダンジョンタイルの2次元配列
+            x: プレイヤーのX座標
+            y: プレイヤーのY座標
+
+        Returns:
+        -------
+            計算済みの場合True
+
+        """
+        return self.origin == (x, y) and self._tiles is tiles
+
+    def covers(self, sight_range: float) -> bool:
+        """
+        指定の視界範囲をこのマップでカバーできるかチェック。
+
+        Args:
+        ----
+            sight_range: 視界範囲
+
+        Returns:
+        -------
+            カバーできる場合True
+
+        """
+        return sight_range <= self.radius
+
+    def update(self, tiles: np.ndarray, x: int, y: int) -> None:
+        """
+        プレイヤー座標を中心に視線マップを再計算。
+
+        Args:
+        ----
+            tiles: ダンジョンタイルの2次元配列
+            x: プレイヤーのX座標
+            y: プレイヤーのY座標
+
+        """
+        ray_x, ray_y, valid = build_ray_table(self.radius)
+        window = build_transparency_window(tiles, x, y, self.radius)
+        np.all(window[ray_y, ray_x] | ~valid, axis=2, out=self._sight)
+        self.origin = (x, y)
+        self._tiles = tiles
+
+    def can_see_player_from(self, x: int, y: int) -> bool:
+        """
+        指定座標からプレイヤーへの視線が通っているかチェック。
+
+        Args:
+        ----
+            x: 観測者のX座標
+            y: 観測者のY座標
+
+        Returns:
+        -------
+            視線が通っている場合True（マップ範囲外はFalse）
+
+        """
+        if self.origin is None:
+            return False
+        ox = x - self.origin[0] + self.radius
+        oy = y - self.origin[1] + self.radius
+        if not (0 <= ox < self._sight.shape[1] and 0 <= oy < self._sight.shape[0]):
+            return False
+        return bool(self._sight[oy, ox])
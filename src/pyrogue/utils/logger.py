@@ -1,29 +1,125 @@
 """
 ゲーム用ログ設定モジュール。
 
-このモジュールは、PyRogueゲームの包括的なログシステムを提供します。
-JSON形式のログ、ファイルローテーション、カスタムログレベル、
-NumPyオブジェクトのシリアル化などの機能を提供します。
+このモジュールは、PyRogueゲームのログシステムを提供します。
+ログレベルの判定はメッセージの組み立て前に行い、%形式の引数や
+メッセージを返す関数は出力が有効な場合だけ評価します。
+ファイルへの書き込みはキュー経由で別スレッドのリスナーが行うため、
+ゲームループがディスクI/Oで止まることはありません。
+LOG_JSON=true の場合は機械処理用のJSON Lines形式のログも出力します。
 
 Example:
 -------
     >>> from pyrogue.utils import game_logger
-    >>> game_logger.info("Game started", {"player": "test"})
-    >>> game_logger.error("Critical error", {"error_code": 500})
+    >>> game_logger.info("Game started", extra={"player": "test"})
+    >>> game_logger.debug("Turn %d processed", 42)
+    >>> game_logger.debug(lambda: f"Expensive state: {compute_state()}")
 
 """
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+from collections.abc import Callable
+from datetime import UTC, datetime
 from pathlib import Path
 
-from pyrogue.config.env import get_debug_mode, get_log_directory, get_log_level
+from pyrogue.config.env import get_debug_mode, get_log_directory, get_log_json, get_log_level
+
+# メッセージとして渡せる値（関数は出力が有効な場合だけ呼び出す）
+type LogMessage = str | Callable[[], str]
+
+# LogRecordに付加する構造化データの属性名
+EXTRA_ATTR = "pyrogue_extra"
+
+
+class TextFormatter(logging.Formatter):
+    """構造化データを " - {...}" としてメッセージの後ろに付ける書式。"""
+
+    def formatMessage(self, record: logging.LogRecord) -> str:  # noqa: N802
+        """メッセージを書式化し、構造化データがあれば後ろに付ける。"""
+        text = super().formatMessage(record)
+        extra = getattr(record, EXTRA_ATTR, None)
+        return f"{text} - {extra}" if extra else text
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """1レコードを1行のJSONオブジェクトにする書式。"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """レコードをJSONオブジェクト1行に変換。"""
+        entry = {
+            "time": datetime.fromtimestamp(record.created, tz=UTC).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        extra = getattr(record, EXTRA_ATTR, None)
+        if extra:
+            entry["extra"] = extra
+        # キュー経由のレコードは例外情報が文字列（exc_text）になっている
+        exception = self.formatException(record.exc_info) if record.exc_info else record.exc_text
+        if exception:
+            entry["exception"] = exception
+        # NumPyの値などJSONにできないものは文字列にする
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _PreparedQueueHandler(logging.handlers.QueueHandler):
+    """
+    %形式の引数だけを展開してキューに入れるハンドラー。
+
+    標準のQueueHandlerはメッセージを書式済みの文字列に置き換えるため、
+    リスナー側の書式（テキストとJSON）を使い分けられるよう
+    書式化はリスナーに任せます。
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _create_handlers(debug_mode: bool) -> list[logging.Handler]:
+    """ファイル出力（と必要に応じてコンソール・JSON Lines出力）のハンドラーを作成。"""
+    # Create logs directory from environment variable
+    log_dir = Path(get_log_directory())
+    log_dir.mkdir(parents=True, exist_ok=True)
+
+    formatter = TextFormatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handler = logging.FileHandler(log_dir / "game.log", encoding="utf-8")
+    handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [handler]
+
+    # Structured output for machine analysis
+    if get_log_json():
+        json_handler = logging.FileHandler(log_dir / "game.jsonl", encoding="utf-8")
+        json_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(json_handler)
+
+    # Add console handler for debug mode
+    if debug_mode:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+
+    return handlers
 
 
 def setup_game_logger() -> logging.Logger:
     """
-    シンプルなゲームロガーを設定。
+    ゲームロガーを設定。
+
+    ロガーにはキューへ入れるだけのハンドラーを付け、実際の出力は
+    バックグラウンドのリスナースレッドが行います。リスナーは
+    プロセス終了時に残りのレコードを書き出してから停止します。
 
     Returns
     -------
@@ -55,54 +151,82 @@ def setup_game_logger() -> logging.Logger:
     else:
         logger.setLevel(logging.DEBUG if debug_mode else logging.INFO)
 
-    # Create logs directory from environment variable
-    log_dir = Path(get_log_directory())
-    log_dir.mkdir(parents=True, exist_ok=True)
-
-    # Simple file handler
-    handler = logging.FileHandler(log_dir / "game.log", encoding="utf-8")
-    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
-    # Add console handler for debug mode
-    if debug_mode:
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+    # File I/O happens on the listener thread, not the game thread
+    records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *_create_handlers(debug_mode), respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(_PreparedQueueHandler(records))
 
     return logger
 
 
 class GameLogger:
     """
-    簡素化されたゲームロガークラス。
+    ゲームロガークラス。
 
     標準のloggingライブラリをベースにしたシンプルなインターフェースです。
+    各メソッドは最初にログレベルを判定し、出力されない場合は
+    メッセージの組み立て（%形式の展開・関数の呼び出し・extraの文字列化）を
+    一切行いません。
+
+    Attributes
+    ----------
+        logger: 出力先の標準ロガー
+
     """
 
-    def __init__(self) -> None:
-        self.logger = setup_game_logger()
+    def __init__(self, logger: logging.Logger | None = None) -> None:
+        """
+        ゲームロガーを初期化。
+
+        Args:
+        ----
+            logger: 出力先の標準ロガー（Noneの場合はゲーム用に設定したロガー）
+
+        """
+        self.logger = logger or setup_game_logger()
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        指定レベルのログが出力されるかを判定。
+
+        Args:
+        ----
+            level: ログレベル（logging.DEBUG など）
+
+        Returns:
+        -------
+            出力される場合はTrue
+
+        """
+        return self.logger.isEnabledFor(level)
 
-    def debug(self, message: str, extra: dict | None = None) -> None:
+    def debug(self, message: LogMessage, *args: object, extra: dict | None = None) -> None:
         """DEBUGレベルのメッセージをログ出力。"""
-        extra_str = f" - {extra}" if extra else ""
-        self.logger.debug(f"{message}{extra_str}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, message, args, extra)
 
-    def info(self, message: str, extra: dict | None = None) -> None:
+    def info(self, message: LogMessage, *args: object, extra: dict | None = None) -> None:
         """INFOレベルのメッセージをログ出力。"""
-        extra_str = f" - {extra}" if extra else ""
-        self.logger.info(f"{message}{extra_str}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, message, args, extra)
 
-    def warning(self, message: str, extra: dict | None = None) -> None:
+    def warning(self, message: LogMessage, *args: object, extra: dict | None = None) -> None:
         """WARNINGレベルのメッセージをログ出力。"""
-        extra_str = f" - {extra}" if extra else ""
-        self.logger.warning(f"{message}{extra_str}")
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, message, args, extra)
 
-    def error(self, message: str, extra: dict | None = None) -> None:
+    def error(self, message: LogMessage, *args: object, extra: dict | None = None) -> None:
         """ERRORレベルのメッセージをログ出力。"""
-        extra_str = f" - {extra}" if extra else ""
-        self.logger.error(f"{message}{extra_str}")
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, message, args, extra)
+
+    def _log(self, level: int, message: LogMessage, args: tuple[object, ...], extra: dict | None) -> None:
+        """出力が有効なレベルのメッセージを組み立てて標準ロガーに渡す。"""
+        if callable(message):
+            message = message()
+        self.logger.log(level, message, *args, extra={EXTRA_ATTR: extra} if extra else None, stacklevel=3)
 
 
 # Create a singleton instance
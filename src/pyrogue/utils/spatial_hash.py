@@ -0,0 +1,225 @@
+"""
+空間ハッシュモジュール。
+
+このモジュールは、一様グリッドによる空間ハッシュを提供します。
+エンティティをセル単位のバケットに登録し、周辺検索を
+近傍セルのエンティティ数に比例したコストで行えるようにします。
+"""
+
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+
+class DistanceMetric(Enum):
+    """範囲検索に使用する距離の種類。"""
+
+    CHEBYSHEV = auto()  # max(|dx|, |dy|)（8方向移動の歩数）
+    MANHATTAN = auto()  # |dx| + |dy|
+    EUCLIDEAN = auto()  # sqrt(dx^2 + dy^2)
+
+
+def within_distance(dx: int, dy: int, radius: float, metric: DistanceMetric) -> bool:
+    """
+    相対座標が指定距離以内かチェック。
+
+    Args:
+    ----
+        dx: X方向の差
+        dy: Y方向の差
+        radius: 検索半径
+        metric: 距離の種類
+
+    Returns:
+    -------
+        距離以内の場合True
+
+    """
+    if metric == DistanceMetric.CHEBYSHEV:
+        return max(abs(dx), abs(dy)) <= radius
+    if metric == DistanceMetric.MANHATTAN:
+        return abs(dx) + abs(dy) <= radius
+    return dx * dx + dy * dy <= radius * radius
+
+
+class SpatialHash[T]:
+    """
+    一様グリッドの空間ハッシュ。
+
+    エンティティは同一性（is）で管理され、位置の変更は
+    move() で通知する必要があります。
+
+    Attributes
+    ----------
+        cell_size: 1バケットがカバーするマス数（一辺）
+
+    """
+
+    def __init__(self, cell_size: int = 8) -> None:
+        """
+        空間ハッシュを初期化。
+
+        Args:
+        ----
+            cell_size: 1バケットがカバーするマス数（一辺）
+
+        """
+        self.cell_size = cell_size
+        self._cells: dict[tuple[int, int], dict[T, tuple[int, int]]] = {}
+        self._positions: dict[T, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        """登録されているエンティティ数。"""
+        return len(self._positions)
+
+    def __contains__(self, entity: object) -> bool:
+        """エンティティが登録されているかチェック。"""
+        return entity in self._positions
+
+    def _cell_of(self, x: int, y: int) -> tuple[int, int]:
+        return (x // self.cell_size, y // self.cell_size)
+
+    def insert(self, entity: T, x: int, y: int) -> None:
+        """
+        エンティティを登録（登録済みの場合は位置を更新）。
+
+        Args:
+        ----
+            entity: 登録するエンティティ
+            x: X座標
+            y: Y座標
+
+        """
+        if entity in self._positions:
+            self.move(entity, x, y)
+            return
+        self._positions[entity] = (x, y)
+        self._cells.setdefault(self._cell_of(x, y), {})[entity] = (x, y)
+
+    def remove(self, entity: T) -> None:
+        """
+        エンティティの登録を解除（未登録の場合は何もしない）。
+
+        Args:
+        ----
+            entity: 解除するエンティティ
+
+        """
+        position = self._positions.pop(entity, None)
+        if position is None:
+            return
+        cell = self._cell_of(*position)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(entity, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def move(self, entity: T, x: int, y: int) -> None:
+        """
+        エンティティの位置を更新（未登録の場合は登録）。
+
+        Args:
+        ----
+            entity: 移動したエンティティ
+            x: 新しいX座標
+            y: 新しいY座標
+
+        """
+        old_position = self._positions.get(entity)
+        if old_position is None:
+            self.insert(entity, x, y)
+            return
+
+        old_cell = self._cell_of(*old_position)
+        new_cell = self._cell_of(x, y)
+        self._positions[entity] = (x, y)
+        if old_cell == new_cell:
+            self._cells[old_cell][entity] = (x, y)
+            return
+
+        bucket = self._cells[old_cell]
+        del bucket[entity]
+        if not bucket:
+            del self._cells[old_cell]
+        self._cells.setdefault(new_cell, {})[entity] = (x, y)
+
+    def rebuild(self, entities: Iterable[T]) -> None:
+        """
+        全エンティティを登録し直す。
+
+        Args:
+        ----
+            entities: x, y 属性を持つエンティティの列
+
+        """
+        self.clear()
+        for entity in entities:
+            self.insert(entity, entity.x, entity.y)
+
+    def clear(self) -> None:
+        """全ての登録を解除。"""
+        self._cells.clear()
+        self._positions.clear()
+
+    def at(self, x: int, y: int) -> Iterator[T]:
+        """
+        指定座標にいるエンティティを列挙。
+
+        Args:
+        ----
+            x: X座標
+            y: Y座標
+
+        Yields:
+        ------
+            座標が一致するエンティティ
+
+        """
+        bucket = self._cells.get(self._cell_of(x, y))
+        if not bucket:
+            return
+        for entity, position in bucket.items():
+            if position == (x, y):
+                yield entity
+
+    def query(
+        self,
+        x: int,
+        y: int,
+        radius: float,
+        metric: DistanceMetric = DistanceMetric.CHEBYSHEV,
+    ) -> list[T]:
+        """
+        指定座標から一定距離内のエンティティを取得。
+
+        Args:
+        ----
+            x: 中心のX座標
+            y: 中心のY座標
+            radius: 検索半径
+            metric: 距離の種類
+
+        Returns:
+        -------
+            範囲内のエンティティのリスト
+
+        """
+        reach = int(radius)
+        min_cx, min_cy = self._cell_of(x - reach, y - reach)
+        max_cx, max_cy = self._cell_of(x + reach, y + reach)
+
+        results: list[T] = []
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = self._cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for entity, (ex, ey) in bucket.items():
+                    if within_distance(ex - x, ey - y, radius, metric):
+                        results.append(entity)
+        return results
@@ -0,0 +1,213 @@
+"""
+起動時間プロファイラーモジュール。
+
+このモジュールは、起動から最初の画面表示までの時間を、モジュールの
+インポート時間と初期化段階ごとの時間に分けて計測するツールを提供します。
+インポート時間は sys.meta_path に計測用のファインダーを追加して
+各モジュールのローダーを包むことで計測します（`--startup-profile` 指定時のみ）。
+
+Example:
+-------
+    >>> profiler = StartupProfiler()
+    >>> profiler.install()
+    >>> with profiler.phase("engine_init"):
+    ...     import json
+    >>> profiler.uninstall()
+
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, TextIO
+
+from pyrogue.utils import game_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator, Sequence
+    from importlib.machinery import ModuleSpec
+    from types import ModuleType
+
+
+class StartupProfiler:
+    """
+    インポート時間と初期化段階の時間を記録するプロファイラー。
+
+    Attributes
+    ----------
+        start_time: 計測開始時刻
+        imports: モジュール名から [累積時間, 自身の時間]（秒）への辞書
+        phases: 初期化段階ごとの (名前, 開始からの経過時間, 所要時間)（秒）
+        marks: 目印ごとの (名前, 開始からの経過時間)（秒）
+
+    """
+
+    def __init__(self) -> None:
+        """プロファイラーを初期化（この時点を計測開始とする）。"""
+        self.start_time = time.perf_counter()
+        self.imports: dict[str, list[float]] = {}
+        self.phases: list[tuple[str, float, float]] = []
+        self.marks: list[tuple[str, float]] = []
+        self._finder: _ImportTimingFinder | None = None
+        # 計測中のインポート: [モジュール名, 開始時刻, 子モジュールの累積時間]
+        self._stack: list[list[Any]] = []
+
+    def install(self) -> None:
+        """インポート時間の計測を開始。"""
+        if self._finder is None:
+            self._finder = _ImportTimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def uninstall(self) -> None:
+        """インポート時間の計測を終了。"""
+        if self._finder is not None:
+            if self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    @contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+        """
+        初期化段階を計測するコンテキストマネージャー。
+
+        Args:
+        ----
+            name: 段階名
+
+        Yields:
+        ------
+            None
+
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            self.phases.append((name, start - self.start_time, end - start))
+
+    def mark(self, name: str) -> None:
+        """
+        計測開始からの経過時間を目印として記録。
+
+        Args:
+        ----
+            name: 目印の名前
+
+        """
+        self.marks.append((name, time.perf_counter() - self.start_time))
+
+    def measure_import(self, name: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        モジュールの読み込み処理を実行して時間を記録。
+
+        Args:
+        ----
+            name: モジュール名
+            func: 読み込み処理（ローダーの create_module / exec_module）
+            *args: 読み込み処理の引数
+
+        Returns:
+        -------
+            読み込み処理の戻り値
+
+        """
+        frame = [name, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return func(*args)
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            record = self.imports.setdefault(name, [0.0, 0.0])
+            record[0] += elapsed
+            record[1] += elapsed - frame[2]
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    def format_report(self, limit: int = 25) -> str:
+        """
+        計測結果のレポートを作成。
+
+        Args:
+        ----
+            limit: 表示するモジュールの最大数（累積時間の長い順）
+
+        Returns:
+        -------
+            レポート文字列
+
+        """
+        lines = ["Startup profile (ms)"]
+        if self.phases or self.marks:
+            lines.append("  phases:")
+            lines.extend(
+                f"    {name:<28} {duration * 1000:9.1f}  (at {offset * 1000:.1f})"
+                for name, offset, duration in self.phases
+            )
+            lines.extend(f"    {name:<28} {'':>9}  (at {offset * 1000:.1f})" for name, offset in self.marks)
+
+        if self.imports:
+            total = sum(self_time for _, self_time in self.imports.values())
+            lines.append(f"  imports: {len(self.imports)} modules, {total * 1000:.1f} ms")
+            lines.append(f"    {'cumulative':>10} {'self':>8}  module")
+            ranked = sorted(self.imports.items(), key=lambda item: item[1][0], reverse=True)[:limit]
+            lines.extend(
+                f"    {cumulative * 1000:10.1f} {self_time * 1000:8.1f}  {name}"
+                for name, (cumulative, self_time) in ranked
+            )
+        return "\n".join(lines)
+
+    def report(self, file: TextIO | None = None) -> None:
+        """
+        インポート時間の計測を終了し、レポートを出力してログに記録。
+
+        Args:
+        ----
+            file: 出力先（Noneの場合は標準エラー出力）
+
+        """
+        self.uninstall()
+        text = self.format_report()
+        print(text, file=file or sys.stderr)
+        game_logger.info(text)
+
+
+class _ImportTimingFinder:
+    """他のファインダーが見つけたモジュールのローダーを計測用に包むファインダー。"""
+
+    def __init__(self, profiler: StartupProfiler) -> None:
+        self.profiler = profiler
+
+    def find_spec(
+        self, fullname: str, path: Sequence[str] | None, target: ModuleType | None = None
+    ) -> ModuleSpec | None:
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self.profiler, fullname)
+                return spec
+        return None
+
+
+class _TimedLoader:
+    """モジュールの作成と実行の時間を記録するローダーのラッパー。"""
+
+    def __init__(self, loader: Any, profiler: StartupProfiler, name: str) -> None:
+        self._loader = loader
+        self._profiler = profiler
+        self._name = name
+
+    def create_module(self, spec: ModuleSpec) -> ModuleType | None:
+        return self._profiler.measure_import(self._name, self._loader.create_module, spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        self._profiler.measure_import(self._name, self._loader.exec_module, module)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
@@ -0,0 +1,63 @@
+"""
+モンスターAIベンチマークのテストモジュール。
+
+ベンチマークが決定的に再現でき、レポートに
+パーセンタイルとフェーズ別内訳が含まれることを確認します。
+"""
+
+import json
+
+from ai_benchmark import PHASES, AIBenchmark, main, phase_totals, run_benchmarks
+
+from pyrogue.utils import FrameTimer, frame_timer
+
+
+class TestAIBenchmark:
+    """ベンチマークハーネスのテスト。"""
+
+    def test_same_seed_replays_identically(self):
+        """同じシードなら同じ最終状態になる。"""
+        first = AIBenchmark(30, seed=7).run(turns=10, warmup=0)
+        second = AIBenchmark(30, seed=7).run(turns=10, warmup=0)
+
+        assert first["state_checksum"] == second["state_checksum"]
+        assert first["final_monsters"] == second["final_monsters"]
+
+    def test_report_contains_percentiles_and_phases(self):
+        """レポートにパーセンタイルとフェーズ別内訳が含まれる。"""
+        report = run_benchmarks([10, 50], turns=5, seed=1, warmup=1)
+
+        assert [scenario["monsters"] for scenario in report["scenarios"]] == [10, 50]
+        scenario = report["scenarios"][0]
+        assert scenario["turns"] == 5
+        assert set(scenario["latency_ms"]) >= {"p50", "p95", "p99", "max"}
+        assert set(scenario["phases_ms"]) == {*PHASES, "other"}
+
+    def test_phase_totals_count_nested_spans_exclusively(self):
+        """入れ子の区間の時間は内側のフェーズにのみ計上される。"""
+        timer = FrameTimer(enabled=True)
+        with timer.scope("ai.pathing"), timer.scope("ai.movement"):
+            sum(range(10000))
+
+        totals = phase_totals(timer.spans)
+        (_, _, outer, _), (_, _, inner, _) = timer.spans[1], timer.spans[0]
+        assert totals["movement"] == inner / 1e9
+        assert totals["pathing"] == (outer - inner) / 1e9
+        assert totals["status"] == 0.0
+
+    def test_run_restores_shared_timer(self):
+        """計測後は共有タイマーの状態が元に戻る。"""
+        enabled, spans = frame_timer.enabled, frame_timer.spans
+        AIBenchmark(10, seed=3).run(turns=2, warmup=0)
+
+        assert frame_timer.spans is spans
+        assert frame_timer.enabled == enabled
+
+    def test_main_writes_json(self, tmp_path, capsys):
+        """コマンドラインからJSONレポートを出力できる。"""
+        output = tmp_path / "bench.json"
+        main(["--monsters", "10", "--turns", "3", "--warmup", "0", "--output", str(output)])
+
+        report = json.loads(output.read_text(encoding="utf-8"))
+        assert report["benchmark"] == "monster_ai"
+        assert "monster AI benchmark" in capsys.readouterr().out
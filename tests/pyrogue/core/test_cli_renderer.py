@@ -0,0 +1,107 @@
+"""
+CLI出力レンダラーのテストモジュール。
+
+textモードでは従来どおり全てを出力し、quiet / json モードでは
+変化したセクションだけを1コマンド1回の書き込みで出力することを確認します。
+"""
+
+import io
+import json
+
+import pytest
+
+from pyrogue.core.cli_engine import CLIEngine
+from pyrogue.core.cli_renderer import CLIRenderer
+
+
+class CountingStream(io.StringIO):
+    """書き込み回数を数える出力先。"""
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, text):
+        self.writes += 1
+        return super().write(text)
+
+
+class TestCLIRenderer:
+    """CLI出力レンダラーのテスト。"""
+
+    def test_text_mode_always_renders(self):
+        """textモードでは同じ内容でも毎回出力し、1回の書き込みにまとめる。"""
+        stream = CountingStream()
+        renderer = CLIRenderer(stream=stream)
+
+        for _ in range(2):
+            renderer.write("Moved north", verbose=True)
+            renderer.section("state", ["HP: 12/12"], title="=" * 5)
+            renderer.section("enemies", [], title="Nearby enemies:")
+            renderer.flush("look")
+
+        assert stream.getvalue() == "Moved north\n\n=====\nHP: 12/12\n" * 2
+        assert stream.writes == 2
+
+    def test_quiet_mode_renders_changes_only(self):
+        """quietモードでは変化したセクションだけを出力し、空になったことも伝える。"""
+        stream = CountingStream()
+        renderer = CLIRenderer("quiet", stream)
+
+        renderer.write("verbose", verbose=True)
+        renderer.section("state", ["HP: 12/12"])
+        renderer.section("enemies", ["  Bat at (1, 2)"], title="Nearby enemies:")
+        renderer.flush("look")
+        renderer.section("state", ["HP: 12/12"])
+        renderer.section("enemies", ["  Bat at (1, 2)"], title="Nearby enemies:")
+        renderer.flush("look")
+        renderer.section("enemies", [], title="Nearby enemies:")
+        renderer.flush("look")
+
+        assert stream.getvalue() == "HP: 12/12\n\nNearby enemies:\n  Bat at (1, 2)\n\nNearby enemies:\n  (none)\n"
+        assert stream.writes == 2
+
+    def test_unknown_mode(self):
+        """未知の出力モードはエラーになる。"""
+        with pytest.raises(ValueError, match="Unknown output mode"):
+            CLIRenderer("xml")
+
+
+class TestCLIEngineOutput:
+    """CLIエンジンの出力のテスト。"""
+
+    @pytest.fixture
+    def engine(self, tmp_path, monkeypatch):
+        """JSONで出力するCLIエンジン（セーブ先は一時ディレクトリ）。"""
+        (tmp_path / ".pyrogue").mkdir()
+        monkeypatch.setenv("HOME", str(tmp_path))
+        engine = CLIEngine("json", io.StringIO())
+        engine.game_logic.setup_new_game()
+        return engine
+
+    def run_command(self, engine, command):
+        """コマンドを実行して出力されたJSONオブジェクトを返す。"""
+        engine.renderer.stream.seek(0)
+        engine.renderer.stream.truncate()
+        engine.process_command(command)
+        engine.renderer.flush(command, engine.last_command_ok)
+        return json.loads(engine.renderer.stream.getvalue())
+
+    def test_json_reports_changed_sections(self, engine):
+        """最初のlookは全セクションを返し、変化がなければ何も返さない。"""
+        first = self.run_command(engine, "look")
+        player = engine.game_logic.player
+        assert first["ok"] is True
+        assert f"Player: ({player.x}, {player.y})" in first["changed"]["state"]
+        assert len(first["changed"]["surroundings"]) == 8
+
+        assert self.run_command(engine, "look") == {"command": "look", "ok": True}
+
+        player.hp -= 1
+        status = self.run_command(engine, "status")
+        assert f"HP: {player.hp}/{player.max_hp}" in status["changed"]["status"]
+        assert "state" not in status["changed"]
+
+        unknown = self.run_command(engine, "dance")
+        assert unknown["ok"] is False
+        assert unknown["output"] == ["Unknown command: dance"]
@@ -11,6 +11,7 @@ from unittest.mock import Mock, patch
 from pyrogue.core.managers.game_context import GameContext
 from pyrogue.core.managers.monster_ai_manager import MonsterAIManager
 from pyrogue.entities.actors.monster import Monster
+from pyrogue.entities.actors.monster_spawner import MonsterSpawner
 from pyrogue.entities.actors.player import Player
 
 
@@ -27,9 +28,7 @@ class TestDiverseMonsterAI:
 
         # フロアデータのモック
         self.floor_data = Mock()
-        self.floor_data.monster_spawner = Mock()
-        self.floor_data.monster_spawner.monsters = []
-        self.floor_data.monster_spawner.occupied_positions = set()
+        self.floor_data.monster_spawner = MonsterSpawner(1)
         self.context.get_current_floor_data = Mock(return_value=self.floor_data)
 
         self.ai_manager = MonsterAIManager()
@@ -0,0 +1,97 @@
+"""
+エンジンの再描画判定のテストモジュール。
+
+表示内容が変わらないイベントでは描画・転送を行わず、まとめて届いた
+キー入力は1回の描画にまとめられることを確認します。
+"""
+
+import pytest
+import tcod.event
+
+from pyrogue.core.engine import Engine
+from pyrogue.core.game_states import GameStates
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """ウィンドウを開かずに転送回数を数えるエンジン（セーブ先は一時ディレクトリ）。"""
+    (tmp_path / ".pyrogue").mkdir()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    engine = Engine()
+    engine.context = FakeContext()
+    return engine
+
+
+class FakeContext:
+    """転送回数を数えるコンテキスト。"""
+
+    def __init__(self):
+        self.presented = 0
+
+    def present(self, console):
+        self.presented += 1
+
+
+def key(sym):
+    """キー押下イベントを作成。"""
+    return tcod.event.KeyDown(scancode=tcod.event.Scancode.UNKNOWN, sym=sym, mod=tcod.event.Modifier.NONE)
+
+
+def run_with_events(engine, batches, monkeypatch):
+    """イベントのまとまりを順に渡してメインループを実行し、最後に終了する。"""
+    pending = [*batches, [tcod.event.Quit()]]
+    timeouts = []
+
+    def fake_wait(timeout=None):
+        timeouts.append(timeout)
+        return iter(pending.pop(0))
+
+    monkeypatch.setattr(tcod.event, "wait", fake_wait)
+    engine.run()
+    return timeouts
+
+
+class TestEngineRedraw:
+    """再描画判定のテスト。"""
+
+    def test_idle_events_do_not_redraw(self, engine, monkeypatch):
+        """マウス移動や変化のない入力待ちでは描き直さない。"""
+        timeouts = run_with_events(engine, [[tcod.event.MouseMotion()], [], [tcod.event.MouseMotion()]], monkeypatch)
+
+        assert engine.frame_count == 1
+        assert engine.context.presented == 1
+        assert timeouts == [None, None, None, None]
+
+    def test_key_burst_is_coalesced(self, engine, monkeypatch):
+        """まとめて届いたキー入力は1回の描画になり、画面の版数が進む。"""
+        version = engine.menu_screen.version
+
+        run_with_events(engine, [[key(tcod.event.KeySym.DOWN)] * 5, [tcod.event.MouseMotion()]], monkeypatch)
+
+        assert engine.state == GameStates.MENU
+        assert engine.menu_screen.version > version
+        assert engine.frame_count == 2
+        assert engine.context.presented == 2
+
+    def test_exposed_window_is_presented_without_render(self, engine, monkeypatch):
+        """ウィンドウの再表示では描画済みの内容を転送し直すだけ。"""
+        exposed = tcod.event.WindowEvent(type="WindowExposed", window_id=0, data=(0, 0))
+        run_with_events(engine, [[exposed]], monkeypatch)
+
+        assert engine.frame_count == 1
+        assert engine.context.presented == 2
+
+    def test_screens_are_created_on_first_use(self, engine):
+        """画面は初回アクセス時に作成され、作成済みの画面だけがリサイズで更新される。"""
+        assert "game_screen" not in engine.__dict__
+        assert "menu_screen" not in engine.__dict__
+
+        menu = engine.menu_screen
+        assert engine.menu_screen is menu
+        assert "game_screen" not in engine.__dict__
+
+        engine.font_width = engine.font_height = 10
+        engine.handle_resize(tcod.event.WindowResized(type="WindowResized", window_id=0, data=(1000, 700)))
+        assert menu.console is engine.console
+        assert "game_screen" not in engine.__dict__
+        assert engine.victory_screen.console is engine.console
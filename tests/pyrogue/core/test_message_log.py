@@ -0,0 +1,70 @@
+"""
+メッセージログのテストモジュール。
+
+リングバッファの容量制限、連続する同じメッセージのまとめ、
+圧縮アーカイブ、折り返し行のキャッシュ、セーブデータの往復を確認します。
+"""
+
+import pickle
+
+from pyrogue.core.message_log import MessageLog
+
+
+class TestMessageLog:
+    """メッセージログのテスト。"""
+
+    def test_ring_buffer_and_deduplication(self):
+        """容量を超えると古いものから押し出し、連続する同じメッセージはまとめる。"""
+        log = MessageLog(["a", "b"], capacity=3)
+        log.append("You hit the bat.")
+        log.append("You hit the bat.")
+        log.append("You hit the bat.")
+
+        assert len(log) == 3
+        assert log[-1] == "You hit the bat. (x3)"
+        assert log[-2:] == ["b", "You hit the bat. (x3)"]
+
+        log.append("c")
+        assert log.copy() == ["b", "You hit the bat. (x3)", "c"]
+        # アーカイブ無効時は押し出したメッセージを保持しない
+        assert log.history() == log.copy()
+
+    def test_archive_keeps_full_history(self):
+        """アーカイブ有効時は押し出したメッセージも履歴に残る。"""
+        log = MessageLog(capacity=5, archive=True)
+        log.ARCHIVE_CHUNK_SIZE = 4
+        messages = [f"message {i}" for i in range(23)]
+        log.extend(messages)
+
+        assert log.copy() == messages[-5:]
+        assert log.history() == messages
+        assert len(log._archive_chunks) == 4
+
+        log.clear()
+        assert not log
+        assert log.history() == []
+
+    def test_wrapped_lines_are_cached(self):
+        """折り返し行は最新の行から数え、ログが変わるまで同じ結果を返す。"""
+        log = MessageLog(["first", "x" * 25, "line one\nline two"])
+
+        lines = log.wrapped_lines(10, 4)
+        assert lines == ("xxxxxxxxxx", "xxxxx", "line one", "line two")
+        assert log.wrapped_lines(10, 4) is lines
+
+        log.append("last")
+        assert log.wrapped_lines(10, 2) == ("line two", "last")
+
+    def test_save_data_round_trip(self):
+        """セーブデータから回数とアーカイブを含めて復元でき、旧形式のリストも読める。"""
+        log = MessageLog(capacity=3, archive=True)
+        log.ARCHIVE_CHUNK_SIZE = 2
+        log.extend(["a", "b", "c", "c", "d", "e", "f"])
+
+        restored = MessageLog(capacity=3, archive=True)
+        restored.load_save_data(pickle.loads(pickle.dumps(log.to_save_data())))
+        assert restored.copy() == log.copy()
+        assert restored.history() == log.history() == ["a", "b", "c (x2)", "d", "e", "f"]
+
+        restored.load_save_data(["x", "x"])
+        assert restored.copy() == ["x", "x"]
@@ -0,0 +1,50 @@
+"""
+PathfindingManager（経路探索）のテストモジュール。
+
+開始位置の周囲のウィンドウ内で壁を回り込む経路が見つかること、
+最大探索距離より遠い目標では探索しないことを確認します。
+"""
+
+from itertools import pairwise
+from unittest.mock import Mock
+
+import numpy as np
+
+from pyrogue.core.managers.pathfinding_manager import PathfindingManager
+from pyrogue.map.tile import Floor, Wall
+
+
+def _make_context(width: int, height: int, walls: list[tuple[int, int]]) -> Mock:
+    tiles = np.full((height, width), Floor.shared(), dtype=object)
+    tiles[0, :] = tiles[-1, :] = tiles[:, 0] = tiles[:, -1] = Wall.shared()
+    for x, y in walls:
+        tiles[y, x] = Wall.shared()
+
+    context = Mock()
+    context.get_current_floor_data = Mock(return_value=Mock(tiles=tiles))
+    return context
+
+
+class TestPathfindingManager:
+    """経路探索のテスト。"""
+
+    def test_path_routes_around_wall(self):
+        """壁を回り込む経路を開始位置から目標位置まで返し、結果をキャッシュする。"""
+        context = _make_context(300, 200, [(150, y) for y in range(95, 106)])
+        manager = PathfindingManager()
+
+        path = manager.find_path(147, 100, 153, 100, context)
+        assert path[0] == (147, 100)
+        assert path[-1] == (153, 100)
+        assert all(x != 150 or not 95 <= y <= 105 for x, y in path)
+        assert all(max(abs(x2 - x1), abs(y2 - y1)) == 1 for (x1, y1), (x2, y2) in pairwise(path))
+        assert manager.get_cache_size() == 1
+
+    def test_unreachable_or_distant_target(self):
+        """到達できない目標や最大探索距離より遠い目標では経路を返さない。"""
+        context = _make_context(60, 40, [(x, 10) for x in range(60)])
+        manager = PathfindingManager()
+
+        assert manager.find_path(5, 5, 5, 15, context) is None
+        assert manager.find_path(5, 20, 40, 20, context) is None
+        assert manager.get_cache_size() == 0
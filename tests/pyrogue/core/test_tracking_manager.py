@@ -0,0 +1,146 @@
+"""
+TrackingManager（匂い・フローフィールド追跡）のテストモジュール。
+
+フローフィールドが壁を回り込む経路を示し、目標位置の周囲だけで計算されること、
+目標位置ごとに保持されドアの開閉で作り直されること、
+匂いの痕跡が新しい方向へ辿れること、匂いが時間で薄れることを確認します。
+"""
+
+from unittest.mock import Mock
+
+import numpy as np
+
+from pyrogue.core.managers.tracking_manager import FLOW_FIELD_CACHE_SIZE, FLOW_FIELD_RADIUS, TrackingManager
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
+from pyrogue.map.tile import Door, Floor, Wall
+
+
+def _make_context(layout: list[str]) -> Mock:
+    tiles = np.empty((len(layout), len(layout[0])), dtype=object)
+    floor, wall = Floor(), Wall()
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            if char == "+":
+                tiles[y, x] = Door()
+            else:
+                tiles[y, x] = wall if char == "#" else floor
+
+    context = Mock()
+    context.get_current_floor_data = Mock(return_value=Mock(tiles=tiles, floor_number=1))
+    context.player = Mock(x=0, y=0)
+    return context
+
+
+class TestTrackingManager:
+    """追跡マップのテスト。"""
+
+    def test_flow_field_routes_around_wall(self):
+        """直線方向が壁で塞がっている場合は回り込む方向を示す。"""
+        context = _make_context(
+            [
+                "#######",
+                "#.....#",
+                "#.###.#",
+                "#.#.#.#",
+                "#.....#",
+                "#######",
+            ]
+        )
+        manager = TrackingManager()
+
+        # (3,3) から (3,1) へは真上が壁なので、下へ回り込む
+        steps = manager.get_flow_step(context, 3, 3, (3, 1))
+        assert steps
+        assert all(dy == 1 for _, dy in steps)
+
+    def test_flow_field_shared_between_calls(self):
+        """同じ目標ならフローフィールドは再計算されない。"""
+        context = _make_context(["#####", "#...#", "#...#", "#####"])
+        manager = TrackingManager()
+
+        manager.get_flow_step(context, 1, 1, (3, 2))
+        floor_map = manager.get_floor_map(context.get_current_floor_data())
+        distances = floor_map.flow_distances
+
+        manager.get_flow_step(context, 2, 1, (3, 2))
+        assert floor_map.flow_distances is distances
+
+    def test_flow_field_covers_window_around_target(self):
+        """フローフィールドは目標位置の周囲だけで計算し、範囲外では候補を返さない。"""
+        context = _make_context(["#" + "." * 98 + "#"] * 3)
+        manager = TrackingManager()
+
+        steps = manager.get_flow_step(context, 30, 1, (10, 1))
+        assert steps
+        assert all(dx == -1 for dx, _ in steps)
+        floor_map = manager.get_floor_map(context.get_current_floor_data())
+        assert floor_map.flow_distances.shape == (3, 10 + FLOW_FIELD_RADIUS + 1)
+        assert manager.get_flow_step(context, 60, 1, (10, 1)) == []
+
+    def test_flow_fields_cached_per_target(self):
+        """目標位置が入れ替わっても、保持しているフローフィールドを使い回す。"""
+        context = _make_context(["#" * 22, "#" + "." * 20 + "#", "#" * 22])
+        manager = TrackingManager()
+
+        manager.get_flow_step(context, 4, 1, (1, 1))
+        floor_map = manager.get_floor_map(context.get_current_floor_data())
+        to_left = floor_map.flow_distances
+        manager.get_flow_step(context, 4, 1, (20, 1))
+        to_right = floor_map.flow_distances
+
+        assert manager.get_flow_step(context, 4, 1, (1, 1)) == [(-1, 0)]
+        assert floor_map.flow_distances is to_left
+        assert manager.get_flow_step(context, 4, 1, (20, 1)) == [(1, 0)]
+        assert floor_map.flow_distances is to_right
+
+        # 使われていない目標位置から順に破棄される
+        for x in range(2, 1 + FLOW_FIELD_CACHE_SIZE):
+            manager.get_flow_step(context, 4, 1, (x, 1))
+        manager.get_flow_step(context, 4, 1, (20, 1))
+        assert floor_map.flow_distances is to_right
+        manager.get_flow_step(context, 4, 1, (1, 1))
+        assert floor_map.flow_distances is not to_left
+
+    def test_flow_field_recomputed_after_door_toggle(self):
+        """ドアの開閉をタイルバッファに記録すると、フローフィールドを作り直す。"""
+        context = _make_context(["#######", "#..+..#", "#######"])
+        floor_data = context.get_current_floor_data()
+        floor_data.tile_buffer = TileBuffer(7, 3, tiles=floor_data.tiles)
+        manager = TrackingManager()
+
+        assert manager.get_flow_step(context, 1, 1, (5, 1)) == []
+
+        floor_data.tiles[1, 3].toggle()
+        floor_data.tile_buffer.mark_dirty(floor_data.tiles, 3, 1)
+        assert manager.get_flow_step(context, 1, 1, (5, 1)) == [(1, 0)]
+
+    def test_scent_step_follows_freshest_trail(self):
+        """匂いの新しい方向へ進む候補が先頭になる。"""
+        context = _make_context(["#######", "#.....#", "#######"])
+        manager = TrackingManager()
+
+        for x in range(1, 6):
+            context.player.x, context.player.y = x, 1
+            manager.record_player_position(context)
+
+        assert manager.get_scent_step(context, 3, 1)[0] == (1, 0)
+        # 最新の位置では辿る先がない
+        assert manager.get_scent_step(context, 5, 1) == []
+
+    def test_scent_decays_over_time(self):
+        """匂いの強さは経過ターンに応じて弱まり、やがて消える。"""
+        context = _make_context(["#####", "#...#", "#####"])
+        manager = TrackingManager(scent_duration=5)
+
+        context.player.x, context.player.y = 1, 1
+        manager.record_player_position(context)
+        assert manager.get_scent_strength(context, 1, 1) == 5
+
+        context.player.x = 3
+        for _ in range(3):
+            manager.record_player_position(context)
+        assert manager.get_scent_strength(context, 1, 1) == 2
+
+        for _ in range(3):
+            manager.record_player_position(context)
+        assert manager.get_scent_strength(context, 1, 1) == 0
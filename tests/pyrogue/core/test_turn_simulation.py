@@ -0,0 +1,112 @@
+"""
+TurnManager.simulate（複数ターン一括処理）のテストモジュール。
+
+休憩などの連続行動がイベント駆動で中断され、
+HP回復が一括で適用されることを確認します。
+"""
+
+from pyrogue.constants import HungerConstants
+from pyrogue.core.game_logic import GameLogic
+from pyrogue.core.managers.turn_manager import TurnInterrupt
+
+
+class TestTurnSimulation:
+    """複数ターン一括処理のテスト。"""
+
+    def setup_method(self):
+        """各テストメソッドの前に呼ばれるセットアップ。"""
+        self.game_logic = GameLogic()
+        self.game_logic.setup_new_game()
+        self.player = self.game_logic.player
+
+        # モンスターのいない状態で検証する
+        floor_data = self.game_logic.get_current_floor_data()
+        floor_data.monster_spawner.monsters.clear()
+        floor_data.monster_spawner.occupied_positions.clear()
+
+    def test_rest_until_full_hp(self):
+        """HPが全回復した時点で一括処理が停止する。"""
+        self.player.hp = self.player.max_hp - 5
+        self.player.hunger = HungerConstants.CONTENT_THRESHOLD + 10
+        start_turn = self.game_logic.turn_manager.turn_count
+
+        result = self.game_logic.simulate_turns(
+            100,
+            stop_conditions={TurnInterrupt.FULL_HP},
+            hp_regen_interval=2,
+        )
+
+        assert result.interrupt == TurnInterrupt.FULL_HP
+        assert self.player.hp == self.player.max_hp
+        assert result.hp_recovered == 5
+        assert result.turns <= 10
+        assert self.game_logic.turn_manager.turn_count == start_turn + result.turns
+
+    def test_runs_all_turns_without_stop_conditions(self):
+        """中断条件がない場合は指定ターン数だけ進む。"""
+        self.player.hunger = HungerConstants.MAX_HUNGER
+
+        result = self.game_logic.simulate_turns(10, stop_conditions=set())
+
+        assert result.turns == 10
+        assert not result.interrupted
+
+    def test_monster_already_nearby_interrupts_immediately(self):
+        """開始時に監視範囲内にモンスターがいる場合はターンを進めない。"""
+        from pyrogue.entities.actors.monster import Monster
+
+        floor_data = self.game_logic.get_current_floor_data()
+        monster = Monster(
+            char="B",
+            x=self.player.x + 1,
+            y=self.player.y,
+            name="Bat",
+            level=1,
+            hp=5,
+            max_hp=5,
+            attack=1,
+            defense=0,
+            exp_value=1,
+            view_range=5,
+            color=(255, 255, 255),
+        )
+        floor_data.monster_spawner.monsters.append(monster)
+        start_turn = self.game_logic.turn_manager.turn_count
+
+        result = self.game_logic.simulate_turns(50)
+
+        assert result.turns == 0
+        assert result.interrupt == TurnInterrupt.MONSTER_IN_VIEW
+        assert self.game_logic.turn_manager.turn_count == start_turn
+
+    def test_monster_move_event_interrupts(self):
+        """監視範囲内へのモンスター移動通知で一括処理が中断される。"""
+        ai_manager = self.game_logic.monster_ai_manager
+        player = self.player
+
+        def fake_process_all_monsters(context):
+            listener = ai_manager._behavior_manager._move_listener
+            if listener and self.game_logic.turn_manager.turn_count >= 3:
+                listener(None, player.x + 2, player.y)
+
+        ai_manager.process_all_monsters = fake_process_all_monsters
+        start_turn = self.game_logic.turn_manager.turn_count
+
+        result = self.game_logic.simulate_turns(50, stop_conditions={TurnInterrupt.MONSTER_IN_VIEW})
+
+        assert result.interrupt == TurnInterrupt.MONSTER_IN_VIEW
+        assert result.turns == 3 - start_turn
+        # 一括処理終了後は通知先が解除される
+        assert ai_manager._behavior_manager._move_listener is None
+
+    def test_hunger_threshold_interrupts(self):
+        """満腹度の段階変化で一括処理が中断される。"""
+        self.player.hunger = HungerConstants.HUNGRY_THRESHOLD
+
+        result = self.game_logic.simulate_turns(
+            HungerConstants.HUNGER_DECREASE_INTERVAL * 3,
+            stop_conditions={TurnInterrupt.HUNGER_THRESHOLD},
+        )
+
+        assert result.interrupt == TurnInterrupt.HUNGER_THRESHOLD
+        assert self.player.hunger == HungerConstants.HUNGRY_THRESHOLD - 1
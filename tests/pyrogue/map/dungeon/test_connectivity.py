@@ -0,0 +1,88 @@
+"""
+連結成分ラベリングのテストモジュール。
+
+スキャンライン方式のラベリングがフラッドフィルと同じ成分分けになること、
+サイズ・外接矩形・最近点の問い合わせが正しいことを確認します。
+"""
+
+from collections import deque
+
+import numpy as np
+
+from pyrogue.map.dungeon.connectivity import BACKGROUND, label_components
+
+
+def _flood_fill_components(mask: np.ndarray) -> list[set[tuple[int, int]]]:
+    height, width = mask.shape
+    seen = np.zeros_like(mask)
+    components = []
+    for y in range(height):
+        for x in range(width):
+            if not mask[y, x] or seen[y, x]:
+                continue
+            component = set()
+            queue = deque([(x, y)])
+            seen[y, x] = True
+            while queue:
+                cx, cy = queue.popleft()
+                component.add((cx, cy))
+                for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+                    nx, ny = cx + dx, cy + dy
+                    if 0 <= nx < width and 0 <= ny < height and mask[ny, nx] and not seen[ny, nx]:
+                        seen[ny, nx] = True
+                        queue.append((nx, ny))
+            components.append(component)
+    return components
+
+
+class TestConnectivity:
+    """連結成分ラベリングのテスト。"""
+
+    def test_matches_flood_fill(self):
+        """ランダムなマスクでフラッドフィルと同じ成分分けになる。"""
+        rng = np.random.default_rng(11)
+        mask = rng.random((30, 50)) < 0.55
+
+        result = label_components(mask)
+        expected = _flood_fill_components(mask)
+
+        assert result.count == len(expected)
+        for component in expected:
+            labels = {result.label_at(x, y) for x, y in component}
+            assert len(labels) == 1
+            label = labels.pop()
+            assert result.sizes[label] == len(component)
+            assert set(result.points(label)) == component
+
+    def test_u_shape_is_single_component(self):
+        """下で繋がるU字形は1つの成分になる（後から合流するラン）。"""
+        mask = np.zeros((4, 5), dtype=bool)
+        mask[0:3, 0] = mask[0:3, 4] = True
+        mask[3, :] = True
+
+        result = label_components(mask)
+
+        assert result.count == 1
+        assert result.connected((0, 0), (4, 0))
+        assert tuple(result.bounding_boxes[1]) == (0, 0, 4, 3)
+
+    def test_largest_and_nearest_points(self):
+        """最大成分と成分間の最近点を取得できる。"""
+        mask = np.zeros((5, 12), dtype=bool)
+        mask[1, 1:4] = True  # 小さい成分
+        mask[1:4, 7:11] = True  # 大きい成分
+
+        result = label_components(mask)
+        small, large = result.label_at(1, 1), result.label_at(7, 1)
+
+        assert result.largest() == large
+        assert result.nearest_points(small, large) == ((3, 1), (7, 1), 4)
+        assert result.nearest_point(large, 0, 4) == ((7, 3), 8)
+        assert result.label_at(5, 1) == BACKGROUND
+        assert not result.connected((1, 1), (7, 1))
+
+    def test_empty_mask(self):
+        """歩行可能マスがない場合は成分なし。"""
+        result = label_components(np.zeros((3, 3), dtype=bool))
+        assert result.count == 0
+        assert result.largest() == BACKGROUND
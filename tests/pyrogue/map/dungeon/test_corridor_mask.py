@@ -0,0 +1,76 @@
+"""
+通路マスクのテストモジュール。
+
+通路マスクによるドア候補の抽出が従来の通路リスト走査と同じ結果・順序になること、
+境界の再強化が通路を残して床を壁に戻すことを確認します。
+"""
+
+import random
+
+import numpy as np
+
+from pyrogue.map.dungeon.corridor_builder import Corridor, CorridorBuilder
+from pyrogue.map.dungeon.corridor_mask import NO_CORRIDOR, CorridorMask
+from pyrogue.map.dungeon.director import DungeonDirector
+from pyrogue.map.dungeon.door_manager import DoorManager
+from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.tile import Floor, Wall
+
+
+def _reference_connections(room: Room, corridors: list[Corridor]) -> list[tuple[int, int]]:
+    door_positions = []
+    for corridor in corridors:
+        for corridor_x, corridor_y in corridor.points:
+            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
+                if (corridor_x + dx, corridor_y + dy) in room.inner:
+                    if (corridor_x, corridor_y) not in door_positions:
+                        door_positions.append((corridor_x, corridor_y))
+                    break
+    return door_positions
+
+
+class TestCorridorMask:
+    """通路マスクのテスト。"""
+
+    def test_first_corridor_wins(self):
+        """重なったマスは最初の通路のIDと掘削順を保持する。"""
+        corridor_mask = CorridorMask(10, 5)
+        corridor_mask.add_points([(1, 1), (2, 1), (3, 1)])
+        corridor_mask.add_points([(3, 1), (3, 2)])
+
+        assert corridor_mask.corridor_id_at(3, 1) == 0
+        assert corridor_mask.corridor_id_at(3, 2) == 1
+        assert corridor_mask.corridor_id_at(0, 0) == NO_CORRIDOR
+        assert corridor_mask.order[2, 3] == 3
+        assert not corridor_mask.contains(-1, 1)
+
+    def test_door_candidates_match_list_scan(self):
+        """ドア候補が従来の走査と同じ座標・順序になる。"""
+        random.seed(3)
+        rooms = [
+            Room(x=2, y=2, width=8, height=6, id=1),
+            Room(x=20, y=3, width=9, height=7, id=2),
+            Room(x=8, y=14, width=10, height=6, id=3),
+        ]
+        tiles = np.full((24, 40), Wall(), dtype=object)
+        builder = CorridorBuilder(40, 24)
+        corridors = builder.connect_rooms_rogue_style(rooms, tiles)
+        manager = DoorManager()
+
+        for room in rooms:
+            expected = _reference_connections(room, corridors)
+            assert manager._find_corridor_to_room_connections(room, builder.corridor_mask) == expected
+
+    def test_reinforce_keeps_corridors(self):
+        """境界の再強化は通路以外の床だけを壁に戻す。"""
+        director = DungeonDirector(20, 12, floor=1)
+        director.rooms = [Room(x=2, y=2, width=6, height=5, id=1)]
+        director.tiles[2:7, 2:8] = [[Floor() for _ in range(6)] for _ in range(5)]
+        director.corridor_mask.add_points([(7, 4), (8, 4), (9, 4)])
+
+        director._reinforce_room_boundaries()
+
+        assert isinstance(director.tiles[2, 2], Wall)
+        assert isinstance(director.tiles[6, 5], Wall)
+        assert isinstance(director.tiles[4, 7], Floor)
+        assert isinstance(director.tiles[4, 4], Floor)
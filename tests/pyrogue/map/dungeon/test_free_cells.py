@@ -0,0 +1,76 @@
+"""
+空きマスサンプラーのテストモジュール。
+
+非復元抽出、占有・解放による集合の維持、スポナーでの利用を確認します。
+"""
+
+import random
+
+import numpy as np
+
+from pyrogue.entities.actors.monster_spawner import MonsterSpawner
+from pyrogue.entities.items.item_spawner import ItemSpawner
+from pyrogue.map.dungeon.free_cells import FreeCellSampler
+from pyrogue.map.tile import Floor, Wall
+
+
+def _maze_tiles() -> np.ndarray:
+    tiles = np.empty((12, 20), dtype=object)
+    tiles[:] = [[Wall() for _ in range(20)] for _ in range(12)]
+    for x in range(1, 19):
+        tiles[5, x] = Floor()
+    for y in range(1, 11):
+        tiles[y, 9] = Floor()
+    return tiles
+
+
+class TestFreeCellSampler:
+    """空きマスサンプラーのテスト。"""
+
+    def test_sampling_without_replacement(self):
+        """抽出したマスは重複せず、全て配置可能マスになる。"""
+        mask = np.zeros((6, 8), dtype=bool)
+        mask[1:5, 2:6] = True
+        sampler = FreeCellSampler(mask, occupied=[(2, 1), (0, 0)], rng=random.Random(7))
+
+        assert len(sampler) == 15
+        positions = sampler.sample_many(100)
+
+        assert len(positions) == 15
+        assert len(set(positions)) == 15
+        assert all(mask[y, x] for x, y in positions)
+        assert (2, 1) not in positions
+        assert sampler.sample() is None
+
+    def test_occupy_and_release(self):
+        """占有したマスは候補から外れ、解放すると戻る。"""
+        mask = np.ones((3, 3), dtype=bool)
+        mask[1, 1] = False
+        sampler = FreeCellSampler(mask)
+
+        assert sampler.occupy(0, 0)
+        assert not sampler.occupy(0, 0)
+        assert not sampler.contains(0, 0)
+        assert not sampler.release(1, 1)
+        assert sampler.release(0, 0)
+        assert sampler.contains(0, 0)
+        assert sorted(sampler.positions()) == sorted((x, y) for y in range(3) for x in range(3) if (x, y) != (1, 1))
+
+    def test_spawners_use_free_cells(self):
+        """部屋のない階層でモンスターとアイテムが重複せず床に配置される。"""
+        random.seed(11)
+        tiles = _maze_tiles()
+
+        monster_spawner = MonsterSpawner(dungeon_level=3)
+        monster_spawner.spawn_monsters(tiles, [])
+        monster_positions = [(m.x, m.y) for m in monster_spawner.monsters]
+        assert monster_positions
+        assert len(set(monster_positions)) == len(monster_positions)
+        assert all(isinstance(tiles[y, x], Floor) for x, y in monster_positions)
+
+        item_spawner = ItemSpawner(floor=3)
+        item_spawner.spawn_items(tiles, [])
+        item_positions = [(item.x, item.y) for item in item_spawner.items]
+        assert len(set(item_positions)) == len(item_positions)
+        assert all(tiles[y, x].walkable for x, y in item_positions)
+        assert item_spawner.free_cells is None
@@ -0,0 +1,85 @@
+"""
+グリッド演算カーネルのテストモジュール。
+
+NumPyカーネルが従来のループ実装と同じ結果を返すこと、
+行き止まり除去が固定点まで進むことを確認します。
+"""
+
+import numpy as np
+
+from pyrogue.map.dungeon.grid_kernels import (
+    cellular_automata_step,
+    count_neighbors,
+    prune_dead_ends,
+    tile_mask,
+    write_tiles,
+)
+from pyrogue.map.tile import Floor, Wall
+
+
+def _reference_ca(wall: np.ndarray) -> np.ndarray:
+    height, width = wall.shape
+    result = wall.copy()
+    for y in range(1, height - 1):
+        for x in range(1, width - 1):
+            count = sum(wall[y + dy, x + dx] for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx)
+            if wall[y, x] and count < 4:
+                result[y, x] = False
+            elif not wall[y, x] and count > 6:
+                result[y, x] = True
+    return result
+
+
+def _dead_ends(floor: np.ndarray) -> np.ndarray:
+    counts = count_neighbors(floor, diagonal=False)
+    dead = floor & (counts == 1)
+    dead[0, :] = dead[-1, :] = dead[:, 0] = dead[:, -1] = False
+    return dead
+
+
+class TestGridKernels:
+    """グリッド演算カーネルのテスト。"""
+
+    def test_cellular_automata_matches_loop(self):
+        """セルラーオートマタが従来のループ実装と一致する。"""
+        rng = np.random.default_rng(5)
+        wall = rng.random((25, 40)) < 0.55
+        assert np.array_equal(cellular_automata_step(wall), _reference_ca(wall))
+
+    def test_count_neighbors_orthogonal(self):
+        """4近傍の隣接数を数える。"""
+        mask = np.zeros((3, 3), dtype=bool)
+        mask[0, 1] = mask[1, 0] = mask[2, 2] = True
+        counts = count_neighbors(mask, diagonal=False)
+        assert counts[1, 1] == 2
+        assert count_neighbors(mask)[1, 1] == 3
+
+    def test_prune_dead_ends_reaches_fixed_point(self):
+        """除去率1.0では行き止まりが残らず、ループは保持される。"""
+        floor = np.zeros((9, 11), dtype=bool)
+        floor[2:7, 2] = floor[2:7, 6] = True  # ループの縦辺
+        floor[2, 2:7] = floor[6, 2:7] = True  # ループの横辺
+        floor[4, 7:10] = True  # ループから伸びる行き止まり
+
+        pruned = prune_dead_ends(floor, 1.0, np.random.default_rng(0))
+
+        assert not _dead_ends(pruned).any()
+        assert not pruned[4, 7:10].any()
+        assert np.array_equal(pruned[2:7, 2:7], floor[2:7, 2:7])
+
+    def test_prune_dead_ends_zero_rate_keeps_floor(self):
+        """除去率0では何も変化しない。"""
+        rng = np.random.default_rng(1)
+        floor = rng.random((15, 20)) < 0.5
+        assert np.array_equal(prune_dead_ends(floor, 0.0, rng), floor)
+
+    def test_write_tiles_creates_distinct_instances(self):
+        """一括書き込みはマスごとに別のタイルを生成する。"""
+        tiles = np.empty((3, 3), dtype=object)
+        tiles[:] = [[Wall() for _ in range(3)] for _ in range(3)]
+        mask = np.zeros((3, 3), dtype=bool)
+        mask[1, :] = True
+
+        assert write_tiles(tiles, mask, Floor) == 3
+        assert np.array_equal(tile_mask(tiles, Floor), mask)
+        assert tiles[1, 0] is not tiles[1, 1]
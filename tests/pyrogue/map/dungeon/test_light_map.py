@@ -0,0 +1,62 @@
+"""
+明暗ラスターのテストモジュール。
+
+ラスターの問い合わせが従来の部屋・光源リスト走査と同じ結果を返すこと、
+暗い部屋があっても視界半径が変わらないことを確認します。
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from pyrogue.entities.actors.inventory import Inventory
+from pyrogue.entities.items.light_items import Torch
+from pyrogue.map.dungeon.dark_room_builder import DarkRoom, DarkRoomBuilder
+from pyrogue.map.dungeon.light_map import LightMap
+from pyrogue.ui.components.fov_manager import FOVManager
+
+DARK_ROOMS = [
+    DarkRoom(2, 2, 8, 6, darkness_level=0.9),
+    DarkRoom(6, 4, 10, 8, darkness_level=0.5),
+]
+LIGHT_SOURCES = [(5, 5), (12, 8), (14, 2)]
+
+
+class TestLightMap:
+    """明暗ラスターのテスト。"""
+
+    def test_matches_list_scans(self):
+        """暗さ・視界範囲・影響度・最寄りの光源がリスト走査と一致する。"""
+        light_map = LightMap.from_dark_rooms(20, 14, DARK_ROOMS, LIGHT_SOURCES)
+        builder = DarkRoomBuilder()
+
+        for y in range(14):
+            for x in range(20):
+                expected_darkness = builder.get_darkness_level_at(x, y, DARK_ROOMS)
+                assert light_map.darkness_at(x, y) == pytest.approx(expected_darkness)
+                assert light_map.visibility_range_at(x, y, False, 5, 8) == builder.get_visibility_range_at(
+                    x, y, DARK_ROOMS, False
+                )
+                assert light_map.visibility_range_at(x, y, True, 5, 8) == builder.get_visibility_range_at(
+                    x, y, DARK_ROOMS, True, 5
+                )
+                assert light_map.influence_at(x, y) == pytest.approx(
+                    builder.get_light_influence_at(x, y, LIGHT_SOURCES), abs=1e-6
+                )
+
+                builder.light_sources = LIGHT_SOURCES
+                assert light_map.nearest_light_source(x, y, 4) == builder.find_nearest_light_source(x, y, 4)
+
+    def test_fov_radius_unaffected_by_dark_rooms(self):
+        """暗い部屋の中でも視界半径は基本半径のまま。"""
+        player = SimpleNamespace(inventory=Inventory())
+        game_logic = SimpleNamespace(player=player, get_current_floor_data=lambda: None)
+        fov_manager = FOVManager(SimpleNamespace(game_logic=game_logic, dungeon_width=20, dungeon_height=14))
+
+        assert fov_manager._calculate_effective_fov_radius(15, 10) == fov_manager.base_fov_radius
+        assert fov_manager._calculate_effective_fov_radius(4, 4) == fov_manager.base_fov_radius
+
+        torch = Torch()
+        torch.use_light()
+        player.inventory.add_item(torch)
+        assert fov_manager._calculate_effective_fov_radius(4, 4) == fov_manager.base_fov_radius
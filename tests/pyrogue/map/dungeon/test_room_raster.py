@@ -0,0 +1,82 @@
+"""
+部屋IDラスターのテストモジュール。
+
+ラスターの問い合わせが従来の部屋リスト走査と同じ結果を返すこと、
+ダンジョン生成でラスターが維持されフロアデータに渡されることを確認します。
+"""
+
+from pyrogue.map.dungeon.dark_room_builder import DarkRoom, DarkRoomBuilder
+from pyrogue.map.dungeon.director import DungeonDirector
+from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.room_raster import NO_ROOM, RoomRaster
+from pyrogue.map.dungeon_manager import DungeonManager
+
+ROOMS = [
+    Room(x=2, y=2, width=6, height=5, id=0),
+    Room(x=12, y=3, width=7, height=6, id=1),
+    Room(x=4, y=11, width=8, height=4, id=2),
+]
+
+
+def _reference_boundary(rooms: list[Room], x: int, y: int) -> bool:
+    for room in rooms:
+        left, right = room.x, room.x + room.width - 1
+        top, bottom = room.y, room.y + room.height - 1
+        if (y == top - 1 or y == bottom + 1) and (left <= x <= right):
+            return True
+        if (x == left - 1 or x == right + 1) and (top <= y <= bottom):
+            return True
+    return False
+
+
+class TestRoomRaster:
+    """部屋IDラスターのテスト。"""
+
+    def test_matches_room_list_scans(self):
+        """所属・内部・境界の判定が部屋リスト走査と一致する。"""
+        raster = RoomRaster.from_rooms(24, 18, ROOMS)
+
+        for y in range(18):
+            for x in range(24):
+                containing = [
+                    room for room in ROOMS if room.x <= x < room.x + room.width and room.y <= y < room.y + room.height
+                ]
+                inside = any(
+                    room.x < x < room.x + room.width - 1 and room.y < y < room.y + room.height - 1 for room in ROOMS
+                )
+                assert raster.room_at(x, y) is (containing[0] if containing else None)
+                assert raster.is_inside_room(x, y) == inside
+                assert raster.is_boundary_wall(x, y) == _reference_boundary(ROOMS, x, y)
+
+    def test_out_of_bounds_and_neighborhood(self):
+        """範囲外は部屋なし、近傍判定は中心を除く。"""
+        raster = RoomRaster.from_rooms(24, 18, ROOMS)
+
+        assert raster.room_index_at(-1, 3) == NO_ROOM
+        assert not raster.is_boundary_wall(30, 30)
+        assert raster.any_room_near(10, 4, 2)
+        assert not raster.any_room_near(21, 15, 2)
+
+    def test_dark_room_lookup_through_raster(self):
+        """暗い部屋に置き換えた部屋はラスター経由で判定される。"""
+        raster = RoomRaster.from_rooms(24, 18, ROOMS)
+        builder = DarkRoomBuilder()
+
+        dark_rooms = builder.apply_darkness_to_rooms(ROOMS, darkness_probability=1.0, room_raster=raster)
+
+        assert all(isinstance(room, DarkRoom) for room in raster.rooms)
+        assert builder.is_position_in_dark_room(3, 3, raster)
+        assert builder.get_darkness_level_at(3, 3, raster) == dark_rooms[0].darkness_level
+        assert not builder.is_position_in_dark_room(10, 10, raster)
+
+    def test_generated_floor_exposes_raster(self):
+        """生成されたフロアのラスターが部屋を網羅している。"""
+        director = DungeonDirector(80, 45, floor=2)
+        director.build_dungeon()
+
+        for room in director.rooms:
+            assert director.room_raster.is_room_floor(*room.center())
+
+        manager = DungeonManager()
+        floor_data = manager.get_floor(2)
+        assert floor_data.room_raster is not None
@@ -0,0 +1,85 @@
+"""
+タイルバッファのテストモジュール。
+
+遅延書き込みの一括適用（最後の書き込みが有効）、サイズによる部分フラッシュ、
+矩形・マスクの即時書き込み、ダーティマスクの記録を確認します。
+"""
+
+import numpy as np
+
+from pyrogue.map.dungeon.grid_kernels import tile_mask
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
+from pyrogue.map.tile import Door, Floor, Wall
+
+
+def _wall_tiles(width: int, height: int) -> np.ndarray:
+    tiles = np.empty((height, width), dtype=object)
+    tiles[:] = [[Wall() for _ in range(width)] for _ in range(height)]
+    return tiles
+
+
+class TestTileBuffer:
+    """タイルバッファのテスト。"""
+
+    def test_flush_applies_last_write(self):
+        """同じマスへの遅延書き込みは最後のものが適用される。"""
+        tiles = _wall_tiles(6, 4)
+        buffer = TileBuffer(6, 4)
+        door = Door()
+
+        buffer.queue_tile_change(1, 1, Floor())
+        buffer.queue_tile_change(1, 1, door)
+        buffer.queue_points([(2, 2), (3, 2), (9, 9)], Floor)
+
+        assert buffer.get_queue_size() == 4
+        assert buffer.flush_to_tiles(tiles) == 4
+        assert tiles[1, 1] is door
+        assert isinstance(tiles[2, 3], Floor)
+        assert buffer.get_queue_size() == 0
+        assert np.count_nonzero(buffer.consume_dirty()) == 3
+
+    def test_partial_flush_on_batch_size(self):
+        """バインド済みならバッチサイズに達した時点で適用される。"""
+        tiles = _wall_tiles(10, 10)
+        buffer = TileBuffer(10, 10, batch_size=4, tiles=tiles)
+
+        for x in range(5):
+            buffer.queue_tile_change(x, 0, Floor())
+
+        assert buffer.get_queue_size() == 1
+        assert tile_mask(tiles, Floor)[0, :4].all()
+        assert isinstance(tiles[0, 4], Wall)
+
+    def test_immediate_writes_keep_order_and_track_dirty(self):
+        """即時書き込みは溜まった書き込みの後に適用され、ダーティマスクに記録される。"""
+        tiles = _wall_tiles(8, 6)
+        buffer = TileBuffer(8, 6, tiles=tiles)
+
+        buffer.queue_tile_change(2, 2, Door())
+        assert buffer.fill_rect(tiles, 1, 1, 3, 3, Floor) == 9
+        assert isinstance(tiles[2, 2], Floor)
+        assert tiles[1, 1] is not tiles[1, 2]
+
+        mask = np.zeros((2, 2), dtype=bool)
+        mask[0, 1] = True
+        assert buffer.write_mask(tiles, mask, Door, origin=(5, 3)) == 1
+        assert isinstance(tiles[3, 6], Door)
+
+        dirty = buffer.consume_dirty()
+        assert dirty[1:4, 1:4].all()
+        assert dirty[3, 6]
+        assert np.count_nonzero(dirty) == 10
+        assert not buffer.consume_dirty().any()
+
+    def test_rebinding_resets_dirty(self):
+        """別の配列にバインドすると保留中の書き込みは元の配列に適用される。"""
+        first = _wall_tiles(4, 4)
+        second = _wall_tiles(5, 3)
+        buffer = TileBuffer(4, 4, tiles=first)
+
+        buffer.queue_tile_change(0, 0, Floor())
+        buffer.set_tile(second, 4, 2, Floor())
+
+        assert isinstance(first[0, 0], Floor)
+        assert buffer.dirty.shape == (3, 5)
+        assert np.count_nonzero(buffer.dirty) == 1
@@ -0,0 +1,82 @@
+"""
+距離マップによるダンジョン検証のテストモジュール。
+
+上り階段からの単一の距離マップで、階段の到達可能性・部屋の到達可能性・
+到達不能な床の数が判定されることを確認します。
+"""
+
+import numpy as np
+
+from pyrogue.map.dungeon.connectivity import DistanceMap
+from pyrogue.map.dungeon.room_builder import Room
+from pyrogue.map.dungeon.validation_manager import ValidationManager
+from pyrogue.map.tile import Door, Floor, StairsDown, StairsUp, Wall
+
+
+def _build_tiles(layout: list[str]) -> np.ndarray:
+    factories = {"#": Wall, ".": Floor, "+": Door, "<": StairsUp, ">": StairsDown}
+    tiles = np.empty((len(layout), len(layout[0])), dtype=object)
+    for y, row in enumerate(layout):
+        for x, char in enumerate(row):
+            tiles[y, x] = factories[char]()
+    return tiles
+
+
+LAYOUT = [
+    "##############",
+    "#<...#########",
+    "#....+.....>.#",
+    "#....#########",
+    "######....####",
+    "######....####",
+    "##############",
+]
+
+
+def _results(manager: ValidationManager) -> dict[str, bool]:
+    return {result["test"]: result["passed"] for result in manager.validation_results}
+
+
+class TestValidationDistanceMap:
+    """距離マップによる検証のテスト。"""
+
+    def test_distance_map_counts_steps_diagonally(self):
+        """8方向移動の歩数が計算される。"""
+        passable = np.ones((5, 5), dtype=bool)
+        distance_map = DistanceMap(passable, (0, 0))
+        assert distance_map.distance_to(4, 4) == 4
+        assert distance_map.distance_to(9, 9) is None
+
+    def test_stairs_reachable_through_door(self):
+        """閉じたドア越しでも階段間は到達可能と判定される。"""
+        tiles = _build_tiles(LAYOUT)
+        manager = ValidationManager()
+
+        manager._validate_accessibility([], (1, 1), (11, 2), tiles)
+
+        assert _results(manager)["accessibility"]
+        assert "distance 10" in manager.validation_results[-1]["message"]
+
+    def test_unreachable_room_and_floor_reported(self):
+        """到達できない部屋は接続性エラー、到達できない床は警告になる。"""
+        tiles = _build_tiles(LAYOUT)
+        manager = ValidationManager()
+        rooms = [Room(x=0, y=0, width=6, height=5, id=1), Room(x=5, y=3, width=6, height=4, id=2)]
+        distance_map = manager._build_distance_map((1, 1), (11, 2), tiles)
+
+        manager._validate_room_connectivity(rooms, distance_map)
+        manager._validate_accessibility(rooms, (1, 1), (11, 2), tiles, distance_map)
+
+        results = _results(manager)
+        assert not results["connectivity"]
+        assert results["accessibility"]
+        assert any("8 floor tiles are not reachable" in warning for warning in manager.warnings)
+
+    def test_blocked_stairs_fail(self):
+        """階段間が壁で塞がれている場合は失敗する。"""
+        layout = [row.replace("+", "#") for row in LAYOUT]
+        manager = ValidationManager()
+
+        manager._validate_accessibility([], (1, 1), (11, 2), _build_tiles(layout))
+
+        assert not _results(manager)["accessibility"]
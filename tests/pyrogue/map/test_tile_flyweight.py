@@ -0,0 +1,82 @@
+"""
+タイルの共有インスタンスのテストモジュール。
+
+状態を持たない種類のタイルが種類ごとに1つのインスタンスを共有し、
+変更・保存・生成時にその共有が壊れないことを確認します。
+"""
+
+import pickle
+import random
+
+import numpy as np
+import pytest
+
+from pyrogue.map.dungeon.director import DungeonDirector
+from pyrogue.map.dungeon.grid_kernels import tile_values
+from pyrogue.map.tile import Door, Floor, SecretDoor, StairsDown, Wall
+
+
+class TestTileFlyweight:
+    """タイルの共有インスタンスのテスト。"""
+
+    def test_shared_tiles_are_interned_and_immutable(self):
+        """共有インスタンスは種類ごとに1つで、変更するには専用コピーが必要。"""
+        floor = Floor.shared()
+        assert floor is Floor.shared()
+        assert floor is not Wall.shared()
+        assert floor == Floor()
+        assert floor.is_shared
+        assert not Floor().is_shared
+
+        with pytest.raises(AttributeError):
+            floor.walkable = False
+
+        copy = floor.unshared()
+        copy.walkable = False
+        assert isinstance(copy, Floor)
+        assert not copy.is_shared
+        assert floor.walkable
+
+        with pytest.raises(TypeError):
+            Door.shared()
+        with pytest.raises(TypeError):
+            SecretDoor.shared()
+
+    def test_pickle_keeps_sharing(self):
+        """保存と読み込みの後も共有インスタンスは共有されたまま。"""
+        tiles = np.full((3, 4), Wall.shared(), dtype=object)
+        tiles[1, 1] = StairsDown.shared()
+        tiles[1, 2] = Door("open")
+
+        restored = pickle.loads(pickle.dumps(tiles))
+
+        assert restored[0, 0] is Wall.shared()
+        assert restored[2, 3] is Wall.shared()
+        assert restored[1, 1] is StairsDown.shared()
+        assert restored[1, 2].door_state == "open"
+        assert not restored[1, 2].is_shared
+
+    def test_tile_values(self):
+        """共有インスタンスは全要素で同じオブジェクト、生成関数はマスごとに別。"""
+        shared = tile_values(Floor.shared(), 3)
+        assert all(tile is Floor.shared() for tile in shared)
+
+        created = tile_values(Floor, 2)
+        assert created[0] is not created[1]
+
+        with pytest.raises(ValueError):
+            tile_values(Floor(), 2)
+
+    def test_generated_floor_shares_tiles(self):
+        """生成されたフロアの床と壁は共有インスタンスで、光源の床だけが専用。"""
+        random.seed(3)
+        director = DungeonDirector(80, 45, 6)
+        tiles, _, _ = director.build_dungeon()
+
+        unique = {id(tile): tile for tile in tiles.flat}.values()
+        walls = [tile for tile in unique if type(tile) is Wall]
+        floors = [tile for tile in unique if type(tile) is Floor]
+
+        assert walls == [Wall.shared()]
+        assert Floor.shared() in floors
+        assert all(tile.has_light_source for tile in floors if not tile.is_shared)
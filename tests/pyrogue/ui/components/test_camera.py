@@ -0,0 +1,37 @@
+"""
+カメラ（表示範囲）のテストモジュール。
+
+追従対象を中央に置き、マップ端では範囲外を映さないこと、
+マップが表示範囲より小さい場合は左上に固定されることを確認します。
+"""
+
+from pyrogue.ui.components.camera import Camera
+
+
+class TestCamera:
+    """カメラのテスト。"""
+
+    def test_follow_centers_and_clamps(self):
+        """追従対象を中央に置き、マップの端で止まる。"""
+        camera = Camera(20, 10)
+
+        assert camera.follow(50, 30, 100, 60)
+        assert camera.bounds == (40, 25, 20, 10)
+        assert camera.to_screen(50, 30) == (10, 5)
+        assert camera.contains(59, 34)
+        assert not camera.contains(60, 34)
+
+        assert not camera.follow(50, 30, 100, 60)
+        camera.follow(2, 58, 100, 60)
+        assert camera.bounds == (0, 50, 20, 10)
+        camera.follow(99, 0, 100, 60)
+        assert camera.bounds == (80, 0, 20, 10)
+
+    def test_small_map_is_fixed(self):
+        """マップが表示範囲より小さい場合はマップ全体を左上に固定して表示する。"""
+        camera = Camera()
+        camera.resize(80, 45)
+
+        camera.follow(70, 40, 80, 43)
+        assert camera.bounds == (0, 0, 80, 43)
+        assert camera.to_screen(70, 40) == (70, 40)
@@ -0,0 +1,63 @@
+"""
+FOVマネージャーのテストモジュール。
+
+視界半径のウィンドウだけで計算したFOVが、マップ全体で計算したFOVと
+一致すること、前回の視界が消えることを確認します。
+"""
+
+from functools import partial
+from types import SimpleNamespace
+
+import numpy as np
+import tcod.map
+from tcod import libtcodpy
+
+from pyrogue.core.game_logic import GameLogic
+from pyrogue.map.tile import Floor, Wall
+from pyrogue.ui.components.fov_manager import FOVManager
+
+
+def _game_screen(tiles: np.ndarray, player: SimpleNamespace) -> SimpleNamespace:
+    height, width = tiles.shape
+    floor_data = SimpleNamespace(tiles=tiles, explored=np.zeros((height, width), dtype=bool), light_map=None)
+    game_logic = SimpleNamespace(
+        player=player,
+        get_current_floor_data=lambda: floor_data,
+        get_explored_tiles=lambda: floor_data.explored,
+    )
+    game_logic.update_explored_tiles = partial(GameLogic.update_explored_tiles, game_logic)
+    return SimpleNamespace(game_logic=game_logic, player=player, dungeon_width=width, dungeon_height=height)
+
+
+class TestFOVManager:
+    """FOVマネージャーのテスト。"""
+
+    def test_windowed_fov_matches_full_map(self):
+        """ウィンドウで計算した視界はマップ全体で計算した視界と一致する。"""
+        rng = np.random.default_rng(3)
+        walls = rng.random((60, 90)) < 0.3
+        tiles = np.where(walls, Wall.shared(), Floor.shared())
+        player = SimpleNamespace(x=0, y=0)
+        fov_manager = FOVManager(_game_screen(tiles, player))
+
+        for x, y in [(45, 30), (1, 1), (88, 58), (46, 31), (10, 50)]:
+            player.x, player.y = x, y
+            fov_manager.update_fov()
+            expected = tcod.map.compute_fov(~walls, (y, x), fov_manager.base_fov_radius, algorithm=libtcodpy.FOV_SHADOW)
+            assert (fov_manager.visible == expected).all()
+
+        explored = fov_manager.game_screen.game_logic.get_explored_tiles()
+        assert explored[30, 45]
+        assert not explored[5, 70]
+
+    def test_toggle_clears_whole_map(self):
+        """FOVを無効から有効に戻すと、全体を可視にした状態が消える。"""
+        tiles = np.full((20, 40), Floor.shared(), dtype=object)
+        player = SimpleNamespace(x=5, y=5)
+        fov_manager = FOVManager(_game_screen(tiles, player))
+
+        fov_manager.toggle_fov()
+        assert fov_manager.visible.all()
+        fov_manager.toggle_fov()
+        assert fov_manager.visible[5, 5]
+        assert not fov_manager.visible[19, 39]
@@ -0,0 +1,85 @@
+"""
+表示文字と色のテーブルのテストモジュール。
+
+テーブルから引いた表示文字と色が判定関数と一致すること、
+エンティティの描画と幻覚状態のランダム化を確認します。
+"""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import tcod.console
+
+from pyrogue.entities.actors.player import Player
+from pyrogue.entities.actors.status_effects import HallucinationEffect
+from pyrogue.map.tile import Door, Floor, SecretDoor, StairsUp, Wall
+from pyrogue.ui.components.game_renderer import HALLUCINATION_CODES, GameRenderer
+from pyrogue.ui.components.glyph_table import HIDDEN, REMEMBERED, VISIBLE, GlyphTable, tile_glyph
+
+
+def _entity(x, y, char, color):
+    return SimpleNamespace(x=x, y=y, char=char, color=color)
+
+
+class TestGlyphTable:
+    """表示文字と色のテーブルのテスト。"""
+
+    def test_table_matches_tile_glyph(self):
+        """全ての種類と表示状態でテーブルの値が判定関数と一致する。"""
+        table = GlyphTable.with_defaults()
+        open_door = Door("open")
+        tiles = [Wall.shared(), Floor(), StairsUp.shared(), Door(), open_door, SecretDoor()]
+
+        assert table.tile_code(Floor()) == table.tile_code(Floor.shared())
+        assert table.tile_code(Door()) != table.tile_code(open_door)
+
+        for tile in tiles:
+            code = table.tile_code(tile)
+            for wizard in (0, 1):
+                assert chr(table.tile_ch[wizard, HIDDEN, code]) == " "
+                for state, visible in ((VISIBLE, True), (REMEMBERED, False)):
+                    char, color = tile_glyph(tile, visible, bool(wizard))
+                    assert chr(table.tile_ch[wizard, state, code]) == char
+                    assert tuple(table.tile_fg[wizard, state, code]) == tuple(color)
+
+    def test_trap_codes(self):
+        """トラップは種類ごとの文字で、隠しトラップは薄い色になる。"""
+        table = GlyphTable.with_defaults()
+        trap = SimpleNamespace(name="Teleport Trap", is_hidden=False)
+        code = table.trap_code(trap)
+        trap.is_hidden = True
+        hidden_code = table.trap_code(trap)
+
+        assert chr(table.symbol_ch[code]) == chr(table.symbol_ch[hidden_code]) == "T"
+        assert tuple(table.symbol_fg[hidden_code]) == (127, 0, 127)
+        assert chr(table.symbol_ch[table.trap_code(SimpleNamespace(name="Unknown", is_hidden=False))]) == "^"
+
+    def test_entities_and_hallucination(self):
+        """視界内のエンティティだけを描画し、幻覚状態では文字と色を置き換える。"""
+        player = Player(x=0, y=0)
+        renderer = GameRenderer(SimpleNamespace(player=player))
+        floor_data = SimpleNamespace(
+            item_spawner=SimpleNamespace(items=[_entity(1, 1, "!", (0, 0, 255)), _entity(1, 1, "?", (1, 2, 3))]),
+            monster_spawner=SimpleNamespace(monsters=[_entity(2, 1, "K", (255, 0, 0)), _entity(3, 1, "B", (5, 5, 5))]),
+        )
+        visible = np.zeros((4, 6), dtype=bool)
+        visible[1, 1:3] = True
+
+        console = tcod.console.Console(6, 6)
+        renderer._render_entities(console, floor_data, visible, False, 2)
+        assert chr(console.ch[3, 1]) == "!"
+        assert tuple(console.fg[3, 1]) == (0, 0, 255)
+        assert chr(console.ch[3, 2]) == "K"
+        assert console.ch[3, 3] == ord(" ")
+
+        # 幻覚表示はゲーム進行用の乱数列を消費しない
+        random.seed(4)
+        state = random.getstate()
+        player.status_effects.add_effect(HallucinationEffect(duration=5))
+        console.clear()
+        renderer._render_entities(console, floor_data, visible, False, 2)
+        assert random.getstate() == state
+        assert console.ch[3, 1] in HALLUCINATION_CODES
+        assert console.ch[3, 2] in HALLUCINATION_CODES
+        assert console.ch[3, 3] == ord(" ")
@@ -0,0 +1,40 @@
+"""
+入力処理コンポーネントのテストモジュール。
+
+Ctrl修飾付きのキーが同じ文字の通常コマンドに横取りされず、
+ウィザード用の割り当てに届くことを確認します。
+"""
+
+from unittest.mock import Mock
+
+import tcod.event
+
+from pyrogue.ui.components.input_handler import InputHandler
+
+
+def _key(sym: tcod.event.KeySym, mod: tcod.event.Modifier = tcod.event.Modifier.NONE) -> tcod.event.KeyDown:
+    return tcod.event.KeyDown(scancode=tcod.event.Scancode.UNKNOWN, sym=sym, mod=mod)
+
+
+class TestInputHandler:
+    """入力ハンドラーのテスト。"""
+
+    def test_ctrl_e_exports_trace(self):
+        """Ctrl+E は食事ではなくトレースの書き出しを実行する。"""
+        handler = InputHandler(Mock())
+        handler._handle_eat_action = Mock()
+
+        handler.handle_key(_key(tcod.event.KeySym.E, tcod.event.Modifier.LCTRL))
+
+        handler.game_screen.game_logic.wizard_export_trace.assert_called_once_with()
+        handler._handle_eat_action.assert_not_called()
+
+    def test_plain_e_eats(self):
+        """修飾なしの e は従来どおり食事コマンドになる。"""
+        handler = InputHandler(Mock())
+        handler._handle_eat_action = Mock()
+
+        handler.handle_key(_key(tcod.event.KeySym.E))
+
+        handler._handle_eat_action.assert_called_once_with()
+        handler.game_screen.game_logic.wizard_export_trace.assert_not_called()
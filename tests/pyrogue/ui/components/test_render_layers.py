@@ -0,0 +1,126 @@
+"""
+描画レイヤーのテストモジュール。
+
+マップ層が変化したマスだけを描き直すこと、パネルが表示内容の変化時だけ
+描き直すこと、差分描画の結果が全体描画と一致すること
+（画面より大きいマップをスクロールする場合を含む）を確認します。
+"""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import tcod.console
+
+import pyrogue.core  # noqa: F401  # GameScreenの循環importを解決するため先に読み込む
+from pyrogue.map.dungeon.tile_buffer import TileBuffer
+from pyrogue.map.tile import Floor, StairsDown, Wall
+from pyrogue.ui.components.game_renderer import GameRenderer
+from pyrogue.ui.components.render_layers import MapLayer, PanelLayer
+from pyrogue.ui.screens.game_screen import GameScreen
+
+
+def _floor_data(width: int = 10, height: int = 6) -> SimpleNamespace:
+    tiles = np.full((height, width), Wall.shared(), dtype=object)
+    tiles[1:-1, 1:-1] = Floor.shared()
+    return SimpleNamespace(tiles=tiles, tile_buffer=TileBuffer(width, height, tiles=tiles))
+
+
+class TestRenderLayers:
+    """描画レイヤーのテスト。"""
+
+    def test_map_layer_patches_changed_cells(self):
+        """視界・探索状態・タイルが変わったマスだけを描き直す。"""
+        floor_data = _floor_data()
+        visible = np.zeros((6, 10), dtype=bool)
+        explored = np.zeros((6, 10), dtype=bool)
+        visible[2:4, 2:4] = True
+        explored[2:4, 2:4] = True
+        layer = MapLayer()
+
+        console = layer.update(floor_data, visible, explored, False)
+        assert layer.last_patch_count == 60
+        assert chr(console.ch[2, 2]) == "."
+        assert chr(console.ch[0, 0]) == " "
+
+        layer.update(floor_data, visible, explored, False)
+        assert layer.last_patch_count == 0
+
+        visible[2, 2] = False
+        layer.update(floor_data, visible, explored, False)
+        assert layer.last_patch_count == 1
+        assert tuple(console.fg[2, 2]) == Floor.shared().dark
+
+        floor_data.tile_buffer.set_tile(floor_data.tiles, 3, 3, StairsDown.shared())
+        layer.update(floor_data, visible, explored, False)
+        assert layer.last_patch_count == 1
+        assert chr(console.ch[3, 3]) == ">"
+
+        layer.update(floor_data, visible, explored, True)
+        assert layer.last_patch_count == 60
+        layer.update(_floor_data(), visible, explored, True)
+        assert layer.last_patch_count == 60
+
+    def test_panel_redraws_on_key_change(self):
+        """表示内容のキーが変わった時だけ描き直す。"""
+        panel = PanelLayer(20, 2)
+        calls = []
+
+        def paint(console):
+            calls.append(1)
+            console.print(0, 0, "HP:10")
+
+        panel.update(("HP:10",), paint)
+        panel.update(("HP:10",), paint)
+        assert len(calls) == 1
+        assert chr(panel.console.ch[0, 3]) == "1"
+
+        panel.update(("HP:9",), paint)
+        assert len(calls) == 2
+
+    def test_incremental_render_matches_full_render(self):
+        """移動を繰り返しても差分描画の結果は新しいレンダラーでの全体描画と一致する。"""
+        random.seed(5)
+        game_screen = GameScreen(None)
+        game_screen.setup_new_game()
+        console = tcod.console.Console(80, 54)
+
+        for step in range(12):
+            for dx, dy in [(1, 0), (0, 1), (-1, 0), (0, -1)]:
+                if game_screen.try_move_player(dx, dy):
+                    break
+            game_screen.game_logic.wizard_mode = step >= 8
+            game_screen.render(console)
+
+            reference = tcod.console.Console(80, 54)
+            GameRenderer(game_screen).render(reference)
+            assert (reference.rgb == console.rgb).all()
+
+        assert game_screen.renderer.map_layer.last_patch_count < 80 * 45 // 10
+
+    def test_scrolling_render_matches_full_render(self):
+        """画面より大きいマップでは表示範囲だけを描画し、スクロールしても全体描画と一致する。"""
+        random.seed(7)
+        game_screen = GameScreen(SimpleNamespace(map_width=160, map_height=100))
+        game_screen.setup_new_game()
+        console = tcod.console.Console(80, 54)
+        renderer = game_screen.renderer
+        origins = set()
+
+        for step in range(40):
+            for dx, dy in [(1, 0), (0, 1), (1, 1), (-1, 0), (0, -1)]:
+                if game_screen.try_move_player(dx, dy):
+                    break
+            game_screen.game_logic.wizard_mode = step >= 30
+            game_screen.render(console)
+            origins.add(renderer.map_layer.origin)
+
+            reference = tcod.console.Console(80, 54)
+            GameRenderer(game_screen).render(reference)
+            assert (reference.rgb == console.rgb).all()
+
+        player = game_screen.player
+        assert renderer.camera.bounds[2:] == (80, 45)
+        assert renderer.camera.contains(player.x, player.y)
+        assert renderer.map_layer.kinds.shape == (45, 80)
+        assert len(origins) > 1
@@ -0,0 +1,59 @@
+"""
+インベントリ画面のテストモジュール。
+
+表示行と文字キーの対応がインベントリと識別状態の世代番号ごとに
+キャッシュされ、追加・装備・識別の後だけ作り直されることを確認します。
+"""
+
+from types import SimpleNamespace
+
+import tcod.console
+import tcod.event
+
+from pyrogue.entities.actors.inventory import Inventory
+from pyrogue.entities.items.effects import HealingEffect
+from pyrogue.entities.items.identification import ItemIdentification
+from pyrogue.entities.items.item import Potion, Weapon
+from pyrogue.ui.screens.inventory_screen import InventoryScreen
+
+
+def _row(console: tcod.console.Console, y: int) -> str:
+    return "".join(chr(c) for c in console.ch[y]).strip()
+
+
+class TestInventoryScreen:
+    """インベントリ画面のテスト。"""
+
+    def test_rows_cached_per_version(self):
+        """変化がなければ表示行を作り直さず、追加・装備・識別の後は作り直す。"""
+        inventory = Inventory()
+        identification = ItemIdentification()
+        game_logic = SimpleNamespace(inventory=inventory, player=SimpleNamespace(identification=identification))
+        screen = InventoryScreen(SimpleNamespace(engine=None, game_logic=game_logic))
+        console = tcod.console.Console(80, 30)
+
+        potion = Potion(0, 0, "Healing Potion", HealingEffect(heal_amount=12))
+        sword = Weapon(0, 0, "Long Sword", 3)
+        inventory.add_item(potion)
+        inventory.add_item(sword)
+        screen.render(console)
+        rows = screen._item_rows
+        assert _row(console, 3).startswith("a) ")
+        assert "Healing Potion" not in _row(console, 3)
+
+        screen.selected_index = 1
+        screen.render(console)
+        assert screen._item_rows is rows
+
+        inventory.equip(sword)
+        identification.identify_item(potion.name, potion.item_type)
+        screen.render(console)
+        assert screen._item_rows is not rows
+        assert _row(console, 3).startswith("a) Healing Potion")
+        assert any("Weapon: Long Sword (ATK 3)" in _row(console, y) for y in range(30))
+
+        key = tcod.event.KeyDown(
+            scancode=tcod.event.Scancode.UNKNOWN, sym=tcod.event.KeySym.A, mod=tcod.event.Modifier.NONE
+        )
+        screen.handle_input(key)
+        assert screen.selected_index == 0
@@ -0,0 +1,53 @@
+"""
+エイリアステーブルのテストモジュール。
+
+抽選分布が重みに従うこと、出現テーブルがキャッシュされ
+階層の出現範囲を守ることを確認します。
+"""
+
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from pyrogue.entities.actors.monster_spawner import MonsterSpawner
+from pyrogue.entities.actors.monster_types import FLOOR_MONSTERS
+from pyrogue.entities.items.item_spawner import get_floor_item_table
+from pyrogue.entities.items.item_types import get_spawn_table
+from pyrogue.utils.alias_table import AliasTable
+
+
+class TestAliasTable:
+    """エイリアステーブルのテスト。"""
+
+    def test_distribution_follows_weights(self):
+        """一括抽選と単発抽選の頻度が重みの比率に近い。"""
+        table = AliasTable([("a", 1), ("b", 3), ("c", 0), ("d", 6)])
+
+        counts = Counter(table.sample_many(50_000, np.random.default_rng(1)))
+        assert counts["c"] == 0
+        assert counts["a"] / 50_000 == pytest.approx(0.1, abs=0.01)
+        assert counts["d"] / 50_000 == pytest.approx(0.6, abs=0.01)
+
+        rng = random.Random(2)
+        single = Counter(table.sample(rng) for _ in range(20_000))
+        assert single["b"] / 20_000 == pytest.approx(0.3, abs=0.015)
+
+    def test_rejects_empty_table(self):
+        """要素がない、または重みの合計が0のテーブルは作れない。"""
+        with pytest.raises(ValueError):
+            AliasTable([])
+        with pytest.raises(ValueError):
+            AliasTable([("a", 0)])
+
+    def test_spawn_tables_are_cached(self):
+        """出現テーブルは階層ごとに一度だけ作られ、出現範囲を守る。"""
+        assert get_spawn_table(3, "weapon") is get_spawn_table(3, "weapon")
+        assert get_floor_item_table(3) is get_floor_item_table(3)
+        assert all(t.min_floor <= 3 <= t.max_floor for t in get_spawn_table(3, "weapon").items)
+
+        spawner = MonsterSpawner(dungeon_level=2)
+        table = spawner._get_monster_table()
+        assert table is MonsterSpawner(dungeon_level=2)._get_monster_table()
+        assert set(table.items) == {monster_id for monster_id, _ in FLOOR_MONSTERS[2]}
@@ -0,0 +1,58 @@
+"""
+フレーム・ターン計測タイマーのテストモジュール。
+
+無効時は記録せず、有効時は入れ子の区間をリングバッファに記録し、
+集計・オーバーレイ表示・Chromeトレース形式の書き出しができることを確認します。
+"""
+
+import json
+
+from pyrogue.utils.frame_timer import FrameTimer
+
+
+class TestFrameTimer:
+    """計測タイマーのテスト。"""
+
+    def test_disabled_timer_records_nothing(self):
+        """無効時は共有の空の区間を返し、何も記録しない。"""
+        timer = FrameTimer()
+
+        with timer.scope("turn"):
+            pass
+
+        assert timer.scope("turn") is timer.scope("fov")
+        assert not timer.spans
+
+    def test_nested_scopes_and_ring_buffer(self):
+        """入れ子の深さを記録し、容量を超えると古い区間から捨てる。"""
+        timer = FrameTimer(capacity=3, enabled=True)
+
+        with timer.scope("turn"), timer.scope("turn.monsters"):
+            pass
+        with timer.scope("fov"):
+            pass
+        with timer.scope("fov"):
+            pass
+
+        assert [(name, depth) for name, _, _, depth in timer.spans] == [("turn", 0), ("fov", 0), ("fov", 0)]
+        stats = timer.summary()
+        assert stats["fov"].count == 2
+        assert stats["fov"].max_ms >= stats["fov"].mean_ms >= 0
+        assert timer.overlay_lines()[0].startswith("span")
+        assert len(timer.overlay_lines()) == 3
+
+    def test_chrome_trace_export(self, tmp_path):
+        """書き出したJSONは完了イベント（ph=X）の一覧になる。"""
+        timer = FrameTimer(enabled=True)
+        with timer.scope("render"), timer.scope("render.map"):
+            pass
+
+        path = timer.export_chrome_trace(tmp_path / "trace" / "out.json")
+        events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+
+        assert {event["name"] for event in events} == {"render", "render.map"}
+        assert all(event["ph"] == "X" and event["cat"] == "render" for event in events)
+        outer = next(event for event in events if event["name"] == "render")
+        inner = next(event for event in events if event["name"] == "render.map")
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
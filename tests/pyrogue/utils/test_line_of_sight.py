@@ -0,0 +1,66 @@
+"""
+視線判定テーブルのテストモジュール。
+
+事前計算済みレイテーブルによる視線判定が、
+ブレゼンハム線分による従来の判定と一致することを確認します。
+"""
+
+import random
+from unittest.mock import Mock
+
+import numpy as np
+
+from pyrogue.map.tile import Floor, Wall
+from pyrogue.utils.coordinate_utils import has_line_of_sight
+from pyrogue.utils.line_of_sight import PlayerSightMap, build_ray_table
+
+
+def _random_tiles(width: int, height: int, seed: int) -> np.ndarray:
+    rng = random.Random(seed)
+    tiles = np.empty((height, width), dtype=object)
+    floor, wall = Floor(), Wall()
+    for y in range(height):
+        for x in range(width):
+            tiles[y, x] = wall if rng.random() < 0.25 else floor
+    return tiles
+
+
+class TestLineOfSight:
+    """視線判定テーブルのテスト。"""
+
+    def test_ray_table_shape(self):
+        """レイテーブルの形状と中間点数が正しい。"""
+        ray_x, ray_y, valid = build_ray_table(4)
+        assert ray_x.shape == (9, 9, 3)
+        assert ray_y.shape == (9, 9, 3)
+        # 隣接オフセットには中間点がない
+        assert not valid[4 + 1, 4 + 1].any()
+        # 距離4のオフセットには中間点が3つ
+        assert valid[4, 4 + 4].sum() == 3
+
+    def test_matches_bresenham_line_of_sight(self):
+        """全オフセットで従来の判定と一致する。"""
+        tiles = _random_tiles(30, 20, seed=7)
+        context = Mock()
+        context.get_current_floor_data = Mock(return_value=Mock(tiles=tiles))
+
+        sight_map = PlayerSightMap(radius=8)
+        for px, py in [(15, 10), (1, 1), (28, 18)]:
+            sight_map.update(tiles, px, py)
+            for y in range(max(0, py - 8), min(20, py + 9)):
+                for x in range(max(0, px - 8), min(30, px + 9)):
+                    expected = has_line_of_sight(x, y, px, py, context)
+                    assert sight_map.can_see_player_from(x, y) == expected, (x, y, px, py)
+
+    def test_out_of_range_and_invalidate(self):
+        """マップ範囲外や未計算の状態ではFalseを返す。"""
+        tiles = _random_tiles(10, 10, seed=1)
+        sight_map = PlayerSightMap(radius=3)
+        assert not sight_map.can_see_player_from(5, 5)
+
+        sight_map.update(tiles, 5, 5)
+        assert sight_map.is_current(tiles, 5, 5)
+        assert not sight_map.can_see_player_from(9, 9)
+
+        sight_map.invalidate()
+        assert not sight_map.is_current(tiles, 5, 5)
@@ -0,0 +1,91 @@
+"""
+ゲームロガーのテストモジュール。
+
+出力されないレベルのメッセージは組み立てないこと、%形式の引数と
+構造化データがリスナースレッド経由でテキストとJSON Linesに
+出力されることを確認します。
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+
+from pyrogue.utils.logger import GameLogger, JsonLinesFormatter, TextFormatter, _PreparedQueueHandler
+
+
+class ListHandler(logging.Handler):
+    """書式化したレコードをリストに保持するハンドラー。"""
+
+    def __init__(self, formatter):
+        super().__init__()
+        self.setFormatter(formatter)
+        self.lines = []
+
+    def emit(self, record):
+        self.lines.append(self.format(record))
+
+
+def make_logger(name, level):
+    """キューとリスナーを経由してテキストとJSON Linesに出力するロガーを作成。"""
+    logger = logging.getLogger(name)
+    logger.handlers.clear()
+    logger.propagate = False
+    logger.setLevel(level)
+
+    text = ListHandler(TextFormatter("%(levelname)s - %(message)s"))
+    jsonl = ListHandler(JsonLinesFormatter())
+    records = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, text, jsonl)
+    logger.addHandler(_PreparedQueueHandler(records))
+    return GameLogger(logger), listener, text, jsonl
+
+
+def fail():
+    """例外を送出する。"""
+    raise ValueError("boom")
+
+
+class TestGameLogger:
+    """ゲームロガーのテスト。"""
+
+    def test_disabled_level_skips_formatting(self):
+        """出力されないレベルでは関数も引数の文字列化も評価しない。"""
+        game_logger, listener, text, _ = make_logger("pyrogue.test.disabled", logging.INFO)
+        calls = []
+
+        class Expensive:
+            def __str__(self):
+                calls.append("str")
+                return "expensive"
+
+        listener.start()
+        game_logger.debug(lambda: calls.append("callable") or "never")
+        game_logger.debug("value: %s", Expensive())
+        game_logger.debug("extra", extra={"value": Expensive()})
+        listener.stop()
+
+        assert calls == []
+        assert text.lines == []
+        assert not game_logger.is_enabled_for(logging.DEBUG)
+        assert game_logger.is_enabled_for(logging.WARNING)
+
+    def test_text_and_json_lines_output(self):
+        """%形式の引数・関数・構造化データがリスナー経由で両方の書式に出力される。"""
+        game_logger, listener, text, jsonl = make_logger("pyrogue.test.enabled", logging.DEBUG)
+
+        listener.start()
+        game_logger.debug("Turn %d processed", 7)
+        game_logger.info(lambda: "lazy message", extra={"floor": 3})
+        try:
+            fail()
+        except ValueError:
+            game_logger.logger.exception("failed")
+        listener.stop()
+
+        assert text.lines[:2] == ["DEBUG - Turn 7 processed", "INFO - lazy message - {'floor': 3}"]
+        entries = [json.loads(line) for line in jsonl.lines]
+        assert entries[0]["message"] == "Turn 7 processed"
+        assert entries[1]["extra"] == {"floor": 3}
+        assert entries[2]["level"] == "ERROR"
+        assert "ValueError: boom" in entries[2]["exception"]
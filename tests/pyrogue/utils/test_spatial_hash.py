@@ -0,0 +1,102 @@
+"""
+空間ハッシュのテストモジュール。
+
+範囲検索が全件走査と同じ結果を返すこと、移動・削除が
+正しく反映されること、MonsterSpawnerと同期されることを確認します。
+"""
+
+import random
+
+import pytest
+
+from pyrogue.entities.actors.monster import Monster
+from pyrogue.entities.actors.monster_spawner import MonsterSpawner
+from pyrogue.utils.spatial_hash import DistanceMetric, SpatialHash, within_distance
+
+
+class _Point:
+    def __init__(self, x: int, y: int) -> None:
+        self.x = x
+        self.y = y
+
+
+def _make_monster(x: int, y: int) -> Monster:
+    return Monster(
+        char="B",
+        x=x,
+        y=y,
+        name="Bat",
+        level=1,
+        hp=5,
+        max_hp=5,
+        attack=1,
+        defense=0,
+        exp_value=1,
+        view_range=5,
+        color=(255, 255, 255),
+    )
+
+
+class TestSpatialHash:
+    """空間ハッシュのテスト。"""
+
+    @pytest.mark.parametrize("metric", list(DistanceMetric))
+    def test_query_matches_brute_force(self, metric):
+        """各距離で全件走査と同じエンティティを返す。"""
+        rng = random.Random(3)
+        points = [_Point(rng.randrange(80), rng.randrange(45)) for _ in range(300)]
+        index = SpatialHash(cell_size=8)
+        index.rebuild(points)
+
+        for cx, cy, radius in [(40, 20, 5), (0, 0, 3), (79, 44, 10), (10, 30, 2.5)]:
+            expected = {id(p) for p in points if within_distance(p.x - cx, p.y - cy, radius, metric)}
+            assert {id(p) for p in index.query(cx, cy, radius, metric)} == expected
+
+    def test_move_and_remove(self):
+        """移動と削除が検索結果に反映される。"""
+        point = _Point(1, 1)
+        index = SpatialHash(cell_size=4)
+        index.insert(point, point.x, point.y)
+
+        index.move(point, 20, 20)
+        assert index.query(1, 1, 2) == []
+        assert index.query(20, 20, 0) == [point]
+        assert list(index.at(20, 20)) == [point]
+
+        index.remove(point)
+        assert len(index) == 0
+        assert index.query(20, 20, 5) == []
+
+    def test_spawner_keeps_index_in_sync(self):
+        """MonsterSpawner経由の追加・移動・削除と直接のリスト変更に追従する。"""
+        spawner = MonsterSpawner(1)
+        monster = _make_monster(5, 5)
+        spawner.add_monster(monster)
+
+        spawner.move_monster(monster, 30, 10)
+        assert spawner.get_monster_at(30, 10) is monster
+        assert spawner.get_monster_at(5, 5) is None
+        assert (30, 10) in spawner.occupied_positions
+
+        # リストへの直接追加も検索時に反映される
+        other = _make_monster(31, 11)
+        spawner.monsters.append(other)
+        assert set(map(id, spawner.get_monsters_in_range(30, 10, 1))) == {id(monster), id(other)}
+
+        spawner.remove_monster(monster)
+        assert spawner.get_monsters_in_range(30, 10, 1) == [other]
+
+    def test_spawner_resyncs_when_monster_swapped(self):
+        """数が変わらない直接の入れ替えや差し替えでも空間ハッシュを作り直す。"""
+        spawner = MonsterSpawner(1)
+        first, second, third = _make_monster(2, 2), _make_monster(8, 8), _make_monster(14, 14)
+        spawner.add_monster(first)
+        assert spawner.get_monster_at(2, 2) is first
+
+        spawner.monsters[0] = second
+        assert spawner.get_monster_at(2, 2) is None
+        assert spawner.get_monster_at(8, 8) is second
+
+        spawner.monsters = [third]
+        assert spawner.get_monster_at(8, 8) is None
+        assert spawner.get_monsters_in_range(14, 14, 0) == [third]
@@ -0,0 +1,46 @@
+"""
+起動時間プロファイラーのテストモジュール。
+
+計測用ファインダーがモジュールのインポート時間を累積時間と自身の時間に
+分けて記録し、初期化段階とレポートを出力できることを確認します。
+"""
+
+import io
+import sys
+
+from pyrogue.utils.startup_profiler import StartupProfiler, _ImportTimingFinder
+
+
+class TestStartupProfiler:
+    """起動時間プロファイラーのテスト。"""
+
+    def test_import_and_phase_timing(self, tmp_path, monkeypatch):
+        """入れ子のインポートは親の累積時間に含まれ、自身の時間からは除かれる。"""
+        (tmp_path / "profiled_outer.py").write_text("import profiled_inner\nVALUE = profiled_inner.VALUE\n")
+        (tmp_path / "profiled_inner.py").write_text("VALUE = sum(range(1000))\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        profiler = StartupProfiler()
+        profiler.install()
+        try:
+            with profiler.phase("import outer"):
+                import profiled_outer  # noqa: PLC0415
+        finally:
+            profiler.uninstall()
+            sys.modules.pop("profiled_outer", None)
+            sys.modules.pop("profiled_inner", None)
+
+        assert profiled_outer.VALUE == 499500
+        outer_cumulative, outer_self = profiler.imports["profiled_outer"]
+        inner_cumulative, _ = profiler.imports["profiled_inner"]
+        assert outer_cumulative >= inner_cumulative
+        assert outer_self <= outer_cumulative - inner_cumulative + 1e-9
+        assert not any(isinstance(finder, _ImportTimingFinder) for finder in sys.meta_path)
+        assert profiler.phases[0][0] == "import outer"
+
+        profiler.mark("first_frame")
+        out = io.StringIO()
+        profiler.report(file=out)
+        report = out.getvalue()
+        assert "profiled_outer" in report
+        assert "first_frame" in report